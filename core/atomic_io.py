@@ -0,0 +1,47 @@
+"""
+Atomic File Write
+
+파이프라인 산출물(CSV / JSONL / JSON / MD)을 같은 디렉토리의 임시 파일에 기록한 뒤
+os.replace로 교체한다. 기록 도중 실패 / 중단되어도 기존 산출물은 그대로 남고,
+다른 단계(또는 tools/run_pipeline.py의 병렬 node)가 반쯤 쓰인 파일을 읽지 않는다.
+
+- 임시 파일: .{name}.*.tmp (같은 파일시스템 → rename이 원자적)
+- 권한: 기존 파일이 있으면 그 mode 유지, 없으면 0o644
+- 예외 발생 시 임시 파일 삭제 후 예외 전파
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+DEFAULT_FILE_MODE = 0o644
+
+
+@contextmanager
+def atomic_write(path, mode: str = 'w', encoding: Optional[str] = 'utf-8',
+                 newline: Optional[str] = None) -> Iterator[IO]:
+    """
+    open(path, mode) 대체 (with 블록 정상 종료 시에만 path 교체)
+
+    Usage:
+        with atomic_write(output_csv, newline='') as f:
+            csv.writer(f).writerows(rows)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    binary = 'b' in mode
+    try:
+        with os.fdopen(fd, mode, encoding=None if binary else encoding,
+                       newline=None if binary else newline) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        file_mode = path.stat().st_mode & 0o777 if path.exists() else DEFAULT_FILE_MODE
+        os.chmod(tmp_name, file_mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
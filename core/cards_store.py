@@ -0,0 +1,234 @@
+"""
+Coverage Cards Store - projection read API
+
+비교 단계(Step 7/8)는 카드의 mapping_status / evidence_status / flags /
+top evidence ref만 사용한다. 이 모듈은 evidence를 최초 접근 시에만 decode하는
+경량 카드 view와, Step 5가 기록하는 summary sidecar를 제공한다.
+
+Summary sidecar:
+- 경로: {INSURER}_coverage_cards.summary.json (cards JSONL 옆)
+- 내용: 카드별 비교 필드 + top_evidence_ref + cards JSONL 내 byte offset/length
+- source_size / source_mtime_ns가 현재 cards JSONL과 다르면 stale로 보고 무시
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from core.atomic_io import atomic_write
+from core.compare_types import CoverageCard, Evidence
+
+
+SUMMARY_SUFFIX = ".summary.json"
+
+# Summary sidecar에 기록하는 카드 필드 (evidences / snippet 제외)
+SUMMARY_FIELDS = (
+    'insurer',
+    'coverage_name_raw',
+    'coverage_code',
+    'coverage_name_canonical',
+    'mapping_status',
+    'evidence_status',
+    'hits_by_doc_type',
+    'flags',
+)
+
+
+def summary_path_for(cards_jsonl) -> Path:
+    """cards JSONL 경로 → summary sidecar 경로"""
+    cards_jsonl = Path(cards_jsonl)
+    return cards_jsonl.with_name(cards_jsonl.stem + SUMMARY_SUFFIX)
+
+
+def card_summary(card: CoverageCard) -> dict:
+    """카드 → summary 항목 (offset/length 제외)"""
+    summary = {name: getattr(card, name) for name in SUMMARY_FIELDS}
+    summary['top_evidence_ref'] = card.get_top_evidence_ref()
+    return summary
+
+
+def _top_ref_from_raw(raw_evidences: list) -> str:
+    """decode 전 evidence dict 목록에서 top evidence ref 계산"""
+    if raw_evidences:
+        top = raw_evidences[0]
+        return f"{top['doc_type']} p.{top['page']}"
+    return "-"
+
+
+class CoverageCardView:
+    """
+    CoverageCard 경량 view
+
+    비교 필드는 즉시 보관하고, evidences는 최초 접근 시 decode한다.
+    - JSONL 직접 읽기: 라인 decode 결과의 evidence dict를 보관 → Evidence 변환만 지연
+    - summary sidecar 읽기: evidence 미보관 → 접근 시 cards JSONL의 해당 라인만 seek하여 읽음
+    """
+
+    __slots__ = (
+        'insurer', 'coverage_name_raw', 'coverage_code', 'coverage_name_canonical',
+        'mapping_status', 'evidence_status', 'hits_by_doc_type', 'flags',
+        '_top_evidence_ref', '_raw_evidences', '_evidences', '_source', '_span'
+    )
+
+    def __init__(
+        self,
+        data: dict,
+        top_evidence_ref: Optional[str] = None,
+        raw_evidences: Optional[list] = None,
+        source: Optional[str] = None,
+        span: Optional[Tuple[int, int]] = None
+    ):
+        self.insurer = data['insurer']
+        self.coverage_name_raw = data['coverage_name_raw']
+        self.coverage_code = data.get('coverage_code')
+        self.coverage_name_canonical = data.get('coverage_name_canonical')
+        self.mapping_status = data['mapping_status']
+        self.evidence_status = data['evidence_status']
+        self.hits_by_doc_type = data.get('hits_by_doc_type', {})
+        self.flags = data.get('flags', [])
+        self._top_evidence_ref = top_evidence_ref
+        self._raw_evidences = raw_evidences
+        self._evidences = None
+        self._source = source
+        self._span = span
+
+    @classmethod
+    def from_line(cls, line: str) -> 'CoverageCardView':
+        """cards JSONL 한 줄에서 생성 (Evidence 객체 생성은 지연)"""
+        data = json.loads(line)
+        return cls(data, raw_evidences=data.get('evidences', []))
+
+    @classmethod
+    def from_summary(cls, entry: dict, source: str) -> 'CoverageCardView':
+        """summary sidecar 항목에서 생성 (evidence/snippet 미접근)"""
+        return cls(
+            entry,
+            top_evidence_ref=entry['top_evidence_ref'],
+            source=source,
+            span=(entry['offset'], entry['length'])
+        )
+
+    def _load_raw_evidences(self) -> list:
+        """summary 기반 view: cards JSONL의 해당 라인만 읽어 evidence dict 반환"""
+        offset, length = self._span
+        with open(self._source, 'rb') as f:
+            f.seek(offset)
+            data = json.loads(f.read(length).decode('utf-8'))
+        return data.get('evidences', [])
+
+    @property
+    def evidences(self) -> List[Evidence]:
+        """Evidence 목록 (최초 접근 시 decode)"""
+        if self._evidences is None:
+            raw = self._raw_evidences
+            if raw is None:
+                raw = self._load_raw_evidences()
+            self._evidences = [Evidence.from_dict(e) for e in raw]
+            self._raw_evidences = None
+        return self._evidences
+
+    def get_top_evidence_ref(self) -> str:
+        """
+        상위 evidence 참조 (CoverageCard.get_top_evidence_ref와 동일)
+
+        Returns:
+            str: "doc_type p.{page}" 형식 또는 "-"
+        """
+        if self._top_evidence_ref is None:
+            if self._evidences is not None:
+                top = self._evidences[0] if self._evidences else None
+                self._top_evidence_ref = f"{top.doc_type} p.{top.page}" if top else "-"
+            elif self._raw_evidences is not None:
+                self._top_evidence_ref = _top_ref_from_raw(self._raw_evidences)
+            else:
+                self._top_evidence_ref = _top_ref_from_raw(self._load_raw_evidences())
+        return self._top_evidence_ref
+
+    def to_card(self) -> CoverageCard:
+        """전체 CoverageCard로 변환 (evidence decode 포함)"""
+        return CoverageCard(
+            self.insurer,
+            self.coverage_name_raw,
+            self.coverage_code,
+            self.coverage_name_canonical,
+            self.mapping_status,
+            self.evidence_status,
+            list(self.evidences),
+            self.hits_by_doc_type,
+            self.flags
+        )
+
+
+def write_cards_summary(cards_jsonl, entries: Iterable[dict]) -> Path:
+    """
+    Summary sidecar 기록 (cards JSONL 기록 완료 후 호출)
+
+    Args:
+        cards_jsonl: 기록 완료된 cards JSONL 경로
+        entries: card_summary() 항목 + offset/length (cards JSONL 라인 순)
+
+    Returns:
+        Path: summary sidecar 경로
+    """
+    cards_jsonl = Path(cards_jsonl)
+    stat = cards_jsonl.stat()
+    summary = {
+        'source': cards_jsonl.name,
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'cards': list(entries)
+    }
+
+    summary_path = summary_path_for(cards_jsonl)
+    with atomic_write(summary_path) as f:
+        json.dump(summary, f, ensure_ascii=False)
+    return summary_path
+
+
+def load_cards_summary(cards_jsonl) -> Optional[List[dict]]:
+    """
+    Summary sidecar 로드
+
+    Returns:
+        카드 summary 목록, sidecar가 없거나 stale이면 None
+    """
+    cards_jsonl = Path(cards_jsonl)
+    summary_path = summary_path_for(cards_jsonl)
+    if not summary_path.exists() or not cards_jsonl.exists():
+        return None
+
+    with open(summary_path, 'r', encoding='utf-8') as f:
+        summary = json.load(f)
+
+    stat = os.stat(cards_jsonl)
+    if (summary.get('source_size') != stat.st_size
+            or summary.get('source_mtime_ns') != stat.st_mtime_ns):
+        return None
+    return summary['cards']
+
+
+def load_card_views(cards_jsonl, use_summary: bool = True) -> List[CoverageCardView]:
+    """
+    Coverage cards projection read
+
+    Args:
+        cards_jsonl: cards JSONL 경로
+        use_summary: 유효한 summary sidecar가 있으면 사용 (snippet 미접근)
+
+    Returns:
+        List[CoverageCardView]: cards JSONL 라인 순
+    """
+    if use_summary:
+        entries = load_cards_summary(cards_jsonl)
+        if entries is not None:
+            source = str(cards_jsonl)
+            return [CoverageCardView.from_summary(entry, source) for entry in entries]
+
+    views = []
+    with open(cards_jsonl, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                views.append(CoverageCardView.from_line(line))
+    return views
+
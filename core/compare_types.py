@@ -2,13 +2,28 @@
 Coverage Card 데이터 타입 정의
 
 Scope-only 비교를 위한 공용 스키마
+
+Evidence / CoverageCard는 __slots__ 기반이며, 반복되는 문자열
+(doc_type, file_path, insurer, status 값)은 intern하여 카드 간 공유한다.
 """
 
+import json
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+# JSONL 직렬화용 공용 encoder (json.dumps 호출마다 encoder를 새로 만들지 않음)
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_json_decode = json.JSONDecoder().decode
+
+
+def _intern(value):
+    """str이면 intern, 그 외(None 등)는 그대로 반환"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Evidence:
     """Evidence 항목"""
     doc_type: str
@@ -17,6 +32,11 @@ class Evidence:
     snippet: str
     match_keyword: str
 
+    def __post_init__(self):
+        # 같은 문서의 evidence는 doc_type/file_path 문자열을 공유
+        self.doc_type = _intern(self.doc_type)
+        self.file_path = _intern(self.file_path)
+
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
         return {
@@ -31,15 +51,15 @@ class Evidence:
     def from_dict(cls, data: dict) -> 'Evidence':
         """딕셔너리에서 생성"""
         return cls(
-            doc_type=data['doc_type'],
-            file_path=data['file_path'],
-            page=data['page'],
-            snippet=data['snippet'],
-            match_keyword=data['match_keyword']
+            data['doc_type'],
+            data['file_path'],
+            data['page'],
+            data['snippet'],
+            data['match_keyword']
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CoverageCard:
     """Coverage Card - 담보별 종합 정보"""
     insurer: str
@@ -52,6 +72,11 @@ class CoverageCard:
     hits_by_doc_type: dict = field(default_factory=dict)  # NEW
     flags: List[str] = field(default_factory=list)  # NEW
 
+    def __post_init__(self):
+        self.insurer = _intern(self.insurer)
+        self.mapping_status = _intern(self.mapping_status)
+        self.evidence_status = _intern(self.evidence_status)
+
     def to_dict(self) -> dict:
         """딕셔너리로 변환 (JSONL 출력용)"""
         return {
@@ -69,19 +94,35 @@ class CoverageCard:
     @classmethod
     def from_dict(cls, data: dict) -> 'CoverageCard':
         """딕셔너리에서 생성 (JSONL 읽기용)"""
-        evidences = [Evidence.from_dict(e) for e in data.get('evidences', [])]
+        evidences = [
+            Evidence(e['doc_type'], e['file_path'], e['page'], e['snippet'], e['match_keyword'])
+            for e in data.get('evidences', [])
+        ]
         return cls(
-            insurer=data['insurer'],
-            coverage_name_raw=data['coverage_name_raw'],
-            coverage_code=data.get('coverage_code'),
-            coverage_name_canonical=data.get('coverage_name_canonical'),
-            mapping_status=data['mapping_status'],
-            evidence_status=data['evidence_status'],
-            evidences=evidences,
-            hits_by_doc_type=data.get('hits_by_doc_type', {}),
-            flags=data.get('flags', [])
+            data['insurer'],
+            data['coverage_name_raw'],
+            data.get('coverage_code'),
+            data.get('coverage_name_canonical'),
+            data['mapping_status'],
+            data['evidence_status'],
+            evidences,
+            data.get('hits_by_doc_type', {}),
+            data.get('flags', [])
         )
 
+    def to_json(self) -> str:
+        """
+        JSONL 한 줄로 직렬화 (json.dumps(to_dict(), ensure_ascii=False)와 동일 출력)
+
+        to_dict() 후 공용 encoder로 인코딩한다 (중간 dict는 만든다).
+        """
+        return _JSON_ENCODER.encode(self.to_dict())
+
+    @classmethod
+    def from_json(cls, line: str) -> 'CoverageCard':
+        """JSONL 한 줄에서 생성 (공용 decoder로 dict 파싱 후 from_dict)"""
+        return cls.from_dict(_json_decode(line))
+
     def get_top_evidence_ref(self) -> str:
         """
         상위 evidence 참조 (리포트용)
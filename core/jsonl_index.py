@@ -0,0 +1,133 @@
+"""
+JSONL Byte-Offset Index
+
+cards / evidence pack JSONL의 coverage_code, coverage_name_raw → (offset, length)
+sidecar 인덱스. 단일 담보 조회 시 파일 전체를 decode하지 않고 해당 라인만 seek한다.
+
+Sidecar:
+- 경로: {JSONL stem}.index.json (예: samsung_evidence_pack.index.json)
+- 키별 최초 등장 라인만 기록 (기존 선형 스캔의 first-match 동작과 동일)
+- source_size / source_mtime_ns가 현재 JSONL과 다르면 stale로 보고
+  1회 스캔으로 메모리 인덱스를 만들어 사용
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from core.atomic_io import atomic_write
+
+
+INDEX_SUFFIX = ".index.json"
+INDEX_KEYS = ('coverage_code', 'coverage_name_raw')
+
+
+def index_path_for(jsonl_path) -> Path:
+    """JSONL 경로 → index sidecar 경로"""
+    jsonl_path = Path(jsonl_path)
+    return jsonl_path.with_name(jsonl_path.stem + INDEX_SUFFIX)
+
+
+class JsonlIndexBuilder:
+    """JSONL 기록 중 라인별 (offset, length)를 키 필드 값으로 누적"""
+
+    def __init__(self, keys: Iterable[str] = INDEX_KEYS):
+        self.keys = tuple(keys)
+        self.offsets: Dict[str, Dict[str, Tuple[int, int]]] = {key: {} for key in self.keys}
+
+    def add(self, item: dict, offset: int, length: int):
+        """라인 항목 등록 (키 값별 최초 등장만 유지)"""
+        for key in self.keys:
+            value = item.get(key)
+            if value and value not in self.offsets[key]:
+                self.offsets[key][value] = (offset, length)
+
+    def write(self, jsonl_path) -> Path:
+        """
+        Index sidecar 기록 (JSONL 기록 완료 후 호출)
+
+        Returns:
+            Path: index sidecar 경로
+        """
+        jsonl_path = Path(jsonl_path)
+        stat = jsonl_path.stat()
+        index = {
+            'source': jsonl_path.name,
+            'source_size': stat.st_size,
+            'source_mtime_ns': stat.st_mtime_ns,
+            'keys': {key: {v: list(span) for v, span in spans.items()} for key, spans in self.offsets.items()}
+        }
+
+        index_path = index_path_for(jsonl_path)
+        with atomic_write(index_path) as f:
+            json.dump(index, f, ensure_ascii=False)
+        return index_path
+
+
+def _scan_offsets(jsonl_path, keys: Iterable[str]) -> JsonlIndexBuilder:
+    """JSONL 1회 스캔으로 인덱스 생성"""
+    builder = JsonlIndexBuilder(keys)
+    offset = 0
+    with open(jsonl_path, 'rb') as f:
+        for raw in f:
+            if raw.strip():
+                builder.add(json.loads(raw), offset, len(raw))
+            offset += len(raw)
+    return builder
+
+
+def write_jsonl_index(jsonl_path, keys: Iterable[str] = INDEX_KEYS) -> Path:
+    """기존 JSONL을 스캔하여 index sidecar 생성"""
+    return _scan_offsets(jsonl_path, keys).write(jsonl_path)
+
+
+def _load_index(jsonl_path, keys: Tuple[str, ...]) -> Optional[Dict[str, Dict[str, Tuple[int, int]]]]:
+    """유효한 index sidecar 로드 (없거나 stale이거나 키가 부족하면 None)"""
+    index_path = index_path_for(jsonl_path)
+    if not index_path.exists():
+        return None
+
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+
+    stat = os.stat(jsonl_path)
+    if (index.get('source_size') != stat.st_size
+            or index.get('source_mtime_ns') != stat.st_mtime_ns):
+        return None
+    if not all(key in index.get('keys', {}) for key in keys):
+        return None
+    return {key: index['keys'][key] for key in keys}
+
+
+class JsonlIndexedReader:
+    """
+    키 기반 JSONL 라인 조회
+
+    index sidecar가 유효하면 그대로 사용하고, 아니면 1회 스캔으로 메모리 인덱스를 만든다.
+    이후 조회는 seek + 해당 라인만 decode.
+    """
+
+    def __init__(self, jsonl_path, keys: Iterable[str] = INDEX_KEYS):
+        self.path = Path(jsonl_path)
+        self.keys = tuple(keys)
+        offsets = _load_index(self.path, self.keys)
+        self.from_sidecar = offsets is not None
+        if offsets is None:
+            offsets = _scan_offsets(self.path, self.keys).offsets
+        self.offsets = offsets
+
+    def get(self, key: str, value: str) -> Optional[dict]:
+        """
+        key 필드 값이 value인 최초 라인 반환
+
+        Returns:
+            decode된 JSON 객체, 없으면 None
+        """
+        span = self.offsets[key].get(value)
+        if span is None:
+            return None
+        offset, length = span
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
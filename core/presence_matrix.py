@@ -0,0 +1,104 @@
+"""
+Coverage Presence Matrix (codes × insurers)
+
+Multi-insurer 통계(Step 8)용 presence matrix.
+행(code)과 열(insurer)을 모두 Python int bitset으로 보관하여
+공통/고유 code, code별 insurer 수, insurer 간 Jaccard 유사도를
+bitwise 연산으로 계산한다 (numpy 의존성 없음).
+
+- rows[r]: code r을 가진 insurer bitset (bit i = insurers[i])
+- columns[i]: insurer i가 가진 code bitset (bit r = codes[r])
+- codes는 오름차순 정렬 → bitset 순회 결과도 coverage_code 오름차순
+"""
+
+from typing import Dict, Iterable, Iterator, List
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """set bit 위치를 오름차순으로 순회"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class PresenceMatrix:
+    """codes × insurers presence matrix (int bitset 기반)"""
+
+    __slots__ = ('codes', 'insurers', 'code_index', 'insurer_index', 'rows', 'columns')
+
+    def __init__(self, codes_by_insurer: Dict[str, Iterable[str]]):
+        """
+        Args:
+            codes_by_insurer: insurer → 보유 coverage_code 목록 (insurer 순서 유지)
+        """
+        code_sets = {insurer: set(codes) for insurer, codes in codes_by_insurer.items()}
+
+        self.insurers: List[str] = list(code_sets.keys())
+        self.insurer_index: Dict[str, int] = {ins: i for i, ins in enumerate(self.insurers)}
+        self.codes: List[str] = sorted(set().union(*code_sets.values()))
+        # O(1) code → row index (리포트 렌더링용)
+        self.code_index: Dict[str, int] = {code: r for r, code in enumerate(self.codes)}
+
+        self.rows: List[int] = [0] * len(self.codes)
+        self.columns: List[int] = [0] * len(self.insurers)
+        for i, insurer in enumerate(self.insurers):
+            column = 0
+            for code in code_sets[insurer]:
+                r = self.code_index[code]
+                self.rows[r] |= 1 << i
+                column |= 1 << r
+            self.columns[i] = column
+
+    def _codes_of(self, code_mask: int) -> List[str]:
+        """code bitset → coverage_code 목록 (오름차순)"""
+        return [self.codes[r] for r in _iter_bits(code_mask)]
+
+    def common_to_all(self) -> List[str]:
+        """모든 insurer에 있는 code (오름차순)"""
+        if not self.columns:
+            return []
+        mask = self.columns[0]
+        for column in self.columns[1:]:
+            mask &= column
+        return self._codes_of(mask)
+
+    def unique_per_insurer(self) -> Dict[str, List[str]]:
+        """insurer별 해당 insurer에만 있는 code (오름차순)"""
+        # insurer bitset이 단일 bit인 code 행 = 정확히 한 insurer에만 존재
+        single = 0
+        for r, row in enumerate(self.rows):
+            if row and not row & (row - 1):
+                single |= 1 << r
+        return {
+            insurer: self._codes_of(self.columns[i] & single)
+            for i, insurer in enumerate(self.insurers)
+        }
+
+    def insurer_counts(self) -> Dict[str, int]:
+        """code별 보유 insurer 수 (code 오름차순)"""
+        return {code: self.rows[r].bit_count() for r, code in enumerate(self.codes)}
+
+    def insurers_of(self, code: str) -> List[str]:
+        """code를 가진 insurer 목록 (insurer 순서)"""
+        return [self.insurers[i] for i in _iter_bits(self.rows[self.code_index[code]])]
+
+    def pairwise_jaccard(self, ndigits: int = 4) -> Dict[str, Dict[str, float]]:
+        """
+        insurer 간 code 집합 Jaccard 유사도
+
+        Returns:
+            Dict[insurer_a, Dict[insurer_b, |A∩B| / |A∪B|]] (합집합이 비면 0.0)
+        """
+        result = {insurer: {} for insurer in self.insurers}
+        for i, a in enumerate(self.insurers):
+            col_a = self.columns[i]
+            result[a][a] = 1.0 if col_a else 0.0
+            for j in range(i + 1, len(self.insurers)):
+                b = self.insurers[j]
+                col_b = self.columns[j]
+                union = (col_a | col_b).bit_count()
+                value = round((col_a & col_b).bit_count() / union, ndigits) if union else 0.0
+                result[a][b] = value
+                result[b][a] = value
+        return result
@@ -0,0 +1,118 @@
+"""
+Regex per-match time budget (runtime guard).
+
+tools/gate_engine.GateEngine(budget=RegexBudget(...)) / Step 8 SlotEngine(budget=...)은 compiled 패턴을
+BudgetedPattern으로 감싸 search 1회마다 소요 시간을 재고, budget을 넘은 패턴을 기록한다.
+Python re는 실행 중 중단할 수 없으므로 budget은 매칭 종료 후 판정한다.
+
+- on_exceed="record": 기록만 (판정 결과 불변)
+- on_exceed="raise":  기록 후 RegexBudgetExceeded (CI / 회귀 검사용 fail-fast)
+
+파이프라인은 실행 종료 시 data/regex_budget_overruns.json(로컬 실행 상태, git 제외)에 패턴별로 누적한다.
+정적 분석(코퍼스 벤치마크 / super-linear 탐지)은 tools/regex_cost.py.
+"""
+
+import json
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, List
+
+from core.atomic_io import atomic_write
+
+DEFAULT_OVERRUN_PATH = Path(__file__).parent.parent / "data" / "regex_budget_overruns.json"
+
+ON_EXCEED_MODES = ("record", "raise")
+
+
+class RegexBudgetExceeded(RuntimeError):
+    def __init__(self, pattern: str, elapsed_ns: int, budget_ns: int):
+        super().__init__(f"regex {pattern!r} took {elapsed_ns / 1000:.1f}us (budget {budget_ns / 1000:.1f}us)")
+        self.pattern = pattern
+        self.elapsed_ns = elapsed_ns
+
+
+class RegexBudget:
+    """
+    패턴별 budget 초과 기록
+
+    overruns: pattern → {"count", "total_ns", "max_ns", "max_text_len"}
+    """
+
+    __slots__ = ('budget_ns', 'on_exceed', 'overruns')
+
+    def __init__(self, budget_us: float, on_exceed: str = "record"):
+        if on_exceed not in ON_EXCEED_MODES:
+            raise ValueError(f"on_exceed must be one of {ON_EXCEED_MODES}: {on_exceed}")
+        self.budget_ns = int(budget_us * 1000)
+        self.on_exceed = on_exceed
+        self.overruns: Dict[str, dict] = {}
+
+    def wrap(self, compiled) -> 'BudgetedPattern':
+        return BudgetedPattern(compiled, self)
+
+    def record(self, pattern: str, elapsed_ns: int, text_len: int):
+        entry = self.overruns.get(pattern)
+        if entry is None:
+            entry = self.overruns[pattern] = {"count": 0, "total_ns": 0, "max_ns": 0, "max_text_len": 0}
+        entry["count"] += 1
+        entry["total_ns"] += elapsed_ns
+        if elapsed_ns > entry["max_ns"]:
+            entry["max_ns"] = elapsed_ns
+            entry["max_text_len"] = text_len
+        if self.on_exceed == "raise":
+            raise RegexBudgetExceeded(pattern, elapsed_ns, self.budget_ns)
+
+    def merge(self, other: 'RegexBudget') -> 'RegexBudget':
+        for pattern, theirs in other.overruns.items():
+            entry = self.overruns.setdefault(pattern, {"count": 0, "total_ns": 0, "max_ns": 0, "max_text_len": 0})
+            entry["count"] += theirs["count"]
+            entry["total_ns"] += theirs["total_ns"]
+            if theirs["max_ns"] > entry["max_ns"]:
+                entry["max_ns"] = theirs["max_ns"]
+                entry["max_text_len"] = theirs["max_text_len"]
+        return self
+
+    def summary(self, top: int = 10) -> List[str]:
+        """최대 소요 시간 내림차순 요약 줄"""
+        ranked = sorted(self.overruns.items(), key=lambda item: -item[1]["max_ns"])
+        return [f"{entry['max_ns'] / 1000:10.1f}us max  x{entry['count']:<6d} len={entry['max_text_len']:<7d} {pattern}"
+                for pattern, entry in ranked[:top]]
+
+
+class BudgetedPattern:
+    """re.Pattern.search 대체 (소요 시간 측정 후 budget 초과 기록)"""
+
+    __slots__ = ('compiled', 'budget')
+
+    def __init__(self, compiled, budget: RegexBudget):
+        self.compiled = compiled
+        self.budget = budget
+
+    @property
+    def pattern(self) -> str:
+        return self.compiled.pattern
+
+    def search(self, text: str):
+        start = perf_counter_ns()
+        match = self.compiled.search(text)
+        elapsed = perf_counter_ns() - start
+        if elapsed > self.budget.budget_ns:
+            self.budget.record(self.compiled.pattern, elapsed, len(text))
+        return match
+
+
+def record_regex_overruns(budget: RegexBudget, path: Path = DEFAULT_OVERRUN_PATH) -> Path:
+    """이번 실행 초과 기록을 기존 파일에 누적 (budget_us는 마지막 실행 값)"""
+    path = Path(path)
+    merged = RegexBudget(budget.budget_ns / 1000)
+    if path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            merged.overruns = json.load(f).get("patterns", {})
+    merged.merge(budget)
+    data = {
+        "budget_us": budget.budget_ns / 1000,
+        "patterns": dict(sorted(merged.overruns.items(), key=lambda item: -item[1]["max_ns"])),
+    }
+    with atomic_write(path) as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
@@ -0,0 +1,309 @@
+"""
+Single coverage multi-insurer 비교 엔진 (fact-only)
+
+Step 8 batch 모드(extract_single_coverage)와 Step 10(compare_matrix / compare_a4200_1_all)이
+공유하는 profile 로드 / code × insurer × slot 상태 테이블 / 비교 JSON · 리포트 기록.
+
+출력:
+- data/single/{coverage_code 소문자}_all_compare.json
+- reports/{coverage_code 소문자}_all_insurers.md
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.atomic_io import atomic_write
+
+
+DEFAULT_TARGETS_CONFIG = Path(__file__).parent.parent / 'data' / 'metadata' / 'single_compare_targets.json'
+
+# Slot 순서 (Step 8 profile 슬롯)
+SLOT_KEYS = [
+    'payout_amount',
+    'waiting_period',
+    'reduction_period',
+    'excluded_cancer',
+    'definition_excerpt',
+    'payment_condition_excerpt'
+]
+
+# 리포트 slot 표시명
+SLOT_NAMES = {
+    'payout_amount': 'Payout Amount',
+    'waiting_period': 'Waiting Period',
+    'reduction_period': 'Reduction Period',
+    'excluded_cancer': 'Excluded Cancer',
+    'definition_excerpt': 'Definition Excerpt',
+    'payment_condition_excerpt': 'Payment Condition'
+}
+
+
+def load_compare_targets(config_path: Optional[Path] = None) -> Tuple[Dict[str, Dict], List[str]]:
+    """
+    비교 대상 config 로드
+
+    Args:
+        config_path: targets JSON 경로 (기본: data/metadata/single_compare_targets.json)
+
+    Returns:
+        (Dict[coverage_code, {'canonical_name', 'title_name'}], 보험사 목록 - 빈 목록이면 전체)
+    """
+    config_path = Path(config_path) if config_path else DEFAULT_TARGETS_CONFIG
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f) or {}
+
+    targets = {}
+    for item in config.get('coverages') or []:
+        targets[item['coverage_code']] = {
+            'canonical_name': item.get('canonical_name'),
+            'title_name': item.get('title_name')
+        }
+    return targets, list(config.get('insurers') or [])
+
+
+def load_profiles(
+    base_dir: Path,
+    coverage_codes: List[str],
+    insurers: Optional[List[str]] = None
+) -> Dict[str, Dict[str, Dict]]:
+    """
+    대상 code의 profile 일괄 로드 (data/single 1회 glob, profile당 1회 로드)
+
+    Args:
+        base_dir: 프로젝트 루트
+        coverage_codes: 대상 coverage_code 목록
+        insurers: 대상 보험사 (None/빈 목록이면 전체)
+
+    Returns:
+        Dict[coverage_code, Dict[insurer, profile]]
+    """
+    profiles: Dict[str, Dict[str, Dict]] = {code: {} for code in coverage_codes}
+    single_dir = base_dir / 'data' / 'single'
+    if not single_dir.exists():
+        return profiles
+
+    insurer_filter = set(insurers) if insurers else None
+    # 긴 code 우선 매칭 ({insurer}_{code}_profile에서 code 접미사 판별)
+    codes_by_length = sorted(coverage_codes, key=len, reverse=True)
+
+    for profile_file in single_dir.glob('*_profile.json'):
+        stem = profile_file.stem[:-len('_profile')]
+        code = next((c for c in codes_by_length if stem.endswith(f'_{c}')), None)
+        if code is None:
+            continue
+        insurer = stem[:-len(code) - 1]
+        if insurer_filter is not None and insurer not in insurer_filter:
+            continue
+
+        with open(profile_file, 'r', encoding='utf-8') as f:
+            profile = json.load(f)
+        # Validate coverage_code
+        if profile.get('coverage_code') == code:
+            profiles[code][insurer] = profile
+
+    return profiles
+
+
+class SlotStatusTable:
+    """
+    code × insurer × slot columnar 상태 테이블
+
+    (code, insurer) 셀은 present / doc_type_coverage 컬럼,
+    (code, insurer, slot) 셀은 status / refs / has_text 컬럼에 평탄화하여 보관한다.
+    """
+
+    def __init__(self, profiles_by_code: Dict[str, Dict[str, Dict]], coverage_codes: List[str]):
+        self.codes = list(coverage_codes)
+        self.insurers = sorted({ins for code in self.codes for ins in profiles_by_code.get(code, {})})
+        self.slots = list(SLOT_KEYS)
+        self.code_index = {code: c for c, code in enumerate(self.codes)}
+        self.insurer_index = {ins: i for i, ins in enumerate(self.insurers)}
+        self.canonical_names: Dict[str, str] = {}
+
+        cells = len(self.codes) * len(self.insurers)
+        slot_cells = cells * len(self.slots)
+        self.present: List[bool] = [False] * cells
+        self.doc_type_coverage: List[Optional[Dict]] = [None] * cells
+        self.status: List[Optional[str]] = [None] * slot_cells
+        self.refs: List[Optional[List[str]]] = [None] * slot_cells
+        self.has_text: List[bool] = [False] * slot_cells
+
+        for code in self.codes:
+            profiles = profiles_by_code.get(code, {})
+            self.canonical_names[code] = next(
+                (profiles[i].get('canonical_name') for i in sorted(profiles) if profiles[i].get('canonical_name')),
+                ''
+            )
+            for insurer, profile in profiles.items():
+                cell = self._cell(code, insurer)
+                self.present[cell] = True
+                self.doc_type_coverage[cell] = profile.get('doc_type_coverage', {})
+                for s, slot_key in enumerate(self.slots):
+                    slot_data = profile.get(slot_key, {})
+                    pos = cell * len(self.slots) + s
+                    self.status[pos] = slot_data.get('status', 'unknown')
+                    self.refs[pos] = slot_data.get('refs', [])
+                    self.has_text[pos] = slot_data.get('text') is not None
+
+    def _cell(self, code: str, insurer: str) -> int:
+        return self.code_index[code] * len(self.insurers) + self.insurer_index[insurer]
+
+    def insurers_of(self, code: str) -> List[str]:
+        """code profile이 있는 보험사 (오름차순)"""
+        base = self.code_index[code] * len(self.insurers)
+        return [ins for i, ins in enumerate(self.insurers) if self.present[base + i]]
+
+    def comparison(self, code: str, canonical_name: Optional[str] = None) -> Dict:
+        """
+        code별 비교 JSON (Step 10 a4200_1_all_compare.json 포맷)
+
+        Args:
+            code: coverage_code
+            canonical_name: 표시명 (None이면 profile canonical_name)
+        """
+        insurers = self.insurers_of(code)
+        comparison = {
+            'coverage_code': code,
+            'canonical_name': canonical_name if canonical_name is not None else self.canonical_names[code],
+            'insurers': insurers,
+            'count': len(insurers),
+            'doc_type_coverage': {},
+            'slot_status': {}
+        }
+
+        for insurer in insurers:
+            comparison['doc_type_coverage'][insurer] = self.doc_type_coverage[self._cell(code, insurer)]
+
+        for s, slot_key in enumerate(self.slots):
+            comparison['slot_status'][slot_key] = {}
+            for insurer in insurers:
+                pos = self._cell(code, insurer) * len(self.slots) + s
+                comparison['slot_status'][slot_key][insurer] = {
+                    'status': self.status[pos],
+                    'refs': self.refs[pos],
+                    'has_text': self.has_text[pos]
+                }
+
+        return comparison
+
+    def to_dict(self) -> Dict:
+        """columnar JSON (code 우선, insurer, slot 순 평탄화)"""
+        return {
+            'codes': self.codes,
+            'insurers': self.insurers,
+            'slots': self.slots,
+            'present': self.present,
+            'status': self.status,
+            'has_text': self.has_text
+        }
+
+
+def render_markdown_report(comparison: Dict, title_name: Optional[str] = None) -> str:
+    """
+    마크다운 리포트 생성 (fact-only)
+
+    Args:
+        comparison: SlotStatusTable.comparison() 결과
+        title_name: 제목 표시명 (None이면 canonical_name)
+
+    Returns:
+        str: 마크다운 텍스트
+    """
+    lines = []
+
+    coverage_code = comparison['coverage_code']
+    if title_name is None:
+        title_name = comparison['canonical_name']
+
+    # Title
+    lines.append(f"# Multi-Insurer {coverage_code} ({title_name}) Comparison")
+    lines.append("")
+    lines.append(f"**Coverage Code**: {coverage_code}")
+    lines.append(f"**Canonical Name**: {comparison['canonical_name']}")
+    lines.append(f"**Insurers**: {', '.join([i.upper() for i in comparison['insurers']])}")
+    lines.append(f"**Count**: {comparison['count']}")
+    lines.append("")
+
+    # Document Type Coverage
+    lines.append("## Document Type Coverage")
+    lines.append("")
+    lines.append(f"| Insurer | 약관 | 사업방법서 | 상품요약서 |")
+    lines.append("|---|---|---|---|")
+
+    for insurer in comparison['insurers']:
+        doc_cov = comparison['doc_type_coverage'][insurer]
+        policy = doc_cov.get('약관', 0)
+        method = doc_cov.get('사업방법서', 0)
+        summary = doc_cov.get('상품요약서', 0)
+        lines.append(f"| {insurer.upper()} | {policy} | {method} | {summary} |")
+
+    lines.append("")
+
+    # Slot Status Summary
+    lines.append("## Slot Status Summary")
+    lines.append("")
+
+    for slot_key, slot_name in SLOT_NAMES.items():
+        lines.append(f"### {slot_name}")
+        lines.append("")
+        lines.append(f"| Insurer | Status | Evidence Refs |")
+        lines.append("|---|---|---|")
+
+        slot_data = comparison['slot_status'][slot_key]
+        for insurer in comparison['insurers']:
+            data = slot_data[insurer]
+            status = data['status']
+            refs = ', '.join(data['refs']) if data['refs'] else '-'
+            lines.append(f"| {insurer.upper()} | {status} | {refs} |")
+
+        lines.append("")
+
+    return '\n'.join(lines)
+
+
+def write_code_outputs(base_dir: Path, comparison: Dict, title_name: Optional[str] = None) -> Tuple[Path, Path]:
+    """
+    code별 비교 JSON / 리포트 저장
+
+    Returns:
+        (compare JSON 경로, report MD 경로)
+    """
+    coverage_code = comparison['coverage_code']
+
+    output_dir = base_dir / 'data' / 'single'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    compare_file = output_dir / f'{coverage_code.lower()}_all_compare.json'
+    with atomic_write(compare_file) as f:
+        json.dump(comparison, f, ensure_ascii=False, indent=2)
+
+    report_dir = base_dir / 'reports'
+    report_dir.mkdir(parents=True, exist_ok=True)
+    report_file = report_dir / f'{coverage_code.lower()}_all_insurers.md'
+    with atomic_write(report_file) as f:
+        f.write(render_markdown_report(comparison, title_name))
+
+    return compare_file, report_file
+
+
+def write_multi_insurer_comparison(
+    base_dir: Path,
+    profiles: Dict[str, Dict],
+    coverage_code: str
+) -> Tuple[Dict, Path, Path]:
+    """
+    code 1개의 보험사별 profile → 비교 JSON/리포트 생성 및 저장
+    (표시명은 single_compare_targets.json, 없으면 profile canonical_name)
+
+    출력:
+    - data/single/{coverage_code 소문자}_all_compare.json
+    - reports/{coverage_code 소문자}_all_insurers.md
+
+    Returns:
+        (비교 결과, compare JSON 경로, report MD 경로)
+    """
+    target = load_compare_targets()[0].get(coverage_code, {})
+    table = SlotStatusTable({coverage_code: profiles}, [coverage_code])
+    comparison = table.comparison(coverage_code, target.get('canonical_name'))
+    compare_file, report_file = write_code_outputs(base_dir, comparison, target.get('title_name'))
+    return comparison, compare_file, report_file
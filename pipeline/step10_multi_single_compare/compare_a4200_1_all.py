@@ -2,6 +2,7 @@
 Step 10: Multi-Insurer Single Coverage Comparison (A4200_1)
 
 전체 보험사의 A4200_1(암진단비) 비교 (fact-only)
+(비교/렌더링은 core.single_compare 엔진 사용 - Step 8 batch 모드와 공유)
 
 입력:
 - data/single/*_A4200_1_profile.json
@@ -12,78 +13,67 @@ Step 10: Multi-Insurer Single Coverage Comparison (A4200_1)
 """
 
 import argparse
-import json
+import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict
 
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-def load_all_a4200_1_profiles(base_dir: Path) -> Dict[str, Dict]:
+from core.single_compare import (
+    SlotStatusTable, load_compare_targets, load_profiles, render_markdown_report, write_multi_insurer_comparison
+)
+
+
+DEFAULT_COVERAGE_CODE = 'A4200_1'
+
+
+def _target(coverage_code: str) -> Dict:
+    """config(single_compare_targets.json)의 code 표시명"""
+    targets, _ = load_compare_targets()
+    return targets.get(coverage_code, {})
+
+
+def load_all_profiles(base_dir: Path, coverage_code: str) -> Dict[str, Dict]:
     """
-    모든 A4200_1 profile 로드
+    모든 보험사의 coverage_code profile 로드
 
     Args:
         base_dir: 프로젝트 루트
+        coverage_code: Coverage code
 
     Returns:
         Dict[insurer, profile]
     """
-    profiles = {}
-    single_dir = base_dir / 'data' / 'single'
+    return load_profiles(base_dir, [coverage_code])[coverage_code]
+
 
-    if not single_dir.exists():
-        return profiles
+def load_all_a4200_1_profiles(base_dir: Path) -> Dict[str, Dict]:
+    """
+    모든 A4200_1 profile 로드
 
-    for profile_file in single_dir.glob('*_A4200_1_profile.json'):
-        insurer = profile_file.stem.replace('_A4200_1_profile', '')
-        with open(profile_file, 'r', encoding='utf-8') as f:
-            profile = json.load(f)
-            # Validate coverage_code
-            if profile.get('coverage_code') == 'A4200_1':
-                profiles[insurer] = profile
+    Args:
+        base_dir: 프로젝트 루트
 
-    return profiles
+    Returns:
+        Dict[insurer, profile]
+    """
+    return load_all_profiles(base_dir, 'A4200_1')
 
 
-def generate_comparison_json(profiles: Dict[str, Dict]) -> Dict:
+def generate_comparison_json(profiles: Dict[str, Dict], coverage_code: str = DEFAULT_COVERAGE_CODE) -> Dict:
     """
     비교 JSON 생성
 
     Args:
         profiles: insurer별 profile
+        coverage_code: Coverage code
 
     Returns:
         Dict: 비교 결과
     """
-    insurers = sorted(profiles.keys())
-
-    comparison = {
-        'coverage_code': 'A4200_1',
-        'canonical_name': '암진단비(유사암제외)',
-        'insurers': insurers,
-        'count': len(insurers),
-        'doc_type_coverage': {},
-        'slot_status': {}
-    }
-
-    # Doc type coverage
-    for insurer in insurers:
-        comparison['doc_type_coverage'][insurer] = profiles[insurer].get('doc_type_coverage', {})
-
-    # Slot status
-    slot_keys = ['payout_amount', 'waiting_period', 'reduction_period', 'excluded_cancer', 'definition_excerpt', 'payment_condition_excerpt']
-
-    for slot_key in slot_keys:
-        comparison['slot_status'][slot_key] = {}
-        for insurer in insurers:
-            profile = profiles[insurer]
-            slot_data = profile.get(slot_key, {})
-            comparison['slot_status'][slot_key][insurer] = {
-                'status': slot_data.get('status', 'unknown'),
-                'refs': slot_data.get('refs', []),
-                'has_text': slot_data.get('text') is not None
-            }
-
-    return comparison
+    table = SlotStatusTable({coverage_code: profiles}, [coverage_code])
+    return table.comparison(coverage_code, _target(coverage_code).get('canonical_name'))
 
 
 def generate_markdown_report(comparison: Dict, profiles: Dict[str, Dict]) -> str:
@@ -92,66 +82,12 @@ def generate_markdown_report(comparison: Dict, profiles: Dict[str, Dict]) -> str
 
     Args:
         comparison: 비교 결과
-        profiles: insurer별 profile
+        profiles: insurer별 profile (사용하지 않음, 기존 호출 호환용으로 유지)
 
     Returns:
         str: 마크다운 텍스트
     """
-    lines = []
-
-    # Title
-    lines.append(f"# Multi-Insurer A4200_1 (암진단비) Comparison")
-    lines.append("")
-    lines.append(f"**Coverage Code**: A4200_1")
-    lines.append(f"**Canonical Name**: 암진단비(유사암제외)")
-    lines.append(f"**Insurers**: {', '.join([i.upper() for i in comparison['insurers']])}")
-    lines.append(f"**Count**: {comparison['count']}")
-    lines.append("")
-
-    # Document Type Coverage
-    lines.append("## Document Type Coverage")
-    lines.append("")
-    lines.append(f"| Insurer | 약관 | 사업방법서 | 상품요약서 |")
-    lines.append("|---|---|---|---|")
-
-    for insurer in comparison['insurers']:
-        doc_cov = comparison['doc_type_coverage'][insurer]
-        policy = doc_cov.get('약관', 0)
-        method = doc_cov.get('사업방법서', 0)
-        summary = doc_cov.get('상품요약서', 0)
-        lines.append(f"| {insurer.upper()} | {policy} | {method} | {summary} |")
-
-    lines.append("")
-
-    # Slot Status Summary
-    lines.append("## Slot Status Summary")
-    lines.append("")
-
-    slot_names = {
-        'payout_amount': 'Payout Amount',
-        'waiting_period': 'Waiting Period',
-        'reduction_period': 'Reduction Period',
-        'excluded_cancer': 'Excluded Cancer',
-        'definition_excerpt': 'Definition Excerpt',
-        'payment_condition_excerpt': 'Payment Condition'
-    }
-
-    for slot_key, slot_name in slot_names.items():
-        lines.append(f"### {slot_name}")
-        lines.append("")
-        lines.append(f"| Insurer | Status | Evidence Refs |")
-        lines.append("|---|---|---|")
-
-        slot_data = comparison['slot_status'][slot_key]
-        for insurer in comparison['insurers']:
-            data = slot_data[insurer]
-            status = data['status']
-            refs = ', '.join(data['refs']) if data['refs'] else '-'
-            lines.append(f"| {insurer.upper()} | {status} | {refs} |")
-
-        lines.append("")
-
-    return '\n'.join(lines)
+    return render_markdown_report(comparison, _target(comparison['coverage_code']).get('title_name'))
 
 
 def main():
@@ -173,25 +109,8 @@ def main():
     print(f"[Step 10] Found {len(profiles)} insurers with A4200_1 profile")
     print(f"[Step 10] Insurers: {', '.join(sorted(profiles.keys()))}")
 
-    # Generate comparison
-    comparison = generate_comparison_json(profiles)
-
-    # Save comparison JSON
-    output_dir = base_dir / 'data' / 'single'
-    output_dir.mkdir(parents=True, exist_ok=True)
-    compare_file = output_dir / 'a4200_1_all_compare.json'
-
-    with open(compare_file, 'w', encoding='utf-8') as f:
-        json.dump(comparison, f, ensure_ascii=False, indent=2)
-
-    # Generate and save report
-    report_text = generate_markdown_report(comparison, profiles)
-    report_dir = base_dir / 'reports'
-    report_dir.mkdir(parents=True, exist_ok=True)
-    report_file = report_dir / 'a4200_1_all_insurers.md'
-
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(report_text)
+    # Generate comparison + save JSON/report
+    comparison, compare_file, report_file = write_multi_insurer_comparison(base_dir, profiles, 'A4200_1')
 
     print(f"\n[Step 10] Comparison completed:")
     print(f"  - Total insurers: {comparison['count']}")
@@ -0,0 +1,112 @@
+"""
+Step 10: Multi-Insurer × Multi-Coverage Single Coverage Comparison Matrix
+
+N개 보험사 × M개 coverage_code 비교 엔진 (fact-only)
+
+- 대상 coverage_code / 표시명은 data/metadata/single_compare_targets.json에서 읽는다
+- data/single/*_profile.json은 1회 glob, profile당 1회만 로드
+- code × insurer × slot 상태를 columnar table(SlotStatusTable)로 구성
+- code별 비교 JSON / 마크다운 리포트는 thread pool로 병렬 렌더링
+
+입력:
+- data/single/{INSURER}_{COVERAGE_CODE}_profile.json
+- data/metadata/single_compare_targets.json
+  - coverages[].coverage_code: 필수 (code 추가 = 항목 추가)
+  - coverages[].canonical_name: 비교 JSON/리포트 표시명 (생략 시 profile의 canonical_name)
+  - coverages[].title_name: 리포트 제목 표시명 (생략 시 canonical_name)
+  - insurers: 비교 대상 보험사 (생략/빈 목록이면 profile이 있는 전체 보험사)
+
+출력:
+- data/single/{coverage_code 소문자}_all_compare.json
+- reports/{coverage_code 소문자}_all_insurers.md
+- data/single/slot_status_matrix.json (columnar slot 상태 테이블)
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.atomic_io import atomic_write
+from core.single_compare import SlotStatusTable, load_compare_targets, load_profiles, write_code_outputs
+
+
+def run_compare_matrix(
+    base_dir: Path,
+    targets: Dict[str, Dict],
+    insurers: Optional[List[str]] = None,
+    jobs: int = 4
+) -> SlotStatusTable:
+    """
+    N 보험사 × M coverage 비교 실행
+
+    Args:
+        base_dir: 프로젝트 루트
+        targets: Dict[coverage_code, {'canonical_name', 'title_name'}]
+        insurers: 대상 보험사 (None/빈 목록이면 전체)
+        jobs: 렌더링 thread 수
+
+    Returns:
+        SlotStatusTable
+    """
+    codes = list(targets.keys())
+    profiles_by_code = load_profiles(base_dir, codes, insurers)
+    table = SlotStatusTable(profiles_by_code, codes)
+
+    def render(code: str):
+        target = targets[code]
+        comparison = table.comparison(code, target.get('canonical_name'))
+        return write_code_outputs(base_dir, comparison, target.get('title_name'))
+
+    # profile이 있는 code만 렌더링
+    rendered_codes = [code for code in codes if table.insurers_of(code)]
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        list(executor.map(render, rendered_codes))
+
+    matrix_file = base_dir / 'data' / 'single' / 'slot_status_matrix.json'
+    matrix_file.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_write(matrix_file) as f:
+        json.dump(table.to_dict(), f, ensure_ascii=False)
+
+    return table
+
+
+def main():
+    """CLI 엔트리포인트"""
+    parser = argparse.ArgumentParser(description='Compare coverage codes across insurers')
+    parser.add_argument('--config', type=str, default=None, help='targets JSON (기본: data/metadata/single_compare_targets.json)')
+    parser.add_argument('--coverage-codes', type=str, help='config 대신 사용할 code (쉼표 구분)')
+    parser.add_argument('--insurers', type=str, help='대상 보험사 (쉼표 구분, 기본: config 또는 전체)')
+    parser.add_argument('--jobs', type=int, default=4, help='렌더링 thread 수')
+    args = parser.parse_args()
+
+    base_dir = Path(__file__).parent.parent.parent
+
+    targets, insurers = load_compare_targets(args.config)
+    if args.coverage_codes:
+        codes = [c.strip() for c in args.coverage_codes.split(',') if c.strip()]
+        targets = {code: targets.get(code, {}) for code in codes}
+    if args.insurers:
+        insurers = [i.strip() for i in args.insurers.split(',') if i.strip()]
+
+    print(f"[Step 10] Multi-Insurer Coverage Comparison Matrix")
+    print(f"[Step 10] Coverage Codes: {', '.join(targets)}")
+    print(f"[Step 10] Insurers: {', '.join(insurers) if insurers else 'all'}")
+
+    table = run_compare_matrix(base_dir, targets, insurers, jobs=args.jobs)
+
+    print(f"\n[Step 10] Comparison completed:")
+    for code in table.codes:
+        print(f"  - {code}: {len(table.insurers_of(code))} insurers")
+    print(f"\n✓ Compare JSON: {base_dir / 'data' / 'single'}/{{coverage_code}}_all_compare.json")
+    print(f"✓ Report MD: {base_dir / 'reports'}/{{coverage_code}}_all_insurers.md")
+    print(f"✓ Matrix: {base_dir / 'data' / 'single' / 'slot_status_matrix.json'}")
+
+
+if __name__ == '__main__':
+    main()
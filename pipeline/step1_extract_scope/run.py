@@ -15,6 +15,7 @@ from typing import List, Dict
 import pdfplumber
 import re
 from .hardening import hardening_correction
+from core.atomic_io import atomic_write
 
 
 class ScopeExtractor:
@@ -131,7 +132,7 @@ class ScopeExtractor:
         """
         output_path = self.output_dir / f"{self.insurer}_scope.csv"
 
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with atomic_write(output_path, newline='') as f:
             writer = csv.DictWriter(f, fieldnames=["coverage_name_raw", "insurer", "source_page"])
             writer.writeheader()
             writer.writerows(coverages)
@@ -11,8 +11,15 @@ LLM 금지 - exact/normalized matching만 사용
 import csv
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
-import openpyxl
+from typing import Dict, List, Optional, Tuple
+from core.atomic_io import atomic_write
+
+
+MAPPED_FIELDNAMES = [
+    'coverage_name_raw', 'insurer', 'source_page',
+    'coverage_code', 'coverage_name_canonical',
+    'mapping_status', 'match_type'
+]
 
 
 class CanonicalMapper:
@@ -53,6 +60,8 @@ class CanonicalMapper:
         if not self.mapping_excel_path.exists():
             raise FileNotFoundError(f"Mapping excel not found: {self.mapping_excel_path}")
 
+        import openpyxl
+
         wb = openpyxl.load_workbook(self.mapping_excel_path, data_only=True)
         ws = wb.active
 
@@ -144,31 +153,17 @@ class CanonicalMapper:
         }
 
 
-def map_scope_to_canonical(
-    scope_csv_path: str,
-    mapping_excel_path: str,
-    output_csv_path: str
-) -> Dict:
+def map_scope_rows(scope_rows: List[Dict], mapper: CanonicalMapper) -> Tuple[List[Dict], Dict]:
     """
-    Scope CSV를 canonical mapping하여 저장
+    Scope 행 목록 canonical 매핑 (메모리 내)
 
     Args:
-        scope_csv_path: 입력 scope CSV 경로
-        mapping_excel_path: 담보명 mapping 엑셀 경로
-        output_csv_path: 출력 mapped CSV 경로
+        scope_rows: scope CSV 행 (coverage_name_raw / insurer / source_page)
+        mapper: CanonicalMapper (보험사 간 재사용 가능)
 
     Returns:
-        dict: 매핑 통계
+        (mapped 행 목록, 매핑 통계)
     """
-    mapper = CanonicalMapper(mapping_excel_path)
-
-    # Scope CSV 읽기
-    scope_rows = []
-    with open(scope_csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        scope_rows = list(reader)
-
-    # 매핑 실행
     mapped_rows = []
     stats = {'matched': 0, 'unmatched': 0}
 
@@ -189,17 +184,47 @@ def map_scope_to_canonical(
 
         stats[mapping_result['mapping_status']] += 1
 
-    # 결과 저장
-    with open(output_csv_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = [
-            'coverage_name_raw', 'insurer', 'source_page',
-            'coverage_code', 'coverage_name_canonical',
-            'mapping_status', 'match_type'
-        ]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    return mapped_rows, stats
+
+
+def write_mapped_csv(mapped_rows: List[Dict], output_csv_path: str):
+    """mapped 행 목록 → {INSURER}_scope_mapped.csv"""
+    with atomic_write(output_csv_path, newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=MAPPED_FIELDNAMES)
         writer.writeheader()
         writer.writerows(mapped_rows)
 
+
+def map_scope_to_canonical(
+    scope_csv_path: str,
+    mapping_excel_path: str,
+    output_csv_path: str
+) -> Dict:
+    """
+    Scope CSV를 canonical mapping하여 저장
+
+    Args:
+        scope_csv_path: 입력 scope CSV 경로
+        mapping_excel_path: 담보명 mapping 엑셀 경로
+        output_csv_path: 출력 mapped CSV 경로
+
+    Returns:
+        dict: 매핑 통계
+    """
+    mapper = CanonicalMapper(mapping_excel_path)
+
+    # Scope CSV 읽기
+    scope_rows = []
+    with open(scope_csv_path, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        scope_rows = list(reader)
+
+    # 매핑 실행
+    mapped_rows, stats = map_scope_rows(scope_rows, mapper)
+
+    # 결과 저장
+    write_mapped_csv(mapped_rows, output_csv_path)
+
     return stats
 
 
@@ -12,6 +12,7 @@ import json
 from pathlib import Path
 from typing import List, Dict
 import pymupdf  # PyMuPDF (fitz)
+from core.atomic_io import atomic_write
 
 
 class PDFTextExtractor:
@@ -64,7 +65,7 @@ class PDFTextExtractor:
             doc.close()
 
         # JSONL 저장
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with atomic_write(output_file) as f:
             for page_data in pages_data:
                 f.write(json.dumps(page_data, ensure_ascii=False) + '\n')
 
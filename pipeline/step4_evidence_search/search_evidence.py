@@ -7,6 +7,7 @@ Step 4: Evidence Search (Deterministic, No LLM, No Embedding)
 
 출력:
 - data/evidence_pack/{INSURER}_evidence_pack.jsonl
+- data/evidence_pack/{INSURER}_evidence_pack.index.json (byte-offset index)
 - data/scope/{INSURER}_unmatched_review.csv
 """
 
@@ -14,12 +15,14 @@ import csv
 import json
 import re
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import sys
 
 # scope_gate import
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from core.scope_gate import load_scope_gate
+from core.jsonl_index import JsonlIndexBuilder
+from core.atomic_io import atomic_write
 
 
 class EvidenceSearcher:
@@ -602,38 +605,24 @@ class EvidenceSearcher:
         }
 
 
-def create_evidence_pack(
-    scope_mapped_csv: str,
-    evidence_text_dir: str,
-    insurer: str,
-    output_pack_jsonl: str,
-    output_unmatched_csv: str
-) -> Dict:
+def build_evidence_pack(
+    scope_rows: List[Dict],
+    scope_gate,
+    searcher: EvidenceSearcher,
+    insurer: str
+) -> Tuple[List[Dict], List[Dict], Dict]:
     """
-    Evidence pack 생성
+    Evidence pack 생성 (메모리 내)
 
     Args:
-        scope_mapped_csv: scope mapped CSV 경로
-        evidence_text_dir: evidence text 디렉토리
+        scope_rows: scope mapped 행 목록 (CSV 행 또는 Step 2 map_scope_rows 결과)
+        scope_gate: ScopeGate
+        searcher: EvidenceSearcher (corpus 로드 완료)
         insurer: 보험사명
-        output_pack_jsonl: 출력 evidence pack JSONL
-        output_unmatched_csv: 출력 unmatched review CSV
 
     Returns:
-        dict: 통계
+        (evidence pack 항목 목록, unmatched review 행 목록, 통계)
     """
-    # Scope gate 로드
-    scope_gate = load_scope_gate(insurer)
-
-    # Evidence searcher 초기화
-    searcher = EvidenceSearcher(evidence_text_dir, insurer)
-
-    # Scope mapped CSV 읽기
-    with open(scope_mapped_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        scope_rows = list(reader)
-
-    # Evidence pack 생성
     evidence_pack = []
     unmatched_rows = []
     stats = {'total': 0, 'matched': 0, 'unmatched': 0, 'with_evidence': 0, 'without_evidence': 0}
@@ -703,18 +692,72 @@ def create_evidence_pack(
                 'suggested_canonical_code': ''  # 비워둠
             })
 
-    # Evidence pack JSONL 저장
-    with open(output_pack_jsonl, 'w', encoding='utf-8') as f:
+    return evidence_pack, unmatched_rows, stats
+
+
+def write_evidence_pack(evidence_pack: List[Dict], output_pack_jsonl: str):
+    """Evidence pack JSONL 저장 + byte-offset index sidecar"""
+    index_builder = JsonlIndexBuilder()
+    offset = 0
+    with atomic_write(output_pack_jsonl) as f:
         for item in evidence_pack:
-            f.write(json.dumps(item, ensure_ascii=False) + '\n')
+            record = json.dumps(item, ensure_ascii=False) + '\n'
+            length = len(record.encode('utf-8'))
+            f.write(record)
+            index_builder.add(item, offset, length)
+            offset += length
+    index_builder.write(output_pack_jsonl)
 
-    # Unmatched review CSV 저장
-    with open(output_unmatched_csv, 'w', newline='', encoding='utf-8') as f:
+
+def write_unmatched_review(unmatched_rows: List[Dict], output_unmatched_csv: str):
+    """Unmatched review CSV 저장"""
+    with atomic_write(output_unmatched_csv, newline='') as f:
         fieldnames = ['coverage_name_raw', 'top_hits', 'suggested_canonical_code']
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(unmatched_rows)
 
+
+def create_evidence_pack(
+    scope_mapped_csv: str,
+    evidence_text_dir: str,
+    insurer: str,
+    output_pack_jsonl: str,
+    output_unmatched_csv: str
+) -> Dict:
+    """
+    Evidence pack 생성
+
+    Args:
+        scope_mapped_csv: scope mapped CSV 경로
+        evidence_text_dir: evidence text 디렉토리
+        insurer: 보험사명
+        output_pack_jsonl: 출력 evidence pack JSONL
+        output_unmatched_csv: 출력 unmatched review CSV
+
+    Returns:
+        dict: 통계
+    """
+    # Scope gate 로드
+    scope_gate = load_scope_gate(insurer)
+
+    # Evidence searcher 초기화
+    searcher = EvidenceSearcher(evidence_text_dir, insurer)
+
+    # Scope mapped CSV 읽기
+    with open(scope_mapped_csv, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        scope_rows = list(reader)
+
+    # Evidence pack 생성
+    evidence_pack, unmatched_rows, stats = build_evidence_pack(scope_rows, scope_gate, searcher, insurer)
+
+    # Evidence pack JSONL 저장 + byte-offset index sidecar
+    write_evidence_pack(evidence_pack, output_pack_jsonl)
+
+    # Unmatched review CSV 저장
+    write_unmatched_review(unmatched_rows, output_unmatched_csv)
+
     return stats
 
 
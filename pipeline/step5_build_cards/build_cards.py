@@ -7,20 +7,66 @@ Step 5: Build Coverage Cards
 
 출력:
 - data/compare/{INSURER}_coverage_cards.jsonl
+- data/compare/{INSURER}_coverage_cards.summary.json (비교 필드 sidecar)
+- data/compare/{INSURER}_coverage_cards.index.json (byte-offset index)
 """
 
 import argparse
 import csv
+import heapq
 import json
 from pathlib import Path
 import sys
-from typing import List
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Tuple
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from core.scope_gate import load_scope_gate
 from core.compare_types import CoverageCard, Evidence, CompareStats
+from core.cards_store import card_summary, write_cards_summary
+from core.jsonl_index import JsonlIndexBuilder
+from core.atomic_io import atomic_write
+
+
+# 외부 정렬 전환 기준 (메모리 내 보관 카드 수)
+DEFAULT_MAX_CARDS_IN_MEMORY = 10000
+
+# STEP 6-ε.2.3: doc_type priority (약관 > 사업방법서 > 상품요약서)
+DOC_TYPE_PRIORITY = ['약관', '사업방법서', '상품요약서']
+_DOC_TYPE_PRIORITY_INDEX = {doc_type: i for i, doc_type in enumerate(DOC_TYPE_PRIORITY)}
+
+
+def _is_fallback(ev: Evidence) -> bool:
+    """Rule 6-ε.2.2: 'fallback_' 포함 OR 'token_and(' 시작 → fallback"""
+    if not ev.match_keyword:
+        return False
+    return 'fallback_' in ev.match_keyword.lower() or ev.match_keyword.startswith('token_and(')
+
+
+def _evidence_sort_key(ev: Evidence) -> tuple:
+    """Rule 6-ε.2.3 정렬 키 (evidence당 1회 계산)"""
+    return (
+        _is_fallback(ev),                                # 1. Non-fallback 우선
+        _DOC_TYPE_PRIORITY_INDEX.get(ev.doc_type, 999),  # 2. doc_type priority
+        ev.page,                                         # 3. page 오름차순
+        ev.file_path,                                    # 4. file_path 오름차순
+        ev.snippet                                       # 5. snippet 오름차순 (동률 방지)
+    )
+
+
+class _HeapEntry:
+    """Bounded max-heap 항목 (heapq min-heap 위에서 key 역순 비교)"""
+
+    __slots__ = ('key', 'evidence')
+
+    def __init__(self, key: tuple, evidence: Evidence):
+        self.key = key
+        self.evidence = evidence
+
+    def __lt__(self, other: '_HeapEntry') -> bool:
+        return self.key > other.key
 
 
 def _select_diverse_evidences(evidences: List[Evidence], max_count: int = 3) -> List[Evidence]:
@@ -47,157 +93,198 @@ def _select_diverse_evidences(evidences: List[Evidence], max_count: int = 3) ->
             5. snippet 오름차순 (동률 방지)
         Rule 6-ε.2.4: Fill-up 유지 (LOCK)
             - 중복 제거 후에도 max_count까지 보충
+
+    구현:
+        단일 pass로 dedup + doc_type별 bounded heap(max_count + 1개) 유지.
+        정렬 키 마지막에 입력 순서를 붙여 기존 안정 정렬과 동일한 동률 처리를 보장한다.
+        Fill-up 대상은 각 doc_type 상위 max_count + 1개 안에 반드시 포함된다
+        (doc_type 대표 1개 + 보충 후보 max_count개).
     """
-    if not evidences:
+    if not evidences or max_count <= 0:
         return []
 
-    # Helper: dedup key (Rule 6-ε.2.1)
-    def dedup_key(ev: Evidence) -> tuple:
-        return (ev.doc_type, ev.file_path, ev.page, ev.snippet)
-
-    # Helper: fallback 판정 (Rule 6-ε.2.2 — 보정)
-    def is_fallback(ev: Evidence) -> bool:
-        if not ev.match_keyword:
-            return False
-        mk_lower = ev.match_keyword.lower()
-        # 'fallback_' 포함 OR 'token_and(' 시작
-        return 'fallback_' in mk_lower or ev.match_keyword.startswith('token_and(')
-
-    # Helper: doc_type priority index
-    doc_type_priority_map = {
-        '약관': 0,
-        '사업방법서': 1,
-        '상품요약서': 2
-    }
-
-    def doc_type_priority_index(ev: Evidence) -> int:
-        return doc_type_priority_map.get(ev.doc_type, 999)
-
-    # Helper: sort key (Rule 6-ε.2.3)
-    def sort_key(ev: Evidence):
-        return (
-            is_fallback(ev),           # 1. Non-fallback 우선
-            doc_type_priority_index(ev),  # 2. doc_type priority
-            ev.page,                   # 3. page 오름차순
-            ev.file_path,              # 4. file_path 오름차순
-            ev.snippet                 # 5. snippet 오름차순 (동률 방지)
-        )
-
-    # 중복 제거 (Rule 6-ε.2.1)
+    bucket_size = max_count + 1
     seen_keys = set()
-    unique_evidences = []
-    for ev in evidences:
-        key = dedup_key(ev)
-        if key not in seen_keys:
-            seen_keys.add(key)
-            unique_evidences.append(ev)
+    heaps = {}
+
+    # 1-pass: 중복 제거 (Rule 6-ε.2.1) + doc_type별 상위 bucket_size개 유지
+    for seq, ev in enumerate(evidences):
+        dedup_key = (ev.doc_type, ev.file_path, ev.page, ev.snippet)
+        if dedup_key in seen_keys:
+            continue
+        seen_keys.add(dedup_key)
+
+        entry = _HeapEntry(_evidence_sort_key(ev) + (seq,), ev)
+        heap = heaps.setdefault(ev.doc_type, [])
+        if len(heap) < bucket_size:
+            heapq.heappush(heap, entry)
+        elif entry.key < heap[0].key:
+            heapq.heapreplace(heap, entry)
 
     # 1차 선택 (Diversity pass): 약관/사업방법서/상품요약서 각 1개씩
-    by_doc_type = {}
-    for ev in unique_evidences:
-        doc_type = ev.doc_type
-        if doc_type not in by_doc_type:
-            by_doc_type[doc_type] = []
-        by_doc_type[doc_type].append(ev)
-
-    # 각 doc_type 내에서 정렬
-    for doc_type in by_doc_type:
-        by_doc_type[doc_type].sort(key=sort_key)
-
     selected = []
-    doc_type_priority = ['약관', '사업방법서', '상품요약서']
-
-    # 1차 선택: 각 doc_type에서 1개씩
-    for doc_type in doc_type_priority:
-        if doc_type in by_doc_type and len(selected) < max_count:
-            selected.append(by_doc_type[doc_type][0])
+    selected_keys = set()
+    for doc_type in DOC_TYPE_PRIORITY:
+        if doc_type in heaps and len(selected) < max_count:
+            head = min(heaps[doc_type], key=lambda e: e.key)
+            selected.append(head.evidence)
+            selected_keys.add(head.key)
 
     # 2차 보충 (Fill-up pass): max_count까지 채우기 (Rule 6-ε.2.4)
     if len(selected) < max_count:
-        # 선택되지 않은 evidence pool 구축 (이미 중복 제거된 unique_evidences 사용)
-        selected_set = set(id(ev) for ev in selected)
-        remaining = [ev for ev in unique_evidences if id(ev) not in selected_set]
+        remaining = [
+            entry for heap in heaps.values() for entry in heap
+            if entry.key not in selected_keys
+        ]
+        remaining.sort(key=lambda e: e.key)
+        for entry in remaining[:max_count - len(selected)]:
+            selected.append(entry.evidence)
 
-        # 정렬 후 부족분 채우기
-        remaining.sort(key=sort_key)
-        for ev in remaining:
-            if len(selected) >= max_count:
-                break
-            selected.append(ev)
+    return selected
 
-    return selected[:max_count]
 
+class _ExternalCardSorter:
+    """
+    CoverageCard.sort_key 순 외부 정렬기 (bounded memory)
 
-def build_coverage_cards(
-    scope_mapped_csv: str,
-    evidence_pack_jsonl: str,
-    insurer: str,
-    output_cards_jsonl: str
-) -> CompareStats:
+    카드를 JSONL 라인 + summary 항목으로 보관하고, max_in_memory 초과 시
+    정렬된 run을 임시 파일로 내린 뒤 heapq.merge로 병합한다.
+    동률은 입력 순서(seq)로 유지 (기존 list.sort 안정 정렬과 동일).
     """
-    Coverage cards 생성
 
-    Args:
-        scope_mapped_csv: scope mapped CSV 경로
-        evidence_pack_jsonl: evidence pack JSONL 경로
-        insurer: 보험사명
-        output_cards_jsonl: 출력 cards JSONL 경로
+    def __init__(self, max_in_memory: int = DEFAULT_MAX_CARDS_IN_MEMORY):
+        self.max_in_memory = max(1, max_in_memory)
+        self.buffer: List[tuple] = []
+        self.run_paths: List[str] = []
+        self.seq = 0
+
+    def add(self, card: CoverageCard):
+        """카드 추가 (필요 시 run spill)"""
+        line = card.to_json()
+        self.buffer.append((card.sort_key(), self.seq, line, card_summary(card)))
+        self.seq += 1
+        if len(self.buffer) >= self.max_in_memory:
+            self._spill()
+
+    def _spill(self):
+        """현재 buffer를 정렬하여 임시 run 파일로 저장"""
+        self.buffer.sort(key=lambda entry: (entry[0], entry[1]))
+        with tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', suffix='.cards.run', delete=False
+        ) as f:
+            for sort_key, seq, line, summary in self.buffer:
+                f.write(json.dumps([sort_key[0], sort_key[1], seq, line, summary], ensure_ascii=False) + '\n')
+            self.run_paths.append(f.name)
+        self.buffer = []
+
+    @staticmethod
+    def _read_run(path: str) -> Iterator[tuple]:
+        with open(path, 'r', encoding='utf-8') as f:
+            for raw in f:
+                priority, sort_value, seq, line, summary = json.loads(raw)
+                yield ((priority, sort_value), seq, line, summary)
+
+    def iter_sorted(self) -> Iterator[tuple]:
+        """정렬된 (JSONL 라인, summary 항목) 순회 (임시 run 파일은 순회 종료 시 삭제)"""
+        if not self.run_paths:
+            self.buffer.sort(key=lambda entry: (entry[0], entry[1]))
+            for _, _, line, summary in self.buffer:
+                yield line, summary
+            self.buffer = []
+            return
+
+        if self.buffer:
+            self._spill()
+
+        try:
+            runs = [self._read_run(path) for path in self.run_paths]
+            for _, _, line, summary in heapq.merge(*runs, key=lambda entry: (entry[0], entry[1])):
+                yield line, summary
+        finally:
+            for path in self.run_paths:
+                Path(path).unlink(missing_ok=True)
+            self.run_paths = []
+
+
+def _scope_index_from_rows(scope_rows: Iterable[Dict], scope_gate) -> Dict[str, Dict]:
+    """
+    Scope mapped 행 → coverage_name_raw 키 인덱스 (evidence 미포함)
 
-    Returns:
-        CompareStats: 통계
+    동일 coverage_name_raw 중복 시 위치는 최초 등장, 값은 마지막 행
+    (기존 dict 누적 동작과 동일)
     """
-    # Scope gate 로드
-    scope_gate = load_scope_gate(insurer)
+    scope_index = {}
+    for row in scope_rows:
+        coverage_name_raw = row['coverage_name_raw']
 
-    # Scope mapped CSV 읽기
-    scope_data = {}
+        # Scope gate 검증
+        if not scope_gate.is_in_scope(coverage_name_raw):
+            continue
+
+        scope_index[coverage_name_raw] = {
+            'coverage_code': row.get('coverage_code', ''),
+            'coverage_name_canonical': row.get('coverage_name_canonical', ''),
+            'mapping_status': row['mapping_status']
+        }
+
+    return scope_index
+
+
+def _load_scope_index(scope_mapped_csv: str, scope_gate) -> Dict[str, Dict]:
+    """Scope mapped CSV → coverage_name_raw 키 인덱스"""
     with open(scope_mapped_csv, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            coverage_name_raw = row['coverage_name_raw']
-
-            # Scope gate 검증
-            if not scope_gate.is_in_scope(coverage_name_raw):
-                continue
-
-            scope_data[coverage_name_raw] = {
-                'coverage_code': row.get('coverage_code', ''),
-                'coverage_name_canonical': row.get('coverage_name_canonical', ''),
-                'mapping_status': row['mapping_status']
-            }
-
-    # Evidence pack JSONL 읽기
-    evidence_data = {}
+        return _scope_index_from_rows(csv.DictReader(f), scope_gate)
+
+
+def _reduce_evidence_items(
+    items: Iterable[Dict],
+    scope_index: Dict[str, Dict],
+    max_count: int = 3
+) -> Dict[str, Dict]:
+    """
+    Evidence pack 항목 축약: 담보별 선택된 evidence(최대 max_count)만 보관
+
+    scope_index에 없는 담보(scope gate 미통과 포함)는 evidence를 변환하지 않는다.
+    동일 coverage_name_raw 중복 시 마지막 항목 기준 (기존 동작과 동일)
+    """
+    reduced = {}
+    for item in items:
+        coverage_name_raw = item['coverage_name_raw']
+        if coverage_name_raw not in scope_index:
+            continue
+
+        # STEP 6-ε: Doc-Type Diversity Evidence Selection (최대 3개)
+        evidences = [Evidence.from_dict(e) for e in item.get('evidences', [])]
+        reduced[coverage_name_raw] = {
+            'evidences': _select_diverse_evidences(evidences, max_count=max_count),
+            'hits_by_doc_type': item.get('hits_by_doc_type', {}),
+            'flags': item.get('flags', [])
+        }
+
+    return reduced
+
+
+def _reduce_evidence_pack(
+    evidence_pack_jsonl: str,
+    scope_index: Dict[str, Dict],
+    max_count: int = 3
+) -> Dict[str, Dict]:
+    """Evidence pack JSONL 스트리밍 축약 (라인 단위 decode)"""
     with open(evidence_pack_jsonl, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                item = json.loads(line)
-                coverage_name_raw = item['coverage_name_raw']
-
-                # Scope gate 검증
-                if not scope_gate.is_in_scope(coverage_name_raw):
-                    continue
-
-                evidences = [Evidence.from_dict(e) for e in item.get('evidences', [])]
-                hits_by_doc_type = item.get('hits_by_doc_type', {})
-                flags = item.get('flags', [])
-                evidence_data[coverage_name_raw] = {
-                    'evidences': evidences,
-                    'hits_by_doc_type': hits_by_doc_type,
-                    'flags': flags
-                }
+        items = (json.loads(line) for line in f if line.strip())
+        return _reduce_evidence_items(items, scope_index, max_count=max_count)
 
-    # Coverage cards 생성
-    cards: List[CoverageCard] = []
-    stats = {
-        'total': 0,
-        'matched': 0,
-        'unmatched': 0,
-        'evidence_found': 0,
-        'evidence_not_found': 0
-    }
 
-    for coverage_name_raw, scope_info in scope_data.items():
+def _iter_cards(
+    scope_index: Dict[str, Dict],
+    evidence_data: Dict[str, Dict],
+    insurer: str,
+    stats: Dict[str, int]
+) -> Iterator[CoverageCard]:
+    """scope 인덱스 순서로 카드 생성 (stats 누적, evidence_data 항목은 소비 후 제거)"""
+    empty_evidence = {'evidences': [], 'hits_by_doc_type': {}, 'flags': []}
+
+    for coverage_name_raw, scope_info in scope_index.items():
         stats['total'] += 1
 
         # Mapping status
@@ -207,12 +294,10 @@ def build_coverage_cards(
         else:
             stats['unmatched'] += 1
 
-        # Evidence status
-        ev_data = evidence_data.get(coverage_name_raw, {'evidences': [], 'hits_by_doc_type': {}, 'flags': []})
-        evidences = ev_data['evidences']
-        hits_by_doc_type = ev_data['hits_by_doc_type']
-        flags = ev_data['flags']
-        evidence_status = 'found' if evidences else 'not_found'
+        # Evidence status (선택 evidence는 원본 evidence가 있을 때만 비어있지 않음)
+        ev_data = evidence_data.pop(coverage_name_raw, empty_evidence)
+        selected_evidences = ev_data['evidences']
+        evidence_status = 'found' if selected_evidences else 'not_found'
 
         if evidence_status == 'found':
             stats['evidence_found'] += 1
@@ -223,11 +308,8 @@ def build_coverage_cards(
         coverage_code = scope_info['coverage_code'] if scope_info['coverage_code'] else None
         coverage_name_canonical = scope_info['coverage_name_canonical'] if scope_info['coverage_name_canonical'] else None
 
-        # STEP 6-ε: Doc-Type Diversity Evidence Selection (최대 3개)
-        selected_evidences = _select_diverse_evidences(evidences, max_count=3)
-
         # Card 생성
-        card = CoverageCard(
+        yield CoverageCard(
             insurer=insurer,
             coverage_name_raw=coverage_name_raw,
             coverage_code=coverage_code,
@@ -235,20 +317,24 @@ def build_coverage_cards(
             mapping_status=mapping_status,
             evidence_status=evidence_status,
             evidences=selected_evidences,
-            hits_by_doc_type=hits_by_doc_type,
-            flags=flags
+            hits_by_doc_type=ev_data['hits_by_doc_type'],
+            flags=ev_data['flags']
         )
-        cards.append(card)
 
-    # 정렬
-    cards.sort(key=lambda c: c.sort_key())
 
-    # JSONL 저장
-    with open(output_cards_jsonl, 'w', encoding='utf-8') as f:
-        for card in cards:
-            f.write(json.dumps(card.to_dict(), ensure_ascii=False) + '\n')
+def _new_stats() -> Dict[str, int]:
+    """카드 생성 통계 카운터"""
+    return {
+        'total': 0,
+        'matched': 0,
+        'unmatched': 0,
+        'evidence_found': 0,
+        'evidence_not_found': 0
+    }
 
-    # 통계 반환
+
+def _compare_stats(stats: Dict[str, int]) -> CompareStats:
+    """카운터 → CompareStats"""
     return CompareStats(
         total_coverages=stats['total'],
         matched=stats['matched'],
@@ -258,6 +344,123 @@ def build_coverage_cards(
     )
 
 
+def _write_card_lines(
+    lines: Iterable[Tuple[str, dict]],
+    output_cards_jsonl: str,
+    write_summary: bool = True
+):
+    """
+    정렬된 (JSONL 라인, summary 항목) → cards JSONL + summary / index sidecar
+    (summary 항목/index에 라인 byte offset/length 기록)
+    """
+    summary_entries = []
+    index_builder = JsonlIndexBuilder()
+    offset = 0
+    with atomic_write(output_cards_jsonl) as f:
+        for line, summary in lines:
+            record = line + '\n'
+            length = len(record.encode('utf-8'))
+            f.write(record)
+            index_builder.add(summary, offset, length)
+            if write_summary:
+                summary['offset'] = offset
+                summary['length'] = length
+                summary_entries.append(summary)
+            offset += length
+
+    # Summary sidecar (Step 7/8 projection read용)
+    if write_summary:
+        write_cards_summary(output_cards_jsonl, summary_entries)
+
+    # Byte-offset index sidecar (coverage_code / coverage_name_raw 조회용)
+    index_builder.write(output_cards_jsonl)
+
+
+def build_cards_in_memory(
+    scope_rows: Iterable[Dict],
+    evidence_pack: Iterable[Dict],
+    insurer: str,
+    scope_gate
+) -> Tuple[List[CoverageCard], CompareStats]:
+    """
+    Coverage cards 생성 (메모리 내, fused pipeline용)
+
+    Args:
+        scope_rows: scope mapped 행 (Step 2 map_scope_rows 결과)
+        evidence_pack: evidence pack 항목 (Step 4 build_evidence_pack 결과)
+        insurer: 보험사명
+        scope_gate: ScopeGate (Step 4와 공유)
+
+    Returns:
+        (CoverageCard.sort_key 순 카드 목록, 통계)
+    """
+    scope_index = _scope_index_from_rows(scope_rows, scope_gate)
+    evidence_data = _reduce_evidence_items(evidence_pack, scope_index)
+
+    stats = _new_stats()
+    cards = list(_iter_cards(scope_index, evidence_data, insurer, stats))
+    cards.sort(key=lambda card: card.sort_key())  # 안정 정렬 (동률은 생성 순서)
+    return cards, _compare_stats(stats)
+
+
+def write_coverage_cards(cards: List[CoverageCard], output_cards_jsonl: str, write_summary: bool = True):
+    """정렬된 카드 목록 → cards JSONL + sidecar (build_coverage_cards와 동일 출력)"""
+    _write_card_lines(
+        ((card.to_json(), card_summary(card)) for card in cards),
+        output_cards_jsonl,
+        write_summary=write_summary
+    )
+
+
+def build_coverage_cards(
+    scope_mapped_csv: str,
+    evidence_pack_jsonl: str,
+    insurer: str,
+    output_cards_jsonl: str,
+    max_cards_in_memory: int = DEFAULT_MAX_CARDS_IN_MEMORY,
+    write_summary: bool = True
+) -> CompareStats:
+    """
+    Coverage cards 생성 (streaming)
+
+    scope / evidence pack 모두 coverage_name_raw로 키잉하고, evidence pack은
+    라인 단위로 읽으며 담보별 선택 evidence(최대 3개)만 보관한다.
+    카드는 CoverageCard.sort_key 순으로 기록하며, 카드 수가 max_cards_in_memory를
+    넘으면 임시 run 파일 기반 외부 정렬을 사용한다.
+
+    Args:
+        scope_mapped_csv: scope mapped CSV 경로
+        evidence_pack_jsonl: evidence pack JSONL 경로
+        insurer: 보험사명
+        output_cards_jsonl: 출력 cards JSONL 경로
+        max_cards_in_memory: 외부 정렬 전환 기준 카드 수
+        write_summary: summary sidecar({INSURER}_coverage_cards.summary.json) 기록 여부
+
+    Returns:
+        CompareStats: 통계
+    """
+    # Scope gate 로드
+    scope_gate = load_scope_gate(insurer)
+
+    # Scope mapped CSV → key index
+    scope_index = _load_scope_index(scope_mapped_csv, scope_gate)
+
+    # Evidence pack → 담보별 선택 evidence
+    evidence_data = _reduce_evidence_pack(evidence_pack_jsonl, scope_index)
+
+    # Coverage cards 생성
+    sorter = _ExternalCardSorter(max_cards_in_memory)
+    stats = _new_stats()
+    for card in _iter_cards(scope_index, evidence_data, insurer, stats):
+        sorter.add(card)
+
+    # JSONL 저장 (sort_key 순) + summary / index sidecar
+    _write_card_lines(sorter.iter_sorted(), output_cards_jsonl, write_summary=write_summary)
+
+    # 통계 반환
+    return _compare_stats(stats)
+
+
 def main():
     """CLI 엔트리포인트"""
     parser = argparse.ArgumentParser(description='Build coverage cards')
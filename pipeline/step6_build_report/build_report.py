@@ -11,15 +11,15 @@ Step 6: Build Markdown Report
 
 import argparse
 import csv
-import json
 from pathlib import Path
 import sys
-from typing import List
+from typing import Dict, List
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from core.compare_types import CoverageCard, CompareStats
+from core.atomic_io import atomic_write
 
 
 def build_markdown_report(
@@ -45,10 +45,37 @@ def build_markdown_report(
     with open(cards_jsonl, 'r', encoding='utf-8') as f:
         for line in f:
             if line.strip():
-                card_data = json.loads(line)
-                card = CoverageCard.from_dict(card_data)
+                card = CoverageCard.from_json(line)
                 cards.append(card)
 
+    # Unmatched review 로드
+    unmatched_rows = []
+    if Path(unmatched_review_csv).exists():
+        with open(unmatched_review_csv, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            unmatched_rows = list(reader)
+
+    return write_markdown_report(cards, unmatched_rows, insurer, output_md)
+
+
+def write_markdown_report(
+    cards: List[CoverageCard],
+    unmatched_rows: List[Dict],
+    insurer: str,
+    output_md: str
+) -> CompareStats:
+    """
+    카드 / unmatched review 행 (메모리 내) → 마크다운 리포트
+
+    Args:
+        cards: coverage cards (sort_key 순)
+        unmatched_rows: unmatched review 행 (coverage_name_raw / top_hits / suggested_canonical_code)
+        insurer: 보험사명
+        output_md: 출력 마크다운 경로
+
+    Returns:
+        CompareStats: 통계
+    """
     # 통계 계산
     stats = CompareStats(
         total_coverages=len(cards),
@@ -58,13 +85,6 @@ def build_markdown_report(
         evidence_not_found=sum(1 for c in cards if c.evidence_status == 'not_found')
     )
 
-    # Unmatched review 로드
-    unmatched_rows = []
-    if Path(unmatched_review_csv).exists():
-        with open(unmatched_review_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            unmatched_rows = list(reader)
-
     # 마크다운 생성
     md_lines = []
 
@@ -163,7 +183,7 @@ def build_markdown_report(
     output_path = Path(output_md)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
+    with atomic_write(output_path) as f:
         f.write('\n'.join(md_lines))
 
     return stats
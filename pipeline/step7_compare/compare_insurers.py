@@ -9,69 +9,56 @@ Step 7: Compare Insurers
 - data/compare/{INSURER_A}_vs_{INSURER_B}_compare.jsonl
 - reports/{INSURER_A}_vs_{INSURER_B}_report.md
 - data/compare/compare_stats.json
+
+--all-pairs:
+- data/compare/*_coverage_cards.jsonl 전체 보험사 쌍 (A < B, 이름순)
+- 쌍별 JSONL/MD + data/compare/all_pairs_compare_stats.json (쌍 키: "A_vs_B")
 """
 
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+from typing import Dict, List, Tuple
 import sys
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.compare_types import CoverageCard
+from core.cards_store import CoverageCardView, load_card_views
+from core.atomic_io import atomic_write
 
 
-def compare_insurers(
+def index_cards_by_code(cards: List[CoverageCardView]) -> Dict[str, CoverageCardView]:
+    """
+    coverage_code 기준 카드 인덱스 (동일 code 중복 시 마지막 카드)
+    """
+    cards_by_code: Dict[str, CoverageCardView] = {}
+    for card in cards:
+        if card.coverage_code:
+            cards_by_code[card.coverage_code] = card
+    return cards_by_code
+
+
+def compare_indexed(
     insurer_a: str,
     insurer_b: str,
-    cards_a_jsonl: str,
-    cards_b_jsonl: str,
-    output_compare_jsonl: str,
-    output_report_md: str,
-    output_stats_json: str
-):
+    cards_a_by_code: Dict[str, CoverageCardView],
+    cards_b_by_code: Dict[str, CoverageCardView]
+) -> Tuple[List[Dict], Dict]:
     """
-    두 보험사 비교
+    coverage_code 인덱스 기준 두 보험사 비교
 
     Args:
         insurer_a: 보험사 A
         insurer_b: 보험사 B
-        cards_a_jsonl: 보험사 A coverage cards
-        cards_b_jsonl: 보험사 B coverage cards
-        output_compare_jsonl: 비교 결과 JSONL
-        output_report_md: 비교 리포트 MD
-        output_stats_json: 통계 JSON
-    """
-    # Cards 로드
-    cards_a: List[CoverageCard] = []
-    with open(cards_a_jsonl, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                card_data = json.loads(line)
-                card = CoverageCard.from_dict(card_data)
-                cards_a.append(card)
-
-    cards_b: List[CoverageCard] = []
-    with open(cards_b_jsonl, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                card_data = json.loads(line)
-                card = CoverageCard.from_dict(card_data)
-                cards_b.append(card)
-
-    # coverage_code 기준으로 join
-    cards_a_by_code: Dict[str, CoverageCard] = {}
-    for card in cards_a:
-        if card.coverage_code:
-            cards_a_by_code[card.coverage_code] = card
-
-    cards_b_by_code: Dict[str, CoverageCard] = {}
-    for card in cards_b:
-        if card.coverage_code:
-            cards_b_by_code[card.coverage_code] = card
+        cards_a_by_code: 보험사 A coverage_code 인덱스
+        cards_b_by_code: 보험사 B coverage_code 인덱스
 
+    Returns:
+        (비교 rows, 통계)
+    """
     # All unique coverage codes
     all_codes = sorted(set(cards_a_by_code.keys()) | set(cards_b_by_code.keys()))
 
@@ -165,16 +152,25 @@ def compare_insurers(
         }
         compare_rows.append(compare_row)
 
-    # JSONL 저장
+    return compare_rows, stats
+
+
+def write_compare_jsonl(compare_rows: List[Dict], output_compare_jsonl: str):
+    """비교 결과 JSONL 저장"""
     Path(output_compare_jsonl).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_compare_jsonl, 'w', encoding='utf-8') as f:
+    with atomic_write(output_compare_jsonl) as f:
         for row in compare_rows:
             f.write(json.dumps(row, ensure_ascii=False) + '\n')
 
-    # 통계 JSON 저장
-    with open(output_stats_json, 'w', encoding='utf-8') as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
 
+def write_compare_report(
+    insurer_a: str,
+    insurer_b: str,
+    compare_rows: List[Dict],
+    stats: Dict,
+    output_report_md: str
+):
+    """비교 마크다운 리포트 저장"""
     # 마크다운 리포트 생성
     md_lines = []
     md_lines.append(f"# {insurer_a.upper()} vs {insurer_b.upper()} Comparison Report")
@@ -227,24 +223,195 @@ def compare_insurers(
 
     # 리포트 저장
     Path(output_report_md).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_report_md, 'w', encoding='utf-8') as f:
+    with atomic_write(output_report_md) as f:
         f.write('\n'.join(md_lines))
 
+
+def compare_insurers(
+    insurer_a: str,
+    insurer_b: str,
+    cards_a_jsonl: str,
+    cards_b_jsonl: str,
+    output_compare_jsonl: str,
+    output_report_md: str,
+    output_stats_json: str
+):
+    """
+    두 보험사 비교
+
+    Args:
+        insurer_a: 보험사 A
+        insurer_b: 보험사 B
+        cards_a_jsonl: 보험사 A coverage cards
+        cards_b_jsonl: 보험사 B coverage cards
+        output_compare_jsonl: 비교 결과 JSONL
+        output_report_md: 비교 리포트 MD
+        output_stats_json: 통계 JSON
+    """
+    # Cards 로드 (projection read: evidence/snippet 미decode)
+    cards_a: List[CoverageCardView] = load_card_views(cards_a_jsonl)
+    cards_b: List[CoverageCardView] = load_card_views(cards_b_jsonl)
+
+    # coverage_code 기준으로 join
+    compare_rows, stats = compare_indexed(
+        insurer_a,
+        insurer_b,
+        index_cards_by_code(cards_a),
+        index_cards_by_code(cards_b)
+    )
+
+    # JSONL 저장
+    write_compare_jsonl(compare_rows, output_compare_jsonl)
+
+    # 통계 JSON 저장
+    with atomic_write(output_stats_json) as f:
+        json.dump(stats, f, ensure_ascii=False, indent=2)
+
+    # 마크다운 리포트 생성
+    write_compare_report(insurer_a, insurer_b, compare_rows, stats, output_report_md)
+
     return stats
 
 
+def compare_all_pairs(
+    insurers: List[str],
+    cards_dir: str,
+    output_compare_dir: str,
+    output_report_dir: str,
+    output_stats_json: str,
+    jobs: int = 4
+) -> Dict[str, Dict]:
+    """
+    전체 보험사 쌍 비교 (--all-pairs)
+
+    보험사별 cards를 1회만 로드하고 coverage_code 인덱스도 1회만 생성한 뒤,
+    모든 쌍(insurers 순서 기준 A < B)의 비교 rows/통계를 계산한다.
+    쌍별 JSONL/MD 출력은 thread pool로 병렬 기록한다.
+
+    Args:
+        insurers: 보험사 목록 (쌍 순서 기준)
+        cards_dir: {INSURER}_coverage_cards.jsonl 디렉토리
+        output_compare_dir: {A}_vs_{B}_compare.jsonl 출력 디렉토리
+        output_report_dir: {A}_vs_{B}_report.md 출력 디렉토리
+        output_stats_json: 쌍별 통계 JSON ({"A_vs_B": stats})
+        jobs: 출력 기록 병렬 thread 수
+
+    Returns:
+        Dict[pair_key, stats]
+    """
+    # 보험사별 1회 로드 + 인덱스
+    cards_by_insurer: Dict[str, Dict[str, CoverageCardView]] = {}
+    for insurer in insurers:
+        cards_jsonl = Path(cards_dir) / f"{insurer}_coverage_cards.jsonl"
+        cards_by_insurer[insurer] = index_cards_by_code(load_card_views(cards_jsonl))
+
+    results = compare_pairs(insurers, cards_by_insurer)
+    return write_pair_results(results, output_compare_dir, output_report_dir, output_stats_json, jobs=jobs)
+
+
+def compare_pairs(
+    insurers: List[str],
+    cards_by_insurer: Dict[str, Dict[str, CoverageCardView]]
+) -> List[Tuple[str, str, List[Dict], Dict]]:
+    """
+    전체 쌍(insurers 순서 기준 A < B) 비교 (1 pass, 메모리 내)
+
+    cards_by_insurer 값은 coverage_code 인덱스. 카드는 CoverageCardView 또는
+    CoverageCard (fused pipeline의 메모리 내 카드) 모두 가능.
+
+    Returns:
+        [(insurer_a, insurer_b, 비교 rows, 통계)]
+    """
+    results = []
+    for insurer_a, insurer_b in combinations(insurers, 2):
+        compare_rows, stats = compare_indexed(
+            insurer_a,
+            insurer_b,
+            cards_by_insurer[insurer_a],
+            cards_by_insurer[insurer_b]
+        )
+        results.append((insurer_a, insurer_b, compare_rows, stats))
+    return results
+
+
+def write_pair_results(
+    results: List[Tuple[str, str, List[Dict], Dict]],
+    output_compare_dir: str,
+    output_report_dir: str,
+    output_stats_json: str,
+    jobs: int = 4
+) -> Dict[str, Dict]:
+    """쌍별 JSONL/MD 병렬 기록 + 쌍별 통계 JSON ({"A_vs_B": stats})"""
+    def write_pair(result):
+        insurer_a, insurer_b, compare_rows, stats = result
+        pair = f"{insurer_a}_vs_{insurer_b}"
+        write_compare_jsonl(compare_rows, str(Path(output_compare_dir) / f"{pair}_compare.jsonl"))
+        write_compare_report(
+            insurer_a, insurer_b, compare_rows, stats,
+            str(Path(output_report_dir) / f"{pair}_report.md")
+        )
+
+    # 쌍별 출력 병렬 기록
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        list(executor.map(write_pair, results))
+
+    all_stats = {f"{a}_vs_{b}": stats for a, b, _, stats in results}
+    Path(output_stats_json).parent.mkdir(parents=True, exist_ok=True)
+    with atomic_write(output_stats_json) as f:
+        json.dump(all_stats, f, ensure_ascii=False, indent=2)
+
+    return all_stats
+
+
+def run_all_pairs(base_dir: Path, jobs: int):
+    """--all-pairs CLI 실행"""
+    cards_dir = base_dir / "data" / "compare"
+    insurers = sorted(
+        f.stem.replace("_coverage_cards", "") for f in cards_dir.glob("*_coverage_cards.jsonl")
+    )
+    output_stats_json = base_dir / "data" / "compare" / "all_pairs_compare_stats.json"
+
+    print(f"[Step 7] Compare Insurers (all pairs)")
+    print(f"[Step 7] Insurers: {', '.join(insurers)}")
+
+    all_stats = compare_all_pairs(
+        insurers,
+        str(cards_dir),
+        str(base_dir / "data" / "compare"),
+        str(base_dir / "reports"),
+        str(output_stats_json),
+        jobs=jobs
+    )
+
+    print(f"\n[Step 7] All-pairs comparison completed:")
+    print(f"  - Pairs compared: {len(all_stats)}")
+    print(f"\n✓ Compare JSONL: {cards_dir}/{{A}}_vs_{{B}}_compare.jsonl")
+    print(f"✓ Report MD: {base_dir / 'reports'}/{{A}}_vs_{{B}}_report.md")
+    print(f"✓ Stats JSON: {output_stats_json}")
+
+
 def main():
     """CLI 엔트리포인트"""
     parser = argparse.ArgumentParser(description='Compare insurers')
-    parser.add_argument('--insurer-a', type=str, required=True, help='보험사 A')
-    parser.add_argument('--insurer-b', type=str, required=True, help='보험사 B')
+    parser.add_argument('--insurer-a', type=str, help='보험사 A')
+    parser.add_argument('--insurer-b', type=str, help='보험사 B')
+    parser.add_argument('--all-pairs', action='store_true',
+                        help='data/compare의 전체 보험사 쌍 비교 (cards 1회 로드)')
+    parser.add_argument('--jobs', type=int, default=4, help='--all-pairs 출력 병렬 thread 수')
     args = parser.parse_args()
 
+    base_dir = Path(__file__).parent.parent.parent
+
+    if args.all_pairs:
+        run_all_pairs(base_dir, args.jobs)
+        return
+
+    if not args.insurer_a or not args.insurer_b:
+        parser.error('--insurer-a and --insurer-b are required (or use --all-pairs)')
+
     insurer_a = args.insurer_a
     insurer_b = args.insurer_b
 
-    base_dir = Path(__file__).parent.parent.parent
-
     # 입력 파일
     cards_a_jsonl = base_dir / "data" / "compare" / f"{insurer_a}_coverage_cards.jsonl"
     cards_b_jsonl = base_dir / "data" / "compare" / f"{insurer_b}_coverage_cards.jsonl"
@@ -13,35 +13,31 @@ Step 8: Multi-Insurer Comparison (All Insurers)
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional
 from collections import defaultdict
 import sys
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from core.compare_types import CoverageCard
+from core.cards_store import CoverageCardView, load_card_views
+from core.presence_matrix import PresenceMatrix
+from core.atomic_io import atomic_write
 
 
-def load_all_cards(cards_dir: Path) -> Dict[str, List[CoverageCard]]:
+def load_all_cards(cards_dir: Path) -> Dict[str, List[CoverageCardView]]:
     """
-    모든 보험사의 coverage cards 로드
+    모든 보험사의 coverage cards 로드 (projection read: evidence/snippet 미decode)
 
     Returns:
-        Dict[insurer_name, List[CoverageCard]]
+        Dict[insurer_name, List[CoverageCardView]]
     """
     all_cards = {}
 
     for cards_file in cards_dir.glob("*_coverage_cards.jsonl"):
         insurer = cards_file.stem.replace("_coverage_cards", "")
 
-        cards = []
-        with open(cards_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    card_data = json.loads(line)
-                    card = CoverageCard.from_dict(card_data)
-                    cards.append(card)
+        cards = load_card_views(cards_file)
 
         all_cards[insurer] = cards
         print(f"  Loaded {insurer}: {len(cards)} coverages")
@@ -49,7 +45,7 @@ def load_all_cards(cards_dir: Path) -> Dict[str, List[CoverageCard]]:
     return all_cards
 
 
-def build_canonical_matrix(all_cards: Dict[str, List[CoverageCard]]) -> List[Dict]:
+def build_canonical_matrix(all_cards: Dict[str, List[CoverageCardView]]) -> List[Dict]:
     """
     Canonical coverage_code 기준으로 보험사 분포 매트릭스 생성
 
@@ -103,32 +99,34 @@ def build_canonical_matrix(all_cards: Dict[str, List[CoverageCard]]) -> List[Dic
     return matrix
 
 
-def calculate_stats(all_cards: Dict[str, List[CoverageCard]], matrix: List[Dict]) -> Dict:
+def build_presence_matrix(all_cards: Dict[str, List[CoverageCardView]]) -> PresenceMatrix:
     """
-    분포 통계 계산
+    codes × insurers presence matrix 생성 (matched coverage_code 기준)
     """
-    all_codes = {row['coverage_code'] for row in matrix}
+    return PresenceMatrix({
+        insurer: (card.coverage_code for card in cards if card.coverage_code)
+        for insurer, cards in all_cards.items()
+    })
 
-    # Insurer별 code 집합
-    insurer_codes = {}
-    for insurer, cards in all_cards.items():
-        insurer_codes[insurer] = {card.coverage_code for card in cards if card.coverage_code}
+
+def calculate_stats(
+    all_cards: Dict[str, List[CoverageCardView]],
+    matrix: List[Dict],
+    presence: Optional[PresenceMatrix] = None
+) -> Dict:
+    """
+    분포 통계 계산 (presence matrix bitset 연산)
+    """
+    if presence is None:
+        presence = build_presence_matrix(all_cards)
+
+    all_codes = {row['coverage_code'] for row in matrix}
 
     # 공통 codes (모든 보험사에 있음)
-    if insurer_codes:
-        codes_common_to_all = set.intersection(*insurer_codes.values())
-    else:
-        codes_common_to_all = set()
+    codes_common_to_all = presence.common_to_all()
 
     # 각 보험사별 unique codes
-    codes_unique_per_insurer = {}
-    for insurer, codes in insurer_codes.items():
-        other_codes = set()
-        for other_insurer, other_codes_set in insurer_codes.items():
-            if other_insurer != insurer:
-                other_codes.update(other_codes_set)
-
-        codes_unique_per_insurer[insurer] = list(codes - other_codes)
+    codes_unique_per_insurer = presence.unique_per_insurer()
 
     # Insurer별 unmatched rate
     unmatched_rate_per_insurer = {}
@@ -142,33 +140,37 @@ def calculate_stats(all_cards: Dict[str, List[CoverageCard]], matrix: List[Dict]
         }
 
     # Coverage code별 insurer 수
-    insurer_count_per_code = {}
-    for row in matrix:
-        code = row['coverage_code']
-        count = sum(1 for ins_data in row['insurers'].values() if ins_data.get('present', False))
-        insurer_count_per_code[code] = count
+    insurer_count_per_code = presence.insurer_counts()
 
     stats = {
         'total_canonical_codes': len(all_codes),
         'total_insurers': len(all_cards),
         'insurer_count_per_code': insurer_count_per_code,
-        'codes_common_to_all': list(sorted(codes_common_to_all)),
+        'codes_common_to_all': codes_common_to_all,
         'codes_unique_per_insurer': codes_unique_per_insurer,
-        'unmatched_rate_per_insurer': unmatched_rate_per_insurer
+        'unmatched_rate_per_insurer': unmatched_rate_per_insurer,
+        'pairwise_jaccard': presence.pairwise_jaccard()
     }
 
     return stats
 
 
 def generate_markdown_report(
-    all_cards: Dict[str, List[CoverageCard]],
+    all_cards: Dict[str, List[CoverageCardView]],
     matrix: List[Dict],
     stats: Dict,
-    output_md: str
+    output_md: str,
+    presence: Optional[PresenceMatrix] = None
 ):
     """
     Human-readable overview 리포트 생성 (fact-only)
     """
+    if presence is None:
+        presence = build_presence_matrix(all_cards)
+
+    # O(1) code → canonical_name (matrix 행 순서와 무관)
+    canonical_names = {row['coverage_code']: row['canonical_name'] for row in matrix}
+
     md_lines = []
 
     # Title
@@ -208,8 +210,7 @@ def generate_markdown_report(
         md_lines.append("| Code | Canonical Name |")
         md_lines.append("|---|---|")
         for code in stats['codes_common_to_all']:
-            # Find canonical name from matrix
-            canonical_name = next((row['canonical_name'] for row in matrix if row['coverage_code'] == code), '')
+            canonical_name = canonical_names.get(code, '')
             md_lines.append(f"| {code} | {canonical_name} |")
         md_lines.append("")
     else:
@@ -231,7 +232,7 @@ def generate_markdown_report(
             md_lines.append("| Code | Canonical Name |")
             md_lines.append("|---|---|")
             for code in unique_codes:
-                canonical_name = next((row['canonical_name'] for row in matrix if row['coverage_code'] == code), '')
+                canonical_name = canonical_names.get(code, '')
                 md_lines.append(f"| {code} | {canonical_name} |")
             md_lines.append("")
         else:
@@ -250,19 +251,27 @@ def generate_markdown_report(
         count = stats['insurer_count_per_code'][code]
 
         # List insurers with this coverage
-        present_insurers = [
-            ins for ins, data in row['insurers'].items()
-            if data.get('present', False)
-        ]
-        insurers_str = ", ".join(sorted(present_insurers))
+        insurers_str = ", ".join(sorted(presence.insurers_of(code)))
 
         md_lines.append(f"| {code} | {canonical} | {count} | {insurers_str} |")
 
     md_lines.append("")
 
+    # Pairwise overlap (Jaccard)
+    insurers_sorted = sorted(all_cards.keys())
+    jaccard = stats['pairwise_jaccard']
+    md_lines.append("## Pairwise Code Overlap (Jaccard)")
+    md_lines.append("")
+    md_lines.append("| Insurer | " + " | ".join(insurers_sorted) + " |")
+    md_lines.append("|---|" + "---|" * len(insurers_sorted))
+    for insurer in insurers_sorted:
+        cells = " | ".join(f"{jaccard[insurer][other]:.2f}" for other in insurers_sorted)
+        md_lines.append(f"| {insurer} | {cells} |")
+    md_lines.append("")
+
     # Write report
     Path(output_md).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_md, 'w', encoding='utf-8') as f:
+    with atomic_write(output_md) as f:
         f.write('\n'.join(md_lines))
 
 
@@ -295,21 +304,22 @@ def main():
     matrix = build_canonical_matrix(all_cards)
 
     print(f"[Step 8] Calculating statistics...")
-    stats = calculate_stats(all_cards, matrix)
+    presence = build_presence_matrix(all_cards)
+    stats = calculate_stats(all_cards, matrix, presence)
 
     print(f"[Step 8] Generating reports...")
 
     # Save matrix
     output_matrix.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_matrix, 'w', encoding='utf-8') as f:
+    with atomic_write(output_matrix) as f:
         json.dump(matrix, f, ensure_ascii=False, indent=2)
 
     # Save stats
-    with open(output_stats, 'w', encoding='utf-8') as f:
+    with atomic_write(output_stats) as f:
         json.dump(stats, f, ensure_ascii=False, indent=2)
 
     # Generate markdown report
-    generate_markdown_report(all_cards, matrix, stats, str(output_report))
+    generate_markdown_report(all_cards, matrix, stats, str(output_report), presence)
 
     print(f"\n[Step 8] Multi-insurer comparison completed:")
     print(f"  - Total insurers: {stats['total_insurers']}")
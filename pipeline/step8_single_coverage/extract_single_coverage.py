@@ -9,26 +9,166 @@ Step 8: Single Coverage Extraction (Deterministic, No LLM)
 
 출력:
 - data/single/{INSURER}_{COVERAGE_CODE}_profile.json
+
+Batch 모드 (--all / --coverage-codes):
+- 보험사별 process pool로 cards / evidence pack을 1회 로드하여 다수 code 추출
+- code별 multi-insurer 비교: data/single/{coverage_code}_all_compare.json,
+  reports/{coverage_code}_all_insurers.md (Step 10 포맷, --no-compare면 생략)
+
+--regex-budget-us: 슬롯 패턴 search 1회당 time budget(µs). 초과 패턴을
+data/regex_budget_overruns.json에 누적 (추출 결과 불변)
 """
 
 import argparse
 import json
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.cards_store import load_card_views
+from core.atomic_io import atomic_write
+from core.jsonl_index import JsonlIndexedReader
+from core.regex_budget import RegexBudget, record_regex_overruns
+from core.single_compare import write_multi_insurer_comparison
+
+
+# 보험사 × (cards, evidence pack) JSONL indexed reader 보관 수 (LRU)
+READER_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=READER_CACHE_SIZE)
+def _cached_reader(jsonl_path: Path, size: int, mtime_ns: int) -> JsonlIndexedReader:
+    """(경로, 크기, mtime) 단위 reader: 파일이 바뀌면 새 key → 재생성"""
+    return JsonlIndexedReader(jsonl_path)
+
+
+def _indexed_reader(jsonl_path: Path) -> JsonlIndexedReader:
+    """JSONL indexed reader (sidecar 없거나 stale이면 1회 스캔, 동일 프로세스 내 반복 조회 시 인덱스 재사용)"""
+    stat = jsonl_path.stat()
+    return _cached_reader(jsonl_path, stat.st_size, stat.st_mtime_ns)
+
+
+# 슬롯 정의: (slot_key, 정규식 패턴 목록, context_lines) - profile 기록 순서
+SLOT_SPECS = [
+    ('payout_amount', [r'만원|원|금액|지급액|보험금', r'\d+만원|\d+원'], 1),
+    # STEP 7 quality patch
+    ('waiting_period', [r'대기|면책|90일|기간|책임개시|개시일|대기기간', r'\d+일'], 1),
+    ('reduction_period', [r'감액|지급률|50%|1년', r'\d+년.*\d+%'], 1),
+    ('excluded_cancer', [r'유사암|기타피부암|갑상선암|제외', r'소액암'], 1),
+    ('definition_excerpt', [r'정의|암의.*정의|진단|조직검사|병리', r'악성신생물'], 2),
+    # STEP 7 quality patch
+    ('payment_condition_excerpt', [r'지급사유|지급조건|진단확정|최초.*1회|재진단|지급|회한|보험금.*지급|보험금 지급'], 2),
+]
+
+
+class SlotEngine:
+    """
+    슬롯 6종 일괄 추출기
+
+    슬롯마다 패턴 목록을 alternation 정규식 1개로 미리 컴파일하여(IGNORECASE)
+    라인당 슬롯별 search 1회로 판정한다 (슬롯별 re.search(pattern, line, re.IGNORECASE) any-match와 동일).
+    전체 슬롯 결합 정규식(named group / lookahead)은 라인 대부분이 어떤 슬롯이든 매칭되는
+    evidence 코퍼스에서 오히려 느려 쓰지 않는다.
+    evidence 간 동일 라인이 많으므로 라인별 판정 결과는 cache_size개까지 memo한다.
+
+    context window는 snippet별 라인 배열에서 (라인, context_lines) 단위로 1회만 생성한다.
+    결과는 SingleCoverageExtractor._extract_slot_text와 동일한 text/refs.
+
+    budget(core/regex_budget.RegexBudget)이 주어지면 슬롯 search마다 시간을 재어 초과 패턴을 기록한다
+    (reduction_period의 '년.*%'처럼 라인 길이에 따라 backtracking이 커질 수 있는 패턴 감시, 판정 결과 불변).
+    """
+
+    def __init__(self, slot_specs: List[Tuple[str, List[str], int]], cache_size: int = 65536, budget=None):
+        self.slot_specs = slot_specs
+        self.cache_size = cache_size
+        self.budget = budget
+        self._line_cache: Dict[str, Tuple[int, ...]] = {}
+        compiled = [
+            re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+            for _, patterns, _ in slot_specs
+        ]
+        if budget is not None:
+            compiled = [budget.wrap(pattern) for pattern in compiled]
+        self.slot_searches = [pattern.search for pattern in compiled]
+
+    def match_slots(self, line: str) -> Tuple[int, ...]:
+        """라인에 매칭되는 슬롯 index 목록 (오름차순)"""
+        slots = self._line_cache.get(line)
+        if slots is not None:
+            return slots
+
+        slots = tuple(slot for slot, search in enumerate(self.slot_searches) if search(line) is not None)
+
+        if len(self._line_cache) >= self.cache_size:
+            self._line_cache.clear()
+        self._line_cache[line] = slots
+        return slots
+
+    def extract(self, evidences: List[Dict]) -> Dict[str, Dict]:
+        """
+        evidence 목록에서 슬롯 전체 추출
+
+        Returns:
+            Dict[slot_key, {'text': str 또는 None, 'refs': List[str]}]
+        """
+        slot_count = len(self.slot_specs)
+        matches = [[] for _ in range(slot_count)]
+        refs = [[] for _ in range(slot_count)]
+        match_slots = self.match_slots
+
+        for evidence in evidences:
+            lines = evidence['snippet'].split('\n')
+            line_count = len(lines)
+            ref = None
+            contexts = {}
+
+            for i, line in enumerate(lines):
+                for slot in match_slots(line):
+                    context_lines = self.slot_specs[slot][2]
+                    context = contexts.get((i, context_lines))
+                    if context is None:
+                        start = max(0, i - context_lines)
+                        end = min(line_count, i + context_lines + 1)
+                        context = '\n'.join(lines[start:end]).strip()
+                        contexts[(i, context_lines)] = context
+                    matches[slot].append(context)
+                    if ref is None:
+                        ref = f"{evidence['doc_type']} p.{evidence['page']}"
+                    if ref not in refs[slot]:
+                        refs[slot].append(ref)
+
+        results = {}
+        for slot, (slot_key, _, _) in enumerate(self.slot_specs):
+            if matches[slot]:
+                # 중복 제거 및 결합 (최대 3개)
+                unique_matches = list(dict.fromkeys(matches[slot]))
+                results[slot_key] = {'text': ' | '.join(unique_matches[:3]), 'refs': refs[slot]}
+            else:
+                results[slot_key] = {'text': None, 'refs': []}
+        return results
+
+
+SLOT_ENGINE = SlotEngine(SLOT_SPECS)
 
 
 class SingleCoverageExtractor:
     """단일 담보에 대한 deterministic 슬롯 추출"""
 
-    def __init__(self, insurer: str, coverage_code: str, base_dir: Path):
+    def __init__(self, insurer: str, coverage_code: str, base_dir: Path, slot_engine: Optional[SlotEngine] = None):
         self.insurer = insurer
         self.coverage_code = coverage_code
         self.base_dir = base_dir
+        self.slot_engine = slot_engine or SLOT_ENGINE
 
     def _extract_slot_text(self, evidences: List[Dict], patterns: List[str], context_lines: int = 1) -> Dict:
         """
-        정규식 패턴으로 슬롯 텍스트 추출
+        정규식 패턴으로 슬롯 텍스트 추출 (슬롯 1개, SlotEngine 기준 구현)
 
         Args:
             evidences: evidence 리스트
@@ -85,30 +225,17 @@ class SingleCoverageExtractor:
         Returns:
             Dict: profile 정보
         """
-        # Coverage card 로드
+        # Coverage card 로드 (byte-offset index seek)
         cards_file = self.base_dir / 'data' / 'compare' / f'{self.insurer}_coverage_cards.jsonl'
-        card = None
-        with open(cards_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    if data.get('coverage_code') == self.coverage_code:
-                        card = data
-                        break
+        card = _indexed_reader(cards_file).get('coverage_code', self.coverage_code)
 
         if not card:
             raise ValueError(f"Coverage code {self.coverage_code} not found in {self.insurer} cards")
 
-        # Evidence pack 로드
+        # Evidence pack 로드 (byte-offset index seek)
         pack_file = self.base_dir / 'data' / 'evidence_pack' / f'{self.insurer}_evidence_pack.jsonl'
-        evidences = None
-        with open(pack_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    if data.get('coverage_code') == self.coverage_code:
-                        evidences = data.get('evidences', [])
-                        break
+        pack_item = _indexed_reader(pack_file).get('coverage_code', self.coverage_code)
+        evidences = pack_item.get('evidences', []) if pack_item is not None else None
 
         if evidences is None:
             raise ValueError(f"Coverage code {self.coverage_code} not found in {self.insurer} evidence pack")
@@ -122,79 +249,16 @@ class SingleCoverageExtractor:
             'doc_type_coverage': card.get('hits_by_doc_type', {}),
         }
 
-        # payout_amount_text
-        payout_result = self._extract_slot_text(
-            evidences,
-            [r'만원|원|금액|지급액|보험금', r'\d+만원|\d+원']
-        )
-        profile['payout_amount'] = {
-            'text': payout_result['text'],
-            'refs': payout_result['refs'],
-            'status': 'found' if payout_result['text'] else 'unknown',
-            'reason': 'no evidence lines matched regex' if not payout_result['text'] else None
-        }
-
-        # waiting_period_text (STEP 7 quality patch)
-        waiting_result = self._extract_slot_text(
-            evidences,
-            [r'대기|면책|90일|기간|책임개시|개시일|대기기간', r'\d+일']
-        )
-        profile['waiting_period'] = {
-            'text': waiting_result['text'],
-            'refs': waiting_result['refs'],
-            'status': 'found' if waiting_result['text'] else 'unknown',
-            'reason': 'no evidence lines matched regex' if not waiting_result['text'] else None
-        }
-
-        # reduction_period_text
-        reduction_result = self._extract_slot_text(
-            evidences,
-            [r'감액|지급률|50%|1년', r'\d+년.*\d+%']
-        )
-        profile['reduction_period'] = {
-            'text': reduction_result['text'],
-            'refs': reduction_result['refs'],
-            'status': 'found' if reduction_result['text'] else 'unknown',
-            'reason': 'no evidence lines matched regex' if not reduction_result['text'] else None
-        }
-
-        # excluded_cancer_text
-        excluded_result = self._extract_slot_text(
-            evidences,
-            [r'유사암|기타피부암|갑상선암|제외', r'소액암']
-        )
-        profile['excluded_cancer'] = {
-            'text': excluded_result['text'],
-            'refs': excluded_result['refs'],
-            'status': 'found' if excluded_result['text'] else 'unknown',
-            'reason': 'no evidence lines matched regex' if not excluded_result['text'] else None
-        }
-
-        # definition_excerpt
-        definition_result = self._extract_slot_text(
-            evidences,
-            [r'정의|암의.*정의|진단|조직검사|병리', r'악성신생물'],
-            context_lines=2
-        )
-        profile['definition_excerpt'] = {
-            'text': definition_result['text'],
-            'refs': definition_result['refs'],
-            'status': 'found' if definition_result['text'] else 'unknown',
-            'reason': 'no evidence lines matched regex' if not definition_result['text'] else None
-        }
-
-        # payment_condition_excerpt (STEP 7 quality patch)
-        payment_result = self._extract_slot_text(
-            evidences,
-            [r'지급사유|지급조건|진단확정|최초.*1회|재진단|지급|회한|보험금.*지급|보험금 지급'],
-            context_lines=2
-        )
-        profile['payment_condition_excerpt'] = {
-            'text': payment_result['text'],
-            'refs': payment_result['refs'],
-            'status': 'found' if payment_result['text'] else 'unknown',
-            'reason': 'no evidence lines matched regex' if not payment_result['text'] else None
-        }
+        # 슬롯 6종 일괄 추출 (SLOT_SPECS 순서)
+        slot_results = self.slot_engine.extract(evidences)
+        for slot_key, _, _ in SLOT_SPECS:
+            result = slot_results[slot_key]
+            profile[slot_key] = {
+                'text': result['text'],
+                'refs': result['refs'],
+                'status': 'found' if result['text'] else 'unknown',
+                'reason': 'no evidence lines matched regex' if not result['text'] else None
+            }
 
         # All evidence refs
         all_refs = set()
@@ -206,32 +270,193 @@ class SingleCoverageExtractor:
         return profile
 
 
+def save_profile(base_dir: Path, insurer: str, coverage_code: str, profile: Dict) -> Path:
+    """profile JSON 저장 (data/single/{INSURER}_{COVERAGE_CODE}_profile.json)"""
+    output_dir = base_dir / 'data' / 'single'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / f'{insurer}_{coverage_code}_profile.json'
+
+    with atomic_write(output_file) as f:
+        json.dump(profile, f, ensure_ascii=False, indent=2)
+    return output_file
+
+
+def matched_coverage_codes(base_dir: Path, insurer: str) -> List[str]:
+    """보험사 cards의 matched coverage_code 목록 (오름차순, 중복 제거)"""
+    cards_file = base_dir / 'data' / 'compare' / f'{insurer}_coverage_cards.jsonl'
+    return sorted({
+        card.coverage_code for card in load_card_views(cards_file)
+        if card.mapping_status == 'matched' and card.coverage_code
+    })
+
+
+def extract_insurer_profiles(
+    base_dir: Path,
+    insurer: str,
+    coverage_codes: Optional[List[str]] = None,
+    regex_budget_us: Optional[float] = None
+) -> Tuple[str, Dict[str, Dict], List[str], Optional[RegexBudget]]:
+    """
+    보험사 1곳의 여러 coverage_code profile 추출 + 저장 (process pool worker)
+
+    cards / evidence pack indexed reader를 1회만 만들고 code별로 seek 조회한다.
+
+    Args:
+        base_dir: 프로젝트 루트
+        insurer: 보험사명
+        coverage_codes: 대상 code (None이면 matched 전체, 보험사에 없는 code는 제외)
+        regex_budget_us: 슬롯 패턴 search 1회당 time budget(µs, None이면 측정 안 함)
+
+    Returns:
+        (insurer, Dict[coverage_code, profile], 실패 code 목록, budget 초과 기록 또는 None)
+    """
+    available = matched_coverage_codes(base_dir, insurer)
+    if coverage_codes is None:
+        targets = available
+    else:
+        available_set = set(available)
+        targets = [code for code in coverage_codes if code in available_set]
+
+    budget = RegexBudget(regex_budget_us) if regex_budget_us is not None else None
+    slot_engine = SlotEngine(SLOT_SPECS, budget=budget) if budget is not None else SLOT_ENGINE
+
+    profiles = {}
+    failed = []
+    for coverage_code in targets:
+        try:
+            profile = SingleCoverageExtractor(insurer, coverage_code, base_dir, slot_engine).extract_profile()
+        except ValueError:
+            failed.append(coverage_code)
+            continue
+        save_profile(base_dir, insurer, coverage_code, profile)
+        profiles[coverage_code] = profile
+
+    return insurer, profiles, failed, budget
+
+
+def run_batch(
+    base_dir: Path,
+    insurers: List[str],
+    coverage_codes: Optional[List[str]] = None,
+    jobs: int = 4,
+    write_comparisons: bool = True,
+    regex_budget: Optional[RegexBudget] = None
+) -> Dict[str, Dict[str, Dict]]:
+    """
+    Batch 추출: 보험사별 process pool로 profile 추출 후 code별 multi-insurer 비교 저장
+
+    Args:
+        base_dir: 프로젝트 루트
+        insurers: 보험사 목록
+        coverage_codes: 대상 code 목록 (None이면 보험사별 matched 전체)
+        jobs: process 수
+        write_comparisons: False면 profile만 기록 (비교는 Step 10 compare_matrix가 기록)
+        regex_budget: 주어지면 보험사별 슬롯 패턴 budget 초과 기록을 누적
+
+    Returns:
+        Dict[coverage_code, Dict[insurer, profile]]
+    """
+    profiles_by_code: Dict[str, Dict[str, Dict]] = {}
+    regex_budget_us = regex_budget.budget_ns / 1000 if regex_budget is not None else None
+
+    with ProcessPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = [
+            executor.submit(extract_insurer_profiles, base_dir, insurer, coverage_codes, regex_budget_us)
+            for insurer in insurers
+        ]
+        for future in futures:
+            insurer, profiles, failed, budget = future.result()
+            if budget is not None:
+                regex_budget.merge(budget)
+            print(f"  [{insurer}] profiles: {len(profiles)}" + (f" (failed: {', '.join(failed)})" if failed else ""))
+            for coverage_code, profile in profiles.items():
+                profiles_by_code.setdefault(coverage_code, {})[insurer] = profile
+
+    # code별 multi-insurer 비교 (Step 10 포맷)
+    if write_comparisons:
+        for coverage_code in sorted(profiles_by_code):
+            write_multi_insurer_comparison(base_dir, profiles_by_code[coverage_code], coverage_code)
+
+    return profiles_by_code
+
+
+def save_regex_overruns(budget: RegexBudget):
+    """슬롯 패턴 budget 초과 요약 출력 + data/regex_budget_overruns.json 누적"""
+    budget_us = budget.budget_ns / 1000
+    if not budget.overruns:
+        print(f"⏱️  No slot pattern exceeded the regex budget ({budget_us}us)")
+        return
+    print(f"⏱️  {len(budget.overruns)} slot patterns exceeded the regex budget ({budget_us}us):")
+    for line in budget.summary():
+        print(f"   {line}")
+    path = record_regex_overruns(budget)
+    print(f"⏱️  Regex budget overruns recorded: {path}")
+
+
 def main():
     """CLI 엔트리포인트"""
     parser = argparse.ArgumentParser(description='Extract single coverage profile')
-    parser.add_argument('--insurer', type=str, required=True, help='보험사명')
-    parser.add_argument('--coverage-code', type=str, required=True, help='Coverage code (e.g., A4200_1)')
+    parser.add_argument('--insurer', type=str, help='보험사명')
+    parser.add_argument('--coverage-code', type=str, help='Coverage code (e.g., A4200_1)')
+    parser.add_argument('--all', action='store_true', help='Batch: 전체 보험사 × matched coverage_code 전체')
+    parser.add_argument('--coverage-codes', type=str, help='Batch: 대상 code (쉼표 구분)')
+    parser.add_argument('--insurers', type=str, help='Batch: 대상 보험사 (쉼표 구분, 기본: 전체)')
+    parser.add_argument('--jobs', type=int, default=4, help='Batch: process 수')
+    parser.add_argument('--no-compare', action='store_true', help='Batch: profile만 기록 (code별 비교 생략)')
+    parser.add_argument('--regex-budget-us', type=float,
+                        help='슬롯 패턴 search 1회당 time budget(µs), 초과 패턴을 data/regex_budget_overruns.json에 누적')
     args = parser.parse_args()
 
+    base_dir = Path(__file__).parent.parent.parent
+    regex_budget = RegexBudget(args.regex_budget_us) if args.regex_budget_us is not None else None
+
+    if args.all or args.coverage_codes:
+        if args.insurers:
+            insurers = [i.strip() for i in args.insurers.split(',') if i.strip()]
+        else:
+            insurers = sorted(
+                f.stem.replace('_coverage_cards', '')
+                for f in (base_dir / 'data' / 'compare').glob('*_coverage_cards.jsonl')
+            )
+        coverage_codes = None
+        if args.coverage_codes:
+            coverage_codes = [c.strip() for c in args.coverage_codes.split(',') if c.strip()]
+
+        print(f"[Step 8] Single Coverage Extraction (batch)")
+        print(f"[Step 8] Insurers: {', '.join(insurers)}")
+        print(f"[Step 8] Coverage Codes: {', '.join(coverage_codes) if coverage_codes else 'all matched'}")
+
+        profiles_by_code = run_batch(base_dir, insurers, coverage_codes, jobs=args.jobs,
+                                     write_comparisons=not args.no_compare, regex_budget=regex_budget)
+        total = sum(len(p) for p in profiles_by_code.values())
+
+        print(f"\n[Step 8] Batch extraction completed:")
+        print(f"  - Coverage codes: {len(profiles_by_code)}")
+        print(f"  - Profiles: {total}")
+        print(f"\n✓ Profiles: {base_dir / 'data' / 'single'}/{{INSURER}}_{{COVERAGE_CODE}}_profile.json")
+        if not args.no_compare:
+            print(f"✓ Compare JSON: {base_dir / 'data' / 'single'}/{{coverage_code}}_all_compare.json")
+        if regex_budget is not None:
+            save_regex_overruns(regex_budget)
+        return
+
+    if not args.insurer or not args.coverage_code:
+        parser.error('--insurer and --coverage-code are required (or use --all / --coverage-codes)')
+
     insurer = args.insurer
     coverage_code = args.coverage_code
-    base_dir = Path(__file__).parent.parent.parent
 
     print(f"[Step 8] Single Coverage Extraction")
     print(f"[Step 8] Insurer: {insurer}")
     print(f"[Step 8] Coverage Code: {coverage_code}")
 
     # Extract profile
-    extractor = SingleCoverageExtractor(insurer, coverage_code, base_dir)
+    slot_engine = SlotEngine(SLOT_SPECS, budget=regex_budget) if regex_budget is not None else None
+    extractor = SingleCoverageExtractor(insurer, coverage_code, base_dir, slot_engine)
     profile = extractor.extract_profile()
 
     # Save profile
-    output_dir = base_dir / 'data' / 'single'
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_file = output_dir / f'{insurer}_{coverage_code}_profile.json'
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(profile, f, ensure_ascii=False, indent=2)
+    output_file = save_profile(base_dir, insurer, coverage_code, profile)
 
     print(f"\n[Step 8] Profile extracted:")
     print(f"  - Coverage: {profile['canonical_name']} ({profile['raw_name']})")
@@ -243,6 +468,8 @@ def main():
     print(f"  - Definition: {profile['definition_excerpt']['status']}")
     print(f"  - Payment condition: {profile['payment_condition_excerpt']['status']}")
     print(f"\n✓ Profile: {output_file}")
+    if regex_budget is not None:
+        save_regex_overruns(regex_budget)
 
 
 if __name__ == '__main__':
@@ -17,6 +17,8 @@ import json
 from pathlib import Path
 from typing import Dict
 
+from core.atomic_io import atomic_write
+
 
 def compare_single_coverage(
     insurer_a: str,
@@ -236,7 +238,7 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     compare_file = output_dir / f'{insurer_a}_vs_{insurer_b}_{coverage_code}_compare.json'
 
-    with open(compare_file, 'w', encoding='utf-8') as f:
+    with atomic_write(compare_file) as f:
         json.dump(comparison, f, ensure_ascii=False, indent=2)
 
     # Generate and save report
@@ -245,7 +247,7 @@ def main():
     report_dir.mkdir(parents=True, exist_ok=True)
     report_file = report_dir / f'single_{coverage_code}_{insurer_a}_vs_{insurer_b}.md'
 
-    with open(report_file, 'w', encoding='utf-8') as f:
+    with atomic_write(report_file) as f:
         f.write(report_text)
 
     print(f"\n[Step 9] Comparison completed:")
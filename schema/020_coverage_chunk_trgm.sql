@@ -0,0 +1,16 @@
+-- inca-rag-scope: coverage_chunk gate pushdown indexes
+-- tools/run_db_only_coverage.py 후보 필터 (tools/gate_pushdown.py)
+--   excerpt LIKE ANY(...)   : GATE 1 anchor
+--   chunk_text !~ '...'     : GATE 2/3 hard/section negative
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 후보 범위 (coverage_code, as_of_date, ins_cd) 조회 + chunk_id 순서
+CREATE INDEX IF NOT EXISTS idx_coverage_chunk_scope
+    ON coverage_chunk (coverage_code, as_of_date, ins_cd, chunk_id);
+
+-- LIKE '%anchor%' / 정규식 검색용 trigram 인덱스
+CREATE INDEX IF NOT EXISTS idx_coverage_chunk_excerpt_trgm
+    ON coverage_chunk USING gin (excerpt gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_coverage_chunk_text_trgm
+    ON coverage_chunk USING gin (chunk_text gin_trgm_ops);
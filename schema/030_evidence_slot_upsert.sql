@@ -0,0 +1,7 @@
+-- inca-rag-scope: evidence_slot set-based upsert key
+-- tools/run_db_only_coverage.py write_evidence_slots:
+--   INSERT ... ON CONFLICT (coverage_code, as_of_date, ins_cd, slot_key) DO UPDATE
+-- (coverage, 기준일, 보험사, slot)당 FOUND 행은 1개
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_evidence_slot_key
+    ON evidence_slot (coverage_code, as_of_date, ins_cd, slot_key);
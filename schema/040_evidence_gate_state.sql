@@ -0,0 +1,24 @@
+-- inca-rag-scope: incremental evidence_slot 재판정 상태
+-- tools/run_db_only_coverage.py plan_regate / write_gate_state (tools/incremental_slots.py)
+--
+-- evidence_slot.chunk_hash: FOUND 행을 만든 chunk의 내용 hash
+-- evidence_gate_state: 마지막 gate 판정 시점의 chunk별 (chunk_hash, gate_hash)
+--   chunk_hash = md5(COALESCE(chunk_text, '') || chr(31) || COALESCE(excerpt, '') || chr(31)
+--                    || COALESCE(page_number::text, ''))
+--   gate_hash  = sha256(gate_version + profile + ins_cd mapping) — 바뀌면 해당 ins_cd 전체 재판정
+-- 재실행은 hash가 바뀐 chunk와 winner가 사라진 slot만 다시 gate한다.
+
+ALTER TABLE evidence_slot ADD COLUMN IF NOT EXISTS chunk_hash TEXT;
+
+CREATE TABLE IF NOT EXISTS evidence_gate_state (
+    coverage_code TEXT NOT NULL,
+    as_of_date DATE NOT NULL,
+    ins_cd TEXT NOT NULL,
+    chunk_id BIGINT NOT NULL,
+    chunk_hash TEXT NOT NULL,
+    gate_hash TEXT NOT NULL,
+    PRIMARY KEY (coverage_code, as_of_date, chunk_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_evidence_gate_state_ins
+    ON evidence_gate_state (coverage_code, as_of_date, ins_cd);
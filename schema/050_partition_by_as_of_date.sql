@@ -0,0 +1,103 @@
+-- inca-rag-scope: as_of_date LIST partitioning (월별 snapshot 이력 누적)
+-- tools/run_db_only_coverage.py의 coverage_chunk / evidence_slot / evidence_gate_state 조회는
+-- 모두 coverage_code = ? AND as_of_date = ? (+ ins_cd)로 한정 → snapshot 1개 = partition 1개.
+-- 현재 기준일 조회는 partition pruning으로 해당 partition만 읽으므로 이력이 쌓여도 비용이 같다.
+--
+-- partition 이름: {table}_dYYYYMMDD
+-- 새 기준일 partition 생성: SELECT ensure_as_of_date_partitions('2025-12-26');
+--   (PostgresCoverageStore.ensure_partitions — write_all에서 호출, chunk 적재 전에도 호출 필요)
+-- 보존 / 아카이브: python3 tools/coverage_store_cli.py partitions --keep 12 [--archive archive | --drop]
+--
+-- 분할 테이블의 PK / UNIQUE는 partition key를 포함해야 함:
+--   coverage_chunk PK (chunk_id) → (chunk_id, as_of_date)
+--   evidence_slot  PK (slot_id)  → (slot_id, as_of_date)
+-- chunk_id / slot_id sequence는 새 parent로 소유권 이전 (기존 id 유지)
+-- 030 / 040 적용 후 실행. 이미 분할된 테이블은 건너뜀 (재실행 안전).
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION ensure_as_of_date_partition(p_table text, p_as_of_date date)
+RETURNS text
+LANGUAGE plpgsql AS $$
+DECLARE
+    part text := p_table || '_d' || to_char(p_as_of_date, 'YYYYMMDD');
+BEGIN
+    IF to_regclass(quote_ident(part)) IS NULL THEN
+        EXECUTE format('CREATE TABLE %I PARTITION OF %I FOR VALUES IN (%L)', part, p_table, p_as_of_date);
+    END IF;
+    RETURN part;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION ensure_as_of_date_partitions(p_as_of_date date)
+RETURNS void
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- 동시 실행 간 CREATE 경합 방지 (호출자는 짧은 트랜잭션으로 commit)
+    PERFORM pg_advisory_xact_lock(hashtext('as_of_date_partition'));
+    PERFORM ensure_as_of_date_partition('coverage_chunk', p_as_of_date);
+    PERFORM ensure_as_of_date_partition('evidence_slot', p_as_of_date);
+    PERFORM ensure_as_of_date_partition('evidence_gate_state', p_as_of_date);
+END
+$$;
+
+-- 기존 테이블 → LIST (as_of_date) 분할 테이블 (기준일별 partition으로 행 이동)
+CREATE FUNCTION pg_temp.partition_by_as_of_date(p_table text, p_pk text)
+RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    old text := p_table || '_unpartitioned';
+    id_column text := split_part(p_pk, ',', 1);
+    seq text;
+    d date;
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = p_table::regclass) THEN
+        RETURN;
+    END IF;
+
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', p_table, old);
+    EXECUTE format('CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS) PARTITION BY LIST (as_of_date)', p_table, old);
+    EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (%s)', p_table, p_pk);
+
+    seq := pg_get_serial_sequence(quote_ident(old), id_column);
+    IF seq IS NOT NULL THEN
+        EXECUTE format('ALTER SEQUENCE %s OWNED BY %I.%I', seq, p_table, id_column);
+    END IF;
+
+    FOR d IN EXECUTE format('SELECT DISTINCT as_of_date FROM %I', old) LOOP
+        PERFORM ensure_as_of_date_partition(p_table, d);
+    END LOOP;
+    EXECUTE format('INSERT INTO %I SELECT * FROM %I', p_table, old);
+    EXECUTE format('DROP TABLE %I', old);
+END
+$$;
+
+SELECT pg_temp.partition_by_as_of_date('coverage_chunk', 'chunk_id, as_of_date');
+SELECT pg_temp.partition_by_as_of_date('evidence_slot', 'slot_id, as_of_date');
+SELECT pg_temp.partition_by_as_of_date('evidence_gate_state', 'coverage_code, as_of_date, chunk_id');
+
+-- 접근 경로별 composite index (parent에 정의 → 모든 partition에 생성)
+-- partition 내 as_of_date는 상수이므로 후보 조회 index에서 제외
+--   iter_candidate_excerpts / chunk_hashes: (coverage_code, ins_cd) + chunk_id 순서
+--   fetch_chunk_texts: as_of_date pruning + PK (chunk_id, as_of_date)
+CREATE INDEX IF NOT EXISTS idx_coverage_chunk_scope
+    ON coverage_chunk (coverage_code, ins_cd, chunk_id);
+CREATE INDEX IF NOT EXISTS idx_coverage_chunk_excerpt_trgm
+    ON coverage_chunk USING gin (excerpt gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_coverage_chunk_text_trgm
+    ON coverage_chunk USING gin (chunk_text gin_trgm_ops);
+
+-- write_evidence_slots ON CONFLICT 대상 (partition key 포함)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_evidence_slot_key
+    ON evidence_slot (coverage_code, as_of_date, ins_cd, slot_key);
+
+-- load_gate_state / write_gate_state ins_cd 범위 삭제
+CREATE INDEX IF NOT EXISTS idx_evidence_gate_state_ins
+    ON evidence_gate_state (coverage_code, as_of_date, ins_cd);
+
+-- compare_table_v2는 분할하지 않음 (coverage × 기준일당 소수 행)
+-- latest_compare_payload: 최신 table_id 1건
+CREATE INDEX IF NOT EXISTS idx_compare_table_v2_latest
+    ON compare_table_v2 (coverage_code, as_of_date, table_id DESC);
+
+COMMIT;
@@ -0,0 +1,71 @@
+"""
+Streaming Card Builder 테스트
+
+Contract tests:
+1. streaming build 결과가 기존 cards JSONL과 바이트 단위로 동일
+2. 외부 정렬(run spill) 경로도 동일한 결과를 생성
+3. 통계가 cards 내용과 일치
+"""
+
+import pytest
+import json
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.step5_build_cards.build_cards import build_coverage_cards
+
+
+# 경로 설정
+BASE_DIR = Path(__file__).parent.parent
+INSURERS = ['samsung', 'meritz', 'db', 'hanwha', 'heungkuk', 'hyundai', 'kb', 'lotte']
+
+
+def _build(insurer: str, output: Path, max_cards_in_memory: int):
+    return build_coverage_cards(
+        str(BASE_DIR / "data" / "scope" / f"{insurer}_scope_mapped.csv"),
+        str(BASE_DIR / "data" / "evidence_pack" / f"{insurer}_evidence_pack.jsonl"),
+        insurer,
+        str(output),
+        max_cards_in_memory=max_cards_in_memory
+    )
+
+
+@pytest.mark.parametrize("insurer", INSURERS)
+def test_streaming_build_matches_locked_cards(insurer, tmp_path):
+    """1. in-memory 정렬 경로 결과 == 기존 cards JSONL"""
+    output = tmp_path / f"{insurer}_coverage_cards.jsonl"
+    _build(insurer, output, max_cards_in_memory=10000)
+
+    expected = (BASE_DIR / "data" / "compare" / f"{insurer}_coverage_cards.jsonl").read_bytes()
+    assert output.read_bytes() == expected, f"{insurer}: streaming build differs from locked cards"
+
+
+@pytest.mark.parametrize("insurer", ['samsung', 'db', 'lotte'])
+def test_external_sort_matches_in_memory(insurer, tmp_path):
+    """2. run spill(카드 4개 단위) 경로 결과 == in-memory 경로 결과"""
+    in_memory = tmp_path / "in_memory.jsonl"
+    spilled = tmp_path / "spilled.jsonl"
+    _build(insurer, in_memory, max_cards_in_memory=10000)
+    _build(insurer, spilled, max_cards_in_memory=4)
+
+    assert spilled.read_bytes() == in_memory.read_bytes(), \
+        f"{insurer}: external sort output differs from in-memory sort"
+
+
+def test_stats_match_cards(tmp_path):
+    """3. 반환 통계 == cards 내용"""
+    output = tmp_path / "samsung_coverage_cards.jsonl"
+    stats = _build('samsung', output, max_cards_in_memory=3)
+
+    cards = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines() if line.strip()]
+    assert stats.total_coverages == len(cards)
+    assert stats.matched == sum(1 for c in cards if c['mapping_status'] == 'matched')
+    assert stats.evidence_found == sum(1 for c in cards if c['evidence_status'] == 'found')
+    assert stats.evidence_not_found == sum(1 for c in cards if c['evidence_status'] == 'not_found')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
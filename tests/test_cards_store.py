@@ -0,0 +1,109 @@
+"""
+Cards Store (projection read) 테스트
+
+Contract tests:
+1. summary sidecar 기반 view == 전체 CoverageCard (비교 필드 + top evidence ref)
+2. view.evidences lazy decode 결과 == 전체 CoverageCard evidences
+3. cards JSONL 변경 시 stale sidecar 무시 (JSONL 직접 읽기로 fallback)
+4. Step 7 비교 결과: view 기반 == 전체 CoverageCard 기반
+"""
+
+import pytest
+import json
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.compare_types import CoverageCard
+from core.cards_store import load_card_views, load_cards_summary, summary_path_for
+from pipeline.step5_build_cards.build_cards import build_coverage_cards
+from pipeline.step7_compare import compare_insurers as step7
+
+
+BASE_DIR = Path(__file__).parent.parent
+COMPARE_FIELDS = [
+    'insurer', 'coverage_name_raw', 'coverage_code', 'coverage_name_canonical',
+    'mapping_status', 'evidence_status', 'hits_by_doc_type', 'flags'
+]
+
+
+def _build(insurer: str, tmp_path: Path) -> Path:
+    output = tmp_path / f"{insurer}_coverage_cards.jsonl"
+    build_coverage_cards(
+        str(BASE_DIR / "data" / "scope" / f"{insurer}_scope_mapped.csv"),
+        str(BASE_DIR / "data" / "evidence_pack" / f"{insurer}_evidence_pack.jsonl"),
+        insurer,
+        str(output)
+    )
+    return output
+
+
+def _load_full(cards_jsonl: Path):
+    with open(cards_jsonl, 'r', encoding='utf-8') as f:
+        return [CoverageCard.from_json(line) for line in f if line.strip()]
+
+
+@pytest.mark.parametrize("insurer", ['samsung', 'db'])
+def test_summary_views_match_full_cards(insurer, tmp_path):
+    """1. summary 기반 view 비교 필드 == 전체 카드"""
+    cards_jsonl = _build(insurer, tmp_path)
+    assert load_cards_summary(cards_jsonl) is not None
+
+    views = load_card_views(cards_jsonl)
+    cards = _load_full(cards_jsonl)
+    assert len(views) == len(cards)
+    for view, card in zip(views, cards):
+        for name in COMPARE_FIELDS:
+            assert getattr(view, name) == getattr(card, name)
+        assert view.get_top_evidence_ref() == card.get_top_evidence_ref()
+        # summary 기반 view는 evidence를 아직 decode하지 않음
+        assert view._raw_evidences is None and view._evidences is None
+
+
+def test_lazy_evidences_match_full_cards(tmp_path):
+    """2. evidences lazy decode (summary seek / JSONL 직접 읽기) == 전체 카드"""
+    cards_jsonl = _build('samsung', tmp_path)
+    cards = _load_full(cards_jsonl)
+
+    for use_summary in (True, False):
+        views = load_card_views(cards_jsonl, use_summary=use_summary)
+        for view, card in zip(views, cards):
+            assert view.evidences == card.evidences
+            assert view.to_card() == card
+
+
+def test_stale_summary_is_ignored(tmp_path):
+    """3. cards JSONL이 sidecar 기록 후 변경되면 sidecar 무시"""
+    cards_jsonl = _build('samsung', tmp_path)
+    lines = cards_jsonl.read_text(encoding='utf-8').splitlines(keepends=True)
+    cards_jsonl.write_text(''.join(lines[:5]), encoding='utf-8')
+
+    assert summary_path_for(cards_jsonl).exists()
+    assert load_cards_summary(cards_jsonl) is None
+    assert len(load_card_views(cards_jsonl)) == 5
+
+
+def test_step7_views_match_full_cards(tmp_path, monkeypatch):
+    """4. Step 7 비교 결과가 전체 CoverageCard 로드 기준과 동일"""
+    cards_a = _build('samsung', tmp_path)
+    cards_b = _build('meritz', tmp_path)
+
+    def run(name):
+        out = tmp_path / name
+        out.mkdir()
+        step7.compare_insurers(
+            'samsung', 'meritz', str(cards_a), str(cards_b),
+            str(out / "compare.jsonl"), str(out / "report.md"), str(out / "stats.json")
+        )
+        return [(out / f).read_bytes() for f in ("compare.jsonl", "report.md", "stats.json")]
+
+    with_views = run("views")
+    monkeypatch.setattr(step7, 'load_card_views', _load_full)
+    with_full_cards = run("full")
+    assert with_views == with_full_cards
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
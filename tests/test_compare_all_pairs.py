@@ -0,0 +1,65 @@
+"""
+All-pairs Comparison (Step 7 --all-pairs) 테스트
+
+Contract tests:
+1. 쌍별 JSONL/MD 출력 == 단일 쌍 compare_insurers 출력
+2. 통합 stats는 모든 쌍을 "A_vs_B" 키로 포함
+"""
+
+import pytest
+import json
+from itertools import combinations
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.step7_compare.compare_insurers import compare_insurers, compare_all_pairs
+
+
+BASE_DIR = Path(__file__).parent.parent
+CARDS_DIR = BASE_DIR / "data" / "compare"
+INSURERS = ['db', 'meritz', 'samsung', 'lotte']
+
+
+@pytest.fixture(scope="module")
+def all_pairs_output(tmp_path_factory):
+    out = tmp_path_factory.mktemp("all_pairs")
+    stats = compare_all_pairs(INSURERS, str(CARDS_DIR), str(out), str(out), str(out / "stats.json"), jobs=3)
+    return out, stats
+
+
+@pytest.mark.parametrize("insurer_a,insurer_b", list(combinations(INSURERS, 2)))
+def test_pair_outputs_match_single_compare(all_pairs_output, insurer_a, insurer_b, tmp_path):
+    """1. 쌍별 출력 == 단일 쌍 비교 출력"""
+    out, all_stats = all_pairs_output
+    pair = f"{insurer_a}_vs_{insurer_b}"
+
+    stats = compare_insurers(
+        insurer_a, insurer_b,
+        str(CARDS_DIR / f"{insurer_a}_coverage_cards.jsonl"),
+        str(CARDS_DIR / f"{insurer_b}_coverage_cards.jsonl"),
+        str(tmp_path / "compare.jsonl"),
+        str(tmp_path / "report.md"),
+        str(tmp_path / "stats.json")
+    )
+
+    assert (out / f"{pair}_compare.jsonl").read_bytes() == (tmp_path / "compare.jsonl").read_bytes()
+    assert (out / f"{pair}_report.md").read_bytes() == (tmp_path / "report.md").read_bytes()
+    assert all_stats[pair] == stats
+
+
+def test_combined_stats_keyed_by_pair(all_pairs_output):
+    """2. 통합 stats 파일 = 전체 쌍"""
+    out, all_stats = all_pairs_output
+    with open(out / "stats.json", 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+
+    expected_keys = [f"{a}_vs_{b}" for a, b in combinations(INSURERS, 2)]
+    assert list(saved.keys()) == expected_keys
+    assert saved == all_stats
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
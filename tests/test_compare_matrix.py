@@ -0,0 +1,90 @@
+"""
+Multi-Insurer × Multi-Coverage Comparison Matrix (Step 10 engine) 테스트
+
+Contract tests:
+1. config(A4200_1) 실행 결과 == 기존 a4200_1_all_compare.json / a4200_1_all_insurers.md
+2. 다수 code 실행 시 code별 비교 JSON == code별 단독 비교
+3. columnar table 셀 == profile slot 값
+"""
+
+import pytest
+import json
+import shutil
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.single_compare import SLOT_KEYS, load_compare_targets, load_profiles
+from pipeline.step10_multi_single_compare.compare_matrix import run_compare_matrix
+from pipeline.step10_multi_single_compare.compare_a4200_1_all import generate_comparison_json
+from pipeline.step8_single_coverage.extract_single_coverage import run_batch
+
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+def test_config_run_matches_locked_a4200_1(tmp_path):
+    """1. A4200_1 출력 동일"""
+    (tmp_path / 'data' / 'single').mkdir(parents=True)
+    for profile in (BASE_DIR / 'data' / 'single').glob('*_A4200_1_profile.json'):
+        shutil.copy2(profile, tmp_path / 'data' / 'single')
+
+    targets, insurers = load_compare_targets()
+    assert 'A4200_1' in targets
+    run_compare_matrix(tmp_path, {'A4200_1': targets['A4200_1']}, insurers, jobs=2)
+
+    assert (tmp_path / 'data' / 'single' / 'a4200_1_all_compare.json').read_bytes() == \
+        (BASE_DIR / 'data' / 'single' / 'a4200_1_all_compare.json').read_bytes()
+    assert (tmp_path / 'reports' / 'a4200_1_all_insurers.md').read_bytes() == \
+        (BASE_DIR / 'reports' / 'a4200_1_all_insurers.md').read_bytes()
+
+
+@pytest.fixture(scope="module")
+def batch_base(tmp_path_factory):
+    """samsung / meritz / db 전체 matched code profile이 있는 임시 프로젝트 루트"""
+    base = tmp_path_factory.mktemp("matrix")
+    for sub, suffix in (('compare', '_coverage_cards.jsonl'), ('evidence_pack', '_evidence_pack.jsonl')):
+        (base / 'data' / sub).mkdir(parents=True)
+        for insurer in ('samsung', 'meritz', 'db'):
+            shutil.copy2(BASE_DIR / 'data' / sub / f'{insurer}{suffix}', base / 'data' / sub)
+    profiles_by_code = run_batch(base, ['samsung', 'meritz', 'db'], jobs=1)
+    return base, profiles_by_code
+
+
+def test_multi_code_matches_single_code(batch_base):
+    """2. 다수 code 동시 실행 == code별 단독 비교"""
+    base, profiles_by_code = batch_base
+    codes = sorted(profiles_by_code)[:10]
+
+    table = run_compare_matrix(base, {code: {} for code in codes}, jobs=4)
+
+    for code in codes:
+        with open(base / 'data' / 'single' / f'{code.lower()}_all_compare.json', 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        assert saved == table.comparison(code)
+        assert saved['insurers'] == sorted(profiles_by_code[code])
+        if code != 'A4200_1':
+            assert saved == generate_comparison_json(profiles_by_code[code], code)
+
+
+def test_table_cells_match_profiles(batch_base):
+    """3. columnar 셀 == profile slot"""
+    base, profiles_by_code = batch_base
+    codes = sorted(profiles_by_code)
+    table = run_compare_matrix(base, {code: {} for code in codes}, insurers=['samsung', 'db'], jobs=2)
+
+    loaded = load_profiles(base, codes, ['samsung', 'db'])
+    for code in codes:
+        assert table.insurers_of(code) == sorted(loaded[code])
+        for insurer, profile in loaded[code].items():
+            for s, slot_key in enumerate(SLOT_KEYS):
+                pos = table._cell(code, insurer) * len(SLOT_KEYS) + s
+                assert table.status[pos] == profile[slot_key]['status']
+                assert table.refs[pos] == profile[slot_key]['refs']
+                assert table.has_text[pos] == (profile[slot_key]['text'] is not None)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,160 @@
+"""
+Coverage profile registry 테스트
+
+Contract tests:
+1. data/coverage_profiles/A4210.json == 기존 A4210_PROFILE (gate_context_hash / 감사 기록 호환)
+2. JSON / YAML 로드 (YAML 파일이 없으면 PyYAML 불필요), 필수 키 누락 / coverage_code 중복 / 잘못된 패턴은 ProfileError
+3. 패턴 cache: profile 수가 늘어도 같은 패턴은 1회 compile, 같은 목록은 같은 CompiledPatternSet
+4. CompiledPatternSet.first_hit / any_hit == 패턴별 re.search (목록 순서, union 불가 패턴 포함)
+5. GateEngine 생성 / 판정 중 re.compile 없음 (registry compile 결과 사용)
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools import coverage_profiles
+from tools.coverage_profiles import (
+    COVERAGE_PROFILES, PROFILE_DIR, PROFILE_LOAD_REPORT, ProfileError, compile_pattern_set, compiled_profile,
+    load_profiles, pattern_cache_info, union_regex
+)
+from tools.gate_engine import GateContext, GateEngine, apply_gates
+
+SLOT_KEYS = ["waiting_period", "exclusions", "subtype_coverage_map"]
+
+TEXTS = [
+    "유사암진단비 보험금을 지급합니다. 보장개시일부터 90일 면책",
+    "유사암 입원일당 연간 3 회한 지급",
+    "유사암진단비 보험료 납입면제 사유에 해당하는 경우",
+    "제자리암, 경계성종양 정의 보험가입금액",
+    "일반 약관 조항 본문",
+    "",
+]
+
+
+def _write_profile(directory: Path, name: str, profile: dict, fmt: str = "json") -> Path:
+    path = directory / f"{name}.{fmt}"
+    with open(path, 'w', encoding='utf-8') as f:
+        if fmt == "json":
+            json.dump(profile, f, ensure_ascii=False)
+        else:
+            yaml = pytest.importorskip("yaml")
+            yaml.safe_dump(profile, f, allow_unicode=True)
+    return path
+
+
+def test_a4210_profile_data_file():
+    profile = COVERAGE_PROFILES["A4210"]
+    assert profile["profile_id"] == "A4210_PROFILE_V1"
+    assert profile["gate_version"] == "GATE_SSOT_V2_CONTEXT_GUARD"
+    assert profile["required_terms_by_slot"]["waiting_period"][4] == r"\d+일"
+    assert profile["hard_negative_terms_global"][5] == r"연간\s*\d+\s*회한"
+    assert profile["slot_specific_negatives"] == {"subtype_coverage_map": ["납입면제", r"면제\s*사유", "보장보험료"]}
+    assert PROFILE_LOAD_REPORT["profiles"] == len(COVERAGE_PROFILES) >= 1
+    assert PROFILE_LOAD_REPORT["load_ms"] >= 0 and PROFILE_LOAD_REPORT["compile_ms"] >= 0
+
+
+def test_load_yaml_and_json(tmp_path):
+    base = dict(COVERAGE_PROFILES["A4210"])
+    _write_profile(tmp_path, "A4210", base, fmt="yml")
+    _write_profile(tmp_path, "B0001", dict(base, coverage_code="B0001", profile_id="B0001_V1"))
+    (tmp_path / "README.md").write_text("ignored", encoding='utf-8')
+
+    profiles, report = load_profiles(tmp_path)
+    assert sorted(profiles) == ["A4210", "B0001"]
+    assert profiles["A4210"] == base
+    assert report["files"] == report["profiles"] == 2
+
+
+def test_json_profiles_without_pyyaml(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "yaml", None)  # import yaml → ImportError
+    _write_profile(tmp_path, "A4210", COVERAGE_PROFILES["A4210"])
+    profiles, _ = load_profiles(tmp_path)
+    assert profiles["A4210"] == COVERAGE_PROFILES["A4210"]
+
+    (tmp_path / "B0001.yml").write_text("coverage_code: B0001\n", encoding='utf-8')
+    with pytest.raises(ProfileError, match="PyYAML"):
+        load_profiles(tmp_path)
+
+
+@pytest.mark.parametrize("change, message", [
+    ({"profile_id": None}, "missing keys"),
+    ({"hard_negative_terms_global": ["(unclosed"]}, "invalid pattern"),
+])
+def test_invalid_profiles_rejected(tmp_path, change, message):
+    profile = dict(COVERAGE_PROFILES["A4210"], **change)
+    profile = {key: value for key, value in profile.items() if value is not None}
+    _write_profile(tmp_path, "A4210", profile)
+    with pytest.raises(ProfileError, match=message):
+        load_profiles(tmp_path)
+
+
+def test_duplicate_coverage_code_rejected(tmp_path):
+    _write_profile(tmp_path, "a", COVERAGE_PROFILES["A4210"])
+    _write_profile(tmp_path, "b", COVERAGE_PROFILES["A4210"], fmt="json")
+    with pytest.raises(ProfileError, match="duplicate coverage_code"):
+        load_profiles(tmp_path)
+
+
+def test_many_profiles_share_compiled_patterns(tmp_path):
+    base = COVERAGE_PROFILES["A4210"]
+    for i in range(40):
+        _write_profile(tmp_path, f"P{i:04d}", dict(base, coverage_code=f"P{i:04d}", profile_id=f"P{i:04d}_V1",
+                                                   anchor_keywords=[f"담보{i}"]))
+    before = pattern_cache_info()
+    profiles, report = load_profiles(tmp_path)
+    assert len(profiles) == 40
+    # anchor는 패턴이 아니고 나머지 패턴 목록은 A4210과 같음 → 새 compile 없음
+    assert report["patterns_compiled"] == 0 and report["pattern_sets"] == 0
+    assert pattern_cache_info()["patterns"] == before["patterns"]
+
+    compiled = [compiled_profile(profile) for profile in profiles.values()]
+    assert all(c.hard_negatives is compiled[0].hard_negatives for c in compiled)
+    assert compiled_profile(dict(base)) is compiled_profile(base)
+
+
+@pytest.mark.parametrize("patterns", [
+    COVERAGE_PROFILES["A4210"]["hard_negative_terms_global"],
+    COVERAGE_PROFILES["A4210"]["section_negative_terms_global"],
+    ["보험금", r"(일)\1", "정의"],
+    ["면책"],
+    [],
+])
+def test_pattern_set_matches_individual_search(patterns):
+    pattern_set = compile_pattern_set(patterns)
+    for text in TEXTS + ["일일 보험금", "정의 면책"]:
+        expected = next((p for p in patterns if re.search(p, text)), None)
+        assert pattern_set.first_hit(text) == expected
+        assert pattern_set.any_hit(text) == (expected is not None)
+
+
+def test_union_regex_skips_unsafe_patterns():
+    assert union_regex(["a", r"\d+"]) == r"(?:a)|(?:\d+)"
+    assert union_regex(["a"]) is None
+    assert union_regex(["a", r"(b)\1"]) is None
+    assert union_regex(["a", "(?i)b"]) is None
+
+
+def test_engine_uses_registry_compiled_patterns(monkeypatch):
+    ctx = GateContext("A4210", "N01", ["유사암"], "유사암진단비", COVERAGE_PROFILES["A4210"])
+    expected = {text: {slot_key: apply_gates(slot_key, text, text, ctx) for slot_key in SLOT_KEYS}
+                for text in TEXTS}
+
+    def fail(*args, **kwargs):
+        raise AssertionError("re.compile called during gating")
+
+    monkeypatch.setattr(coverage_profiles.re, "compile", fail)
+    engine = GateEngine(GateContext("A4210", "N08", ["유사암"], "유사암진단비", COVERAGE_PROFILES["A4210"]))
+    for text in TEXTS:
+        assert engine.evaluate(text, text, SLOT_KEYS) == expected[text]
+
+
+def test_profile_dir_contains_only_valid_profiles():
+    profiles, _ = load_profiles(PROFILE_DIR)
+    assert profiles == COVERAGE_PROFILES
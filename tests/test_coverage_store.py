@@ -0,0 +1,395 @@
+"""
+Coverage Store (SQLite stand-in) 테스트
+
+Contract tests:
+1. JSONL export → SQLite load (멱등 재적재)
+2. SQLite 후보 pushdown == Python GATE 1-3 필터
+3. DBOnlyCoveragePipeline end-to-end (SQLite): evidence_slot == 순수 Python gate 결과,
+   재실행 멱등, chunk 삭제 시 stale slot 제거
+4. MultiCoverageRunner (SQLite 파일, thread / process pool, 후보 스트리밍) 결과 == 단일 실행,
+   batch 단위 gate로 모든 slot 판정 후 이후 batch 미조회
+5. 후보 스트리밍 (excerpt 먼저, chunk_text batch 조회) == fetch_candidates, 조기 종료 시 이후 batch 미조회
+6. generation fingerprint: 입력 불변이면 재생성 skip, chunk / mapping / profile 변경 또는 --force면 재생성,
+   chunk 내용은 chunk_hashes 1회 조회로 checksum / 재판정 계획 공유
+7. as_of_date 보존: retention_dates 선택, 지난 기준일 archive 이동 후 현재 기준일 결과 불변
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.coverage_profiles import COVERAGE_PROFILES, get_profile
+from tools.coverage_store import SqliteCoverageStore
+from tools.coverage_store_cli import load_jsonl, retention_dates
+from tools.gate_engine import GateContext, apply_gates, select_slot_chunks
+from tools.incremental_slots import chunks_checksum
+from tools.run_db_only_coverage import SLOT_KEYS, DBOnlyCoveragePipeline, MultiCoverageRunner
+
+
+COVERAGE_CODE = "A4210"
+AS_OF_DATE = "2025-11-26"
+PROFILE = get_profile(COVERAGE_CODE)
+
+MAPPINGS = [
+    {"coverage_code": COVERAGE_CODE, "ins_cd": "N01", "anchor_keywords": ["유사암", "유사암진단비"],
+     "insurer_coverage_name": "유사암진단비"},
+    {"coverage_code": COVERAGE_CODE, "ins_cd": "N08", "anchor_keywords": ["유사암"],
+     "insurer_coverage_name": "유사암 진단비(경계성종양)"},
+    {"coverage_code": COVERAGE_CODE, "ins_cd": "N09", "anchor_keywords": [],
+     "insurer_coverage_name": "유사암진단비"},
+]
+
+TEXTS = [
+    ("유사암진단비 보험금을 지급합니다. 보장개시일부터 90일 면책", "유사암진단비 지급"),
+    ("유사암 진단확정 시 보험가입금액 지급. 제자리암, 경계성종양 정의", "유사암 정의"),
+    ("유사암진단비는 다음의 경우 보험금을 지급하지 않습니다 (제외)", "유사암진단비 제외"),
+    ("유사암 입원일당 연간 3 회한 지급", "유사암 입원일당"),
+    ("유사암진단비 보험료 납입면제 사유에 해당하는 경우", "유사암 납입면제"),
+    ("일반 약관 조항 본문 보험금", "일반 조항"),
+    ("100%_유사암 진단비 보험금 지급 범위", "100%_유사암"),
+]
+
+
+def _chunks() -> list:
+    chunks = []
+    chunk_id = 1
+    for ins_cd in ("N01", "N08", "N09"):
+        # 통과 chunk가 뒤쪽에 오도록 역순 배치
+        for text, excerpt in reversed(TEXTS):
+            chunks.append({"chunk_id": chunk_id, "coverage_code": COVERAGE_CODE, "as_of_date": AS_OF_DATE,
+                           "ins_cd": ins_cd, "chunk_text": text, "excerpt": excerpt, "page_number": chunk_id})
+            chunk_id += 1
+    chunks.append({"chunk_id": chunk_id, "coverage_code": COVERAGE_CODE, "as_of_date": "2025-10-01",
+                   "ins_cd": "N01", "chunk_text": TEXTS[0][0], "excerpt": TEXTS[0][1], "page_number": 1})
+    return chunks
+
+
+def _write_jsonl(path: Path, rows: list) -> Path:
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + '\n')
+    return path
+
+
+@pytest.fixture
+def sqlite_path(tmp_path) -> str:
+    path = str(tmp_path / "ssot.db")
+    store = SqliteCoverageStore(path)
+    try:
+        assert load_jsonl(store, "coverage_mapping_ssot", _write_jsonl(tmp_path / "mapping.jsonl", MAPPINGS)) == 3
+        assert load_jsonl(store, "coverage_chunk", _write_jsonl(tmp_path / "chunks.jsonl", _chunks())) == 22
+    finally:
+        store.close()
+    return path
+
+
+def _expected_slots() -> dict:
+    """순수 Python gate (apply_gates, 전체 chunk) 기준 (ins_cd, slot_key) → chunk_id"""
+    expected = {}
+    chunks = [c for c in _chunks() if c["as_of_date"] == AS_OF_DATE]
+    for mapping in MAPPINGS:
+        ctx = GateContext(COVERAGE_CODE, mapping["ins_cd"], mapping["anchor_keywords"],
+                          mapping["insurer_coverage_name"], PROFILE)
+        for slot_key in SLOT_KEYS:
+            for chunk in (c for c in chunks if c["ins_cd"] == mapping["ins_cd"]):
+                if apply_gates(slot_key, chunk["chunk_text"], chunk["excerpt"], ctx)[0]:
+                    expected[(mapping["ins_cd"], slot_key)] = chunk["chunk_id"]
+                    break
+    return expected
+
+
+def _slots(sqlite_path: str) -> dict:
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        rows = store.conn.execute("""
+            SELECT ins_cd, slot_key, chunk_id, status FROM evidence_slot
+            WHERE coverage_code = ? AND as_of_date = ?
+        """, (COVERAGE_CODE, AS_OF_DATE)).fetchall()
+        assert all(row["status"] == "FOUND" for row in rows)
+        return {(row["ins_cd"], row["slot_key"]): row["chunk_id"] for row in rows}
+    finally:
+        store.close()
+
+
+def _compare_tables(sqlite_path: str) -> list:
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        rows = store.conn.execute("SELECT payload FROM compare_table_v2 WHERE coverage_code = ?",
+                                  (COVERAGE_CODE,)).fetchall()
+        return [json.loads(row["payload"]) for row in rows]
+    finally:
+        store.close()
+
+
+def _run(sqlite_path: str, ins_cds=None, force: bool = False, itersize: int = 2000) -> bool:
+    return DBOnlyCoveragePipeline(COVERAGE_CODE, AS_OF_DATE, ins_cds, adaptive_gates=False,
+                                  sqlite_path=sqlite_path, force=force, itersize=itersize).run()
+
+
+def _execute(sqlite_path: str, sql: str, params: tuple = ()):
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        store.conn.execute(sql, params)
+    finally:
+        store.close()
+
+
+def test_load_is_idempotent(sqlite_path, tmp_path):
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        load_jsonl(store, "coverage_chunk", _write_jsonl(tmp_path / "chunks.jsonl", _chunks()))
+        load_jsonl(store, "coverage_mapping_ssot", _write_jsonl(tmp_path / "mapping.jsonl", MAPPINGS))
+        assert store.count_chunks(COVERAGE_CODE, AS_OF_DATE) == 21
+        assert store.mapped_ins_cds(COVERAGE_CODE) == ["N01", "N08", "N09"]
+        assert store.load_mappings(COVERAGE_CODE, ["N01"])["N01"]["anchors"] == ["유사암", "유사암진단비"]
+    finally:
+        store.close()
+
+
+def test_sqlite_pushdown_matches_python_gates(sqlite_path):
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        for mapping in MAPPINGS:
+            anchors = mapping["anchor_keywords"]
+            hard = PROFILE["hard_negative_terms_global"]
+            section = PROFILE["section_negative_terms_global"]
+            got = store.fetch_candidates(COVERAGE_CODE, AS_OF_DATE, mapping["ins_cd"], anchors, hard, section)
+
+            expected = [
+                c["chunk_id"] for c in _chunks()
+                if c["ins_cd"] == mapping["ins_cd"] and c["as_of_date"] == AS_OF_DATE
+                and any(anchor in c["excerpt"] for anchor in anchors)
+                and not any(re.search(p, c["chunk_text"]) for p in hard + section)
+            ]
+            assert [c["chunk_id"] for c in got] == expected, mapping["ins_cd"]
+    finally:
+        store.close()
+
+
+@pytest.mark.parametrize("itersize", [1, 3, 100])
+def test_streamed_candidates_match_fetch(sqlite_path, itersize):
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        pipeline = DBOnlyCoveragePipeline(COVERAGE_CODE, AS_OF_DATE, store=store, itersize=itersize)
+        for mapping in MAPPINGS:
+            ctx = GateContext(COVERAGE_CODE, mapping["ins_cd"], mapping["anchor_keywords"],
+                              mapping["insurer_coverage_name"], PROFILE)
+            excerpts = list(store.iter_candidate_excerpts(
+                COVERAGE_CODE, AS_OF_DATE, mapping["ins_cd"], ctx.anchors,
+                ctx.get_hard_negatives(), ctx.get_section_negatives(), itersize=itersize))
+            assert all("chunk_text" not in row for row in excerpts)
+
+            expected = pipeline.fetch_candidates(mapping["ins_cd"], ctx)
+            assert [row["chunk_id"] for row in excerpts] == [c["chunk_id"] for c in expected]
+            assert list(pipeline.stream_candidates(mapping["ins_cd"], ctx)) == expected
+    finally:
+        store.close()
+
+
+def test_streaming_stops_fetching_after_all_slots_found(sqlite_path):
+    store = SqliteCoverageStore(sqlite_path)
+    fetched = []
+    fetch_chunk_texts = store.fetch_chunk_texts
+    store.fetch_chunk_texts = lambda chunk_ids, as_of_date: \
+        fetched.extend(chunk_ids) or fetch_chunk_texts(chunk_ids, as_of_date)
+    try:
+        pipeline = DBOnlyCoveragePipeline(COVERAGE_CODE, AS_OF_DATE, store=store, itersize=1)
+        mapping = MAPPINGS[0]
+        ctx = GateContext(COVERAGE_CODE, mapping["ins_cd"], mapping["anchor_keywords"],
+                          mapping["insurer_coverage_name"], PROFILE)
+        # 모든 slot이 첫 후보에서 통과하는 slot 목록 → 첫 batch 이후 조회 없음
+        candidates = pipeline.fetch_candidates(mapping["ins_cd"], ctx)
+        first = candidates[0]
+        slot_keys = [k for k in SLOT_KEYS if apply_gates(k, first["chunk_text"], first["excerpt"], ctx)[0]]
+        assert slot_keys and len(candidates) > 1
+
+        stream = pipeline.stream_candidates(mapping["ins_cd"], ctx)
+        found = select_slot_chunks(slot_keys, stream, ctx)
+        stream.close()
+        assert {k: c["chunk_id"] for k, c in found.items()} == {k: first["chunk_id"] for k in slot_keys}
+        assert fetched == [first["chunk_id"]]
+    finally:
+        store.close()
+
+
+@pytest.mark.parametrize("itersize", [1, 2])
+def test_pipeline_small_itersize(sqlite_path, itersize):
+    _run(sqlite_path, itersize=itersize)
+    assert _slots(sqlite_path) == _expected_slots()
+
+
+def test_pipeline_end_to_end(sqlite_path):
+    _run(sqlite_path)
+    expected = _expected_slots()
+    assert expected
+    assert _slots(sqlite_path) == expected
+
+    tables = _compare_tables(sqlite_path)
+    assert len(tables) == 1
+    payload = tables[0]
+    assert payload["debug"]["chunk_rowcount_at_generation"] == 21
+    assert [row["ins_cd"] for row in payload["insurer_rows"]] == sorted({ins for ins, _ in expected})
+
+    # 재실행: 결과 동일, compare_table_v2는 교체
+    _run(sqlite_path)
+    assert _slots(sqlite_path) == expected
+    assert len(_compare_tables(sqlite_path)) == 1
+
+
+def test_stale_slots_removed(sqlite_path):
+    _run(sqlite_path)
+    before = _slots(sqlite_path)
+    winner = before[("N01", "waiting_period")]
+
+    _execute(sqlite_path, "DELETE FROM coverage_chunk WHERE ins_cd = 'N01'")
+
+    _run(sqlite_path)
+    after = _slots(sqlite_path)
+    assert not any(ins_cd == "N01" for ins_cd, _ in after)
+    assert winner not in after.values()
+    assert {k: v for k, v in before.items() if k[0] != "N01"} == after
+
+
+def test_multi_coverage_runner_matches_single(sqlite_path, monkeypatch):
+    # 작업 단위도 스트리밍 경로 사용 (chunk_text 일괄 fetch 없음)
+    def fail(*args, **kwargs):
+        raise AssertionError("fetch_candidates called")
+
+    monkeypatch.setattr(SqliteCoverageStore, "fetch_candidates", fail)
+    MultiCoverageRunner([COVERAGE_CODE], AS_OF_DATE, jobs=2, io_jobs=2, adaptive_gates=False,
+                        sqlite_path=sqlite_path).run()
+    assert _slots(sqlite_path) == _expected_slots()
+    assert len(_compare_tables(sqlite_path)) == 1
+
+
+def test_multi_coverage_runner_stops_fetching_after_all_slots_found(sqlite_path, monkeypatch):
+    fetched = []
+    fetch_chunk_texts = SqliteCoverageStore.fetch_chunk_texts
+
+    def recording_fetch(self, chunk_ids, as_of_date):
+        fetched.extend(chunk_ids)
+        return fetch_chunk_texts(self, chunk_ids, as_of_date)
+
+    monkeypatch.setattr(SqliteCoverageStore, "fetch_chunk_texts", recording_fetch)
+    MultiCoverageRunner([COVERAGE_CODE], AS_OF_DATE, jobs=2, io_jobs=2, adaptive_gates=False,
+                        sqlite_path=sqlite_path, itersize=1).run()
+    expected = _expected_slots()
+    assert _slots(sqlite_path) == expected
+
+    # 후보: N01 [1, 5, 6, 7], N08 [8, 12, 13, 14] → N08 winner(13) 뒤 chunk 14는 chunk_text 미조회
+    assert max(expected.values()) == 13
+    assert sorted(fetched) == [1, 5, 6, 7, 8, 12, 13]
+
+
+def test_unchanged_inputs_skip_regeneration(sqlite_path):
+    assert _run(sqlite_path) is True
+    first = _compare_tables(sqlite_path)[0]["debug"]
+    assert first["fingerprint_inputs"]["chunks"]["rowcount"] == 21
+
+    assert _run(sqlite_path) is False
+    assert _compare_tables(sqlite_path)[0]["debug"]["generated_at"] == first["generated_at"]
+
+    assert _run(sqlite_path, force=True) is True
+    assert _compare_tables(sqlite_path)[0]["debug"]["generation_fingerprint"] == first["generation_fingerprint"]
+
+
+@pytest.mark.parametrize("sql", [
+    "UPDATE coverage_chunk SET chunk_text = chunk_text || ' ' WHERE chunk_id = 3",
+    "UPDATE coverage_chunk SET page_number = 99 WHERE chunk_id = 3",
+    "DELETE FROM coverage_chunk WHERE chunk_id = 3",
+    "UPDATE coverage_mapping_ssot SET insurer_coverage_name = '유사암' WHERE ins_cd = 'N08'",
+])
+def test_changed_data_regenerates(sqlite_path, sql):
+    assert _run(sqlite_path) is True
+    _execute(sqlite_path, sql)
+    assert _run(sqlite_path) is True
+    assert _run(sqlite_path) is False
+
+
+def test_other_date_chunks_do_not_affect_fingerprint(sqlite_path):
+    assert _run(sqlite_path) is True
+    _execute(sqlite_path, "UPDATE coverage_chunk SET chunk_text = 'x' WHERE as_of_date = '2025-10-01'")
+    assert _run(sqlite_path) is False
+
+
+def test_profile_change_regenerates(sqlite_path, monkeypatch):
+    assert _run(sqlite_path) is True
+    changed = dict(PROFILE, anchor_keywords=PROFILE["anchor_keywords"] + ["소액암"])
+    monkeypatch.setitem(COVERAGE_PROFILES, COVERAGE_CODE, changed)
+    assert _run(sqlite_path) is True
+    assert _run(sqlite_path) is False
+
+
+def test_fingerprint_reuses_single_chunk_hash_pass(sqlite_path, monkeypatch):
+    """chunk 내용 조회는 chunk_hashes 1회 (fingerprint checksum / 재판정 계획 공유)"""
+    calls = []
+    chunk_hashes = SqliteCoverageStore.chunk_hashes
+
+    def counting_hashes(self, *args):
+        calls.append(args)
+        return chunk_hashes(self, *args)
+
+    monkeypatch.setattr(SqliteCoverageStore, "chunk_hashes", counting_hashes)
+    assert _run(sqlite_path) is True
+    assert len(calls) == 1
+
+    checksum = _compare_tables(sqlite_path)[0]["debug"]["fingerprint_inputs"]["chunks"]
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        assert checksum == chunks_checksum(chunk_hashes(store, COVERAGE_CODE, AS_OF_DATE, ["N01", "N08", "N09"]))
+    finally:
+        store.close()
+    assert checksum["rowcount"] == 21 and checksum["max_chunk_id"] == 21
+
+
+def test_retention_dates():
+    dates = ["2025-09-26", "2025-11-26", "2025-10-26", "2025-11-26"]
+    assert retention_dates(dates, keep=2) == ["2025-09-26"]
+    assert retention_dates(dates, keep=5) == []
+    assert retention_dates(dates, before="2025-11-01") == ["2025-09-26", "2025-10-26"]
+    assert retention_dates(dates, keep=3, before="2025-10-01") == ["2025-09-26"]
+    assert retention_dates(dates) == []
+
+
+def test_chunk_texts_scoped_to_as_of_date(sqlite_path):
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        assert set(store.fetch_chunk_texts([1, 22], AS_OF_DATE)) == {1}
+        assert set(store.fetch_chunk_texts([1, 22], "2025-10-01")) == {22}
+    finally:
+        store.close()
+
+
+def test_detach_old_as_of_dates_to_archive(sqlite_path, tmp_path):
+    assert _run(sqlite_path) is True
+    before = _slots(sqlite_path)
+    archive = str(tmp_path / "archive.db")
+
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        assert store.as_of_dates() == ["2025-10-01", AS_OF_DATE]
+        with pytest.raises(ValueError):
+            store.detach_as_of_dates(["2025-10-01"])
+        expired = retention_dates(store.as_of_dates(), keep=1)
+        assert store.detach_as_of_dates(expired, archive=archive) == ["coverage_chunk_d20251001"]
+        assert store.as_of_dates() == [AS_OF_DATE]
+        assert store.detach_as_of_dates([], archive=archive) == []
+    finally:
+        store.close()
+
+    archived = SqliteCoverageStore(archive)
+    try:
+        rows = archived.conn.execute("SELECT chunk_id, as_of_date FROM coverage_chunk").fetchall()
+        assert [tuple(row) for row in rows] == [(22, "2025-10-01")]
+    finally:
+        archived.close()
+
+    # 현재 기준일 입력 / 결과는 그대로 (fingerprint 일치)
+    assert _run(sqlite_path) is False
+    assert _slots(sqlite_path) == before
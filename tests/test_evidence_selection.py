@@ -0,0 +1,119 @@
+"""
+Evidence Selection (STEP 6-ε.2) 테스트
+
+Contract tests:
+1. heap 기반 선택 결과 == 기존 full-sort 구현 결과 (randomized property test)
+2. 실제 evidence pack 전체에서 두 구현 결과 동일
+"""
+
+import pytest
+import json
+import random
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.compare_types import Evidence
+from pipeline.step5_build_cards.build_cards import _select_diverse_evidences
+
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+def _reference_select(evidences, max_count=3):
+    """기존 full-sort 구현 (Rule 6-ε.2.x 기준 구현)"""
+    if not evidences:
+        return []
+
+    def is_fallback(ev):
+        if not ev.match_keyword:
+            return False
+        mk_lower = ev.match_keyword.lower()
+        return 'fallback_' in mk_lower or ev.match_keyword.startswith('token_and(')
+
+    priority = {'약관': 0, '사업방법서': 1, '상품요약서': 2}
+
+    def sort_key(ev):
+        return (is_fallback(ev), priority.get(ev.doc_type, 999), ev.page, ev.file_path, ev.snippet)
+
+    seen_keys = set()
+    unique_evidences = []
+    for ev in evidences:
+        key = (ev.doc_type, ev.file_path, ev.page, ev.snippet)
+        if key not in seen_keys:
+            seen_keys.add(key)
+            unique_evidences.append(ev)
+
+    by_doc_type = {}
+    for ev in unique_evidences:
+        by_doc_type.setdefault(ev.doc_type, []).append(ev)
+    for doc_type in by_doc_type:
+        by_doc_type[doc_type].sort(key=sort_key)
+
+    selected = []
+    for doc_type in ['약관', '사업방법서', '상품요약서']:
+        if doc_type in by_doc_type and len(selected) < max_count:
+            selected.append(by_doc_type[doc_type][0])
+
+    if len(selected) < max_count:
+        selected_set = set(id(ev) for ev in selected)
+        remaining = [ev for ev in unique_evidences if id(ev) not in selected_set]
+        remaining.sort(key=sort_key)
+        for ev in remaining:
+            if len(selected) >= max_count:
+                break
+            selected.append(ev)
+
+    return selected[:max_count]
+
+
+def _random_evidence(rng: random.Random) -> Evidence:
+    return Evidence(
+        doc_type=rng.choice(['약관', '사업방법서', '상품요약서', '상품설명서', '가입설계서']),
+        file_path=rng.choice(['/a/약관.page.jsonl', '/b/요약서.page.jsonl', '/c/x.page.jsonl']),
+        page=rng.randint(1, 6),
+        snippet=rng.choice(['암 진단비', '유사암', '뇌출혈', '보험금 지급', '']),
+        match_keyword=rng.choice(['암진단비', 'fallback_token_and', 'FALLBACK_X', 'token_and(암,진단)', '', None])
+    )
+
+
+def _as_tuples(evidences):
+    return [(e.doc_type, e.file_path, e.page, e.snippet, e.match_keyword) for e in evidences]
+
+
+def test_matches_reference_on_random_sets():
+    """1. randomized evidence set에서 기존 구현과 동일 (순서 포함)"""
+    rng = random.Random(6022)
+    for _ in range(3000):
+        evidences = [_random_evidence(rng) for _ in range(rng.randint(0, 40))]
+        max_count = rng.randint(0, 6)
+
+        expected = _reference_select(evidences, max_count)
+        actual = _select_diverse_evidences(evidences, max_count)
+
+        assert _as_tuples(actual) == _as_tuples(expected)
+        # 동일 객체 선택 (dedup 시 최초 등장 evidence 유지)
+        assert [id(e) for e in actual] == [id(e) for e in expected]
+
+
+def test_matches_reference_on_evidence_packs():
+    """2. 전체 evidence pack에서 기존 구현과 동일"""
+    pack_files = sorted((BASE_DIR / "data" / "evidence_pack").glob("*_evidence_pack.jsonl"))
+    assert pack_files, "No evidence packs found"
+
+    for pack_file in pack_files:
+        with open(pack_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                evidences = [Evidence.from_dict(e) for e in item.get('evidences', [])]
+                assert _as_tuples(_select_diverse_evidences(evidences)) == \
+                    _as_tuples(_reference_select(evidences)), \
+                    f"{pack_file.name}: selection differs for {item['coverage_name_raw']}"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,226 @@
+"""
+Fused pipeline (tools/run_fused_pipeline.py) 테스트
+
+Contract tests:
+1. fused 산출물 == 단계별 함수(step 2 → 4 → 5 → 6 → 7 파일 경유) 산출물 (byte 단위)
+2. --no-intermediate: 리포트 / 비교만 기록, mapped CSV / evidence pack / cards 미기록
+3. CanonicalMapper / ScopeGate / corpus는 run() 반복 시에도 1회만 로드
+4. 일부 보험사만 fused 실행 시 나머지 보험사는 기존 cards 파일로 비교
+5. 계산 도중 실패하면 아무것도 기록하지 않음
+"""
+
+import csv
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pipeline.step4_evidence_search.search_evidence as step4
+import pipeline.step5_build_cards.build_cards as step5
+from core.scope_gate import load_scope_gate
+from pipeline.step2_canonical_mapping.map_to_canonical import CanonicalMapper, map_scope_rows, write_mapped_csv
+from pipeline.step6_build_report.build_report import build_markdown_report
+from pipeline.step7_compare.compare_insurers import compare_all_pairs
+from tools.run_fused_pipeline import FusedPipeline
+
+INSURERS = ["alpha", "beta"]
+
+SCOPE = {
+    "alpha": ["암진단비(유사암제외)", "뇌출혈진단비", "질병수술비", "특이담보A"],
+    "beta": ["암 진단비(유사암 제외)", "뇌출혈 진단비", "상해입원일당", "특이담보B"],
+}
+
+MAPPING = {
+    "암진단비(유사암제외)": ("A4200_1", "암진단비(유사암제외)"),
+    "뇌출혈진단비": ("A4102", "뇌출혈진단비"),
+    "질병수술비": ("A5100", "질병수술비"),
+    "상해입원일당": ("A6200", "상해입원일당"),
+}
+
+CORPUS = {
+    "약관": [
+        "제1조 암진단비(유사암제외)\n보험기간 중 암으로 진단확정된 경우\n가입금액을 지급합니다",
+        "뇌출혈진단비 지급\n뇌출혈로 진단확정\n특이담보A 관련 조항\n특이담보B 관련 조항",
+    ],
+    "사업방법서": ["질병수술비 1회당\n상해입원일당 1일당\n암진단비 유사암 제외 보험금 지급"],
+    "상품요약서": ["뇌출혈 진단비\n상해입원일당\n특이담보A"],
+}
+
+
+class FixtureMapper(CanonicalMapper):
+    """엑셀 대신 MAPPING 사전으로 mapping_dict 구성 (exact / normalized 규칙은 그대로)"""
+
+    loads = 0
+
+    def __init__(self):
+        super().__init__("fixture.xlsx")
+
+    def _load_mapping(self):
+        FixtureMapper.loads += 1
+        for name, (code, canonical) in MAPPING.items():
+            entry = {'coverage_code': code, 'coverage_name_canonical': canonical, 'match_type': 'exact'}
+            self.mapping_dict[name] = entry
+            self.mapping_dict[self._normalize(name)] = dict(entry, match_type='normalized')
+
+
+def _make_tree(root: Path) -> Path:
+    scope_dir = root / "data" / "scope"
+    scope_dir.mkdir(parents=True)
+    for insurer, names in SCOPE.items():
+        with open(scope_dir / f"{insurer}_scope.csv", 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['coverage_name_raw', 'insurer', 'source_page'])
+            writer.writeheader()
+            writer.writerows({'coverage_name_raw': n, 'insurer': insurer, 'source_page': str(i + 1)}
+                             for i, n in enumerate(names))
+
+        for doc_type, pages in CORPUS.items():
+            doc_dir = root / "data" / "evidence_text" / insurer / doc_type
+            doc_dir.mkdir(parents=True)
+            with open(doc_dir / "doc.page.jsonl", 'w', encoding='utf-8') as f:
+                for page, text in enumerate(pages, start=1):
+                    f.write(json.dumps({'page': page, 'text': text}, ensure_ascii=False) + '\n')
+    return root
+
+
+def _run_steps(root: Path, monkeypatch):
+    """단계별 함수로 파일 경유 실행 (step 2 → 4 → 5 → 6 → 7)"""
+    scope_dir = root / "data" / "scope"
+    gate_loader = lambda insurer: load_scope_gate(insurer, str(scope_dir))
+    monkeypatch.setattr(step4, "load_scope_gate", gate_loader)
+    monkeypatch.setattr(step5, "load_scope_gate", gate_loader)
+
+    mapper = FixtureMapper()
+    for insurer in INSURERS:
+        with open(scope_dir / f"{insurer}_scope.csv", 'r', encoding='utf-8') as f:
+            mapped_rows, _ = map_scope_rows(list(csv.DictReader(f)), mapper)
+        mapped_csv = scope_dir / f"{insurer}_scope_mapped.csv"
+        write_mapped_csv(mapped_rows, str(mapped_csv))
+
+        pack = root / "data" / "evidence_pack" / f"{insurer}_evidence_pack.jsonl"
+        pack.parent.mkdir(parents=True, exist_ok=True)
+        unmatched = scope_dir / f"{insurer}_unmatched_review.csv"
+        step4.create_evidence_pack(str(mapped_csv), str(root / "data" / "evidence_text"), insurer,
+                                   str(pack), str(unmatched))
+
+        cards = root / "data" / "compare" / f"{insurer}_coverage_cards.jsonl"
+        cards.parent.mkdir(parents=True, exist_ok=True)
+        step5.build_coverage_cards(str(mapped_csv), str(pack), insurer, str(cards))
+        build_markdown_report(str(cards), str(unmatched), insurer, str(root / "reports" / f"{insurer}_scope_report.md"))
+
+    compare_dir = root / "data" / "compare"
+    compare_all_pairs(INSURERS, str(compare_dir), str(compare_dir), str(root / "reports"),
+                      str(compare_dir / "all_pairs_compare_stats.json"), jobs=2)
+
+
+def _outputs(root: Path) -> dict:
+    """산출물 상대 경로 → 내용 (evidence file_path의 root 경로 치환, summary / index sidecar의 mtime 제외)"""
+    result = {}
+    for path in sorted(root.rglob("*")):
+        rel = str(path.relative_to(root))
+        if not path.is_file() or rel.startswith("data/evidence_text") or rel.endswith("_scope.csv"):
+            continue
+        content = path.read_bytes().replace(str(root).encode('utf-8'), b"<root>")
+        if rel.endswith((".summary.json", ".index.json")):
+            sidecar = json.loads(content)
+            sidecar.pop("source_mtime_ns")
+            content = sidecar
+        result[rel] = content
+    return result
+
+
+def _fused(root: Path, **kwargs) -> FusedPipeline:
+    return FusedPipeline(kwargs.pop("insurers", INSURERS), base_dir=root, mapper=FixtureMapper(),
+                         jobs=2, log=lambda message: None, **kwargs)
+
+
+def test_fused_outputs_match_step_outputs(tmp_path, monkeypatch):
+    stepwise = _make_tree(tmp_path / "steps")
+    _run_steps(stepwise, monkeypatch)
+    fused_root = _make_tree(tmp_path / "fused")
+    summary = _fused(fused_root).run()
+
+    expected = _outputs(stepwise)
+    assert "data/compare/alpha_vs_beta_compare.jsonl" in expected
+    assert "data/evidence_pack/beta_evidence_pack.index.json" in expected
+    assert _outputs(fused_root) == expected
+
+    cards = summary['insurers']['alpha']['cards']
+    assert cards['total_coverages'] == 4 and cards['matched'] == 3
+    assert summary['insurers']['beta']['mapping'] == {'matched': 3, 'unmatched': 1}
+    assert summary['pairs'] == 1
+    assert set(summary['timings']) == {"map", "evidence", "cards", "compare", "write"}
+
+
+def test_no_intermediate_writes_reports_only(tmp_path):
+    root = _make_tree(tmp_path)
+    _fused(root, write_intermediate=False).run()
+    written = set(_outputs(root))
+    assert written == {
+        "reports/alpha_scope_report.md",
+        "reports/beta_scope_report.md",
+        "reports/alpha_vs_beta_report.md",
+        "data/compare/alpha_vs_beta_compare.jsonl",
+        "data/compare/all_pairs_compare_stats.json",
+    }
+
+
+def test_shared_objects_loaded_once(tmp_path, monkeypatch):
+    root = _make_tree(tmp_path)
+    corpus_loads = []
+    original = step4.EvidenceSearcher._load_all_text_data
+
+    def counting_load(self):
+        corpus_loads.append(self.insurer)
+        return original(self)
+
+    monkeypatch.setattr(step4.EvidenceSearcher, "_load_all_text_data", counting_load)
+    FixtureMapper.loads = 0
+
+    pipeline = _fused(root)
+    first = pipeline.run()
+    gate = pipeline.scope_gate("alpha")
+    second = pipeline.run()
+
+    assert first['insurers'] == second['insurers']
+    assert FixtureMapper.loads == 1
+    assert sorted(corpus_loads) == INSURERS
+    assert pipeline.scope_gate("alpha") is gate
+
+
+def test_subset_compares_against_existing_cards(tmp_path, monkeypatch):
+    stepwise = _make_tree(tmp_path / "steps")
+    _run_steps(stepwise, monkeypatch)
+
+    # beta cards만 파일로 존재 → alpha만 fused 실행
+    root = _make_tree(tmp_path / "fused")
+    for rel in ("data/compare/beta_coverage_cards.jsonl", "data/compare/beta_coverage_cards.summary.json"):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(stepwise / rel, root / rel)
+
+    summary = _fused(root, insurers=["alpha"], remap=True).run()
+    assert list(summary['insurers']) == ["alpha"]
+    assert summary['pairs'] == 1
+    for rel in ("data/compare/alpha_vs_beta_compare.jsonl", "reports/alpha_vs_beta_report.md",
+                "data/compare/alpha_coverage_cards.jsonl"):
+        assert _outputs(root)[rel] == _outputs(stepwise)[rel]
+
+
+def test_skip_mapping_uses_mapped_csv(tmp_path, monkeypatch):
+    stepwise = _make_tree(tmp_path / "steps")
+    _run_steps(stepwise, monkeypatch)
+
+    summary = FusedPipeline(INSURERS, base_dir=stepwise, remap=False, log=lambda message: None).run()
+    assert summary['insurers']['alpha']['mapping'] is None
+    assert summary['insurers']['alpha']['cards']['matched'] == 3
+
+
+def test_failure_writes_nothing(tmp_path):
+    root = _make_tree(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        _fused(root, insurers=["alpha", "missing"]).run()
+    assert _outputs(root) == {}
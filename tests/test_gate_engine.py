@@ -0,0 +1,113 @@
+"""
+Gate Engine (feature bitmask 판정) 테스트
+
+Contract tests:
+1. GateEngine 판정 / reason == apply_gates (evidence pack snippet 전체 × slot × context)
+2. select_slot_chunks == slot별 chunk 순차 apply_gates first-pass
+3. 패턴은 chunk당 최대 1회 평가 (공유 패턴 bit 포함)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.coverage_profiles import get_profile
+from tools.gate_engine import ChunkFeatures, GateContext, GateEngine, apply_gates, select_slot_chunks
+
+
+BASE_DIR = Path(__file__).parent.parent
+SLOT_KEYS = ["waiting_period", "exclusions", "subtype_coverage_map"]
+PROFILE = get_profile("A4210")
+
+CONTEXTS = [
+    GateContext("A4210", "N01", ["유사암", "유사암진단", "유사암진단비"], "유사암진단비", PROFILE),
+    GateContext("A4210", "N08", ["암", "진단"], "유사암 진단비(경계성종양)", PROFILE),
+    GateContext("A4210", "N02", ["보험금"], "", PROFILE),
+    GateContext("A4210", "N03", [], "유사암진단비", PROFILE),
+    GateContext("X0000", "N01", ["암"], "암진단비", None),
+]
+
+
+def _load_chunks(limit: int = 3000) -> list:
+    """evidence pack snippet → chunk (excerpt = snippet 앞 200자)"""
+    chunks = []
+    for pack_file in sorted((BASE_DIR / "data" / "evidence_pack").glob("*_evidence_pack.jsonl")):
+        with open(pack_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                for evidence in json.loads(line).get('evidences', []):
+                    text = evidence.get('snippet', '')
+                    chunks.append({
+                        "chunk_id": len(chunks),
+                        "chunk_text": text,
+                        "excerpt": text[:200],
+                        "page_number": evidence.get('page'),
+                    })
+    chunks.extend([
+        {"chunk_id": -1, "chunk_text": "유사암진단비 보험금을 지급합니다. 90일 면책", "excerpt": "유사암진단비", "page_number": 1},
+        {"chunk_id": -2, "chunk_text": "유사암 진단확정 시 보험금 지급. 제자리암 정의", "excerpt": "유사암 정의", "page_number": 2},
+        {"chunk_id": -3, "chunk_text": "유사암 통원일당 보험금", "excerpt": "유사암", "page_number": 3},
+        {"chunk_id": -4, "chunk_text": "유사암진단비 보험금 납입면제", "excerpt": "유사암", "page_number": 4},
+    ])
+    return chunks[:limit] + chunks[-4:]
+
+
+CHUNKS = _load_chunks()
+
+
+@pytest.mark.parametrize("ctx", CONTEXTS, ids=lambda c: f"{c.coverage_code}-{c.ins_cd}")
+def test_engine_matches_apply_gates(ctx):
+    """모든 chunk × slot 판정과 reason이 apply_gates와 동일"""
+    engine = GateEngine(ctx)
+    for chunk in CHUNKS:
+        results = engine.evaluate(chunk['chunk_text'], chunk['excerpt'], SLOT_KEYS)
+        for slot_key in SLOT_KEYS:
+            expected = apply_gates(slot_key, chunk['chunk_text'], chunk['excerpt'], ctx)
+            assert results[slot_key] == expected, (chunk['chunk_id'], slot_key)
+
+
+@pytest.mark.parametrize("ctx", CONTEXTS, ids=lambda c: f"{c.coverage_code}-{c.ins_cd}")
+def test_select_slot_chunks_matches_sequential(ctx):
+    """slot별 최초 통과 chunk == 기존 slot-major 순회 결과"""
+    expected = {}
+    for slot_key in SLOT_KEYS:
+        for chunk in CHUNKS:
+            if apply_gates(slot_key, chunk['chunk_text'], chunk['excerpt'], ctx)[0]:
+                expected[slot_key] = chunk
+                break
+    assert select_slot_chunks(SLOT_KEYS, CHUNKS, ctx) == expected
+
+
+def test_each_pattern_evaluated_once_per_chunk():
+    """feature bit는 chunk당 1회만 평가되고, 공유 패턴은 bit 하나"""
+    ctx = CONTEXTS[0]
+    engine = GateEngine(ctx)
+    for slot_key in SLOT_KEYS:
+        engine._slot_bits(slot_key)
+
+    calls = []
+
+    class CountingPattern:
+        def __init__(self, pattern):
+            self.pattern = pattern
+
+        def search(self, text):
+            calls.append(self.pattern.pattern)
+            return self.pattern.search(text)
+
+    engine.patterns = [CountingPattern(p) for p in engine.patterns]
+    features = ChunkFeatures("유사암진단비 보험금을 지급합니다. 90일 면책, 제자리암 정의",
+                             "유사암진단비")
+    results = {slot_key: engine.gate(slot_key, features) for slot_key in SLOT_KEYS}
+
+    assert all(passed for passed, _ in results.values())
+    assert len(calls) == len(set(calls))
+    # section negative와 slot negative가 공유하는 "납입면제"
+    assert list(engine._pattern_bits).count("납입면제") == 1
+    assert len(engine.patterns) == len(set(p.pattern.pattern for p in engine.patterns))
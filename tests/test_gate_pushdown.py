@@ -0,0 +1,111 @@
+"""
+Gate Pushdown (SQL 후보 필터) 테스트
+
+Contract tests:
+1. anchor LIKE 패턴 == GATE 1 부분 문자열 판정 (LIKE 메타문자 escape 포함)
+2. negative union regex 탈락 == GATE 2/3 개별 패턴 탈락 (A4210 profile)
+3. 이식 불가 패턴은 pushdown 제외 (Python gate에만 남음)
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.coverage_profiles import get_profile
+from tools.gate_pushdown import (
+    anchor_like_patterns,
+    build_chunk_filter,
+    is_portable_regex,
+    negative_union_regex,
+)
+
+
+PROFILE = get_profile("A4210")
+
+SAMPLE_TEXTS = [
+    "유사암진단비 보험금을 지급합니다",
+    "유사암 진단확정 시 보험가입금액 지급",
+    "입원일당 연간 3 회한 지급",
+    "유사암 1회한 지급",
+    "보험료 납입면제 사유에 해당하는 경우",
+    "차회 이후 보험료 면제",
+    "100세만기 갱신형",
+    "갑상선암, 기타피부암, 제자리암, 경계성종양 정의",
+    "100%_할인 유사암",
+    "",
+]
+
+
+def _like_to_regex(pattern: str) -> re.Pattern:
+    """LIKE 패턴(ESCAPE '\\') → Python 정규식 (테스트용 에뮬레이션)"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            i += 1
+            out.append(re.escape(pattern[i]))
+        elif ch == '%':
+            out.append('.*')
+        elif ch == '_':
+            out.append('.')
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return re.compile(''.join(out), re.DOTALL)
+
+
+@pytest.mark.parametrize("anchors", [
+    PROFILE["anchor_keywords"],
+    ["100%_할인"],
+    ["a\\b"],
+    [],
+])
+def test_anchor_like_matches_gate1(anchors):
+    """LIKE ANY 판정 == any(anchor in excerpt)"""
+    regexes = [_like_to_regex(p) for p in anchor_like_patterns(anchors)]
+    for text in SAMPLE_TEXTS + ["a\\b", "100x할인"]:
+        expected = any(anchor in text for anchor in anchors)
+        assert any(r.fullmatch(text) for r in regexes) == expected, (anchors, text)
+
+
+def test_negative_union_matches_gates_2_3():
+    """A4210 negative는 전부 이식 가능하며, union 탈락 == 개별 패턴 탈락"""
+    negatives = PROFILE["hard_negative_terms_global"] + PROFILE["section_negative_terms_global"]
+    assert all(is_portable_regex(p) for p in negatives)
+
+    union = re.compile(negative_union_regex(negatives))
+    for text in SAMPLE_TEXTS:
+        expected = any(re.search(p, text) for p in negatives)
+        assert bool(union.search(text)) == expected, text
+
+
+@pytest.mark.parametrize("pattern,portable", [
+    ("통원일당", True),
+    (r"연간\s*\d+\s*회한", True),
+    (r"보험금을\s*지급하지", True),
+    (r"(?i)abc", False),
+    (r"\b유사암", False),
+    (r"암.진단", False),
+    (r"[가-힣]+", False),
+    (r"a{2}", False),
+    ("", False),
+])
+def test_portable_regex(pattern, portable):
+    assert is_portable_regex(pattern) == portable
+
+
+def test_non_portable_negatives_not_pushed_down():
+    """이식 불가 패턴만 있으면 chunk_text 조건 없이 anchor 조건만 생성"""
+    sql, params = build_chunk_filter(["유사암"], [r"\b일당"], [])
+    assert "chunk_text" not in sql
+    assert params == [["%유사암%"]]
+
+    sql, params = build_chunk_filter(["유사암"], [r"\b일당", "입원일당"], ["납입면제"])
+    assert sql.count("%s") == len(params) == 2
+    assert params[1] == "(?:입원일당)|(?:납입면제)"
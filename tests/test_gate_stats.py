@@ -0,0 +1,106 @@
+"""
+Adaptive Gate Ordering 테스트
+
+Contract tests:
+1. 임의 gate 순서에서도 판정 / reason == apply_gates (canonical 첫 탈락 reason)
+2. 통계 기록: gate별 평가 / 탈락 횟수 누적, 파일 저장(atomic) / 로드 / 누적
+3. adaptive 순서: 비용 / 탈락률 오름차순, 표본 부족 시 canonical
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.gate_engine import GateEngine, apply_gates, select_slot_chunks, select_slot_chunks_with_stats
+from tools.gate_stats import (
+    GATE_ORDER,
+    GateStats,
+    gate_order_for,
+    load_gate_stats,
+    record_gate_stats,
+)
+from tests.test_gate_engine import CHUNKS, CONTEXTS, SLOT_KEYS
+
+
+ORDERS = [list(reversed(GATE_ORDER))] + [
+    random.Random(seed).sample(GATE_ORDER, len(GATE_ORDER)) for seed in range(3)
+]
+
+
+@pytest.mark.parametrize("order", ORDERS, ids=lambda o: ">".join(g[:4] for g in o))
+@pytest.mark.parametrize("ctx", CONTEXTS[:3], ids=lambda c: f"{c.coverage_code}-{c.ins_cd}")
+def test_reordered_engine_reports_canonical_reason(ctx, order):
+    engine = GateEngine(ctx, order=order)
+    for chunk in CHUNKS:
+        results = engine.evaluate(chunk['chunk_text'], chunk['excerpt'], SLOT_KEYS)
+        for slot_key in SLOT_KEYS:
+            expected = apply_gates(slot_key, chunk['chunk_text'], chunk['excerpt'], ctx)
+            assert results[slot_key] == expected, (chunk['chunk_id'], slot_key)
+
+
+def test_reordered_selection_unchanged():
+    ctx = CONTEXTS[1]
+    expected = select_slot_chunks(SLOT_KEYS, CHUNKS, ctx)
+    for order in ORDERS:
+        assert select_slot_chunks(SLOT_KEYS, CHUNKS, ctx, order) == expected
+
+
+def test_invalid_order_rejected():
+    with pytest.raises(ValueError):
+        GateEngine(CONTEXTS[0], order=["anchor", "name_lock"])
+
+
+def test_stats_recorded_and_persisted(tmp_path):
+    ctx = CONTEXTS[1]
+    found, stats = select_slot_chunks_with_stats(SLOT_KEYS, CHUNKS, ctx)
+    assert found == select_slot_chunks(SLOT_KEYS, CHUNKS, ctx)
+
+    # canonical 순서: 첫 gate는 모든 (chunk, slot) 평가에서 실행
+    assert stats.evaluations["anchor"] > 0
+    assert all(stats.rejections[g] <= stats.evaluations[g] for g in GATE_ORDER)
+    reached = stats.evaluations["anchor"]
+    for gate in GATE_ORDER[1:]:
+        assert stats.evaluations[gate] == reached - stats.rejections[GATE_ORDER[GATE_ORDER.index(gate) - 1]]
+        reached = stats.evaluations[gate]
+
+    path = tmp_path / "gate_stats.json"
+    record_gate_stats("A4210_PROFILE_V1", stats, path)
+    record_gate_stats("A4210_PROFILE_V1", stats, path)
+    loaded = load_gate_stats(path)["A4210_PROFILE_V1"]
+    assert loaded.evaluations == {g: 2 * n for g, n in stats.evaluations.items()}
+    assert loaded.rejections == {g: 2 * n for g, n in stats.rejections.items()}
+    assert [p.name for p in tmp_path.iterdir()] == ["gate_stats.json"]
+
+
+def test_adaptive_order_ranking(tmp_path):
+    stats = GateStats()
+    costs = {  # gate: (mean_ns, rejection_rate)
+        "anchor": (100, 0.5),
+        "hard_negative": (1000, 0.1),
+        "section_negative": (800, 0.0),
+        "diagnosis_signal": (500, 0.5),
+        "name_lock": (50, 0.9),
+        "required_terms": (240, 0.3),
+        "slot_negative": (200, 0.0),
+    }
+    for gate, (mean_ns, rate) in costs.items():
+        n = 1000
+        stats.evaluations[gate] = n
+        stats.total_ns[gate] = mean_ns * n
+        stats.rejections[gate] = int(rate * n)
+
+    assert stats.order() == [
+        "name_lock", "anchor", "required_terms", "diagnosis_signal", "hard_negative",
+        "section_negative", "slot_negative",
+    ]
+    assert stats.order(min_evaluations=2000) == list(GATE_ORDER)
+
+    path = tmp_path / "gate_stats.json"
+    assert gate_order_for("A4210_PROFILE_V1", path) == list(GATE_ORDER)
+    record_gate_stats("A4210_PROFILE_V1", stats, path)
+    assert gate_order_for("A4210_PROFILE_V1", path) == stats.order()
@@ -0,0 +1,221 @@
+"""
+Incremental evidence_slot 재판정 테스트
+
+Contract tests:
+1. chunk_content_hash == SQLite CHUNK_HASH (store.chunk_hashes)
+2. build_slot_plan: 상태 없음 / gate_hash 변경 → 전체, winner 유지 / 사라짐 / 변경 분류
+3. 무작위 chunk 추가 / 수정 / 삭제 반복 후 incremental 결과 == 전체 apply_gates 결과
+4. chunk 1개 변경 시 chunk_text 조회는 변경분 근처로 제한
+5. mapping 변경(gate_hash) / --force는 전체 재판정
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.test_coverage_store import (  # noqa: F401 (fixture)
+    AS_OF_DATE, COVERAGE_CODE, PROFILE, TEXTS, _execute, _slots, sqlite_path
+)
+from tools.coverage_store import SqliteCoverageStore
+from tools.gate_engine import GateContext, apply_gates
+from tools.incremental_slots import SlotPlan, build_slot_plan, chunk_content_hash
+from tools.run_db_only_coverage import SLOT_KEYS, DBOnlyCoveragePipeline
+
+
+def _pipeline(store, force: bool = False, itersize: int = 2000) -> DBOnlyCoveragePipeline:
+    return DBOnlyCoveragePipeline(COVERAGE_CODE, AS_OF_DATE, store=store, adaptive_gates=False,
+                                  force=force, itersize=itersize)
+
+
+def _regenerate(sqlite_path: str, force: bool = False, itersize: int = 2000) -> DBOnlyCoveragePipeline:
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        pipeline = _pipeline(store, force=force, itersize=itersize)
+        pipeline.write_all()
+        return pipeline
+    finally:
+        store.close()
+
+
+def _expected_from_db(sqlite_path: str) -> dict:
+    """DB 현재 내용 기준 전체 apply_gates 결과 (ins_cd, slot_key) → chunk_id"""
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        mappings = store.conn.execute("SELECT * FROM coverage_mapping_ssot").fetchall()
+        chunks = store.conn.execute("""
+            SELECT * FROM coverage_chunk WHERE coverage_code = ? AND as_of_date = ? ORDER BY chunk_id
+        """, (COVERAGE_CODE, AS_OF_DATE)).fetchall()
+    finally:
+        store.close()
+
+    expected = {}
+    for mapping in mappings:
+        ctx = GateContext(COVERAGE_CODE, mapping["ins_cd"], json.loads(mapping["anchor_keywords"] or "[]"),
+                          mapping["insurer_coverage_name"], PROFILE)
+        for slot_key in SLOT_KEYS:
+            for chunk in (c for c in chunks if c["ins_cd"] == mapping["ins_cd"]):
+                if apply_gates(slot_key, chunk["chunk_text"], chunk["excerpt"], ctx)[0]:
+                    expected[(mapping["ins_cd"], slot_key)] = chunk["chunk_id"]
+                    break
+    return expected
+
+
+def test_chunk_hash_matches_sqlite(sqlite_path):
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        hashes = store.chunk_hashes(COVERAGE_CODE, AS_OF_DATE, ["N01", "N08", "N09"])
+        rows = store.conn.execute("SELECT * FROM coverage_chunk WHERE as_of_date = ?", (AS_OF_DATE,)).fetchall()
+        assert sum(len(h) for h in hashes.values()) == len(rows) == 21
+        for row in rows:
+            assert hashes[row["ins_cd"]][row["chunk_id"]] == chunk_content_hash(
+                row["chunk_text"], row["excerpt"], row["page_number"])
+        assert chunk_content_hash("a", "b", None) != chunk_content_hash("a", "b", 1)
+    finally:
+        store.close()
+
+
+def test_build_slot_plan():
+    hashes = {1: "h1", 2: "h2", 3: "h3x", 5: "h5"}
+    state = {1: ("h1", "g"), 2: ("h2", "g"), 3: ("h3", "g"), 4: ("h4", "g")}
+    winners = {
+        "waiting_period": {"chunk_id": 2, "chunk_hash": "h2"},      # 유지
+        "exclusions": {"chunk_id": 3, "chunk_hash": "h3"},          # 내용 변경
+        "subtype_coverage_map": {"chunk_id": 4, "chunk_hash": "h4"},  # 삭제
+    }
+
+    assert build_slot_plan(SLOT_KEYS, hashes, {}, "g", winners).full
+    assert build_slot_plan(SLOT_KEYS, hashes, state, "g2", winners).full
+
+    plan = build_slot_plan(SLOT_KEYS, hashes, state, "g", winners)
+    assert not plan.full
+    assert plan.dirty == {3, 5}
+    assert plan.kept == {"waiting_period": 2}
+    assert plan.rescan_from == {"exclusions": 3, "subtype_coverage_map": 4}
+
+    # 유지 winner 뒤의 변경 chunk는 판정 불필요
+    assert not plan.needs_gate("waiting_period", 3)
+    assert not plan.needs_gate("waiting_period", 1)
+    assert plan.needs_gate("exclusions", 3) and plan.needs_gate("exclusions", 5)
+    assert not plan.needs_gate("exclusions", 2)
+    assert plan.relevant(SLOT_KEYS, 2) and not plan.relevant(SLOT_KEYS, 1)
+
+    # winner 없는 slot: dirty chunk만, 마지막 dirty 이후는 확정
+    no_winner = build_slot_plan(SLOT_KEYS, hashes, state, "g", {})
+    assert [no_winner.needs_gate("exclusions", cid) for cid in (1, 2, 3, 5)] == [False, False, True, True]
+    assert no_winner.horizon("exclusions") == 5
+
+    full = SlotPlan(hashes)
+    assert all(full.needs_gate(slot_key, cid) for slot_key in SLOT_KEYS for cid in hashes)
+
+
+def test_random_mutations_match_full_recompute(sqlite_path):
+    rng = random.Random(44)
+    _regenerate(sqlite_path)
+    assert _slots(sqlite_path) == _expected_from_db(sqlite_path)
+
+    next_id = 1000
+    for _ in range(25):
+        store = SqliteCoverageStore(sqlite_path)
+        try:
+            ids = [row[0] for row in store.conn.execute(
+                "SELECT chunk_id FROM coverage_chunk WHERE as_of_date = ?", (AS_OF_DATE,))]
+        finally:
+            store.close()
+
+        for _ in range(rng.randint(1, 3)):
+            op = rng.choice(["insert", "update", "page", "delete"])
+            text, excerpt = rng.choice(TEXTS)
+            if op == "insert" or not ids:
+                # 기존 chunk 사이에 끼워 넣도록 작은 id도 사용
+                chunk_id = rng.choice([next_id, rng.randint(1, 25) + 100])
+                next_id += 1
+                _execute(sqlite_path, """
+                    INSERT OR REPLACE INTO coverage_chunk
+                        (chunk_id, coverage_code, as_of_date, ins_cd, chunk_text, excerpt, page_number)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (chunk_id, COVERAGE_CODE, AS_OF_DATE, rng.choice(["N01", "N08", "N09"]), text, excerpt, 7))
+            elif op == "update":
+                _execute(sqlite_path, "UPDATE coverage_chunk SET chunk_text = ?, excerpt = ? WHERE chunk_id = ?",
+                         (text, excerpt, rng.choice(ids)))
+            elif op == "page":
+                _execute(sqlite_path, "UPDATE coverage_chunk SET page_number = page_number + 1 WHERE chunk_id = ?",
+                         (rng.choice(ids),))
+            else:
+                _execute(sqlite_path, "DELETE FROM coverage_chunk WHERE chunk_id = ?", (rng.choice(ids),))
+
+        pipeline = _regenerate(sqlite_path, itersize=rng.choice([1, 3, 2000]))
+        assert not any(plan.full for plan in pipeline.slot_plans.values())
+        assert _slots(sqlite_path) == _expected_from_db(sqlite_path)
+
+        # evidence_slot 행 내용(excerpt / page / chunk_hash)도 현재 chunk와 일치
+        store = SqliteCoverageStore(sqlite_path)
+        try:
+            mismatched = store.conn.execute("""
+                SELECT es.slot_id FROM evidence_slot es JOIN coverage_chunk c ON c.chunk_id = es.chunk_id
+                WHERE es.excerpt != c.excerpt OR es.page_number != c.page_number
+                   OR es.chunk_hash != CHUNK_HASH(c.chunk_text, c.excerpt, c.page_number)
+            """).fetchall()
+            assert mismatched == []
+        finally:
+            store.close()
+
+
+def test_single_change_fetches_few_chunk_texts(sqlite_path):
+    _regenerate(sqlite_path)
+    winners = {chunk_id for (ins_cd, _), chunk_id in _slots(sqlite_path).items() if ins_cd == "N01"}
+    # winner가 아닌 chunk 변경 → 그 chunk만 재판정 대상
+    changed = min(chunk_id for chunk_id in range(1, 8) if chunk_id not in winners)
+
+    _execute(sqlite_path, "UPDATE coverage_chunk SET chunk_text = chunk_text || ' ' WHERE chunk_id = ?", (changed,))
+    store = SqliteCoverageStore(sqlite_path)
+    fetched = []
+    fetch_chunk_texts = store.fetch_chunk_texts
+    store.fetch_chunk_texts = lambda chunk_ids, as_of_date: \
+        fetched.extend(chunk_ids) or fetch_chunk_texts(chunk_ids, as_of_date)
+    try:
+        pipeline = _pipeline(store)
+        pipeline.write_all()
+        assert {ins_cd: plan.summary()["dirty"] for ins_cd, plan in pipeline.slot_plans.items()} == \
+            {"N01": 1, "N08": 0, "N09": 0}
+        assert set(fetched) <= {changed}
+        assert not pipeline.slot_plans["N01"].rescan_from
+    finally:
+        store.close()
+    assert _slots(sqlite_path) == _expected_from_db(sqlite_path)
+
+
+def test_mapping_change_and_force_regate_fully(sqlite_path):
+    _regenerate(sqlite_path)
+
+    _execute(sqlite_path, """
+        UPDATE coverage_mapping_ssot SET anchor_keywords = ? WHERE ins_cd = 'N09'
+    """, (json.dumps(["유사암"], ensure_ascii=False),))
+    pipeline = _regenerate(sqlite_path)
+    assert {ins_cd: plan.full for ins_cd, plan in pipeline.slot_plans.items()} == \
+        {"N01": False, "N08": False, "N09": True}
+    assert _slots(sqlite_path) == _expected_from_db(sqlite_path)
+    assert any(ins_cd == "N09" for ins_cd, _ in _slots(sqlite_path))
+
+    pipeline = _regenerate(sqlite_path, force=True)
+    assert all(plan.full for plan in pipeline.slot_plans.values())
+    assert _slots(sqlite_path) == _expected_from_db(sqlite_path)
+
+
+def test_gate_state_follows_ins_cd_scope(sqlite_path):
+    _regenerate(sqlite_path)
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        assert set(store.load_gate_state(COVERAGE_CODE, AS_OF_DATE)) == {"N01", "N08", "N09"}
+        DBOnlyCoveragePipeline(COVERAGE_CODE, AS_OF_DATE, ["N08"], store=store, adaptive_gates=False).write_all()
+        assert set(store.load_gate_state(COVERAGE_CODE, AS_OF_DATE)) == {"N08"}
+    finally:
+        store.close()
+
+    # 제외됐던 ins_cd를 다시 포함하면 상태가 없으므로 전체 재판정
+    pipeline = _regenerate(sqlite_path)
+    assert pipeline.slot_plans["N01"].full and not pipeline.slot_plans["N08"].full
+    assert _slots(sqlite_path) == _expected_from_db(sqlite_path)
@@ -0,0 +1,95 @@
+"""
+JSONL Byte-Offset Index 테스트
+
+Contract tests:
+1. index 조회 결과 == 선형 스캔 first-match (cards / evidence pack 전체 키)
+2. JSONL 변경 후 stale sidecar 무시 (스캔 fallback)
+3. Step 5 cards 기록 시 index sidecar 생성 및 sidecar 기반 조회
+"""
+
+import pytest
+import json
+import shutil
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.jsonl_index import INDEX_KEYS, JsonlIndexedReader, index_path_for, write_jsonl_index
+from pipeline.step5_build_cards.build_cards import build_coverage_cards
+
+
+BASE_DIR = Path(__file__).parent.parent
+JSONL_FILES = sorted(
+    list((BASE_DIR / "data" / "compare").glob("*_coverage_cards.jsonl")) +
+    list((BASE_DIR / "data" / "evidence_pack").glob("*_evidence_pack.jsonl"))
+)
+
+
+def _linear_first_match(jsonl_path: Path, key: str, value: str):
+    """기존 선형 스캔 조회"""
+    with open(jsonl_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                data = json.loads(line)
+                if data.get(key) == value:
+                    return data
+    return None
+
+
+@pytest.mark.parametrize("jsonl_path", JSONL_FILES, ids=lambda p: p.name)
+def test_index_lookup_matches_linear_scan(jsonl_path, tmp_path):
+    """1. sidecar 조회 == 선형 스캔 first-match"""
+    copy = tmp_path / jsonl_path.name
+    shutil.copy2(jsonl_path, copy)
+    write_jsonl_index(copy)
+
+    reader = JsonlIndexedReader(copy)
+    assert reader.from_sidecar
+
+    with open(copy, 'r', encoding='utf-8') as f:
+        items = [json.loads(line) for line in f if line.strip()]
+    for key in INDEX_KEYS:
+        for value in {item.get(key) for item in items if item.get(key)}:
+            assert reader.get(key, value) == _linear_first_match(copy, key, value)
+        assert reader.get(key, '__missing__') is None
+
+
+def test_stale_index_falls_back_to_scan(tmp_path):
+    """2. JSONL 변경 시 sidecar 무시"""
+    copy = tmp_path / "samsung_evidence_pack.jsonl"
+    shutil.copy2(BASE_DIR / "data" / "evidence_pack" / copy.name, copy)
+    write_jsonl_index(copy)
+
+    lines = copy.read_text(encoding='utf-8').splitlines(keepends=True)
+    copy.write_text(''.join(reversed(lines)), encoding='utf-8')
+
+    reader = JsonlIndexedReader(copy)
+    assert not reader.from_sidecar
+    first = json.loads(lines[-1])
+    assert reader.get('coverage_name_raw', first['coverage_name_raw']) == first
+
+
+def test_step5_writes_index(tmp_path):
+    """3. Step 5 cards index sidecar"""
+    output = tmp_path / "db_coverage_cards.jsonl"
+    build_coverage_cards(
+        str(BASE_DIR / "data" / "scope" / "db_scope_mapped.csv"),
+        str(BASE_DIR / "data" / "evidence_pack" / "db_evidence_pack.jsonl"),
+        'db',
+        str(output)
+    )
+    assert index_path_for(output).exists()
+
+    reader = JsonlIndexedReader(output)
+    assert reader.from_sidecar
+    with open(output, 'r', encoding='utf-8') as f:
+        for line in f:
+            card = json.loads(line)
+            assert reader.get('coverage_name_raw', card['coverage_name_raw']) == \
+                _linear_first_match(output, 'coverage_name_raw', card['coverage_name_raw'])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
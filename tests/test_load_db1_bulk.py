@@ -0,0 +1,206 @@
+"""
+STEP NEXT-DB-1 bulk loader 테스트 (DB 없이 메모리 FK 해결 검증)
+
+Contract tests:
+1. 재실행 시 모든 id 동일 (uuid5 자연키 → 멱등 merge)
+2. coverage_instance 수 == scope CSV matched 행 중 (product, variant, code) 고유 수, unmatched / 중복 코드는 skip 집계
+3. 모든 FK(insurer / product / document / instance / evidence)가 적재 행 안에서 해결, coverage_canonical은 적재하지 않음
+4. 동일 coverage_name_raw 중복 행은 별개 instance, evidence는 같은 순번 행에 연결
+5. (product, variant, code) 중복 행은 첫 행만 적재, DB coverage_canonical에 없는 코드는 skip
+6. evidence_ref rank는 doc_type별 1-3 (이후 NULL), amount 없는 카드는 UNCONFIRMED
+7. 카드 amount(CONFIRMED + evidence) → evidence_ref 추가 + amount_fact 연결
+8. COPY text escape (NULL / 탭 / 개행 / 역슬래시)
+"""
+
+import csv
+import json
+import shutil
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.load_db1_bulk import (
+    DEFAULT_DATA_DIR, TABLES, build_rows, copy_buffer, copy_text_value, stable_id
+)
+
+
+def _column(table: str, name: str) -> int:
+    return TABLES[table][1].index(name)
+
+
+def _scope_rows(insurer_key: str) -> list:
+    with open(DEFAULT_DATA_DIR / "scope" / f"{insurer_key}_scope_mapped.csv", encoding='utf-8-sig') as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return build_rows()
+
+
+def test_ids_are_deterministic(rows):
+    again = build_rows()
+    for table in TABLES:
+        assert sorted(again.tables[table]) == sorted(rows.tables[table])
+    assert len(rows.insurer_ids) == 8
+
+
+def test_instances_match_scope_csv(rows):
+    matched = unmatched = duplicate = 0
+    for insurer_key in [p.name[:-len("_scope_mapped.csv")]
+                        for p in (DEFAULT_DATA_DIR / "scope").glob("*_scope_mapped.csv")]:
+        codes = set()
+        for row in _scope_rows(insurer_key):
+            code = row["coverage_code"].strip()
+            if not code:
+                unmatched += 1
+            elif code in codes:
+                duplicate += 1
+            else:
+                codes.add(code)
+                matched += 1
+    assert len(rows.tables["coverage_instance"]) == matched
+    assert rows.skipped["coverage_instance_unmatched"] == unmatched
+    assert rows.skipped["coverage_instance_duplicate_code"] == duplicate
+    assert len(rows.tables["amount_fact"]) == matched
+    assert "coverage_canonical" not in rows.tables
+
+
+def test_foreign_keys_resolve(rows):
+    ids = {table: set(rows.tables[table]) for table in TABLES}
+    for row in rows.rows("product"):
+        assert row[_column("product", "insurer_id")] in ids["insurer"]
+    for row in rows.rows("document"):
+        assert row[_column("document", "product_id")] in ids["product"]
+    for row in rows.rows("coverage_instance"):
+        assert row[_column("coverage_instance", "insurer_id")] in ids["insurer"]
+        assert row[_column("coverage_instance", "product_id")] in ids["product"]
+        assert row[_column("coverage_instance", "mapping_status")] == "matched"
+    for row in rows.rows("evidence_ref"):
+        assert row[_column("evidence_ref", "coverage_instance_id")] in ids["coverage_instance"]
+        assert row[_column("evidence_ref", "document_id")] in ids["document"]
+        assert row[_column("evidence_ref", "page")] > 0 and row[_column("evidence_ref", "snippet")]
+    for row in rows.rows("amount_fact"):
+        assert row[_column("amount_fact", "coverage_instance_id")] in ids["coverage_instance"]
+    assert not rows.skipped["evidence_unknown_document"]
+
+
+def _copy_kb(tmp_path) -> Path:
+    data_dir = tmp_path / "data"
+    for sub, name in (("scope", "kb_scope_mapped.csv"), ("evidence_pack", "kb_evidence_pack.jsonl"),
+                      ("compare", "kb_coverage_cards.jsonl")):
+        (data_dir / sub).mkdir(parents=True)
+        shutil.copy(DEFAULT_DATA_DIR / sub / name, data_dir / sub / name)
+    return data_dir
+
+
+def _read_jsonl(path: Path) -> list:
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _write_jsonl(path: Path, records: list):
+    path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records), encoding='utf-8')
+
+
+def _write_scope(path: Path, scope: list):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(scope[0]))
+        writer.writeheader()
+        writer.writerows(scope)
+
+
+def test_duplicate_raw_names_get_separate_instances(tmp_path):
+    data_dir = _copy_kb(tmp_path)
+    scope_path = data_dir / "scope" / "kb_scope_mapped.csv"
+    scope = _scope_rows("kb")
+    duplicate = next(row for row in scope if row["coverage_code"].strip())
+    # 같은 이름, 다른 코드 (같은 코드면 UNIQUE 중복으로 skip)
+    _write_scope(scope_path, scope + [dict(duplicate, coverage_code="Z9999")])
+
+    # 두 번째 행의 evidence pack에는 첫 evidence만
+    pack_path = data_dir / "evidence_pack" / "kb_evidence_pack.jsonl"
+    packs = _read_jsonl(pack_path)
+    first = next(p for p in packs if p["coverage_name_raw"] == duplicate["coverage_name_raw"])
+    assert len(first["evidences"]) > 1
+    _write_jsonl(pack_path, packs + [dict(first, evidences=first["evidences"][:1])])
+
+    rows = build_rows(["kb"], data_dir=data_dir)
+    instance_ids = [stable_id("coverage_instance", "kb", duplicate["coverage_name_raw"], i) for i in range(2)]
+    assert all(instance_id in rows.tables["coverage_instance"] for instance_id in instance_ids)
+
+    linked = Counter(row[_column("evidence_ref", "coverage_instance_id")] for row in rows.rows("evidence_ref"))
+    assert linked[instance_ids[0]] == len(first["evidences"])
+    assert linked[instance_ids[1]] == 1
+    # 카드가 없는 두 번째 instance에는 amount_fact 없음
+    assert Counter(row[_column("amount_fact", "coverage_instance_id")]
+                   for row in rows.rows("amount_fact"))[instance_ids[1]] == 0
+
+
+def test_duplicate_code_and_unknown_canonical_skipped(tmp_path):
+    data_dir = _copy_kb(tmp_path)
+    scope_path = data_dir / "scope" / "kb_scope_mapped.csv"
+    scope = [row for row in _scope_rows("kb") if row["coverage_code"].strip()]
+    first, second = scope[0], scope[1]
+    _write_scope(scope_path, [first, dict(second, coverage_code=first["coverage_code"])])
+
+    rows = build_rows(["kb"], data_dir=data_dir)
+    assert [row[_column("coverage_instance", "coverage_name_raw")]
+            for row in rows.rows("coverage_instance")] == [first["coverage_name_raw"]]
+    assert rows.skipped["coverage_instance_duplicate_code"] == 1
+
+    # DB coverage_canonical에 없는 코드 → 적재하지 않음 (canonical은 READ-ONLY)
+    _write_scope(scope_path, [first, second])
+    rows = build_rows(["kb"], data_dir=data_dir, canonical_codes={first["coverage_code"]})
+    assert [row[_column("coverage_instance", "coverage_code")]
+            for row in rows.rows("coverage_instance")] == [first["coverage_code"]]
+    assert rows.skipped["coverage_instance_unknown_canonical"] == 1
+
+
+def test_rank_and_unconfirmed_amounts(rows):
+    ranks = Counter(row[_column("evidence_ref", "rank")] for row in rows.rows("evidence_ref"))
+    assert set(ranks) <= {1, 2, 3, None}
+    # amount 필드가 없는 카드 → UNCONFIRMED / value NULL (confirmed_has_value)
+    for row in rows.rows("amount_fact"):
+        assert row[_column("amount_fact", "status")] == "UNCONFIRMED"
+        assert row[_column("amount_fact", "value_text")] is None
+        assert row[_column("amount_fact", "evidence_id")] is None
+
+
+def test_confirmed_amount_links_evidence(tmp_path):
+    data_dir = _copy_kb(tmp_path)
+    cards_path = data_dir / "compare" / "kb_coverage_cards.jsonl"
+    cards = _read_jsonl(cards_path)
+    target = next(card for card in cards if card["coverage_code"] and card["evidences"])
+    target["amount"] = {
+        "status": "CONFIRMED", "value_text": "3,000만원", "source_doc_type": "가입설계서",
+        "source_priority": "PRIMARY", "notes": ["테스트"],
+        "evidence": {"doc_type": "가입설계서", "file_path": target["evidences"][0]["file_path"],
+                     "page": 3, "snippet": "3,000만원"}
+    }
+    _write_jsonl(cards_path, cards)
+
+    rows = build_rows(["kb"], data_dir=data_dir)
+    confirmed = [row for row in rows.rows("amount_fact") if row[_column("amount_fact", "status")] == "CONFIRMED"]
+    assert len(confirmed) == 1
+    evidence_id = confirmed[0][_column("amount_fact", "evidence_id")]
+    assert rows.tables["evidence_ref"][evidence_id][_column("evidence_ref", "rank")] is None
+    assert json.loads(confirmed[0][_column("amount_fact", "notes")]) == ["테스트"]
+
+    # evidence를 해결할 수 없는 CONFIRMED는 적재하지 않음 (confirmed_has_evidence)
+    target["amount"]["evidence"]["file_path"] = "data/evidence_text/unknown.page.jsonl"
+    _write_jsonl(cards_path, cards)
+    rows = build_rows(["kb"], data_dir=data_dir)
+    assert rows.skipped["amount_confirmed_without_evidence"] == 1
+
+
+def test_copy_text_escape():
+    assert copy_text_value(None) == "\\N"
+    assert copy_text_value("a\tb\nc\\d\r") == "a\\tb\\nc\\\\d\\r"
+    assert copy_text_value(3) == "3"
+    assert copy_buffer([("x", None, 1), ("y", "", 2)]).read() == "x\t\\N\t1\ny\t\t2\n"
@@ -0,0 +1,101 @@
+"""
+Presence Matrix 테스트
+
+Contract tests:
+1. bitset 통계 == set 기반 기준 구현 (randomized)
+2. 실제 coverage cards 기준 Step 8 통계 일관성
+3. overview 리포트 canonical name은 matrix 행 순서와 무관
+"""
+
+import pytest
+import random
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.presence_matrix import PresenceMatrix
+from pipeline.step8_multi_compare.compare_all_insurers import (
+    load_all_cards, build_canonical_matrix, calculate_stats, generate_markdown_report
+)
+
+
+BASE_DIR = Path(__file__).parent.parent
+
+
+def _reference_stats(code_sets):
+    """set 기반 기준 구현"""
+    all_codes = set().union(*code_sets.values())
+    common = set.intersection(*code_sets.values()) if code_sets else set()
+    unique = {
+        ins: sorted(codes - set().union(*(c for o, c in code_sets.items() if o != ins)))
+        for ins, codes in code_sets.items()
+    }
+    counts = {code: sum(1 for c in code_sets.values() if code in c) for code in sorted(all_codes)}
+    jaccard = {
+        a: {
+            b: (round(len(ca & cb) / len(ca | cb), 4) if ca | cb else 0.0)
+            for b, cb in code_sets.items()
+        }
+        for a, ca in code_sets.items()
+    }
+    return sorted(common), unique, counts, jaccard
+
+
+def test_matches_set_reference_on_random_sets():
+    """1. randomized code 집합에서 set 기반 구현과 동일"""
+    rng = random.Random(8030)
+    pool = [f"A{n:04d}" for n in range(60)]
+    for _ in range(300):
+        code_sets = {
+            f"ins{i}": set(rng.sample(pool, rng.randint(0, 40)))
+            for i in range(rng.randint(1, 12))
+        }
+        presence = PresenceMatrix(code_sets)
+        common, unique, counts, jaccard = _reference_stats(code_sets)
+
+        assert presence.common_to_all() == common
+        assert presence.unique_per_insurer() == unique
+        assert presence.insurer_counts() == counts
+        # 자기 자신 Jaccard: 비어있지 않으면 1.0
+        assert presence.pairwise_jaccard() == jaccard
+        for code in presence.codes:
+            assert presence.codes[presence.code_index[code]] == code
+            assert set(presence.insurers_of(code)) == {i for i, c in code_sets.items() if code in c}
+
+
+def test_step8_stats_consistent_with_matrix():
+    """2. Step 8 통계가 canonical matrix와 일치"""
+    all_cards = load_all_cards(BASE_DIR / "data" / "compare")
+    matrix = build_canonical_matrix(all_cards)
+    stats = calculate_stats(all_cards, matrix)
+
+    for row in matrix:
+        present = [ins for ins, data in row['insurers'].items() if data['present']]
+        assert stats['insurer_count_per_code'][row['coverage_code']] == len(present)
+        if len(present) == len(all_cards):
+            assert row['coverage_code'] in stats['codes_common_to_all']
+        if len(present) == 1:
+            assert row['coverage_code'] in stats['codes_unique_per_insurer'][present[0]]
+
+    assert set(stats['pairwise_jaccard']) == set(all_cards)
+
+
+def test_report_canonical_names_independent_of_matrix_order(tmp_path):
+    """3. matrix 행 순서가 바뀌어도 code별 canonical name 유지"""
+    all_cards = load_all_cards(BASE_DIR / "data" / "compare")
+    matrix = build_canonical_matrix(all_cards)
+    stats = calculate_stats(all_cards, matrix)
+    names = {row['coverage_code']: row['canonical_name'] for row in matrix}
+
+    output_md = tmp_path / "overview.md"
+    generate_markdown_report(all_cards, list(reversed(matrix)), stats, str(output_md))
+    lines = set(output_md.read_text(encoding='utf-8').splitlines())
+    codes = stats['codes_common_to_all'] + [c for codes in stats['codes_unique_per_insurer'].values() for c in codes]
+    assert codes
+    for code in codes:
+        assert f"| {code} | {names[code]} |" in lines
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,150 @@
+"""
+Regex cost analyzer / runtime budget 테스트
+
+Contract tests:
+1. collect_patterns: profile gate 패턴 + union, SLOT_SPECS 패턴 + SlotEngine 정규식 전체 포함
+2. pump 문자열 / growth exponent: 2차 backtracking 패턴은 super_linear, 단순 literal은 선형
+3. RegexBudget: budget 초과 search 기록 (record), raise 모드는 RegexBudgetExceeded, 파일 누적
+4. budget을 켜도 GateEngine / 파이프라인 판정 결과 불변
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.step8_single_coverage.extract_single_coverage import SLOT_SPECS
+from tests.test_coverage_store import (  # noqa: F401 (fixture)
+    AS_OF_DATE, COVERAGE_CODE, _expected_slots, _slots, sqlite_path
+)
+from tests.test_gate_engine import CHUNKS, CONTEXTS, SLOT_KEYS
+from tools.coverage_profiles import COVERAGE_PROFILES
+from tools.coverage_store import SqliteCoverageStore
+from tools.gate_engine import GateEngine, select_slot_chunks, select_slot_chunks_instrumented
+from core.regex_budget import RegexBudget, RegexBudgetExceeded, record_regex_overruns
+from tools.regex_cost import PatternEntry, analyze_pattern, collect_patterns, growth, load_corpus, pump_strings
+from tools.run_db_only_coverage import DBOnlyCoveragePipeline
+
+SIZES = (500, 1000, 2000, 4000)
+
+
+def test_collect_patterns_covers_profiles_and_slots():
+    entries = {(e.pattern, e.flags): e for e in collect_patterns()}
+    profile = COVERAGE_PROFILES["A4210"]
+    for pattern in profile["hard_negative_terms_global"] + profile["required_terms_by_slot"]["waiting_period"]:
+        assert (pattern, 0) in entries
+        assert entries[(pattern, 0)].scope == "chunk"
+    for slot_key, patterns, _ in SLOT_SPECS:
+        for pattern in patterns:
+            assert f"SLOT_SPECS:{slot_key}" in entries[(pattern, re.IGNORECASE)].sources
+    assert any(source.endswith("(alternation)") for e in entries.values() for source in e.sources)
+    assert any(source.endswith("(union)") for e in entries.values() for source in e.sources)
+    # section negative와 slot negative가 공유하는 패턴은 항목 1개
+    assert len(entries[("납입면제", 0)].sources) == 2
+
+
+def test_pump_strings():
+    assert pump_strings(r'\d+년.*\d+%') == ["1년a1", "1년a", "1년", "1"]
+    assert pump_strings("통원일당|일당") == ["통원일", "통원", "통", "일"]
+    assert pump_strings(r'(?:a)|(?:b+c)') == ["a", "b"]
+
+
+def test_quadratic_pattern_flagged_super_linear():
+    entry = PatternEntry(r'\d+년.*\d+%', re.IGNORECASE, "line")
+    slope, points = growth(entry.compiled, "1년a1", SIZES)
+    assert slope > 1.5
+    report = analyze_pattern(entry, ["2년 후 50%"], SIZES, min_us=50.0)
+    assert "super_linear" in report["flags"]
+    assert report["corpus"]["hits"] == 1
+
+
+def test_literal_pattern_linear():
+    entry = PatternEntry(r'보험료\s*납입면제', 0, "chunk")
+    report = analyze_pattern(entry, ["보험료 납입면제", "일반 약관"], (2000, 4000, 8000, 16000), min_us=50.0)
+    assert report["growth"]["exponent"] < 1.5
+    assert report["flags"] == []
+
+
+def test_slow_flag_from_corpus():
+    entry = PatternEntry("면책", 0, "chunk")
+    assert "slow" in analyze_pattern(entry, ["면책" * 10], SIZES[:2], slow_us=-1.0)["flags"]
+
+
+def test_load_corpus_jsonl_and_long_chunks(tmp_path):
+    path = tmp_path / "corpus.jsonl"
+    path.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in [
+        {"chunk_text": "가" * 30},
+        {"evidences": [{"snippet": "나" * 30}, {"snippet": "가" * 30}]},
+    ]), encoding='utf-8')
+    texts = load_corpus([path], chunk_chars=50)
+    assert texts == ["가" * 30, "나" * 30, "가" * 30 + "\n" + "나" * 30]
+
+
+def test_budget_records_and_raises():
+    budget = RegexBudget(0)
+    pattern = budget.wrap(re.compile("면책"))
+    assert pattern.search("보장개시일부터 면책") is not None
+    assert pattern.search("없음") is None
+    assert pattern.pattern == "면책"
+    assert budget.overruns["면책"]["count"] == 2
+    assert budget.overruns["면책"]["max_text_len"] == len("보장개시일부터 면책")
+
+    merged = RegexBudget(0).merge(budget).merge(budget)
+    assert merged.overruns["면책"]["count"] == 4
+
+    strict = RegexBudget(0, on_exceed="raise")
+    with pytest.raises(RegexBudgetExceeded):
+        strict.wrap(re.compile("면책")).search("면책")
+    assert strict.overruns["면책"]["count"] == 1
+
+    # 넉넉한 budget은 기록 없음
+    generous = RegexBudget(10_000_000)
+    generous.wrap(re.compile("면책")).search("면책")
+    assert generous.overruns == {}
+
+    with pytest.raises(ValueError):
+        RegexBudget(1, on_exceed="kill")
+
+
+def test_record_overruns_accumulates(tmp_path):
+    path = tmp_path / "overruns.json"
+    budget = RegexBudget(0)
+    budget.wrap(re.compile("면책")).search("면책")
+    record_regex_overruns(budget, path)
+    record_regex_overruns(budget, path)
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert data["budget_us"] == 0
+    assert data["patterns"]["면책"]["count"] == 2
+    assert [p.name for p in tmp_path.iterdir()] == ["overruns.json"]
+
+
+@pytest.mark.parametrize("ctx", CONTEXTS[:3], ids=lambda c: f"{c.coverage_code}-{c.ins_cd}")
+def test_engine_results_unchanged_with_budget(ctx):
+    plain = GateEngine(ctx)
+    budget = RegexBudget(0)
+    guarded = GateEngine(ctx, budget=budget)
+    for chunk in CHUNKS:
+        assert (guarded.evaluate(chunk['chunk_text'], chunk['excerpt'], SLOT_KEYS)
+                == plain.evaluate(chunk['chunk_text'], chunk['excerpt'], SLOT_KEYS))
+    assert budget.overruns
+
+    found, stats, recorded = select_slot_chunks_instrumented(SLOT_KEYS, CHUNKS, ctx, budget_us=0)
+    assert found == select_slot_chunks(SLOT_KEYS, CHUNKS, ctx)
+    assert stats is None and recorded.overruns
+
+
+def test_pipeline_budget_keeps_slots(sqlite_path):
+    store = SqliteCoverageStore(sqlite_path)
+    try:
+        pipeline = DBOnlyCoveragePipeline(COVERAGE_CODE, AS_OF_DATE, store=store, adaptive_gates=False,
+                                          regex_budget_us=0)
+        pipeline.write_all()
+    finally:
+        store.close()
+    assert _slots(sqlite_path) == _expected_slots()
+    assert pipeline.regex_budget.overruns
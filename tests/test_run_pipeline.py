@@ -0,0 +1,232 @@
+"""
+Pipeline orchestrator (tools/run_pipeline.py) 테스트
+
+Contract tests:
+1. 최초 실행은 전체 node, 재실행은 전부 up to date
+2. 입력 변경 시 해당 보험사 node + 하위 node만 재실행, 산출물이 같으면 하위 node 건너뜀 (early cutoff)
+3. 코드 변경 / 산출물 삭제 시 해당 node 재실행
+4. 실패 node의 하위 node는 blocked, state 미기록 → 다음 실행에서 재시도
+5. 실제 단계 DAG: 보험사 × 단계 node / 의존 관계 / --targets 상위 포함, import 추적 코드 파일
+6. atomic_write: 예외 시 기존 파일 유지 + 임시 파일 없음
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.atomic_io import atomic_write
+from tools.run_pipeline import PIPELINE_STEPS, PipelineRunner, Step, build_graph, code_files
+
+INSURERS = ["a", "b"]
+
+FAKE_MODULES = {
+    "common.py": """
+        import sys
+        from pathlib import Path
+
+
+        def insurer():
+            return sys.argv[sys.argv.index('--insurer') + 1]
+
+
+        def log(name):
+            with open('runs.log', 'a', encoding='utf-8') as f:
+                f.write(name + '\\n')
+    """,
+    "stage1.py": """
+        from pathlib import Path
+        from pipeline.common import insurer, log
+
+        i = insurer()
+        Path('out1').mkdir(exist_ok=True)
+        Path(f'out1/{i}.txt').write_text(Path(f'src/{i}.txt').read_text().strip().upper())
+        log(f'stage1:{i}')
+    """,
+    "stage2.py": """
+        import sys
+        from pathlib import Path
+        from pipeline.common import insurer, log
+
+        i = insurer()
+        text = Path(f'out1/{i}.txt').read_text()
+        if 'FAIL' in text:
+            sys.exit(3)
+        Path('out2').mkdir(exist_ok=True)
+        Path(f'out2/{i}.txt').write_text(text + '!')
+        log(f'stage2:{i}')
+    """,
+    "merge.py": """
+        from pathlib import Path
+        from pipeline.common import log
+
+        Path('merged.txt').write_text('|'.join(p.read_text() for p in sorted(Path('out2').glob('*.txt'))))
+        log('merge')
+    """,
+}
+
+FAKE_STEPS = [
+    Step("stage1", "pipeline.stage1", inputs=lambda i: [f"src/{i}.txt"], outputs=lambda i: [f"out1/{i}.txt"]),
+    Step("stage2", "pipeline.stage2", deps=["stage1"],
+         inputs=lambda i: [f"out1/{i}.txt"], outputs=lambda i: [f"out2/{i}.txt"]),
+    Step("merge", "pipeline.merge", deps=["stage2"], per_insurer=False,
+         inputs=lambda insurers: ["out2/*.txt"], outputs=lambda insurers: ["merged.txt"]),
+]
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "pipeline").mkdir()
+    for name, source in FAKE_MODULES.items():
+        (tmp_path / "pipeline" / name).write_text(textwrap.dedent(source), encoding='utf-8')
+    (tmp_path / "src").mkdir()
+    for insurer in INSURERS:
+        (tmp_path / "src" / f"{insurer}.txt").write_text(f"{insurer}-v1", encoding='utf-8')
+    return tmp_path
+
+
+def _run(root: Path, jobs: int = 2) -> tuple:
+    """(summary, 이번 실행에서 실행된 node 목록)"""
+    log_path = root / "runs.log"
+    log_path.unlink(missing_ok=True)
+    runner = PipelineRunner(build_graph(FAKE_STEPS, INSURERS), root=root, jobs=jobs, log=lambda message: None)
+    summary = runner.run()
+    runs = sorted(log_path.read_text().split()) if log_path.exists() else []
+    return summary, runs
+
+
+def test_first_run_builds_all_then_up_to_date(project):
+    summary, runs = _run(project)
+    assert runs == ["merge", "stage1:a", "stage1:b", "stage2:a", "stage2:b"]
+    assert sorted(summary["ran"]) == sorted(["stage1:a", "stage1:b", "stage2:a", "stage2:b", "merge"])
+    assert (project / "merged.txt").read_text() == "A-V1!|B-V1!"
+
+    summary, runs = _run(project)
+    assert runs == [] and summary["ran"] == [] and len(summary["skipped"]) == 5
+
+
+def test_input_change_rebuilds_affected_nodes_only(project):
+    _run(project)
+    (project / "src" / "a.txt").write_text("a-v22", encoding='utf-8')
+    summary, runs = _run(project)
+    assert runs == ["merge", "stage1:a", "stage2:a"]
+    assert sorted(summary["skipped"]) == ["stage1:b", "stage2:b"]
+    assert (project / "merged.txt").read_text() == "A-V22!|B-V1!"
+
+
+def test_unchanged_output_cuts_off_downstream(project):
+    _run(project)
+    # strip() 후 내용이 같음 → stage1:b만 재실행, stage2:b / merge는 최신 유지
+    (project / "src" / "b.txt").write_text("  b-v1\n", encoding='utf-8')
+    _, runs = _run(project)
+    assert runs == ["stage1:b"]
+
+
+def test_code_change_and_deleted_output(project):
+    _run(project)
+    with open(project / "pipeline" / "stage2.py", 'a', encoding='utf-8') as f:
+        f.write("# comment only\n")
+    _, runs = _run(project)
+    assert runs == ["stage2:a", "stage2:b"]
+
+    # 공유 모듈 변경은 import하는 모든 단계에 반영
+    with open(project / "pipeline" / "common.py", 'a', encoding='utf-8') as f:
+        f.write("# comment only\n")
+    _, runs = _run(project)
+    assert runs == ["merge", "stage1:a", "stage1:b", "stage2:a", "stage2:b"]
+
+    (project / "out2" / "b.txt").unlink()
+    _, runs = _run(project)
+    assert runs == ["stage2:b"]
+
+
+def test_failure_blocks_downstream_and_retries(project):
+    _run(project)
+    (project / "src" / "a.txt").write_text("fail", encoding='utf-8')
+    summary, runs = _run(project)
+    assert summary["failed"] == ["stage2:a"]
+    assert summary["blocked"] == ["merge"]
+    assert runs == ["stage1:a"]
+
+    (project / "src" / "a.txt").write_text("a-v3", encoding='utf-8')
+    summary, runs = _run(project, jobs=1)
+    assert runs == ["merge", "stage1:a", "stage2:a"]
+    assert summary["failed"] == [] and summary["blocked"] == []
+
+
+def test_dry_run_plan_and_adopt(project):
+    runner = PipelineRunner(build_graph(FAKE_STEPS, INSURERS), root=project, log=lambda message: None)
+    plan = dict(runner.plan())
+    assert plan["stage1:a"] == "never built"
+    assert plan["merge"] == "never built"
+
+    _run(project)
+    (project / "src" / "a.txt").write_text("a-v4444", encoding='utf-8')
+    plan = dict(PipelineRunner(build_graph(FAKE_STEPS, INSURERS), root=project).plan())
+    assert plan["stage1:a"] == "inputs or code changed"
+    assert plan["stage2:a"].startswith("after upstream")
+    assert plan["stage1:b"] == "up to date"
+
+    # adopt: 현재 산출물을 최신으로 기록 (stage1:a만 입력이 바뀐 상태 그대로 인정)
+    summary = PipelineRunner(build_graph(FAKE_STEPS, INSURERS), root=project).adopt()
+    assert len(summary["adopted"]) == 5
+    _, runs = _run(project)
+    assert runs == []
+
+
+def test_pipeline_graph():
+    insurers = ["db", "hanwha", "heungkuk", "hyundai", "kb", "lotte", "meritz", "samsung"]
+    nodes = build_graph(PIPELINE_STEPS, insurers)
+    assert len(nodes) == 6 * len(insurers) + 4
+    assert nodes["evidence:kb"].deps == ["mapped:kb", "text:kb"]
+    assert nodes["compare"].deps == [f"cards:{i}" for i in insurers]
+    assert nodes["matrix"].deps == ["single"]
+    # 단계가 기록하는 파일은 모두 outputs에 있고, 두 node가 같은 파일을 기록하지 않음
+    assert "reports/*_vs_*_report.md" in nodes["compare"].step.outputs(insurers)
+    assert "data/compare/kb_coverage_cards.index.json" in nodes["cards:kb"].step.outputs("kb")
+    assert "--no-compare" in nodes["single"].step.args(insurers)
+    assert {"data/single/*_all_compare.json", "reports/*_all_insurers.md"} <= set(nodes["matrix"].step.outputs(insurers))
+    order = list(nodes)
+    assert all(order.index(dep) < order.index(node_id) for node_id, node in nodes.items() for dep in node.deps)
+
+    partial = build_graph(PIPELINE_STEPS, ["kb"], ["cards"])
+    assert list(partial) == ["scope:kb", "mapped:kb", "text:kb", "evidence:kb", "cards:kb"]
+
+    with pytest.raises(ValueError):
+        build_graph(PIPELINE_STEPS, ["kb"], ["nope"])
+
+
+def test_code_files_follow_local_imports():
+    files = code_files("pipeline.step5_build_cards.build_cards")
+    assert "pipeline/step5_build_cards/build_cards.py" in files
+    assert {"core/scope_gate.py", "core/compare_types.py", "core/cards_store.py",
+            "core/jsonl_index.py", "core/atomic_io.py"} <= set(files)
+    # 상대 import
+    assert "pipeline/step1_extract_scope/hardening.py" in code_files("pipeline.step1_extract_scope.run")
+    # Step 8 batch는 Step 10 모듈이 아니라 core 비교 엔진만 의존
+    single = code_files("pipeline.step8_single_coverage.extract_single_coverage")
+    assert "core/single_compare.py" in single
+    assert not any(f.startswith("pipeline/step10_") for f in single)
+
+
+def test_atomic_write_keeps_original_on_error(tmp_path):
+    path = tmp_path / "out" / "cards.jsonl"
+    with atomic_write(path) as f:
+        f.write("v1\n")
+    assert path.read_text() == "v1\n"
+    assert path.stat().st_mode & 0o777 == 0o644
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("partial")
+            raise RuntimeError("interrupted")
+    assert path.read_text() == "v1\n"
+    assert [p.name for p in path.parent.iterdir()] == ["cards.jsonl"]
+
+    with atomic_write(path, newline='') as f:
+        f.write("a,b\r\n")
+    assert path.read_bytes() == b"a,b\r\n"
@@ -0,0 +1,104 @@
+"""
+Batch Single Coverage Extraction 테스트
+
+Contract tests:
+1. batch profile == 단일 code 추출 profile (보험사 × matched code 전체)
+2. code별 multi-insurer 비교 JSON == Step 10 비교 함수 결과
+3. --coverage-codes 지정 시 해당 code만 추출, --no-compare면 profile만 기록
+4. --regex-budget-us: 보험사 worker별 슬롯 패턴 budget 초과 기록 누적, profile 불변
+"""
+
+import pytest
+import json
+import shutil
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.regex_budget import RegexBudget
+from pipeline.step8_single_coverage.extract_single_coverage import (
+    SLOT_SPECS, SingleCoverageExtractor, matched_coverage_codes, run_batch
+)
+from pipeline.step10_multi_single_compare.compare_a4200_1_all import generate_comparison_json
+
+
+BASE_DIR = Path(__file__).parent.parent
+INSURERS = ['samsung', 'meritz', 'db']
+
+
+def _make_base(tmp_path: Path) -> Path:
+    """입력 데이터만 복사한 임시 프로젝트 루트"""
+    for sub, suffix in (('compare', '_coverage_cards.jsonl'), ('evidence_pack', '_evidence_pack.jsonl')):
+        (tmp_path / 'data' / sub).mkdir(parents=True)
+        for insurer in INSURERS:
+            shutil.copy2(BASE_DIR / 'data' / sub / f'{insurer}{suffix}', tmp_path / 'data' / sub)
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def batch_result(tmp_path_factory):
+    base = _make_base(tmp_path_factory.mktemp("batch"))
+    return base, run_batch(base, INSURERS, jobs=2)
+
+
+def test_batch_profiles_match_single_extraction(batch_result):
+    """1. batch profile == 단일 추출"""
+    base, profiles_by_code = batch_result
+
+    for insurer in INSURERS:
+        for code in matched_coverage_codes(BASE_DIR, insurer):
+            expected = SingleCoverageExtractor(insurer, code, BASE_DIR).extract_profile()
+            assert profiles_by_code[code][insurer] == expected
+
+            saved = base / 'data' / 'single' / f'{insurer}_{code}_profile.json'
+            with open(saved, 'r', encoding='utf-8') as f:
+                assert json.load(f) == expected
+
+
+def test_per_code_comparison_written(batch_result):
+    """2. code별 비교 JSON"""
+    base, profiles_by_code = batch_result
+
+    for code, profiles in profiles_by_code.items():
+        compare_file = base / 'data' / 'single' / f'{code.lower()}_all_compare.json'
+        with open(compare_file, 'r', encoding='utf-8') as f:
+            assert json.load(f) == generate_comparison_json(profiles, code)
+        assert (base / 'reports' / f'{code.lower()}_all_insurers.md').exists()
+
+
+def test_coverage_codes_filter(tmp_path):
+    """3. 지정 code만 추출"""
+    base = _make_base(tmp_path)
+    profiles_by_code = run_batch(base, INSURERS, ['A4200_1', 'NOT_A_CODE'], jobs=1)
+
+    assert list(profiles_by_code) == ['A4200_1']
+    assert sorted(profiles_by_code['A4200_1']) == sorted(INSURERS)
+    assert sorted(p.name for p in (base / 'data' / 'single').glob('*_profile.json')) == \
+        sorted(f'{i}_A4200_1_profile.json' for i in INSURERS)
+
+    # profile만 기록 (비교 JSON / 리포트는 Step 10)
+    base = _make_base(tmp_path / 'profiles_only')
+    run_batch(base, INSURERS, ['A4200_1'], jobs=1, write_comparisons=False)
+    assert sorted(p.name for p in (base / 'data' / 'single').iterdir()) == \
+        sorted(f'{i}_A4200_1_profile.json' for i in INSURERS)
+    assert not (base / 'reports').exists()
+
+
+
+def test_regex_budget_records_slot_overruns(tmp_path, batch_result):
+    """4. budget 0 → 모든 슬롯 패턴 초과 기록, profile은 budget 없는 batch와 동일"""
+    _, expected = batch_result
+    budget = RegexBudget(0)
+    base = _make_base(tmp_path)
+    profiles_by_code = run_batch(base, INSURERS, ['A4200_1'], jobs=2, write_comparisons=False,
+                                 regex_budget=budget)
+
+    assert profiles_by_code['A4200_1'] == expected['A4200_1']
+    assert len(budget.overruns) == len(SLOT_SPECS)
+    assert all(entry["count"] > 0 for entry in budget.overruns.values())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+"""
+Slot Engine (슬롯 6종 일괄 추출) 테스트
+
+Contract tests:
+1. 전체 evidence pack에서 SlotEngine 결과 == 슬롯별 _extract_slot_text 결과
+2. randomized snippet (여러 슬롯이 같은 라인/위치에서 매칭)에서도 동일
+3. 라인 memo가 cache_size를 넘으면 비우고 계속 동일 결과
+4. regex budget: 슬롯 search 초과 기록, 결과 불변
+"""
+
+import pytest
+import json
+import random
+from pathlib import Path
+import sys
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline.step8_single_coverage.extract_single_coverage import (
+    SLOT_SPECS, SingleCoverageExtractor, SlotEngine
+)
+from core.regex_budget import RegexBudget
+
+
+BASE_DIR = Path(__file__).parent.parent
+EXTRACTOR = SingleCoverageExtractor('test', 'test', BASE_DIR)
+
+
+def _reference(evidences):
+    return {
+        slot_key: EXTRACTOR._extract_slot_text(evidences, patterns, context_lines=context_lines)
+        for slot_key, patterns, context_lines in SLOT_SPECS
+    }
+
+
+def _evidence_sets():
+    for pack_file in sorted((BASE_DIR / "data" / "evidence_pack").glob("*_evidence_pack.jsonl")):
+        with open(pack_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line).get('evidences', [])
+
+
+def test_matches_reference_on_evidence_packs():
+    """1. 전체 evidence pack 동일"""
+    engine = SlotEngine(SLOT_SPECS)
+    for evidences in _evidence_sets():
+        assert engine.extract(evidences) == _reference(evidences)
+
+
+def test_matches_reference_on_random_snippets():
+    """2. randomized snippet 동일"""
+    rng = random.Random(8034)
+    tokens = ['보험금 지급', '1,000만원', '90일', '감액', '1년 50%', '유사암 제외', '소액암',
+              '암의 정의', '악성신생물', '최초 1회', '재진단', '진단확정', '책임개시일', 'ABC', '', '  ']
+    engine = SlotEngine(SLOT_SPECS, cache_size=8)
+    for _ in range(500):
+        evidences = []
+        for _ in range(rng.randint(0, 4)):
+            lines = [' '.join(rng.sample(tokens, rng.randint(0, 3))) for _ in range(rng.randint(1, 6))]
+            evidences.append({
+                'doc_type': rng.choice(['약관', '사업방법서', '상품요약서']),
+                'page': rng.randint(1, 5),
+                'snippet': '\n'.join(lines)
+            })
+        assert engine.extract(evidences) == _reference(evidences)
+
+
+def test_line_cache_bounded():
+    """3. memo 크기 제한"""
+    engine = SlotEngine(SLOT_SPECS, cache_size=4)
+    for i in range(20):
+        assert engine.match_slots(f"{i}만원 지급") == engine.match_slots(f"{i}만원 지급")
+        assert len(engine._line_cache) <= 4
+
+
+def test_regex_budget_records_slot_patterns():
+    """4. budget 초과 기록 (budget 0 → 모든 search 초과)"""
+    budget = RegexBudget(0)
+    engine = SlotEngine(SLOT_SPECS, budget=budget)
+    for evidences in list(_evidence_sets())[:20]:
+        assert engine.extract(evidences) == _reference(evidences)
+    reduction = next(pattern for pattern in budget.overruns if r'\d+년.*\d+%' in pattern)
+    assert budget.overruns[reduction]["count"] > 0
+    assert len(budget.overruns) == len(SLOT_SPECS)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark: core.compare_types JSONL round trip (memory + time).
+
+Compares the slotted/interned Evidence + CoverageCard against the previous
+plain-dataclass layout on all insurers' coverage cards. The gain is retained
+memory; to_json/from_json still go through to_dict/from_dict, so load/dump
+times are expected to be on par (run it locally for current numbers).
+
+Usage:
+  python3 tools/bench_compare_types.py [--repeat 20]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.compare_types import CoverageCard
+
+
+@dataclass
+class LegacyEvidence:
+    doc_type: str
+    file_path: str
+    page: int
+    snippet: str
+    match_keyword: str
+
+    def to_dict(self) -> dict:
+        return {
+            'doc_type': self.doc_type,
+            'file_path': self.file_path,
+            'page': self.page,
+            'snippet': self.snippet,
+            'match_keyword': self.match_keyword
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LegacyEvidence':
+        return cls(
+            doc_type=data['doc_type'],
+            file_path=data['file_path'],
+            page=data['page'],
+            snippet=data['snippet'],
+            match_keyword=data['match_keyword']
+        )
+
+
+@dataclass
+class LegacyCoverageCard:
+    insurer: str
+    coverage_name_raw: str
+    coverage_code: Optional[str]
+    coverage_name_canonical: Optional[str]
+    mapping_status: str
+    evidence_status: str
+    evidences: List[LegacyEvidence] = field(default_factory=list)
+    hits_by_doc_type: dict = field(default_factory=dict)
+    flags: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            'insurer': self.insurer,
+            'coverage_name_raw': self.coverage_name_raw,
+            'coverage_code': self.coverage_code,
+            'coverage_name_canonical': self.coverage_name_canonical,
+            'mapping_status': self.mapping_status,
+            'evidence_status': self.evidence_status,
+            'evidences': [e.to_dict() for e in self.evidences],
+            'hits_by_doc_type': self.hits_by_doc_type,
+            'flags': self.flags
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LegacyCoverageCard':
+        evidences = [LegacyEvidence.from_dict(e) for e in data.get('evidences', [])]
+        return cls(
+            insurer=data['insurer'],
+            coverage_name_raw=data['coverage_name_raw'],
+            coverage_code=data.get('coverage_code'),
+            coverage_name_canonical=data.get('coverage_name_canonical'),
+            mapping_status=data['mapping_status'],
+            evidence_status=data['evidence_status'],
+            evidences=evidences,
+            hits_by_doc_type=data.get('hits_by_doc_type', {}),
+            flags=data.get('flags', [])
+        )
+
+
+def load_lines(cards_dir: Path) -> List[str]:
+    lines = []
+    for cards_file in sorted(cards_dir.glob("*_coverage_cards.jsonl")):
+        with open(cards_file, 'r', encoding='utf-8') as f:
+            lines.extend(line for line in f if line.strip())
+    return lines
+
+
+def legacy_load(lines: List[str]) -> list:
+    return [LegacyCoverageCard.from_dict(json.loads(line)) for line in lines]
+
+
+def legacy_dump(cards: list) -> List[str]:
+    return [json.dumps(card.to_dict(), ensure_ascii=False) for card in cards]
+
+
+def slotted_load(lines: List[str]) -> list:
+    return [CoverageCard.from_json(line) for line in lines]
+
+
+def slotted_dump(cards: list) -> List[str]:
+    return [card.to_json() for card in cards]
+
+
+def measure(load_fn, dump_fn, lines: List[str]) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    cards = load_fn(lines)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cards
+    gc.collect()
+
+    start = time.perf_counter()
+    cards = load_fn(lines)
+    load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dumped = dump_fn(cards)
+    dump_s = time.perf_counter() - start
+
+    return {'retained_mb': retained / 1e6, 'load_s': load_s, 'dump_s': dump_s, 'dumped': dumped}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compare_types JSONL round trip")
+    parser.add_argument("--repeat", type=int, default=20, help="Repeat all insurers' cards N times")
+    args = parser.parse_args()
+
+    lines = load_lines(PROJECT_ROOT / "data" / "compare") * args.repeat
+    print(f"Cards: {len(lines)} ({args.repeat}x all insurers)")
+
+    legacy = measure(legacy_load, legacy_dump, lines)
+    slotted = measure(slotted_load, slotted_dump, lines)
+
+    assert legacy['dumped'] == slotted['dumped'], "Serialized output differs"
+
+    print(f"{'':10} {'retained MB':>12} {'load s':>9} {'dump s':>9}")
+    for name, result in (('legacy', legacy), ('slotted', slotted)):
+        print(f"{name:10} {result['retained_mb']:12.2f} {result['load_s']:9.3f} {result['dump_s']:9.3f}")
+    print(f"{'delta':10} {slotted['retained_mb'] - legacy['retained_mb']:+12.2f} "
+          f"{slotted['load_s'] - legacy['load_s']:+9.3f} {slotted['dump_s'] - legacy['dump_s']:+9.3f}")
+
+
+if __name__ == "__main__":
+    main()
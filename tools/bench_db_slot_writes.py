@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark: DB-only evidence_slot generation (legacy vs bulk path).
+
+Builds a synthetic coverage_chunk table (default 100k rows spread over
+--insurers insurer codes) in a scratch schema, then times:
+  - legacy: per-insurer mapping queries, fetch all chunks, Python anchor
+            filter, delete + row-by-row INSERT
+  - bulk:   DBOnlyCoveragePipeline.generate_evidence_slots (single mapping
+            query, SQL gate pushdown, execute_values upsert)
+and checks that both leave identical evidence_slot rows.
+
+Requires a running Postgres (DB_CONFIG in tools/run_db_only_coverage.py).
+The scratch schema is dropped at the end unless --keep is given.
+
+Usage:
+  python3 tools/bench_db_slot_writes.py [--chunks 100000] [--insurers 200] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import psycopg2
+import psycopg2.extras
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.coverage_store import PostgresCoverageStore
+from tools.run_db_only_coverage import DB_CONFIG, DBOnlyCoveragePipeline, GateContext, apply_gates
+from tools.coverage_profiles import get_profile
+
+SCHEMA = "bench_slot_writes"
+COVERAGE_CODE = "A4210"
+AS_OF_DATE = "2025-11-26"
+SLOT_KEYS = ["waiting_period", "exclusions", "subtype_coverage_map"]
+
+# 합성 chunk 본문 (일부만 anchor / gate 통과)
+CHUNK_TEMPLATES = [
+    ("유사암진단비 보험금을 지급합니다. 보장개시일부터 90일 면책", "유사암진단비 지급"),
+    ("유사암 진단확정 시 보험가입금액 지급. 제자리암, 경계성종양 정의", "유사암 정의"),
+    ("유사암진단비는 다음의 경우 보험금을 지급하지 않습니다 (제외)", "유사암진단비 제외"),
+    ("입원일당 연간 3 회한 지급", "입원일당"),
+    ("보험료 납입면제 사유에 해당하는 경우", "유사암 납입면제"),
+    ("일반 약관 조항 본문", "일반 조항"),
+]
+
+SETUP_SQL = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+CREATE SCHEMA {SCHEMA};
+SET search_path TO {SCHEMA};
+CREATE TABLE coverage_mapping_ssot (
+    coverage_code TEXT, ins_cd TEXT, anchor_keywords TEXT[], insurer_coverage_name TEXT
+);
+CREATE TABLE coverage_chunk (
+    chunk_id BIGSERIAL PRIMARY KEY, coverage_code TEXT, as_of_date DATE, ins_cd TEXT,
+    chunk_text TEXT, excerpt TEXT, page_number INT
+);
+CREATE TABLE evidence_slot (
+    slot_id BIGSERIAL PRIMARY KEY, coverage_code TEXT, as_of_date DATE, ins_cd TEXT, slot_key TEXT,
+    chunk_id BIGINT, excerpt TEXT, page_number INT, status TEXT, gate_version TEXT, chunk_hash TEXT
+);
+CREATE UNIQUE INDEX uq_evidence_slot_key ON evidence_slot (coverage_code, as_of_date, ins_cd, slot_key);
+CREATE TABLE evidence_gate_state (
+    coverage_code TEXT, as_of_date DATE, ins_cd TEXT, chunk_id BIGINT, chunk_hash TEXT, gate_hash TEXT,
+    PRIMARY KEY (coverage_code, as_of_date, chunk_id)
+);
+CREATE TABLE compare_table_v2 (
+    table_id BIGSERIAL PRIMARY KEY, coverage_code TEXT, as_of_date DATE, payload JSONB
+);
+"""
+
+
+def ins_cd_of(i: int) -> str:
+    return f"N{i:03d}"
+
+
+def setup(cur, n_chunks: int, n_insurers: int):
+    cur.execute(SETUP_SQL)
+    psycopg2.extras.execute_values(cur, """
+        INSERT INTO coverage_mapping_ssot (coverage_code, ins_cd, anchor_keywords, insurer_coverage_name) VALUES %s
+    """, [(COVERAGE_CODE, ins_cd_of(i), ["유사암", "유사암진단", "유사암진단비"], "유사암진단비")
+          for i in range(n_insurers)])
+    # chunk 순서상 gate 통과 chunk가 뒤쪽에 오도록 template 역순 배치
+    cur.execute("""
+        INSERT INTO coverage_chunk (coverage_code, as_of_date, ins_cd, chunk_text, excerpt, page_number)
+        SELECT %s, %s, 'N' || lpad(((g %% %s))::text, 3, '0'),
+               (%s::text[])[1 + (g / %s) %% %s], (%s::text[])[1 + (g / %s) %% %s], 1 + g %% 300
+        FROM generate_series(%s, 0, -1) AS g
+    """, (COVERAGE_CODE, AS_OF_DATE, n_insurers,
+          [t for t, _ in CHUNK_TEMPLATES], n_insurers, len(CHUNK_TEMPLATES),
+          [e for _, e in CHUNK_TEMPLATES], n_insurers, len(CHUNK_TEMPLATES),
+          n_chunks - 1))
+    cur.execute("ANALYZE")
+
+
+def run_legacy(conn, cur, ins_cds: list):
+    """변경 전 generate_evidence_slots 경로 (delete + 행 단위 INSERT)"""
+    profile = get_profile(COVERAGE_CODE)
+    cur.execute("DELETE FROM evidence_slot WHERE coverage_code = %s AND as_of_date = %s",
+                (COVERAGE_CODE, AS_OF_DATE))
+    for ins_cd in ins_cds:
+        cur.execute("SELECT anchor_keywords FROM coverage_mapping_ssot WHERE coverage_code = %s AND ins_cd = %s",
+                    (COVERAGE_CODE, ins_cd))
+        row = cur.fetchone()
+        anchors = row['anchor_keywords'] if row else []
+        cur.execute("SELECT insurer_coverage_name FROM coverage_mapping_ssot WHERE coverage_code = %s AND ins_cd = %s",
+                    (COVERAGE_CODE, ins_cd))
+        row = cur.fetchone()
+        coverage_name = row['insurer_coverage_name'] if row else ""
+
+        cur.execute("""
+            SELECT chunk_id, chunk_text, excerpt, page_number FROM coverage_chunk
+            WHERE coverage_code = %s AND as_of_date = %s AND ins_cd = %s ORDER BY chunk_id
+        """, (COVERAGE_CODE, AS_OF_DATE, ins_cd))
+        anchor_matched = [c for c in cur.fetchall() if any(a in c['excerpt'] for a in anchors)]
+        ctx = GateContext(COVERAGE_CODE, ins_cd, anchors, coverage_name, profile)
+
+        for slot_key in SLOT_KEYS:
+            for chunk in anchor_matched:
+                passed, _ = apply_gates(slot_key, chunk['chunk_text'], chunk['excerpt'], ctx)
+                if passed:
+                    cur.execute("""
+                        INSERT INTO evidence_slot (coverage_code, as_of_date, ins_cd, slot_key, chunk_id, excerpt, page_number, status, gate_version)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, 'FOUND', %s)
+                    """, (COVERAGE_CODE, AS_OF_DATE, ins_cd, slot_key, chunk['chunk_id'],
+                          chunk['excerpt'], chunk['page_number'], profile['gate_version']))
+                    break
+    conn.commit()
+
+
+def run_bulk(conn, cur, ins_cds: list):
+    store = PostgresCoverageStore(conn, owns_conn=False)
+    # force: incremental 상태를 무시하고 매 반복 전체 재판정 (legacy와 같은 작업량)
+    pipeline = DBOnlyCoveragePipeline(COVERAGE_CODE, AS_OF_DATE, ins_cds, skip_chunks=True,
+                                      store=store, adaptive_gates=False, force=True)
+    pipeline.generate_evidence_slots()
+    store.commit()
+    store.close()
+
+
+def snapshot(cur) -> list:
+    cur.execute("""
+        SELECT ins_cd, slot_key, chunk_id, status FROM evidence_slot
+        WHERE coverage_code = %s AND as_of_date = %s ORDER BY ins_cd, slot_key
+    """, (COVERAGE_CODE, AS_OF_DATE))
+    return [tuple(row.values()) for row in cur.fetchall()]
+
+
+def timed(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark evidence_slot generation write path")
+    parser.add_argument("--chunks", type=int, default=100_000, help="Synthetic coverage_chunk rows")
+    parser.add_argument("--insurers", type=int, default=200, help="Synthetic insurer codes")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema")
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+    try:
+        setup(cur, args.chunks, args.insurers)
+        conn.commit()
+        ins_cds = [ins_cd_of(i) for i in range(args.insurers)]
+        print(f"Synthetic coverage_chunk: {args.chunks} rows, {args.insurers} insurers")
+
+        t_legacy = timed(lambda: run_legacy(conn, cur, ins_cds), args.repeat)
+        legacy_rows = snapshot(cur)
+        t_bulk = timed(lambda: run_bulk(conn, cur, ins_cds), args.repeat)
+        bulk_rows = snapshot(cur)
+
+        print(f"  legacy: {t_legacy:.3f}s")
+        print(f"  bulk:   {t_bulk:.3f}s ({t_legacy / t_bulk:.2f}x)")
+        print(f"  evidence_slot rows: {len(bulk_rows)} (identical: {legacy_rows == bulk_rows})")
+    finally:
+        if not args.keep:
+            cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+            conn.commit()
+        cur.close()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: single-coverage slot extraction.
+
+Runs the six per-slot _extract_slot_text calls and the batched SlotEngine
+over every item of every insurer's evidence pack, checks that the outputs are
+identical, and reports the time of each. Each repeat uses a fresh SlotEngine
+(empty line cache), i.e. one full batch-extraction pass per repeat.
+
+Usage:
+  python3 tools/bench_slot_engine.py [--repeat 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from pipeline.step8_single_coverage.extract_single_coverage import (
+    SLOT_SPECS, SingleCoverageExtractor, SlotEngine
+)
+
+
+def load_evidence_sets() -> list:
+    evidence_sets = []
+    for pack_file in sorted((PROJECT_ROOT / "data" / "evidence_pack").glob("*_evidence_pack.jsonl")):
+        with open(pack_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    evidence_sets.append(json.loads(line).get('evidences', []))
+    return evidence_sets
+
+
+def run_legacy(extractor: SingleCoverageExtractor, evidence_sets: list) -> list:
+    return [
+        {
+            slot_key: extractor._extract_slot_text(evidences, patterns, context_lines=context_lines)
+            for slot_key, patterns, context_lines in SLOT_SPECS
+        }
+        for evidences in evidence_sets
+    ]
+
+
+def run_engine(evidence_sets: list) -> list:
+    engine = SlotEngine(SLOT_SPECS)
+    return [engine.extract(evidences) for evidences in evidence_sets]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark slot extraction")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeat all evidence packs N times")
+    args = parser.parse_args()
+
+    evidence_sets = load_evidence_sets()
+    extractor = SingleCoverageExtractor('bench', 'bench', PROJECT_ROOT)
+    print(f"Evidence sets: {len(evidence_sets)} (all insurers) x {args.repeat} repeats")
+
+    legacy_s = 0.0
+    engine_s = 0.0
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        legacy = run_legacy(extractor, evidence_sets)
+        legacy_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine = run_engine(evidence_sets)
+        engine_s += time.perf_counter() - start
+
+        assert legacy == engine, "SlotEngine output differs from _extract_slot_text"
+
+    print(f"legacy (6 x per-slot scan): {legacy_s:.3f}s")
+    print(f"slot engine (batched):      {engine_s:.3f}s")
+    print(f"speedup: {legacy_s / engine_s:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
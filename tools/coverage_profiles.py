@@ -1,35 +1,224 @@
 """
 Coverage-specific profiles for context guard validation.
 DB-only SSOT baseline.
+
+profile은 data/coverage_profiles/*.json (또는 *.yml) 데이터 파일에 정의하고,
+import 시 1회 로드 + compile한다.
+
+- 파일 1개 = coverage profile 1개 (coverage_code는 전역 unique)
+- 패턴은 Python re 문법 (JSON 문자열이므로 역슬래시는 "\\d+일"처럼 이중으로 작성)
+- 패턴 문자열은 rejection reason에 그대로 기록됨 (hard_negative:<pattern> 등) → 수정 시 감사 기록 확인
+- *.yml / *.yaml은 해당 파일이 있을 때만 PyYAML을 import한다 (기본 profile은 JSON → 표준 라이브러리만 사용)
+
+- 패턴 문자열 → re.Pattern cache (profile 간 공유, re 모듈 cache 크기와 무관)
+- 패턴 목록 → CompiledPatternSet cache (동일 목록은 같은 객체)
+  · union: 목록 전체 alternation — "하나도 안 맞음"을 search 1회로 판정
+  · first_hit: 목록 순서상 첫 매칭 패턴 (rejection reason 문자열 유지)
+- CompiledProfile: gate별 CompiledPatternSet (tools/gate_engine.py가 사용)
+
+profile 수가 늘어도 chunk 판정 중 compile / re cache miss는 발생하지 않는다.
 """
 
-# A4210: 유사암진단비 (Similar Cancer Diagnosis)
-A4210_PROFILE = {
-    "profile_id": "A4210_PROFILE_V1",
-    "coverage_code": "A4210",
-    "canonical_name": "유사암진단비",
-    "gate_version": "GATE_SSOT_V2_CONTEXT_GUARD",
+import json
+import logging
+import re
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterable, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+logger = logging.getLogger(__name__)
+
+PROFILE_DIR = PROJECT_ROOT / "data" / "coverage_profiles"
+PROFILE_SUFFIXES = (".json", ".yml", ".yaml")
+REQUIRED_PROFILE_KEYS = ("profile_id", "coverage_code", "gate_version", "anchor_keywords")
+
+# alternation 결합 시 의미가 바뀌는 구문 (번호 backreference / 이름 참조 / 조건부 / 전역 inline flag)
+_UNION_UNSAFE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)')
+
+
+class ProfileError(ValueError):
+    """profile 데이터 파일 오류 (필수 키 누락 / coverage_code 중복 / 잘못된 패턴)"""
+
+
+_PATTERN_CACHE: Dict[str, re.Pattern] = {}
+_SET_CACHE: Dict[Tuple[str, ...], 'CompiledPatternSet'] = {}
+_PROFILE_CACHE: Dict[str, 'CompiledProfile'] = {}
+
+
+def compile_pattern(pattern: str) -> re.Pattern:
+    """패턴 문자열 → re.Pattern (프로세스당 1회 compile)"""
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[pattern] = re.compile(pattern)
+    return compiled
+
+
+def union_regex(patterns: Iterable[str]) -> Optional[str]:
+    """패턴 목록 → "(?:p1)|(?:p2)|..." (결합이 안전하지 않거나 2개 미만이면 None)"""
+    patterns = list(patterns)
+    if len(patterns) < 2 or any(_UNION_UNSAFE.search(p) for p in patterns):
+        return None
+    return '|'.join(f'(?:{p})' for p in patterns)
+
+
+class CompiledPatternSet:
+    """
+    gate 1개의 패턴 목록 (순서 유지)
+
+    - patterns: 원본 문자열 (reason 기록용)
+    - compiled: 패턴별 re.Pattern
+    - union: 전체 alternation re.Pattern (None이면 개별 평가만)
+    """
+
+    __slots__ = ('patterns', 'compiled', 'union', 'union_source')
+
+    def __init__(self, patterns: Tuple[str, ...]):
+        self.patterns = patterns
+        self.compiled = tuple(compile_pattern(p) for p in patterns)
+        self.union_source = union_regex(patterns)
+        self.union = compile_pattern(self.union_source) if self.union_source else None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
 
-    "anchor_keywords": ["유사암", "유사암진단", "유사암진단비"],
+    def first_hit(self, text: str) -> Optional[str]:
+        """목록 순서상 첫 매칭 패턴 문자열 (없으면 None)"""
+        if self.union is not None and self.union.search(text) is None:
+            return None
+        for pattern, compiled in zip(self.patterns, self.compiled):
+            if compiled.search(text) is not None:
+                return pattern
+        return None
 
-    "required_terms_by_slot": {
-        "waiting_period": ["면책", "보장개시", "책임개시", "90일", r"\d+일", "감액", "지급률", "진단확정"],
-        "exclusions": ["제외", "보장하지", "지급하지", "보상하지", "면책", r"보험금을\s*지급하지"],
-        "subtype_coverage_map": ["제자리암", "상피내암", "전암", "경계성", "경계성종양", "유사암", "소액암", "기타피부암", "갑상선암", "정의", "범위"]
-    },
+    def any_hit(self, text: str) -> bool:
+        if self.union is not None:
+            return self.union.search(text) is not None
+        return self.first_hit(text) is not None
 
-    "hard_negative_terms_global": ["통원일당", "입원일당", "치료일당", "일당", "상급종합병원", r"연간\s*\d+\s*회한", r"\d+\s*회\s*한", "100세만기", "90세만기"],
 
-    "section_negative_terms_global": ["납입면제", r"보험료\s*납입면제", "보장보험료", r"차회\s*이후", r"면제\s*사유", r"납입을\s*면제"],
+def compile_pattern_set(patterns: Iterable[str]) -> CompiledPatternSet:
+    """패턴 목록 → CompiledPatternSet (같은 목록은 같은 객체)"""
+    key = tuple(patterns)
+    pattern_set = _SET_CACHE.get(key)
+    if pattern_set is None:
+        pattern_set = _SET_CACHE[key] = CompiledPatternSet(key)
+    return pattern_set
 
-    "diagnosis_signal_terms_global": ["유사암진단비", "진단비", "진단확정", r"진단\s*확정", "지급사유", "보험금", "보험가입금액", "지급합니다", "지급함"],
 
-    "slot_specific_negatives": {
-        "subtype_coverage_map": ["납입면제", r"면제\s*사유", "보장보험료"]
+class CompiledProfile:
+    """profile 1개의 gate별 CompiledPatternSet"""
+
+    __slots__ = ('profile', 'hard_negatives', 'section_negatives', 'diagnosis_signals',
+                 'required_by_slot', 'slot_negatives')
+
+    def __init__(self, profile: Optional[dict]):
+        self.profile = profile or {}
+        self.hard_negatives = compile_pattern_set(self.profile.get("hard_negative_terms_global", []))
+        self.section_negatives = compile_pattern_set(self.profile.get("section_negative_terms_global", []))
+        self.diagnosis_signals = compile_pattern_set(self.profile.get("diagnosis_signal_terms_global", []))
+        self.required_by_slot = {slot_key: compile_pattern_set(terms)
+                                 for slot_key, terms in self.profile.get("required_terms_by_slot", {}).items()}
+        self.slot_negatives = {slot_key: compile_pattern_set(terms)
+                               for slot_key, terms in self.profile.get("slot_specific_negatives", {}).items()}
+
+    def required_terms(self, slot_key: str) -> CompiledPatternSet:
+        return self.required_by_slot.get(slot_key) or compile_pattern_set(())
+
+    def slot_negative_terms(self, slot_key: str) -> CompiledPatternSet:
+        return self.slot_negatives.get(slot_key) or compile_pattern_set(())
+
+
+def _profile_key(profile: Optional[dict]) -> str:
+    return json.dumps(profile or {}, sort_keys=True, ensure_ascii=False)
+
+
+def compiled_profile(profile: Optional[dict]) -> CompiledProfile:
+    """profile dict → CompiledProfile (내용 기준 cache: 같은 내용이면 다시 compile하지 않음)"""
+    key = _profile_key(profile)
+    compiled = _PROFILE_CACHE.get(key)
+    if compiled is None:
+        compiled = _PROFILE_CACHE[key] = CompiledProfile(profile)
+    return compiled
+
+
+def pattern_cache_info() -> dict:
+    return {"patterns": len(_PATTERN_CACHE), "pattern_sets": len(_SET_CACHE), "profiles": len(_PROFILE_CACHE)}
+
+
+def _read_profile_file(path: Path) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix == ".json":
+            profile = json.load(f)
+        else:
+            try:
+                import yaml
+            except ImportError:
+                raise ProfileError(f"{path}: PyYAML is required for YAML profiles (or convert to .json)") from None
+            profile = yaml.safe_load(f)
+    if not isinstance(profile, dict):
+        raise ProfileError(f"{path}: profile must be a mapping")
+    missing = [key for key in REQUIRED_PROFILE_KEYS if key not in profile]
+    if missing:
+        raise ProfileError(f"{path}: missing keys {missing}")
+    return profile
+
+
+def load_profiles(profile_dir: Path = PROFILE_DIR) -> Tuple[Dict[str, dict], dict]:
+    """
+    profile 데이터 파일 로드 + compile
+
+    Returns:
+        (coverage_code → profile dict, load report)
+    """
+    start = perf_counter()
+    profiles: Dict[str, dict] = {}
+    sources: Dict[str, Path] = {}
+    paths = sorted(p for p in Path(profile_dir).glob("*") if p.suffix in PROFILE_SUFFIXES)
+    for path in paths:
+        profile = _read_profile_file(path)
+        coverage_code = profile["coverage_code"]
+        if coverage_code in profiles:
+            raise ProfileError(f"{path}: duplicate coverage_code {coverage_code} (also in {sources[coverage_code]})")
+        profiles[coverage_code] = profile
+        sources[coverage_code] = path
+    loaded = perf_counter()
+
+    before = pattern_cache_info()
+    for coverage_code, profile in profiles.items():
+        try:
+            compiled_profile(profile)
+        except re.error as e:
+            raise ProfileError(f"{sources[coverage_code]}: invalid pattern {e.pattern!r}: {e}") from e
+    after = pattern_cache_info()
+
+    report = {
+        "files": len(paths),
+        "profiles": len(profiles),
+        "patterns_compiled": after["patterns"] - before["patterns"],
+        "pattern_sets": after["pattern_sets"] - before["pattern_sets"],
+        "load_ms": round((loaded - start) * 1000, 3),
+        "compile_ms": round((perf_counter() - loaded) * 1000, 3),
     }
-}
+    logger.debug(f"Coverage profiles loaded: {report}")
+    return profiles, report
+
+
+COVERAGE_PROFILES, PROFILE_LOAD_REPORT = load_profiles()
+
+# 기존 import 호환
+A4210_PROFILE = COVERAGE_PROFILES.get("A4210")
 
-COVERAGE_PROFILES = {"A4210": A4210_PROFILE}
 
 def get_profile(coverage_code: str) -> dict:
     return COVERAGE_PROFILES.get(coverage_code)
+
+
+def describe_load_report(report: dict = None) -> str:
+    report = report or PROFILE_LOAD_REPORT
+    return (f"{report['profiles']} profiles from {report['files']} files, "
+            f"{report['patterns_compiled']} patterns / {report['pattern_sets']} sets compiled, "
+            f"load {report['load_ms']:.1f}ms + compile {report['compile_ms']:.1f}ms")
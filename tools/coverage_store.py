@@ -0,0 +1,930 @@
+#!/usr/bin/env python3
+"""
+Coverage store: DB-only coverage pipeline 저장소 추상화.
+
+DBOnlyCoveragePipeline이 사용하는 coverage_mapping_ssot / coverage_chunk /
+evidence_slot / compare_table_v2 연산을 backend별로 구현한다.
+
+- PostgresCoverageStore: SSOT Postgres (DB_CONFIG, psycopg2는 연결 시점에 import)
+- SqliteCoverageStore:   로컬 SQLite 파일 또는 ":memory:" (Postgres 없이 gate / 쓰기 경로 측정용)
+  · REGEXP 함수를 Python re로 등록 → negative gate pushdown이 Python gate와 동일 의미
+  · anchor는 instr() 부분 문자열 검색 (LIKE의 ASCII 대소문자 무시 회피)
+
+as_of_date partition 보존 / JSONL export·load 명령: tools/coverage_store_cli.py
+"""
+
+import json
+import re
+import sqlite3
+import sys
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.gate_pushdown import build_chunk_filter
+from tools.incremental_slots import chunk_content_hash
+
+DB_CONFIG = {
+    "host": "localhost",
+    "port": 5433,
+    "dbname": "inca_ssot",
+    "user": "postgres",
+    "password": "postgres"
+}
+
+# execute_values / executemany 1회 statement당 행 수
+WRITE_PAGE_SIZE = 1000
+
+# 후보 chunk 스트리밍 batch 크기 (server-side cursor itersize / chunk_text 조회 단위)
+STREAM_ITERSIZE = 2000
+
+EVIDENCE_SLOT_COLUMNS = ("coverage_code", "as_of_date", "ins_cd", "slot_key", "chunk_id",
+                         "excerpt", "page_number", "status", "gate_version", "chunk_hash")
+
+# tools/incremental_slots.chunk_content_hash와 같은 값 (schema/040_evidence_gate_state.sql)
+PG_CHUNK_HASH_SQL = ("md5(COALESCE(chunk_text, '') || chr(31) || COALESCE(excerpt, '') || chr(31) "
+                     "|| COALESCE(page_number::text, ''))")
+
+# as_of_date LIST partition 테이블 (schema/050_partition_by_as_of_date.sql, 이름: {table}_dYYYYMMDD)
+PARTITIONED_TABLES = ("coverage_chunk", "evidence_slot", "evidence_gate_state")
+PARTITION_NAME_RE = re.compile(r'^(?P<table>\w+)_d(?P<date>\d{8})$')
+
+# JSONL export / load 대상 테이블 컬럼
+TABLE_COLUMNS = {
+    "coverage_mapping_ssot": ("coverage_code", "ins_cd", "anchor_keywords", "insurer_coverage_name"),
+    "coverage_chunk": ("chunk_id", "coverage_code", "as_of_date", "ins_cd", "chunk_text", "excerpt", "page_number"),
+}
+
+
+class CoverageStore(ABC):
+    """
+    DB-only pipeline 저장소 인터페이스
+
+    쓰기 연산은 commit하지 않는다 (호출자가 commit / rollback으로 트랜잭션 경계 결정).
+    """
+
+    backend = "abstract"
+
+    @abstractmethod
+    def commit(self):
+        """현재 트랜잭션 commit"""
+
+    @abstractmethod
+    def rollback(self):
+        """현재 트랜잭션 rollback"""
+
+    @abstractmethod
+    def close(self):
+        """connection 정리 (소유한 connection만 닫음)"""
+
+    @abstractmethod
+    def mapped_ins_cds(self, coverage_code: str) -> List[str]:
+        """coverage_mapping_ssot에 매핑된 ins_cd (오름차순)"""
+
+    @abstractmethod
+    def load_mappings(self, coverage_code: str, ins_cds: List[str]) -> Dict[str, dict]:
+        """ins_cd → {"anchors", "coverage_name"}"""
+
+    @abstractmethod
+    def count_chunks(self, coverage_code: str, as_of_date: str, ins_cd: Optional[str] = None) -> int:
+        """대상 coverage_chunk 행 수 (ins_cd 지정 시 해당 보험사만)"""
+
+    @abstractmethod
+    def fetch_candidates(self, coverage_code: str, as_of_date: str, ins_cd: str, anchors: List[str],
+                         hard_negatives: List[str], section_negatives: List[str]) -> List[dict]:
+        """GATE 1-3 pushdown 후보 chunk (chunk_id 순, dict: chunk_id/chunk_text/excerpt/page_number)"""
+
+    @abstractmethod
+    def iter_candidate_excerpts(self, coverage_code: str, as_of_date: str, ins_cd: str, anchors: List[str],
+                                hard_negatives: List[str], section_negatives: List[str],
+                                itersize: int = STREAM_ITERSIZE) -> Iterator[dict]:
+        """
+        fetch_candidates와 같은 후보를 chunk_text 없이 스트리밍 (dict: chunk_id/excerpt/page_number)
+
+        itersize 행 단위로 가져오며, 소비자가 중간에 닫으면(close) 나머지는 전송하지 않는다.
+        """
+
+    @abstractmethod
+    def fetch_chunk_texts(self, chunk_ids: List[int], as_of_date: str) -> Dict[int, str]:
+        """chunk_id → chunk_text (as_of_date 한정 → partition pruning)"""
+
+    @abstractmethod
+    def lock_coverage(self, coverage_code: str, as_of_date: str):
+        """(coverage_code, as_of_date) 쓰기 직렬화 (트랜잭션 종료 시 해제)"""
+
+    @abstractmethod
+    def delete_compare_tables(self, coverage_code: str, as_of_date: str) -> int:
+        """compare_table_v2 기존 행 삭제 → 삭제 행 수"""
+
+    @abstractmethod
+    def write_evidence_slots(self, coverage_code: str, as_of_date: str, slot_rows: List[tuple]) -> Tuple[int, int]:
+        """
+        evidence_slot set-based upsert + stale 행 삭제
+
+        Args:
+            slot_rows: EVIDENCE_SLOT_COLUMNS 순서 tuple (FOUND 행)
+
+        Returns:
+            (upserted, deleted)
+        """
+
+    @abstractmethod
+    def load_evidence_slots(self, coverage_code: str, as_of_date: str) -> List[dict]:
+        """evidence_slot 행 (ins_cd, slot_key 순, dict: ins_cd/slot_key/excerpt/status)"""
+
+    @abstractmethod
+    def insert_compare_table(self, coverage_code: str, as_of_date: str, payload: dict) -> int:
+        """compare_table_v2 행 추가 → table_id"""
+
+    @abstractmethod
+    def count_rows(self, table: str, coverage_code: str, as_of_date: str) -> int:
+        """table의 (coverage_code, as_of_date) 행 수"""
+
+    @abstractmethod
+    def latest_compare_payload(self, coverage_code: str, as_of_date: str) -> Optional[dict]:
+        """가장 최근 compare_table_v2 payload (없으면 None)"""
+
+    @abstractmethod
+    def chunk_hashes(self, coverage_code: str, as_of_date: str, ins_cds: List[str]) -> Dict[str, Dict[int, str]]:
+        """ins_cd → chunk_id → chunk_hash (chunk_content_hash, 대상 chunk 전체)"""
+
+    @abstractmethod
+    def load_gate_state(self, coverage_code: str, as_of_date: str) -> Dict[str, Dict[int, Tuple[str, str]]]:
+        """evidence_gate_state: ins_cd → chunk_id → (chunk_hash, gate_hash)"""
+
+    @abstractmethod
+    def write_gate_state(self, coverage_code: str, as_of_date: str, ins_cds: List[str],
+                         upserts: List[tuple], removed: List[int]) -> Tuple[int, int]:
+        """
+        evidence_gate_state 갱신
+
+        Args:
+            ins_cds: 이번 실행 대상 (그 밖의 ins_cd 상태는 삭제 — evidence_slot stale 삭제와 동일)
+            upserts: (ins_cd, chunk_id, chunk_hash, gate_hash)
+            removed: 사라진 chunk_id
+
+        Returns:
+            (upserted, deleted)
+        """
+
+    @abstractmethod
+    def load_slot_winners(self, coverage_code: str, as_of_date: str) -> Dict[str, Dict[str, dict]]:
+        """evidence_slot FOUND 행: ins_cd → slot_key → {chunk_id, chunk_hash}"""
+
+    def ensure_partitions(self, as_of_date: str):
+        """as_of_date partition 생성 (분할하지 않은 backend는 no-op)"""
+
+    @abstractmethod
+    def as_of_dates(self) -> List[str]:
+        """PARTITIONED_TABLES에 존재하는 기준일 (오름차순, YYYY-MM-DD)"""
+
+    @abstractmethod
+    def detach_as_of_dates(self, as_of_dates: List[str], archive: Optional[str] = None,
+                           drop: bool = False) -> List[str]:
+        """
+        기준일 이력을 PARTITIONED_TABLES에서 분리 (commit 포함)
+
+        Args:
+            archive: 분리한 데이터 보관 위치 (backend별: Postgres schema / SQLite 파일)
+            drop: 보관 없이 삭제
+
+        Returns:
+            분리한 partition (또는 테이블.기준일) 이름
+        """
+
+
+class PostgresCoverageStore(CoverageStore):
+    """SSOT Postgres backend (psycopg2 RealDictCursor)"""
+
+    backend = "postgres"
+
+    def __init__(self, conn, owns_conn: bool = True):
+        import psycopg2.extras
+
+        self._extras = psycopg2.extras
+        self.conn = conn
+        self.cur = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        self._owns_conn = owns_conn
+        # schema/050 적용 여부 (ensure_partitions 첫 호출 시 확인)
+        self._partitioned: Optional[bool] = None
+
+    @classmethod
+    def connect(cls, db_config: dict = DB_CONFIG) -> 'PostgresCoverageStore':
+        import psycopg2
+
+        return cls(psycopg2.connect(**db_config))
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+
+    def close(self):
+        if self.cur:
+            self.cur.close()
+            self.cur = None
+        if self._owns_conn and self.conn:
+            self.conn.close()
+
+    def mapped_ins_cds(self, coverage_code: str) -> List[str]:
+        self.cur.execute("""
+            SELECT DISTINCT ins_cd FROM coverage_mapping_ssot
+            WHERE coverage_code = %s ORDER BY ins_cd
+        """, (coverage_code,))
+        return [row['ins_cd'] for row in self.cur.fetchall()]
+
+    def load_mappings(self, coverage_code: str, ins_cds: List[str]) -> Dict[str, dict]:
+        self.cur.execute("""
+            SELECT ins_cd, anchor_keywords, insurer_coverage_name FROM coverage_mapping_ssot
+            WHERE coverage_code = %s AND ins_cd = ANY(%s)
+        """, (coverage_code, list(ins_cds)))
+        return {
+            row['ins_cd']: {
+                "anchors": row['anchor_keywords'] or [],
+                "coverage_name": row['insurer_coverage_name'] or ""
+            }
+            for row in self.cur.fetchall()
+        }
+
+    def count_chunks(self, coverage_code: str, as_of_date: str, ins_cd: Optional[str] = None) -> int:
+        if ins_cd is None:
+            self.cur.execute("""
+                SELECT COUNT(*) FROM coverage_chunk
+                WHERE coverage_code = %s AND as_of_date = %s
+            """, (coverage_code, as_of_date))
+        else:
+            self.cur.execute("""
+                SELECT COUNT(*) FROM coverage_chunk
+                WHERE coverage_code = %s AND as_of_date = %s AND ins_cd = %s
+            """, (coverage_code, as_of_date, ins_cd))
+        return self.cur.fetchone()['count']
+
+    def fetch_candidates(self, coverage_code: str, as_of_date: str, ins_cd: str, anchors: List[str],
+                         hard_negatives: List[str], section_negatives: List[str]) -> List[dict]:
+        pushdown_sql, pushdown_params = build_chunk_filter(anchors, hard_negatives, section_negatives)
+        self.cur.execute("""
+            SELECT chunk_id, chunk_text, excerpt, page_number
+            FROM coverage_chunk
+            WHERE coverage_code = %s AND as_of_date = %s AND ins_cd = %s""" + pushdown_sql + """
+            ORDER BY chunk_id
+        """, (coverage_code, as_of_date, ins_cd, *pushdown_params))
+        return [dict(row) for row in self.cur.fetchall()]
+
+    def iter_candidate_excerpts(self, coverage_code: str, as_of_date: str, ins_cd: str, anchors: List[str],
+                                hard_negatives: List[str], section_negatives: List[str],
+                                itersize: int = STREAM_ITERSIZE) -> Iterator[dict]:
+        pushdown_sql, pushdown_params = build_chunk_filter(anchors, hard_negatives, section_negatives)
+        # named cursor → DECLARE CURSOR, itersize 행씩 FETCH (negative pushdown은 서버에서 chunk_text 평가)
+        with self.conn.cursor(name="coverage_candidates", cursor_factory=self._extras.RealDictCursor) as cur:
+            cur.itersize = itersize
+            cur.execute("""
+                SELECT chunk_id, excerpt, page_number
+                FROM coverage_chunk
+                WHERE coverage_code = %s AND as_of_date = %s AND ins_cd = %s""" + pushdown_sql + """
+                ORDER BY chunk_id
+            """, (coverage_code, as_of_date, ins_cd, *pushdown_params))
+            for row in cur:
+                yield dict(row)
+
+    def fetch_chunk_texts(self, chunk_ids: List[int], as_of_date: str) -> Dict[int, str]:
+        self.cur.execute("""
+            SELECT chunk_id, chunk_text FROM coverage_chunk
+            WHERE as_of_date = %s AND chunk_id = ANY(%s)
+        """, (as_of_date, list(chunk_ids)))
+        return {row['chunk_id']: row['chunk_text'] for row in self.cur.fetchall()}
+
+    def lock_coverage(self, coverage_code: str, as_of_date: str):
+        self.cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))",
+                         (f"evidence_slot:{coverage_code}:{as_of_date}",))
+
+    def delete_compare_tables(self, coverage_code: str, as_of_date: str) -> int:
+        self.cur.execute("DELETE FROM compare_table_v2 WHERE coverage_code = %s AND as_of_date = %s",
+                         (coverage_code, as_of_date))
+        return self.cur.rowcount
+
+    def write_evidence_slots(self, coverage_code: str, as_of_date: str, slot_rows: List[tuple]) -> Tuple[int, int]:
+        if slot_rows:
+            self._extras.execute_values(self.cur, """
+                INSERT INTO evidence_slot (coverage_code, as_of_date, ins_cd, slot_key, chunk_id, excerpt, page_number, status, gate_version, chunk_hash)
+                VALUES %s
+                ON CONFLICT (coverage_code, as_of_date, ins_cd, slot_key) DO UPDATE SET
+                    chunk_id = EXCLUDED.chunk_id,
+                    excerpt = EXCLUDED.excerpt,
+                    page_number = EXCLUDED.page_number,
+                    status = EXCLUDED.status,
+                    gate_version = EXCLUDED.gate_version,
+                    chunk_hash = EXCLUDED.chunk_hash
+            """, slot_rows, page_size=WRITE_PAGE_SIZE)
+
+        self.cur.execute("""
+            DELETE FROM evidence_slot es
+            WHERE es.coverage_code = %s AND es.as_of_date = %s
+              AND NOT EXISTS (
+                  SELECT 1 FROM unnest(%s::text[], %s::text[]) AS k(ins_cd, slot_key)
+                  WHERE k.ins_cd = es.ins_cd AND k.slot_key = es.slot_key
+              )
+        """, (coverage_code, as_of_date,
+              [row[2] for row in slot_rows], [row[3] for row in slot_rows]))
+        return len(slot_rows), self.cur.rowcount
+
+    def load_evidence_slots(self, coverage_code: str, as_of_date: str) -> List[dict]:
+        self.cur.execute("""
+            SELECT ins_cd, slot_key, excerpt, status
+            FROM evidence_slot
+            WHERE coverage_code = %s AND as_of_date = %s
+            ORDER BY ins_cd, slot_key
+        """, (coverage_code, as_of_date))
+        return [dict(row) for row in self.cur.fetchall()]
+
+    def insert_compare_table(self, coverage_code: str, as_of_date: str, payload: dict) -> int:
+        self.cur.execute("""
+            INSERT INTO compare_table_v2 (coverage_code, as_of_date, payload)
+            VALUES (%s, %s, %s)
+            RETURNING table_id
+        """, (coverage_code, as_of_date, json.dumps(payload)))
+        return self.cur.fetchone()['table_id']
+
+    def count_rows(self, table: str, coverage_code: str, as_of_date: str) -> int:
+        self.cur.execute(f"SELECT COUNT(*) FROM {table} WHERE coverage_code = %s AND as_of_date = %s",
+                         (coverage_code, as_of_date))
+        return self.cur.fetchone()['count']
+
+    def latest_compare_payload(self, coverage_code: str, as_of_date: str) -> Optional[dict]:
+        self.cur.execute("""
+            SELECT payload FROM compare_table_v2
+            WHERE coverage_code = %s AND as_of_date = %s
+            ORDER BY table_id DESC LIMIT 1
+        """, (coverage_code, as_of_date))
+        row = self.cur.fetchone()
+        if row is None:
+            return None
+        payload = row['payload']
+        return json.loads(payload) if isinstance(payload, str) else payload
+
+    def chunk_hashes(self, coverage_code: str, as_of_date: str, ins_cds: List[str]) -> Dict[str, Dict[int, str]]:
+        self.cur.execute(f"""
+            SELECT ins_cd, chunk_id, {PG_CHUNK_HASH_SQL} AS chunk_hash
+            FROM coverage_chunk
+            WHERE coverage_code = %s AND as_of_date = %s AND ins_cd = ANY(%s)
+        """, (coverage_code, as_of_date, list(ins_cds)))
+        hashes: Dict[str, Dict[int, str]] = {ins_cd: {} for ins_cd in ins_cds}
+        for row in self.cur.fetchall():
+            hashes[row['ins_cd']][row['chunk_id']] = row['chunk_hash']
+        return hashes
+
+    def load_gate_state(self, coverage_code: str, as_of_date: str) -> Dict[str, Dict[int, Tuple[str, str]]]:
+        self.cur.execute("""
+            SELECT ins_cd, chunk_id, chunk_hash, gate_hash FROM evidence_gate_state
+            WHERE coverage_code = %s AND as_of_date = %s
+        """, (coverage_code, as_of_date))
+        state: Dict[str, Dict[int, Tuple[str, str]]] = {}
+        for row in self.cur.fetchall():
+            state.setdefault(row['ins_cd'], {})[row['chunk_id']] = (row['chunk_hash'], row['gate_hash'])
+        return state
+
+    def write_gate_state(self, coverage_code: str, as_of_date: str, ins_cds: List[str],
+                         upserts: List[tuple], removed: List[int]) -> Tuple[int, int]:
+        if upserts:
+            self._extras.execute_values(self.cur, """
+                INSERT INTO evidence_gate_state (coverage_code, as_of_date, ins_cd, chunk_id, chunk_hash, gate_hash)
+                VALUES %s
+                ON CONFLICT (coverage_code, as_of_date, chunk_id) DO UPDATE SET
+                    ins_cd = EXCLUDED.ins_cd,
+                    chunk_hash = EXCLUDED.chunk_hash,
+                    gate_hash = EXCLUDED.gate_hash
+            """, [(coverage_code, as_of_date, *row) for row in upserts], page_size=WRITE_PAGE_SIZE)
+        self.cur.execute("""
+            DELETE FROM evidence_gate_state
+            WHERE coverage_code = %s AND as_of_date = %s
+              AND (chunk_id = ANY(%s) OR NOT (ins_cd = ANY(%s)))
+        """, (coverage_code, as_of_date, list(removed), list(ins_cds)))
+        return len(upserts), self.cur.rowcount
+
+    def load_slot_winners(self, coverage_code: str, as_of_date: str) -> Dict[str, Dict[str, dict]]:
+        self.cur.execute("""
+            SELECT ins_cd, slot_key, chunk_id, chunk_hash FROM evidence_slot
+            WHERE coverage_code = %s AND as_of_date = %s AND status = 'FOUND'
+        """, (coverage_code, as_of_date))
+        winners: Dict[str, Dict[str, dict]] = {}
+        for row in self.cur.fetchall():
+            winners.setdefault(row['ins_cd'], {})[row['slot_key']] = {
+                "chunk_id": row['chunk_id'], "chunk_hash": row['chunk_hash']
+            }
+        return winners
+
+    def ensure_partitions(self, as_of_date: str):
+        if self._partitioned is None:
+            self.cur.execute("SELECT to_regprocedure('ensure_as_of_date_partitions(date)') IS NOT NULL AS ok")
+            self._partitioned = self.cur.fetchone()['ok']
+        if self._partitioned:
+            self.cur.execute("SELECT ensure_as_of_date_partitions(%s)", (as_of_date,))
+
+    def list_partitions(self) -> List[dict]:
+        """PARTITIONED_TABLES의 partition (dict: table/partition/as_of_date/rows, 기준일 순)"""
+        self.cur.execute("""
+            SELECT parent.relname AS table_name, child.relname AS partition, child.reltuples::bigint AS rows
+            FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            WHERE parent.relname = ANY(%s)
+        """, (list(PARTITIONED_TABLES),))
+        partitions = []
+        for row in self.cur.fetchall():
+            match = PARTITION_NAME_RE.match(row['partition'])
+            if match is None or match.group('table') != row['table_name']:
+                continue
+            d = match.group('date')
+            partitions.append({"table": row['table_name'], "partition": row['partition'],
+                               "as_of_date": f"{d[:4]}-{d[4:6]}-{d[6:]}", "rows": max(row['rows'], 0)})
+        return sorted(partitions, key=lambda p: (p['as_of_date'], p['table']))
+
+    def as_of_dates(self) -> List[str]:
+        return sorted({p['as_of_date'] for p in self.list_partitions()})
+
+    def detach_as_of_dates(self, as_of_dates: List[str], archive: Optional[str] = None,
+                           drop: bool = False) -> List[str]:
+        if archive and not re.match(r'^[A-Za-z_]\w*$', archive):
+            raise ValueError(f"invalid archive schema name: {archive}")
+        targets = set(as_of_dates)
+        detached = []
+        try:
+            if archive and not drop:
+                self.cur.execute(f"CREATE SCHEMA IF NOT EXISTS {archive}")
+            for partition in self.list_partitions():
+                if partition['as_of_date'] not in targets:
+                    continue
+                self.cur.execute(f"ALTER TABLE {partition['table']} DETACH PARTITION {partition['partition']}")
+                if drop:
+                    self.cur.execute(f"DROP TABLE {partition['partition']}")
+                elif archive:
+                    self.cur.execute(f"ALTER TABLE {partition['partition']} SET SCHEMA {archive}")
+                detached.append(partition['partition'])
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return detached
+
+    def iter_table(self, table: str, coverage_code: Optional[str] = None,
+                   as_of_date: Optional[str] = None, itersize: int = 5000) -> Iterable[dict]:
+        """JSONL export용 테이블 스트리밍 (named server-side cursor)"""
+        columns = TABLE_COLUMNS[table]
+        where, params = _scope_where(table, coverage_code, as_of_date, "%s")
+        order = " ORDER BY chunk_id" if table == "coverage_chunk" else " ORDER BY coverage_code, ins_cd"
+        with self.conn.cursor(name=f"export_{table}", cursor_factory=self._extras.RealDictCursor) as cur:
+            cur.itersize = itersize
+            cur.execute(f"SELECT {', '.join(columns)} FROM {table}{where}{order}", params)
+            for row in cur:
+                yield dict(row)
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS coverage_mapping_ssot (
+    coverage_code TEXT NOT NULL,
+    ins_cd TEXT NOT NULL,
+    anchor_keywords TEXT,               -- JSON 배열 (Postgres TEXT[])
+    insurer_coverage_name TEXT,
+    UNIQUE (coverage_code, ins_cd)
+);
+CREATE TABLE IF NOT EXISTS coverage_chunk (
+    chunk_id INTEGER PRIMARY KEY,
+    coverage_code TEXT NOT NULL,
+    as_of_date TEXT NOT NULL,           -- YYYY-MM-DD
+    ins_cd TEXT NOT NULL,
+    chunk_text TEXT,
+    excerpt TEXT,
+    page_number INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_coverage_chunk_scope
+    ON coverage_chunk (coverage_code, as_of_date, ins_cd, chunk_id);
+CREATE TABLE IF NOT EXISTS evidence_slot (
+    slot_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    coverage_code TEXT NOT NULL,
+    as_of_date TEXT NOT NULL,
+    ins_cd TEXT NOT NULL,
+    slot_key TEXT NOT NULL,
+    chunk_id INTEGER,
+    excerpt TEXT,
+    page_number INTEGER,
+    status TEXT,
+    gate_version TEXT,
+    chunk_hash TEXT,
+    UNIQUE (coverage_code, as_of_date, ins_cd, slot_key)
+);
+CREATE TABLE IF NOT EXISTS evidence_gate_state (
+    coverage_code TEXT NOT NULL,
+    as_of_date TEXT NOT NULL,
+    ins_cd TEXT NOT NULL,
+    chunk_id INTEGER NOT NULL,
+    chunk_hash TEXT NOT NULL,
+    gate_hash TEXT NOT NULL,
+    PRIMARY KEY (coverage_code, as_of_date, chunk_id)
+);
+CREATE TABLE IF NOT EXISTS compare_table_v2 (
+    table_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    coverage_code TEXT NOT NULL,
+    as_of_date TEXT NOT NULL,
+    payload TEXT,                       -- JSON
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+def _regexp(pattern: str, value: Optional[str]) -> bool:
+    """SQLite REGEXP (X REGEXP Y → regexp(Y, X)), re 모듈 compile 캐시 사용"""
+    return value is not None and re.search(pattern, value) is not None
+
+
+def _sqlite_candidate_filter(anchors: List[str], hard_negatives: List[str],
+                             section_negatives: List[str]) -> Optional[Tuple[str, list]]:
+    """
+    SQLite 후보 필터 WHERE 조각 ("AND ..." 형태, params)
+
+    anchor가 없으면 GATE 1에서 전부 탈락 → None.
+    REGEXP가 Python re이므로 negative 전체를 pushdown (이식성 제한 없음).
+    """
+    if not anchors:
+        return None
+    clauses = ["(" + " OR ".join("instr(excerpt, ?) > 0" for _ in anchors) + ")"]
+    params: list = list(anchors)
+    for pattern in list(hard_negatives) + list(section_negatives):
+        clauses.append("NOT (chunk_text REGEXP ?)")
+        params.append(pattern)
+    return ''.join(f"\n              AND {clause}" for clause in clauses), params
+
+
+class SqliteCoverageStore(CoverageStore):
+    """SQLite stand-in backend (파일 또는 ":memory:")"""
+
+    backend = "sqlite"
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = str(path)
+        # autocommit 비활성 + 명시적 BEGIN (쓰기 트랜잭션 경계는 호출자 commit)
+        self.conn = sqlite3.connect(self.path, timeout=60, isolation_level=None, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.create_function("REGEXP", 2, _regexp, deterministic=True)
+        self.conn.create_function("CHUNK_HASH", 3, chunk_content_hash, deterministic=True)
+        if self.path != ":memory:":
+            # worker thread별 connection의 읽기가 쓰기 트랜잭션에 막히지 않도록
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SQLITE_SCHEMA)
+        # chunk_hash 추가 전에 만든 파일 (schema/040_evidence_gate_state.sql과 동일 변경)
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(evidence_slot)")}
+        if "chunk_hash" not in columns:
+            self.conn.execute("ALTER TABLE evidence_slot ADD COLUMN chunk_hash TEXT")
+        self._in_txn = False
+
+    @classmethod
+    def connect(cls, path: str = ":memory:") -> 'SqliteCoverageStore':
+        return cls(path)
+
+    def _begin(self, immediate: bool = False):
+        if not self._in_txn:
+            self.conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            self._in_txn = True
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        return self.conn.execute(sql, params)
+
+    def commit(self):
+        if self._in_txn:
+            self.conn.execute("COMMIT")
+            self._in_txn = False
+
+    def rollback(self):
+        if self._in_txn:
+            self.conn.execute("ROLLBACK")
+            self._in_txn = False
+
+    def close(self):
+        self.rollback()
+        self.conn.close()
+
+    def mapped_ins_cds(self, coverage_code: str) -> List[str]:
+        rows = self._execute("""
+            SELECT DISTINCT ins_cd FROM coverage_mapping_ssot
+            WHERE coverage_code = ? ORDER BY ins_cd
+        """, (coverage_code,)).fetchall()
+        return [row['ins_cd'] for row in rows]
+
+    def load_mappings(self, coverage_code: str, ins_cds: List[str]) -> Dict[str, dict]:
+        ins_cds = list(ins_cds)
+        if not ins_cds:
+            return {}
+        rows = self._execute(f"""
+            SELECT ins_cd, anchor_keywords, insurer_coverage_name FROM coverage_mapping_ssot
+            WHERE coverage_code = ? AND ins_cd IN ({', '.join('?' * len(ins_cds))})
+        """, (coverage_code, *ins_cds)).fetchall()
+        return {
+            row['ins_cd']: {
+                "anchors": json.loads(row['anchor_keywords']) if row['anchor_keywords'] else [],
+                "coverage_name": row['insurer_coverage_name'] or ""
+            }
+            for row in rows
+        }
+
+    def count_chunks(self, coverage_code: str, as_of_date: str, ins_cd: Optional[str] = None) -> int:
+        if ins_cd is None:
+            return self._execute("""
+                SELECT COUNT(*) FROM coverage_chunk WHERE coverage_code = ? AND as_of_date = ?
+            """, (coverage_code, as_of_date)).fetchone()[0]
+        return self._execute("""
+            SELECT COUNT(*) FROM coverage_chunk WHERE coverage_code = ? AND as_of_date = ? AND ins_cd = ?
+        """, (coverage_code, as_of_date, ins_cd)).fetchone()[0]
+
+    def fetch_candidates(self, coverage_code: str, as_of_date: str, ins_cd: str, anchors: List[str],
+                         hard_negatives: List[str], section_negatives: List[str]) -> List[dict]:
+        where = _sqlite_candidate_filter(anchors, hard_negatives, section_negatives)
+        if where is None:
+            return []
+        rows = self._execute(f"""
+            SELECT chunk_id, chunk_text, excerpt, page_number
+            FROM coverage_chunk
+            WHERE coverage_code = ? AND as_of_date = ? AND ins_cd = ?{where[0]}
+            ORDER BY chunk_id
+        """, (coverage_code, as_of_date, ins_cd, *where[1])).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_candidate_excerpts(self, coverage_code: str, as_of_date: str, ins_cd: str, anchors: List[str],
+                                hard_negatives: List[str], section_negatives: List[str],
+                                itersize: int = STREAM_ITERSIZE) -> Iterator[dict]:
+        where = _sqlite_candidate_filter(anchors, hard_negatives, section_negatives)
+        if where is None:
+            return
+        cur = self._execute(f"""
+            SELECT chunk_id, excerpt, page_number
+            FROM coverage_chunk
+            WHERE coverage_code = ? AND as_of_date = ? AND ins_cd = ?{where[0]}
+            ORDER BY chunk_id
+        """, (coverage_code, as_of_date, ins_cd, *where[1]))
+        try:
+            while True:
+                rows = cur.fetchmany(itersize)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        finally:
+            cur.close()
+
+    def fetch_chunk_texts(self, chunk_ids: List[int], as_of_date: str) -> Dict[int, str]:
+        chunk_ids = list(chunk_ids)
+        if not chunk_ids:
+            return {}
+        rows = self._execute(f"""
+            SELECT chunk_id, chunk_text FROM coverage_chunk
+            WHERE as_of_date = ? AND chunk_id IN ({', '.join('?' * len(chunk_ids))})
+        """, (as_of_date, *chunk_ids)).fetchall()
+        return {row['chunk_id']: row['chunk_text'] for row in rows}
+
+    def lock_coverage(self, coverage_code: str, as_of_date: str):
+        # SQLite는 DB 단위 write lock → 쓰기 트랜잭션 즉시 시작으로 직렬화
+        self._begin(immediate=True)
+
+    def delete_compare_tables(self, coverage_code: str, as_of_date: str) -> int:
+        self._begin(immediate=True)
+        return self._execute("DELETE FROM compare_table_v2 WHERE coverage_code = ? AND as_of_date = ?",
+                             (coverage_code, as_of_date)).rowcount
+
+    def write_evidence_slots(self, coverage_code: str, as_of_date: str, slot_rows: List[tuple]) -> Tuple[int, int]:
+        self._begin(immediate=True)
+        if slot_rows:
+            self.conn.executemany(f"""
+                INSERT INTO evidence_slot ({', '.join(EVIDENCE_SLOT_COLUMNS)})
+                VALUES ({', '.join('?' * len(EVIDENCE_SLOT_COLUMNS))})
+                ON CONFLICT (coverage_code, as_of_date, ins_cd, slot_key) DO UPDATE SET
+                    chunk_id = excluded.chunk_id,
+                    excerpt = excluded.excerpt,
+                    page_number = excluded.page_number,
+                    status = excluded.status,
+                    gate_version = excluded.gate_version,
+                    chunk_hash = excluded.chunk_hash
+            """, slot_rows)
+
+        keep = {(row[2], row[3]) for row in slot_rows}
+        existing = self._execute("""
+            SELECT slot_id, ins_cd, slot_key FROM evidence_slot WHERE coverage_code = ? AND as_of_date = ?
+        """, (coverage_code, as_of_date)).fetchall()
+        stale = [(row['slot_id'],) for row in existing if (row['ins_cd'], row['slot_key']) not in keep]
+        self.conn.executemany("DELETE FROM evidence_slot WHERE slot_id = ?", stale)
+        return len(slot_rows), len(stale)
+
+    def load_evidence_slots(self, coverage_code: str, as_of_date: str) -> List[dict]:
+        rows = self._execute("""
+            SELECT ins_cd, slot_key, excerpt, status
+            FROM evidence_slot
+            WHERE coverage_code = ? AND as_of_date = ?
+            ORDER BY ins_cd, slot_key
+        """, (coverage_code, as_of_date)).fetchall()
+        return [dict(row) for row in rows]
+
+    def insert_compare_table(self, coverage_code: str, as_of_date: str, payload: dict) -> int:
+        self._begin(immediate=True)
+        cur = self._execute("""
+            INSERT INTO compare_table_v2 (coverage_code, as_of_date, payload) VALUES (?, ?, ?)
+        """, (coverage_code, as_of_date, json.dumps(payload, ensure_ascii=False)))
+        return cur.lastrowid
+
+    def count_rows(self, table: str, coverage_code: str, as_of_date: str) -> int:
+        return self._execute(f"SELECT COUNT(*) FROM {table} WHERE coverage_code = ? AND as_of_date = ?",
+                             (coverage_code, as_of_date)).fetchone()[0]
+
+    def latest_compare_payload(self, coverage_code: str, as_of_date: str) -> Optional[dict]:
+        row = self._execute("""
+            SELECT payload FROM compare_table_v2
+            WHERE coverage_code = ? AND as_of_date = ?
+            ORDER BY table_id DESC LIMIT 1
+        """, (coverage_code, as_of_date)).fetchone()
+        return json.loads(row['payload']) if row else None
+
+    def chunk_hashes(self, coverage_code: str, as_of_date: str, ins_cds: List[str]) -> Dict[str, Dict[int, str]]:
+        ins_cds = list(ins_cds)
+        hashes: Dict[str, Dict[int, str]] = {ins_cd: {} for ins_cd in ins_cds}
+        if not ins_cds:
+            return hashes
+        rows = self._execute(f"""
+            SELECT ins_cd, chunk_id, CHUNK_HASH(chunk_text, excerpt, page_number) AS chunk_hash
+            FROM coverage_chunk
+            WHERE coverage_code = ? AND as_of_date = ? AND ins_cd IN ({', '.join('?' * len(ins_cds))})
+        """, (coverage_code, as_of_date, *ins_cds))
+        for row in rows:
+            hashes[row['ins_cd']][row['chunk_id']] = row['chunk_hash']
+        return hashes
+
+    def load_gate_state(self, coverage_code: str, as_of_date: str) -> Dict[str, Dict[int, Tuple[str, str]]]:
+        rows = self._execute("""
+            SELECT ins_cd, chunk_id, chunk_hash, gate_hash FROM evidence_gate_state
+            WHERE coverage_code = ? AND as_of_date = ?
+        """, (coverage_code, as_of_date))
+        state: Dict[str, Dict[int, Tuple[str, str]]] = {}
+        for row in rows:
+            state.setdefault(row['ins_cd'], {})[row['chunk_id']] = (row['chunk_hash'], row['gate_hash'])
+        return state
+
+    def write_gate_state(self, coverage_code: str, as_of_date: str, ins_cds: List[str],
+                         upserts: List[tuple], removed: List[int]) -> Tuple[int, int]:
+        self._begin(immediate=True)
+        if upserts:
+            self.conn.executemany("""
+                INSERT INTO evidence_gate_state (coverage_code, as_of_date, ins_cd, chunk_id, chunk_hash, gate_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (coverage_code, as_of_date, chunk_id) DO UPDATE SET
+                    ins_cd = excluded.ins_cd,
+                    chunk_hash = excluded.chunk_hash,
+                    gate_hash = excluded.gate_hash
+            """, [(coverage_code, as_of_date, *row) for row in upserts])
+        ins_cds = list(ins_cds)
+        deleted = self._execute(f"""
+            DELETE FROM evidence_gate_state
+            WHERE coverage_code = ? AND as_of_date = ?
+              AND ins_cd NOT IN ({', '.join('?' * len(ins_cds))})
+        """, (coverage_code, as_of_date, *ins_cds)).rowcount
+        cur = self.conn.executemany("""
+            DELETE FROM evidence_gate_state WHERE coverage_code = ? AND as_of_date = ? AND chunk_id = ?
+        """, [(coverage_code, as_of_date, chunk_id) for chunk_id in removed])
+        return len(upserts), deleted + max(cur.rowcount, 0)
+
+    def load_slot_winners(self, coverage_code: str, as_of_date: str) -> Dict[str, Dict[str, dict]]:
+        rows = self._execute("""
+            SELECT ins_cd, slot_key, chunk_id, chunk_hash FROM evidence_slot
+            WHERE coverage_code = ? AND as_of_date = ? AND status = 'FOUND'
+        """, (coverage_code, as_of_date))
+        winners: Dict[str, Dict[str, dict]] = {}
+        for row in rows:
+            winners.setdefault(row['ins_cd'], {})[row['slot_key']] = {
+                "chunk_id": row['chunk_id'], "chunk_hash": row['chunk_hash']
+            }
+        return winners
+
+    def as_of_dates(self) -> List[str]:
+        rows = self._execute(" UNION ".join(f"SELECT as_of_date FROM {table}" for table in PARTITIONED_TABLES)
+                             + " ORDER BY 1").fetchall()
+        return [row[0] for row in rows]
+
+    def detach_as_of_dates(self, as_of_dates: List[str], archive: Optional[str] = None,
+                           drop: bool = False) -> List[str]:
+        """SQLite는 partition이 없으므로 기준일 행을 archive 파일로 옮기고(또는 삭제) 본 파일에서 제거"""
+        if not archive and not drop:
+            raise ValueError("sqlite store requires an archive database path or drop")
+        dates = sorted(set(as_of_dates))
+        if not dates:
+            return []
+        in_dates = f"as_of_date IN ({', '.join('?' * len(dates))})"
+        attached = bool(archive) and not drop
+        if attached:
+            # ATTACH / DETACH는 트랜잭션 밖에서만 가능
+            self.rollback()
+            self._execute("ATTACH DATABASE ? AS archive", (str(archive),))
+        detached = []
+        try:
+            self._begin(immediate=True)
+            for table in PARTITIONED_TABLES:
+                if attached:
+                    self._execute(f"CREATE TABLE IF NOT EXISTS archive.{table} AS SELECT * FROM main.{table} WHERE 0")
+                    self._execute(f"INSERT INTO archive.{table} SELECT * FROM main.{table} WHERE {in_dates}",
+                                  tuple(dates))
+                present = {row[0] for row in self._execute(
+                    f"SELECT DISTINCT as_of_date FROM main.{table} WHERE {in_dates}", tuple(dates))}
+                self._execute(f"DELETE FROM main.{table} WHERE {in_dates}", tuple(dates))
+                detached.extend(f"{table}_d{d.replace('-', '')}" for d in sorted(present))
+            self.commit()
+        except Exception:
+            self.rollback()
+            raise
+        finally:
+            if attached:
+                self._execute("DETACH DATABASE archive")
+        return detached
+
+    def load_rows(self, table: str, rows: Iterable[dict], batch_size: int = 10000) -> int:
+        """
+        JSONL export 행 적재 (멱등: mapping은 (coverage_code, ins_cd), chunk는 chunk_id 기준 replace)
+
+        Returns:
+            int: 적재 행 수
+        """
+        columns = TABLE_COLUMNS[table]
+        sql = (f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+               f"VALUES ({', '.join('?' * len(columns))})")
+        count = 0
+        batch = []
+        self._begin(immediate=True)
+        for row in rows:
+            values = []
+            for column in columns:
+                value = row.get(column)
+                if column == "anchor_keywords" and value is not None and not isinstance(value, str):
+                    value = json.dumps(value, ensure_ascii=False)
+                values.append(value)
+            batch.append(values)
+            if len(batch) >= batch_size:
+                self.conn.executemany(sql, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self.conn.executemany(sql, batch)
+            count += len(batch)
+        self.commit()
+        return count
+
+
+def _scope_where(table: str, coverage_code: Optional[str], as_of_date: Optional[str],
+                 placeholder: str) -> Tuple[str, tuple]:
+    clauses, params = [], []
+    if coverage_code:
+        clauses.append(f"coverage_code = {placeholder}")
+        params.append(coverage_code)
+    if as_of_date and table == "coverage_chunk":
+        clauses.append(f"as_of_date = {placeholder}")
+        params.append(as_of_date)
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), tuple(params)
+
+
+class StorePool:
+    """
+    worker thread용 store 대여
+
+    - postgres: psycopg2 ThreadedConnectionPool connection을 감싼 store
+    - sqlite:   대여마다 새 connection (SQLite connection은 thread 간 공유하지 않음)
+    """
+
+    def __init__(self, backend: str = "postgres", maxconn: int = 8, sqlite_path: Optional[str] = None,
+                 db_config: dict = DB_CONFIG):
+        self.backend = backend
+        self.sqlite_path = sqlite_path
+        self._pool = None
+        if backend == "postgres":
+            import psycopg2.pool
+
+            self._pool = psycopg2.pool.ThreadedConnectionPool(1, maxconn, **db_config)
+        elif backend == "sqlite":
+            if not sqlite_path or sqlite_path == ":memory:":
+                raise ValueError("sqlite store pool requires a database file path")
+        else:
+            raise ValueError(f"unknown backend: {backend}")
+
+    def acquire(self) -> CoverageStore:
+        if self._pool is not None:
+            return PostgresCoverageStore(self._pool.getconn(), owns_conn=False)
+        return SqliteCoverageStore(self.sqlite_path)
+
+    def release(self, store: CoverageStore):
+        store.close()
+        if self._pool is not None:
+            self._pool.putconn(store.conn)
+
+    def closeall(self):
+        if self._pool is not None:
+            self._pool.closeall()
+
+
+def open_store(sqlite_path: Optional[str] = None, db_config: dict = DB_CONFIG) -> CoverageStore:
+    """sqlite_path가 주어지면 SQLite, 아니면 Postgres(DB_CONFIG)"""
+    if sqlite_path:
+        return SqliteCoverageStore.connect(sqlite_path)
+    return PostgresCoverageStore.connect(db_config)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Coverage store CLI: JSONL export / load, as_of_date partition 보존
+
+tools/coverage_store.py 저장소 구현 위의 운영 명령.
+
+as_of_date partition 보존 (schema/050_partition_by_as_of_date.sql):
+  python3 tools/coverage_store_cli.py partitions --list
+  python3 tools/coverage_store_cli.py partitions --keep 12 --archive archive   # 오래된 기준일 detach → archive schema
+  python3 tools/coverage_store_cli.py partitions --keep 12 --sqlite /tmp/ssot.db --archive /tmp/ssot_archive.db
+
+JSONL export / load:
+  python3 tools/coverage_store_cli.py export --table coverage_chunk --coverage_code A4210 --out chunks.jsonl
+  python3 tools/coverage_store_cli.py load --sqlite /tmp/ssot.db \\
+    --table coverage_mapping_ssot mapping.jsonl --table coverage_chunk chunks.jsonl
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tools.coverage_store import TABLE_COLUMNS, PostgresCoverageStore, SqliteCoverageStore, open_store
+
+
+def retention_dates(as_of_dates: Iterable[str], keep: Optional[int] = None,
+                    before: Optional[str] = None) -> List[str]:
+    """
+    보존 정책 밖 기준일 (오름차순)
+
+    Args:
+        keep: 최근 keep개 기준일 보존
+        before: 이 날짜(YYYY-MM-DD) 이전 기준일은 분리
+    """
+    dates = sorted(set(as_of_dates))
+    expired = set()
+    if keep is not None:
+        expired.update(dates[:max(len(dates) - keep, 0)])
+    if before:
+        expired.update(d for d in dates if d < before)
+    return sorted(expired)
+
+
+def iter_jsonl(path) -> Iterable[dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_jsonl(store: SqliteCoverageStore, table: str, path) -> int:
+    """JSONL export 파일 → SQLite 테이블"""
+    return store.load_rows(table, iter_jsonl(path))
+
+
+def export_jsonl(store: PostgresCoverageStore, table: str, path, coverage_code: Optional[str] = None,
+                 as_of_date: Optional[str] = None) -> int:
+    """Postgres 테이블 → JSONL (date 등은 문자열로 기록)"""
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for row in store.iter_table(table, coverage_code, as_of_date):
+            f.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+            count += 1
+    return count
+
+
+def run_partitions(args):
+    """partitions 서브커맨드: 목록 / 생성 / 보존 정책에 따른 detach"""
+    store = open_store(args.sqlite)
+    try:
+        if args.ensure:
+            store.ensure_partitions(args.ensure)
+            store.commit()
+            print(f"✓ Ensured partitions for {args.ensure}")
+
+        if args.list:
+            if isinstance(store, PostgresCoverageStore):
+                for partition in store.list_partitions():
+                    print(f"  {partition['as_of_date']}  {partition['partition']}  ~{partition['rows']} rows")
+            else:
+                for as_of_date in store.as_of_dates():
+                    print(f"  {as_of_date}")
+
+        if args.keep is None and not args.before:
+            return
+        dates = store.as_of_dates()
+        expired = retention_dates(dates, args.keep, args.before)
+        print(f"Retention: {len(dates)} as_of_dates, {len(expired)} to detach {expired}")
+        if args.dry_run or not expired:
+            return
+        detached = store.detach_as_of_dates(expired, archive=args.archive, drop=args.drop)
+        target = "dropped" if args.drop else (f"archived → {args.archive}" if args.archive else "detached")
+        print(f"✓ {len(detached)} partitions {target}")
+        for name in detached:
+            print(f"  {name}")
+    finally:
+        store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coverage store JSONL export / load / partition retention")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export", help="Export a Postgres table to JSONL")
+    export.add_argument("--table", required=True, choices=sorted(TABLE_COLUMNS))
+    export.add_argument("--coverage_code", help="Coverage code filter")
+    export.add_argument("--as_of_date", help="As-of date filter (coverage_chunk)")
+    export.add_argument("--out", required=True, help="Output JSONL path")
+
+    load = sub.add_parser("load", help="Load JSONL exports into a SQLite store")
+    load.add_argument("--sqlite", required=True, help="SQLite database path")
+    load.add_argument("--table", nargs=2, action="append", required=True, metavar=("TABLE", "JSONL"),
+                      help="Table name and JSONL export path (repeatable)")
+    partitions = sub.add_parser("partitions", help="List / ensure / detach as_of_date partitions")
+    partitions.add_argument("--sqlite", help="SQLite database path (default: Postgres DB_CONFIG)")
+    partitions.add_argument("--list", action="store_true", help="List as_of_date partitions")
+    partitions.add_argument("--ensure", metavar="AS_OF_DATE", help="Create partitions for an as_of_date")
+    partitions.add_argument("--keep", type=int, help="Keep the N most recent as_of_dates, detach older ones")
+    partitions.add_argument("--before", metavar="AS_OF_DATE", help="Detach as_of_dates earlier than this date")
+    partitions.add_argument("--archive",
+                            help="Archive target for detached data (Postgres schema / SQLite database path)")
+    partitions.add_argument("--drop", action="store_true", help="Drop detached data instead of keeping it")
+    partitions.add_argument("--dry-run", action="store_true", help="Show what would be detached")
+    args = parser.parse_args()
+
+    if args.command == "partitions":
+        if args.keep is not None and args.keep < 1:
+            parser.error("--keep must be at least 1")
+        run_partitions(args)
+        return
+
+    if args.command == "export":
+        store = PostgresCoverageStore.connect()
+        try:
+            count = export_jsonl(store, args.table, args.out, args.coverage_code, args.as_of_date)
+        finally:
+            store.close()
+        print(f"✓ Exported {count} {args.table} rows → {args.out}")
+        return
+
+    store = SqliteCoverageStore.connect(args.sqlite)
+    try:
+        for table, path in args.table:
+            if table not in TABLE_COLUMNS:
+                parser.error(f"unknown table: {table}")
+            count = load_jsonl(store, table, path)
+            print(f"✓ Loaded {count} {table} rows ← {path}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
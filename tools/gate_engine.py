@@ -0,0 +1,435 @@
+"""
+Gate engine: 7-gate context guard (DB-only SSOT).
+
+apply_gates는 slot마다 같은 global gate(hard/section negative, diagnosis signal,
+coverage name lock)를 다시 평가한다. GateEngine은 profile 패턴을 1회 compile하고
+chunk별 feature bitmask(평가 여부 / 결과)에 각 패턴을 최대 1회만 평가하여
+모든 slot을 판정한다.
+
+- 판정 순서와 rejection reason 문자열은 apply_gates와 동일
+  (docs/audit/A4210_CONTEXT_GUARD_PROOF.md 감사 기록 호환)
+- feature는 필요할 때만 평가 (앞 gate에서 탈락하면 뒤 패턴은 평가하지 않음)
+- 같은 패턴 문자열(예: section negative와 slot negative의 "납입면제")은 bit 하나를 공유
+- 패턴은 tools/coverage_profiles.py가 profile 로드 시 compile한 CompiledPatternSet을 사용
+  (engine 생성 시 compile 없음). gate별 alternation(union)이 불일치하면 구성 패턴 bit를
+  한 번에 불일치로 확정
+- gate 평가 순서는 tools/gate_stats.py 통계로 바꿀 수 있으며 (gate는 부작용 없음),
+  reason은 항상 canonical 순서 기준 첫 탈락 gate
+- budget(core/regex_budget.py)이 주어지면 패턴 search마다 시간을 재어 초과 패턴을 기록
+"""
+
+import re
+from time import perf_counter_ns
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from core.regex_budget import RegexBudget
+from tools.coverage_profiles import CompiledPatternSet, CompiledProfile, compile_pattern, compiled_profile
+from tools.gate_stats import GATE_ORDER, GateStats
+from tools.incremental_slots import SlotPlan
+
+
+class GateContext:
+    def __init__(self, coverage_code: str, ins_cd: str, anchors: List[str], coverage_name: str, profile: dict = None):
+        self.coverage_code = coverage_code
+        self.ins_cd = ins_cd
+        self.anchors = anchors
+        self.coverage_name = coverage_name
+        self.profile = profile or {}
+        self._compiled: Optional[CompiledProfile] = None
+
+    @property
+    def compiled(self) -> CompiledProfile:
+        """profile의 compiled pattern set (프로세스별 registry cache에서 조회)"""
+        if self._compiled is None:
+            self._compiled = compiled_profile(self.profile)
+        return self._compiled
+
+    def __getstate__(self):
+        # process pool 전송 시 re.Pattern은 보내지 않음 (worker의 registry cache 사용)
+        state = self.__dict__.copy()
+        state['_compiled'] = None
+        return state
+
+    def get_required_terms(self, slot_key: str) -> List[str]:
+        return self.profile.get("required_terms_by_slot", {}).get(slot_key, [])
+
+    def get_hard_negatives(self) -> List[str]:
+        return self.profile.get("hard_negative_terms_global", [])
+
+    def get_section_negatives(self) -> List[str]:
+        return self.profile.get("section_negative_terms_global", [])
+
+    def get_diagnosis_signals(self) -> List[str]:
+        return self.profile.get("diagnosis_signal_terms_global", [])
+
+    def get_slot_negatives(self, slot_key: str) -> List[str]:
+        return self.profile.get("slot_specific_negatives", {}).get(slot_key, [])
+
+
+def apply_gates(slot_key: str, chunk_text: str, excerpt: str, ctx: GateContext) -> Tuple[bool, List[str]]:
+    """Apply 7-gate validation to chunk"""
+    reasons = []
+
+    # GATE 1: Anchor in excerpt
+    if not any(anchor in excerpt for anchor in ctx.anchors):
+        reasons.append("no_anchor_in_excerpt")
+        return False, reasons
+
+    # GATE 2: Hard-negative check
+    for pattern in ctx.get_hard_negatives():
+        if compile_pattern(pattern).search(chunk_text):
+            reasons.append(f"hard_negative:{pattern}")
+            return False, reasons
+
+    # GATE 3: Section-negative check
+    for pattern in ctx.get_section_negatives():
+        if compile_pattern(pattern).search(chunk_text):
+            reasons.append(f"section_negative:{pattern}")
+            return False, reasons
+
+    # GATE 4: Diagnosis-signal required
+    has_signal = False
+    for pattern in ctx.get_diagnosis_signals():
+        if compile_pattern(pattern).search(chunk_text):
+            has_signal = True
+            break
+    if not has_signal:
+        reasons.append("no_diagnosis_signal")
+        return False, reasons
+
+    # GATE 5: Coverage name lock
+    normalized_name = re.sub(r'\s+', '', ctx.coverage_name)
+    normalized_text = re.sub(r'\s+', '', chunk_text)
+    if normalized_name not in normalized_text:
+        core_tokens = []
+        if "유사암" in ctx.coverage_name:
+            core_tokens.append("유사암")
+        if "진단비" in ctx.coverage_name:
+            core_tokens.append("진단비")
+        if "경계성종양" in ctx.coverage_name:
+            core_tokens.append("경계성종양")
+
+        required_count = min(2, len(core_tokens))
+        matched_count = sum(1 for token in core_tokens if token in chunk_text)
+        if matched_count < required_count:
+            reasons.append("coverage_name_lock_failed")
+            return False, reasons
+
+    # GATE 6: Slot-specific keywords
+    required_terms = ctx.get_required_terms(slot_key)
+    if required_terms:
+        has_required = any(compile_pattern(term).search(chunk_text) for term in required_terms)
+        if not has_required:
+            reasons.append(f"no_required_terms_for_{slot_key}")
+            return False, reasons
+
+    # GATE 7: Slot-specific negatives
+    for pattern in ctx.get_slot_negatives(slot_key):
+        if compile_pattern(pattern).search(chunk_text):
+            reasons.append(f"slot_specific_negative:{pattern}")
+            return False, reasons
+
+    return True, []
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+ANCHOR_BIT = 0
+NAME_LOCK_BIT = 1
+PATTERN_BIT_BASE = 2
+
+
+class GateBits(NamedTuple):
+    """gate 1개의 패턴 bit (union: alternation bit 또는 None, members: 구성 패턴 bit mask)"""
+    union: Optional[int]
+    patterns: List[Tuple[str, int]]
+    members: int
+
+
+class ChunkFeatures:
+    """
+    chunk 1개의 feature bitmask
+
+    - known: 평가 완료 bit
+    - value: 평가 결과 bit (known에 있는 bit만 의미 있음)
+    bit 0 = anchor, bit 1 = coverage name lock, bit 2+i = GateEngine.patterns[i]
+    """
+
+    __slots__ = ('chunk_text', 'excerpt', 'known', 'value')
+
+    def __init__(self, chunk_text: str, excerpt: str):
+        self.chunk_text = chunk_text
+        self.excerpt = excerpt
+        self.known = 0
+        self.value = 0
+
+
+class GateEngine:
+    """
+    GateContext 1개(coverage × insurer)용 compiled gate 판정기
+
+    Usage:
+        engine = GateEngine(ctx)
+        engine.evaluate(chunk_text, excerpt, slot_keys)  # {slot_key: (passed, reasons)}
+        engine.select_slot_chunks(slot_keys, chunks)     # {slot_key: 최초 통과 chunk}
+    """
+
+    def __init__(self, ctx: GateContext, order: Optional[List[str]] = None, stats: Optional[GateStats] = None,
+                 budget: Optional[RegexBudget] = None):
+        """
+        Args:
+            ctx: gate context
+            order: gate 평가 순서 (GATE_ORDER의 순열, None이면 canonical 순서)
+            stats: 주어지면 gate별 평가 비용 / 탈락 여부를 기록
+            budget: 주어지면 패턴 search 1회당 time budget 초과를 기록 (판정 결과 불변)
+        """
+        self.ctx = ctx
+        self.order = list(order) if order else list(GATE_ORDER)
+        if sorted(self.order) != sorted(GATE_ORDER):
+            raise ValueError(f"gate order must be a permutation of {GATE_ORDER}: {self.order}")
+        self._canonical = tuple(self.order) == GATE_ORDER
+        self.stats = stats
+        self.budget = budget
+        self._checks = {name: getattr(self, f"_check_{name}") for name in GATE_ORDER}
+        self.patterns: List[re.Pattern] = []
+        self._pattern_bits: Dict[str, int] = {}
+
+        compiled = ctx.compiled
+        self.hard_negatives = self._bits(compiled.hard_negatives)
+        self.section_negatives = self._bits(compiled.section_negatives)
+        self.diagnosis_signals = self._bits(compiled.diagnosis_signals)
+        self._required: Dict[str, GateBits] = {}
+        self._slot_negatives: Dict[str, GateBits] = {}
+
+        self.normalized_name = _WHITESPACE.sub('', ctx.coverage_name)
+        self.core_tokens = [token for token in ("유사암", "진단비", "경계성종양") if token in ctx.coverage_name]
+        self.required_count = min(2, len(self.core_tokens))
+
+    def _bit(self, pattern: str, compiled: re.Pattern) -> int:
+        bit = self._pattern_bits.get(pattern)
+        if bit is None:
+            bit = PATTERN_BIT_BASE + len(self.patterns)
+            self.patterns.append(self.budget.wrap(compiled) if self.budget is not None else compiled)
+            self._pattern_bits[pattern] = bit
+        return bit
+
+    def _bits(self, pattern_set: CompiledPatternSet) -> GateBits:
+        patterns = [(pattern, self._bit(pattern, compiled))
+                    for pattern, compiled in zip(pattern_set.patterns, pattern_set.compiled)]
+        union = self._bit(pattern_set.union_source, pattern_set.union) if pattern_set.union is not None else None
+        members = 0
+        for _, bit in patterns:
+            members |= 1 << bit
+        return GateBits(union, patterns, members)
+
+    def _slot_bits(self, slot_key: str) -> Tuple[GateBits, GateBits]:
+        """slot별 required / negative 패턴 bit (최초 사용 시 등록)"""
+        if slot_key not in self._required:
+            compiled = self.ctx.compiled
+            self._required[slot_key] = self._bits(compiled.required_terms(slot_key))
+            self._slot_negatives[slot_key] = self._bits(compiled.slot_negative_terms(slot_key))
+        return self._required[slot_key], self._slot_negatives[slot_key]
+
+    def _test(self, features: ChunkFeatures, bit: int) -> bool:
+        """feature bit 평가 (chunk당 최대 1회)"""
+        mask = 1 << bit
+        if not features.known & mask:
+            features.known |= mask
+            if bit == ANCHOR_BIT:
+                hit = any(anchor in features.excerpt for anchor in self.ctx.anchors)
+            elif bit == NAME_LOCK_BIT:
+                hit = self._name_lock(features.chunk_text)
+            else:
+                hit = self.patterns[bit - PATTERN_BIT_BASE].search(features.chunk_text) is not None
+            if hit:
+                features.value |= mask
+        return bool(features.value & mask)
+
+    def _name_lock(self, chunk_text: str) -> bool:
+        if self.normalized_name in _WHITESPACE.sub('', chunk_text):
+            return True
+        matched_count = sum(1 for token in self.core_tokens if token in chunk_text)
+        return matched_count >= self.required_count
+
+    def _union_miss(self, features: ChunkFeatures, bits: GateBits) -> bool:
+        """union이 불일치하면 구성 패턴 bit를 모두 불일치로 확정하고 True"""
+        if bits.union is None or self._test(features, bits.union):
+            return False
+        features.known |= bits.members
+        return True
+
+    def _first_hit(self, features: ChunkFeatures, bits: GateBits):
+        """목록 순서상 첫 매칭 패턴 (reason 기록용)"""
+        if self._union_miss(features, bits):
+            return None
+        for pattern, bit in bits.patterns:
+            if self._test(features, bit):
+                return pattern
+        return None
+
+    def _any_hit(self, features: ChunkFeatures, bits: GateBits) -> bool:
+        if bits.union is not None:
+            return not self._union_miss(features, bits)
+        return self._first_hit(features, bits) is not None
+
+    # 개별 gate: 통과하면 None, 탈락하면 reason 문자열
+    def _check_anchor(self, slot_key: str, features: ChunkFeatures) -> Optional[str]:
+        # GATE 1: Anchor in excerpt
+        if not self._test(features, ANCHOR_BIT):
+            return "no_anchor_in_excerpt"
+        return None
+
+    def _check_hard_negative(self, slot_key: str, features: ChunkFeatures) -> Optional[str]:
+        # GATE 2: Hard-negative check
+        pattern = self._first_hit(features, self.hard_negatives)
+        return f"hard_negative:{pattern}" if pattern is not None else None
+
+    def _check_section_negative(self, slot_key: str, features: ChunkFeatures) -> Optional[str]:
+        # GATE 3: Section-negative check
+        pattern = self._first_hit(features, self.section_negatives)
+        return f"section_negative:{pattern}" if pattern is not None else None
+
+    def _check_diagnosis_signal(self, slot_key: str, features: ChunkFeatures) -> Optional[str]:
+        # GATE 4: Diagnosis-signal required
+        if not self._any_hit(features, self.diagnosis_signals):
+            return "no_diagnosis_signal"
+        return None
+
+    def _check_name_lock(self, slot_key: str, features: ChunkFeatures) -> Optional[str]:
+        # GATE 5: Coverage name lock
+        if not self._test(features, NAME_LOCK_BIT):
+            return "coverage_name_lock_failed"
+        return None
+
+    def _check_required_terms(self, slot_key: str, features: ChunkFeatures) -> Optional[str]:
+        # GATE 6: Slot-specific keywords
+        required, _ = self._slot_bits(slot_key)
+        if required.patterns and not self._any_hit(features, required):
+            return f"no_required_terms_for_{slot_key}"
+        return None
+
+    def _check_slot_negative(self, slot_key: str, features: ChunkFeatures) -> Optional[str]:
+        # GATE 7: Slot-specific negatives
+        _, slot_negatives = self._slot_bits(slot_key)
+        pattern = self._first_hit(features, slot_negatives)
+        return f"slot_specific_negative:{pattern}" if pattern is not None else None
+
+    def gate(self, slot_key: str, features: ChunkFeatures) -> Tuple[bool, List[str]]:
+        """
+        apply_gates와 동일한 판정 / reason (feature bitmask 재사용)
+
+        gate는 self.order 순서로 평가한다. 탈락 시 canonical 순서상 그보다 앞선
+        미평가 gate를 확인하여 apply_gates와 같은 첫 탈락 reason을 보고한다.
+        """
+        evaluated = []
+        for name in self.order:
+            check = self._checks[name]
+            if self.stats is not None:
+                start = perf_counter_ns()
+                reason = check(slot_key, features)
+                self.stats.record(name, perf_counter_ns() - start, reason is not None)
+            else:
+                reason = check(slot_key, features)
+
+            if reason is not None:
+                if self._canonical:
+                    return False, [reason]
+                return False, [self._canonical_reason(slot_key, features, name, reason, evaluated)]
+            evaluated.append(name)
+
+        return True, []
+
+    def _canonical_reason(self, slot_key: str, features: ChunkFeatures, failed: str,
+                          reason: str, evaluated: List[str]) -> str:
+        """canonical 순서상 failed 앞의 미평가 gate 중 첫 탈락 reason (없으면 reason)"""
+        for name in GATE_ORDER[:GATE_ORDER.index(failed)]:
+            if name in evaluated:
+                continue
+            earlier = self._checks[name](slot_key, features)
+            if earlier is not None:
+                return earlier
+        return reason
+
+    def evaluate(self, chunk_text: str, excerpt: str, slot_keys: List[str]) -> Dict[str, Tuple[bool, List[str]]]:
+        """chunk 1개를 모든 slot에 대해 판정"""
+        features = ChunkFeatures(chunk_text, excerpt)
+        return {slot_key: self.gate(slot_key, features) for slot_key in slot_keys}
+
+    def select_slot_chunks(self, slot_keys: List[str], chunks: Iterable[dict],
+                           plan: Optional[SlotPlan] = None) -> Dict[str, dict]:
+        """
+        slot별 gate를 최초 통과한 chunk 선택 (chunk 순서 기준)
+
+        chunk 순회 1회로 모든 slot을 판정하고, 모든 slot이 FOUND면 조기 종료
+        (chunks가 스트리밍 iterator면 나머지 chunk는 소비하지 않는다).
+        plan이 주어지면 plan.needs_gate인 (slot, chunk)만 판정하고 유지되는 winner는 그대로 선택.
+        """
+        if plan is not None:
+            return self._select_planned(slot_keys, chunks, plan)
+        found = {}
+        pending = list(slot_keys)
+        for chunk in chunks:
+            features = ChunkFeatures(chunk['chunk_text'], chunk['excerpt'])
+            for slot_key in pending:
+                passed, _ = self.gate(slot_key, features)
+                if passed:
+                    found[slot_key] = chunk
+            pending = [slot_key for slot_key in pending if slot_key not in found]
+            if not pending:
+                break
+        return {slot_key: found[slot_key] for slot_key in slot_keys if slot_key in found}
+
+    def _select_planned(self, slot_keys: List[str], chunks: Iterable[dict], plan: SlotPlan) -> Dict[str, dict]:
+        found = {}
+        pending = list(slot_keys)
+        for chunk in chunks:
+            chunk_id = chunk['chunk_id']
+            # horizon을 지난 slot은 더 이상 바뀌지 않음 (winner 없음으로 확정)
+            pending = [slot_key for slot_key in pending if chunk_id <= plan.horizon(slot_key)]
+            if not pending:
+                break
+            features = None
+            for slot_key in pending:
+                if plan.kept.get(slot_key) == chunk_id:
+                    found[slot_key] = chunk
+                elif plan.needs_gate(slot_key, chunk_id):
+                    if features is None:
+                        features = ChunkFeatures(chunk['chunk_text'], chunk['excerpt'])
+                    if self.gate(slot_key, features)[0]:
+                        found[slot_key] = chunk
+            pending = [slot_key for slot_key in pending if slot_key not in found]
+            if not pending:
+                break
+        return {slot_key: found[slot_key] for slot_key in slot_keys if slot_key in found}
+
+
+def select_slot_chunks(slot_keys: List[str], chunks: Iterable[dict], ctx: GateContext,
+                       order: Optional[List[str]] = None, plan: Optional[SlotPlan] = None) -> Dict[str, dict]:
+    """
+    slot별 gate를 최초 통과한 chunk 선택 (chunk 순서 기준)
+
+    DB 접근이 없는 순수 함수 → gate CPU 작업을 process pool에서 실행할 수 있다.
+
+    Returns:
+        Dict[slot_key, chunk] (FOUND slot만 포함)
+    """
+    return GateEngine(ctx, order=order).select_slot_chunks(slot_keys, chunks, plan)
+
+
+def select_slot_chunks_with_stats(slot_keys: List[str], chunks: Iterable[dict], ctx: GateContext,
+                                  order: Optional[List[str]] = None,
+                                  plan: Optional[SlotPlan] = None) -> Tuple[Dict[str, dict], GateStats]:
+    """select_slot_chunks + gate 통계 기록 (process pool 반환용)"""
+    engine = GateEngine(ctx, order=order, stats=GateStats())
+    return engine.select_slot_chunks(slot_keys, chunks, plan), engine.stats
+
+
+def select_slot_chunks_instrumented(slot_keys: List[str], chunks: Iterable[dict], ctx: GateContext,
+                                    order: Optional[List[str]] = None, plan: Optional[SlotPlan] = None,
+                                    record_stats: bool = False, budget_us: Optional[float] = None,
+                                    on_exceed: str = "record"
+                                    ) -> Tuple[Dict[str, dict], Optional[GateStats], Optional[RegexBudget]]:
+    """select_slot_chunks + gate 통계 / regex time budget 기록 (process pool 반환용)"""
+    budget = RegexBudget(budget_us, on_exceed) if budget_us is not None else None
+    engine = GateEngine(ctx, order=order, stats=GateStats() if record_stats else None, budget=budget)
+    return engine.select_slot_chunks(slot_keys, chunks, plan), engine.stats, budget
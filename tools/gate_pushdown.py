@@ -0,0 +1,70 @@
+"""
+Gate pushdown: coverage_chunk 후보 필터를 SQL WHERE 절로 변환.
+
+apply_gates의 slot 무관 gate 중 "실패하면 어떤 slot도 통과 불가"인 것만 DB로 내린다.
+- GATE 1 (anchor in excerpt)   → excerpt LIKE ANY(%s)  (LIKE 메타문자 escape)
+- GATE 2/3 (hard/section neg.) → chunk_text !~ %s      (이식 가능한 패턴만 OR 결합)
+
+SQL 필터는 Python gate의 superset 후보만 남기는 용도이며,
+최종 판정(및 rejection reason)은 여전히 apply_gates가 담당한다.
+schema/020_coverage_chunk_trgm.sql의 pg_trgm GIN 인덱스가 LIKE / ~ 검색을 받는다.
+"""
+
+import re
+from typing import List, Tuple
+
+# Python re와 PostgreSQL ARE에서 동일하게 해석되는 패턴만 pushdown
+# (리터럴 문자 / \d / \s 원자 + 선택적 *, +, ? 수량자의 연속)
+_PORTABLE_ATOM = r'(?:[^\\.^$|?*+()\[\]{}]|\\[ds])[*+?]?'
+_PORTABLE_RE = re.compile(rf'(?:{_PORTABLE_ATOM})+')
+
+
+def like_escape(term: str) -> str:
+    """LIKE 패턴 메타문자(\\, %, _) escape (기본 ESCAPE '\\')"""
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def anchor_like_patterns(anchors: List[str]) -> List[str]:
+    """anchor 목록 → 부분 문자열 LIKE 패턴 목록"""
+    return [f"%{like_escape(anchor)}%" for anchor in anchors]
+
+
+def is_portable_regex(pattern: str) -> bool:
+    """Python re / PostgreSQL ARE 양쪽에서 같은 의미인 패턴인지"""
+    return bool(pattern) and _PORTABLE_RE.fullmatch(pattern) is not None
+
+
+def negative_union_regex(patterns: List[str]) -> str:
+    """
+    이식 가능한 negative 패턴을 하나의 alternation으로 결합
+
+    Returns:
+        str: "(?:p1)|(?:p2)|..." (이식 가능한 패턴이 없으면 빈 문자열)
+    """
+    portable = [p for p in patterns if is_portable_regex(p)]
+    return '|'.join(f'(?:{p})' for p in portable)
+
+
+def build_chunk_filter(anchors: List[str], hard_negatives: List[str],
+                       section_negatives: List[str]) -> Tuple[str, list]:
+    """
+    coverage_chunk 후보 필터 WHERE 조각 생성
+
+    Args:
+        anchors: GATE 1 anchor 키워드 (excerpt 부분 문자열)
+        hard_negatives: GATE 2 패턴
+        section_negatives: GATE 3 패턴
+
+    Returns:
+        (sql, params): "AND ..." 형태 조각과 psycopg2 파라미터 목록
+    """
+    # anchor가 없으면 GATE 1에서 전부 탈락 → LIKE ANY('{}')도 false로 동일
+    clauses = ["excerpt LIKE ANY(%s)"]
+    params: list = [anchor_like_patterns(anchors)]
+
+    negative = negative_union_regex(list(hard_negatives) + list(section_negatives))
+    if negative:
+        clauses.append("chunk_text !~ %s")
+        params.append(negative)
+
+    return ''.join(f"\n  AND {clause}" for clause in clauses), params
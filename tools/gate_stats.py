@@ -0,0 +1,146 @@
+"""
+Gate selectivity statistics (profile별 gate 평가 비용 / 탈락률).
+
+GateEngine이 gate 평가마다 (소요 ns, 탈락 여부)를 기록하고,
+파이프라인은 실행 종료 시 data/coverage_gate_stats.json(로컬 실행 상태, git 제외)에 profile_id별로 누적한다.
+다음 실행은 누적 통계로 gate 평가 순서를 정한다 (싼 것 + 많이 탈락시키는 것 먼저).
+
+- 순서 기준: 평균 비용 / 탈락률 오름차순 (탈락 0회 gate는 뒤, canonical 순서 유지)
+- 탈락률은 "해당 gate까지 도달한 평가" 기준 조건부 비율 (순서가 바뀌면 함께 변함)
+- 표본이 MIN_EVALUATIONS 미만인 gate가 있으면 canonical 순서 유지
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.atomic_io import atomic_write
+
+# apply_gates 순서 (rejection reason 판정 기준)
+GATE_ORDER = (
+    "anchor",
+    "hard_negative",
+    "section_negative",
+    "diagnosis_signal",
+    "name_lock",
+    "required_terms",
+    "slot_negative",
+)
+
+DEFAULT_STATS_PATH = PROJECT_ROOT / "data" / "coverage_gate_stats.json"
+
+# gate당 최소 평가 횟수 (미만이면 통계 신뢰 불가 → canonical 순서)
+MIN_EVALUATIONS = 200
+
+
+class GateStats:
+    """profile 1개의 gate별 평가 횟수 / 탈락 횟수 / 누적 소요 ns"""
+
+    __slots__ = ('evaluations', 'rejections', 'total_ns')
+
+    def __init__(self):
+        self.evaluations: Dict[str, int] = {gate: 0 for gate in GATE_ORDER}
+        self.rejections: Dict[str, int] = {gate: 0 for gate in GATE_ORDER}
+        self.total_ns: Dict[str, int] = {gate: 0 for gate in GATE_ORDER}
+
+    def record(self, gate: str, elapsed_ns: int, rejected: bool):
+        self.evaluations[gate] += 1
+        self.total_ns[gate] += elapsed_ns
+        if rejected:
+            self.rejections[gate] += 1
+
+    def merge(self, other: 'GateStats') -> 'GateStats':
+        for gate in GATE_ORDER:
+            self.evaluations[gate] += other.evaluations[gate]
+            self.rejections[gate] += other.rejections[gate]
+            self.total_ns[gate] += other.total_ns[gate]
+        return self
+
+    def rejection_rate(self, gate: str) -> float:
+        n = self.evaluations[gate]
+        return self.rejections[gate] / n if n else 0.0
+
+    def mean_ns(self, gate: str) -> float:
+        n = self.evaluations[gate]
+        return self.total_ns[gate] / n if n else 0.0
+
+    def order(self, min_evaluations: int = MIN_EVALUATIONS) -> List[str]:
+        """
+        adaptive gate 순서
+
+        Returns:
+            List[gate]: 평균 비용 / 탈락률 오름차순 (표본 부족 시 GATE_ORDER)
+        """
+        if any(self.evaluations[gate] < min_evaluations for gate in GATE_ORDER):
+            return list(GATE_ORDER)
+
+        def rank(gate: str):
+            rate = self.rejection_rate(gate)
+            if rate == 0.0:
+                return (1, GATE_ORDER.index(gate))
+            return (0, self.mean_ns(gate) / rate)
+
+        return sorted(GATE_ORDER, key=rank)
+
+    def to_dict(self) -> dict:
+        return {
+            gate: {
+                "evaluations": self.evaluations[gate],
+                "rejections": self.rejections[gate],
+                "total_ns": self.total_ns[gate],
+                "rejection_rate": round(self.rejection_rate(gate), 4),
+                "mean_ns": round(self.mean_ns(gate), 1),
+            }
+            for gate in GATE_ORDER
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'GateStats':
+        stats = cls()
+        for gate in GATE_ORDER:
+            entry = data.get(gate, {})
+            stats.evaluations[gate] = entry.get("evaluations", 0)
+            stats.rejections[gate] = entry.get("rejections", 0)
+            stats.total_ns[gate] = entry.get("total_ns", 0)
+        return stats
+
+
+def load_gate_stats(path: Path = DEFAULT_STATS_PATH) -> Dict[str, GateStats]:
+    """profile_id → GateStats (파일이 없으면 빈 dict)"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {profile_id: GateStats.from_dict(entry["gates"]) for profile_id, entry in data.get("profiles", {}).items()}
+
+
+def save_gate_stats(all_stats: Dict[str, GateStats], path: Path = DEFAULT_STATS_PATH) -> Path:
+    """profile_id별 누적 통계 + 현재 adaptive 순서 기록"""
+    path = Path(path)
+    data = {
+        "profiles": {
+            profile_id: {"gate_order": stats.order(), "gates": stats.to_dict()}
+            for profile_id, stats in sorted(all_stats.items())
+        }
+    }
+    with atomic_write(path) as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def record_gate_stats(profile_id: str, stats: GateStats, path: Path = DEFAULT_STATS_PATH) -> Path:
+    """이번 실행 통계를 기존 파일에 누적"""
+    all_stats = load_gate_stats(path)
+    all_stats.setdefault(profile_id, GateStats()).merge(stats)
+    return save_gate_stats(all_stats, path)
+
+
+def gate_order_for(profile_id: Optional[str], path: Path = DEFAULT_STATS_PATH) -> List[str]:
+    """profile_id의 adaptive gate 순서 (통계 없으면 GATE_ORDER)"""
+    stats = load_gate_stats(path).get(profile_id) if profile_id else None
+    return stats.order() if stats else list(GATE_ORDER)
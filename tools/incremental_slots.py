@@ -0,0 +1,143 @@
+"""
+Incremental evidence_slot 재판정 계획 (chunk 내용 hash 기준).
+
+evidence_gate_state에 마지막 gate 판정 시점의 (chunk_id, chunk_hash, gate_hash)를,
+evidence_slot에 FOUND 행을 만든 chunk의 chunk_hash를 기록해 두고,
+재실행 시 다음만 다시 gate한다.
+
+- 새 chunk / 내용이 바뀐 chunk (dirty)
+- winner chunk가 사라지거나 바뀐 slot: 기존 winner 위치 이후 chunk 전체
+
+근거 (불변식): slot winner W 이전(chunk_id < W)의 기존 chunk는 모두 gate 탈락,
+winner가 없는 slot은 기존 chunk 전체가 탈락. 따라서 바뀌지 않은 chunk는 판정이 같고
+winner는 "dirty chunk 중 W보다 앞서 통과하는 것" 또는 W 그대로다.
+
+gate_hash(gate_version + profile + ins_cd mapping)가 바뀐 ins_cd는 전체 재판정.
+"""
+
+import hashlib
+from math import inf
+from typing import Dict, List, Optional, Set, Tuple
+
+# chunk_hash 필드 구분자 (Postgres chr(31))
+HASH_FIELD_SEP = '\x1f'
+
+
+def chunk_content_hash(chunk_text: Optional[str], excerpt: Optional[str], page_number: Optional[int]) -> str:
+    """
+    chunk 내용 hash (evidence_slot 행에 들어가는 필드 전체)
+
+    Postgres: md5(COALESCE(chunk_text, '') || chr(31) || COALESCE(excerpt, '') || chr(31)
+                  || COALESCE(page_number::text, ''))
+    """
+    page = '' if page_number is None else str(page_number)
+    value = HASH_FIELD_SEP.join((chunk_text or '', excerpt or '', page))
+    return hashlib.md5(value.encode('utf-8')).hexdigest()
+
+
+def chunks_checksum(hashes: Dict[str, Dict[int, str]]) -> dict:
+    """
+    대상 chunk 전체 checksum (generation fingerprint 입력, chunk_hashes 결과에서 계산)
+
+    Returns:
+        {"rowcount", "max_chunk_id", "digest"}: digest는 chunk_id 순
+        "chunk_id:chunk_hash"를 ','로 이은 문자열의 md5
+    """
+    merged = sorted((chunk_id, chunk_hash) for ins_hashes in hashes.values()
+                    for chunk_id, chunk_hash in ins_hashes.items())
+    joined = ','.join(f"{chunk_id}:{chunk_hash}" for chunk_id, chunk_hash in merged)
+    return {"rowcount": len(merged), "max_chunk_id": merged[-1][0] if merged else None,
+            "digest": hashlib.md5(joined.encode('utf-8')).hexdigest()}
+
+
+class SlotPlan:
+    """
+    ins_cd 1개의 slot별 재판정 계획
+
+    - full: 전체 재판정 (상태 없음 / gate_hash 변경 / --force)
+    - dirty: 새로 생기거나 내용이 바뀐 chunk_id
+    - kept: slot_key → 유지 가능한 기존 winner chunk_id
+    - rescan_from: slot_key → winner가 사라지거나 바뀐 slot의 재판정 시작 chunk_id
+    - hashes: 현재 chunk_id → chunk_hash (gate pushdown 탈락 chunk 포함)
+    """
+
+    __slots__ = ('full', 'dirty', 'kept', 'rescan_from', 'hashes')
+
+    def __init__(self, hashes: Dict[int, str], full: bool = True, dirty: Optional[Set[int]] = None,
+                 kept: Optional[Dict[str, int]] = None, rescan_from: Optional[Dict[str, int]] = None):
+        self.hashes = hashes
+        self.full = full
+        self.dirty = dirty if dirty is not None else set(hashes)
+        self.kept = kept or {}
+        self.rescan_from = rescan_from or {}
+
+    def horizon(self, slot_key: str) -> float:
+        """slot 판정에 영향을 줄 수 있는 마지막 chunk_id"""
+        if self.full or slot_key in self.rescan_from:
+            return inf
+        if slot_key in self.kept:
+            return self.kept[slot_key]
+        return max(self.dirty, default=-1)
+
+    def needs_gate(self, slot_key: str, chunk_id: int) -> bool:
+        if chunk_id > self.horizon(slot_key):
+            return False
+        if self.full or chunk_id in self.dirty:
+            return True
+        start = self.rescan_from.get(slot_key)
+        return start is not None and chunk_id >= start
+
+    def needs_chunk_text(self, slot_keys: List[str], chunk_id: int) -> bool:
+        """어떤 slot이든 이 chunk를 gate해야 하면 True"""
+        return any(self.needs_gate(slot_key, chunk_id) for slot_key in slot_keys)
+
+    def relevant(self, slot_keys: List[str], chunk_id: int) -> bool:
+        """gate 대상이거나 유지되는 winner인 chunk"""
+        return chunk_id in self.kept.values() or self.needs_chunk_text(slot_keys, chunk_id)
+
+    def summary(self) -> dict:
+        return {"full": self.full, "chunks": len(self.hashes), "dirty": len(self.dirty),
+                "kept": len(self.kept), "rescan": len(self.rescan_from)}
+
+
+def build_slot_plan(slot_keys: List[str], hashes: Dict[int, str], state: Dict[int, Tuple[str, str]],
+                    gate_hash: str, winners: Dict[str, dict]) -> SlotPlan:
+    """
+    Args:
+        hashes: 현재 chunk_id → chunk_hash
+        state: 지난 판정 시점 chunk_id → (chunk_hash, gate_hash)
+        gate_hash: 현재 gate context hash
+        winners: slot_key → 기존 evidence_slot FOUND 행 (chunk_id, chunk_hash)
+    """
+    if not state or any(state_gate_hash != gate_hash for _, state_gate_hash in state.values()):
+        return SlotPlan(hashes)
+
+    dirty = {chunk_id for chunk_id, chunk_hash in hashes.items()
+             if chunk_id not in state or state[chunk_id][0] != chunk_hash}
+    kept = {}
+    rescan_from = {}
+    for slot_key in slot_keys:
+        winner = winners.get(slot_key)
+        if winner is None:
+            continue
+        chunk_id = winner['chunk_id']
+        if chunk_id not in dirty and winner.get('chunk_hash') is not None \
+                and hashes.get(chunk_id) == winner['chunk_hash']:
+            kept[slot_key] = chunk_id
+        else:
+            rescan_from[slot_key] = chunk_id
+    return SlotPlan(hashes, full=False, dirty=dirty, kept=kept, rescan_from=rescan_from)
+
+
+def gate_state_changes(ins_cd: str, plan: SlotPlan, state: Dict[int, Tuple[str, str]],
+                       gate_hash: str) -> Tuple[List[tuple], List[int]]:
+    """
+    evidence_gate_state 갱신분
+
+    Returns:
+        (upsert rows (ins_cd, chunk_id, chunk_hash, gate_hash), 삭제할 chunk_id)
+    """
+    changed = plan.hashes if plan.full else plan.dirty
+    upserts = [(ins_cd, chunk_id, plan.hashes[chunk_id], gate_hash) for chunk_id in sorted(changed)]
+    removed = sorted(chunk_id for chunk_id in state if chunk_id not in plan.hashes)
+    return upserts, removed
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+STEP NEXT-DB-1 bulk loader: file pipeline 산출물 → docker/schema/STEP_NEXT_DB_1_SCHEMA.sql
+
+입력 (docs/foundation/STEP9_DB_POPULATION_SPEC.md 순서):
+- data/metadata/products.yml            → insurer, product, product_variant, document
+- data/scope/{insurer}_scope_mapped.csv → coverage_instance
+- data/evidence_pack/{insurer}_evidence_pack.jsonl → evidence_ref
+- data/compare/{insurer}_coverage_cards.jsonl      → amount_fact
+
+처리:
+1. 파일을 스트리밍으로 읽고 모든 id를 uuid5(자연키)로 계산 → FK를 메모리에서 해결 (DB 왕복 없음)
+2. 테이블별 TEMP staging 테이블에 COPY
+3. staging → 대상 테이블 set-based merge (INSERT ... ON CONFLICT (PK) DO UPDATE, 변경된 행만)
+4. 적재 대상 insurer의 coverage_instance / evidence_ref / amount_fact 중 이번 입력에 없는 행 삭제
+   (--no-prune이면 생략)
+전체가 단일 트랜잭션 → 재실행(nightly) 멱등.
+
+스키마 제약에 따른 처리:
+- coverage_instance.coverage_code는 NOT NULL FK → unmatched scope 행은 적재하지 않음 (skipped로 보고)
+- coverage_canonical은 담보명mapping자료.xlsx가 SSOT (READ-ONLY) → 적재하지 않음.
+  DB의 coverage_canonical에 없는 코드의 scope 행은 skipped(coverage_instance_unknown_canonical)
+- (product, variant, coverage_code) UNIQUE → 같은 조합의 두 번째 이후 행은 skipped(coverage_instance_duplicate_code)
+- scope CSV에 variant_key 컬럼이 없으면 variant_id = NULL
+- 같은 보험사 내 동일 coverage_name_raw 행은 파일 내 등장 순번으로 구분 (evidence pack / cards도 같은 순번으로 매칭)
+- evidence_ref.rank는 doc_type별 1-3, 그 이후 evidence는 rank NULL
+- 카드에 amount 필드가 없으면 amount_fact는 UNCONFIRMED (value_text / source NULL)
+
+Usage:
+  python3 tools/load_db1_bulk.py                       # 전체 보험사 적재
+  python3 tools/load_db1_bulk.py --insurers kb,samsung
+  python3 tools/load_db1_bulk.py --dry-run             # DB 없이 행 수 / skip 사유만 출력
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+DB1_CONFIG = {
+    "host": "localhost",
+    "port": 5432,
+    "dbname": "inca_rag_scope",
+    "user": "inca_admin",
+    "password": os.environ.get("INCA_DB1_PASSWORD", "")
+}
+
+DEFAULT_METADATA = PROJECT_ROOT / "data" / "metadata" / "products.yml"
+DEFAULT_DATA_DIR = PROJECT_ROOT / "data"
+
+# uuid5 namespace (값을 바꾸면 모든 id가 바뀜 → 재적재 시 전체 교체)
+ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "inca-rag-scope/step-next-db-1")
+
+COVERAGE_CODE_RE = re.compile(r'^[A-Z]\d{4}(_\d+)?$')
+EVIDENCE_TEXT_PREFIX = "data/evidence_text/"
+MAX_EVIDENCE_RANK = 3
+
+# 테이블: (PK, 컬럼) — 적재(merge) 순서 = FK 부모 → 자식
+TABLES = {
+    "insurer": ("insurer_id", ("insurer_id", "insurer_name_kr", "insurer_name_en", "insurer_type")),
+    "product": ("product_id", ("product_id", "insurer_id", "product_name", "product_code")),
+    "product_variant": ("variant_id", ("variant_id", "product_id", "variant_key", "variant_display_name")),
+    "document": ("document_id", ("document_id", "insurer_id", "product_id", "doc_type", "file_path")),
+    "coverage_instance": ("instance_id", ("instance_id", "insurer_id", "product_id", "variant_id", "coverage_code",
+                                          "coverage_name_raw", "source_page", "mapping_status", "match_type")),
+    "evidence_ref": ("evidence_id", ("evidence_id", "coverage_instance_id", "document_id", "doc_type", "page",
+                                     "snippet", "match_keyword", "rank")),
+    "amount_fact": ("amount_id", ("amount_id", "coverage_instance_id", "evidence_id", "status", "value_text",
+                                  "source_doc_type", "source_priority", "notes")),
+}
+
+# 이번 입력에 없으면 삭제하는 테이블 (자식 → 부모 순서)
+PRUNE_TABLES = ("amount_fact", "evidence_ref", "coverage_instance")
+
+
+def stable_id(kind: str, *parts) -> str:
+    """자연키 → 결정적 UUID (uuid5)"""
+    return str(uuid.uuid5(ID_NAMESPACE, kind + ":" + "\x1f".join(str(p) for p in parts)))
+
+
+def relative_evidence_path(file_path: str) -> str:
+    """evidence file_path(절대 경로 포함) → 저장소 상대 경로 data/evidence_text/..."""
+    idx = file_path.find(EVIDENCE_TEXT_PREFIX)
+    return file_path[idx:] if idx >= 0 else file_path
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_csv(path: Path) -> Iterator[dict]:
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        yield from csv.DictReader(f)
+
+
+def _int_or_none(value) -> Optional[int]:
+    if value is None or str(value).strip() == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class DB1Rows:
+    """적재할 행 (테이블 → TABLES 컬럼 순서 tuple) + skip 사유 집계"""
+
+    def __init__(self):
+        self.tables: Dict[str, Dict[str, tuple]] = {table: {} for table in TABLES}
+        self.skipped: Counter = Counter()
+        self.insurer_ids: List[str] = []
+
+    def add(self, table: str, row: tuple):
+        # PK 기준 dedupe (마지막 값 우선)
+        self.tables[table][row[0]] = row
+
+    def rows(self, table: str) -> List[tuple]:
+        return list(self.tables[table].values())
+
+    def counts(self) -> Dict[str, int]:
+        return {table: len(rows) for table, rows in self.tables.items()}
+
+
+class DB1RowBuilder:
+    """products.yml + 보험사별 파일 → DB1Rows (FK는 uuid5로 메모리에서 해결)"""
+
+    def __init__(self, metadata_path: Path = DEFAULT_METADATA, data_dir: Path = DEFAULT_DATA_DIR,
+                 canonical_codes: Optional[Set[str]] = None):
+        import yaml
+
+        self.data_dir = Path(data_dir)
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            self.metadata = yaml.safe_load(f)
+        # DB coverage_canonical 코드 (None이면 검사 생략 — dry-run)
+        self.canonical_codes = canonical_codes
+        self.rows = DB1Rows()
+        # insurer_key → (insurer_id, product_id)
+        self.products: Dict[str, Tuple[str, str]] = {}
+        self.variants: Dict[str, str] = {}
+        # 상대 file_path → (document_id, insurer_key)
+        self.documents: Dict[str, Tuple[str, str]] = {}
+
+    def insurer_keys(self) -> List[str]:
+        """data/scope/{insurer}_scope_mapped.csv가 있는 보험사"""
+        suffix = "_scope_mapped.csv"
+        return sorted(p.name[:-len(suffix)] for p in (self.data_dir / "scope").glob(f"*{suffix}"))
+
+    def load_metadata(self):
+        insurer_ids = {}
+        for insurer in self.metadata.get("insurers", []):
+            insurer_id = stable_id("insurer", insurer["insurer_key"])
+            insurer_ids[insurer["insurer_key"]] = insurer_id
+            self.rows.add("insurer", (insurer_id, insurer["insurer_name_ko"], insurer.get("insurer_name_en"),
+                                      insurer.get("insurer_type")))
+
+        product_insurers = {}
+        for product in self.metadata.get("products", []):
+            insurer_id = insurer_ids[product["insurer_key"]]
+            product_id = stable_id("product", product["product_key"])
+            product_insurers[product["product_key"]] = (insurer_id, product_id)
+            # 보험사당 1개 상품 (products.yml 규칙) → 첫 상품을 scope 적재 대상으로
+            self.products.setdefault(product["insurer_key"], (insurer_id, product_id))
+            self.rows.add("product", (product_id, insurer_id,
+                                      product.get("product_name_display") or product["product_name_raw"],
+                                      product["product_key"]))
+
+        for variant in self.metadata.get("variants", []):
+            _, product_id = product_insurers[variant["product_key"]]
+            variant_id = stable_id("product_variant", variant["variant_key"])
+            self.variants[variant["variant_key"]] = variant_id
+            self.rows.add("product_variant", (variant_id, product_id, variant["variant_key"],
+                                              variant["variant_display_name"]))
+
+        insurer_by_id = {insurer_id: key for key, insurer_id in insurer_ids.items()}
+        for document in self.metadata.get("documents", []):
+            insurer_id, product_id = product_insurers[document["product_key"]]
+            document_id = stable_id("document", document["file_path"])
+            self.documents[document["file_path"]] = (document_id, insurer_by_id[insurer_id])
+            self.rows.add("document", (document_id, insurer_id, product_id, document["doc_type"],
+                                       document["file_path"]))
+
+    def load_insurer(self, insurer_key: str):
+        if insurer_key not in self.products:
+            self.rows.skipped["insurer_not_in_metadata"] += 1
+            return
+        insurer_id, product_id = self.products[insurer_key]
+        self.rows.insurer_ids.append(insurer_id)
+
+        instances = self._load_scope(insurer_key, insurer_id, product_id)
+        self._load_evidence_pack(insurer_key, instances)
+        self._load_cards(insurer_key, instances)
+
+    def _occurrences(self, records: Iterable[dict]) -> Iterator[Tuple[Tuple[str, int], dict]]:
+        """(coverage_name_raw, 파일 내 등장 순번) 키 부여"""
+        seen: Counter = Counter()
+        for record in records:
+            name = record.get("coverage_name_raw") or ""
+            yield (name, seen[name]), record
+            seen[name] += 1
+
+    def _load_scope(self, insurer_key: str, insurer_id: str, product_id: str) -> Dict[Tuple[str, int], str]:
+        """scope CSV → coverage_instance. Returns: (raw name, 순번) → instance_id"""
+        instances = {}
+        # (product_id, variant_id, coverage_code) — 스키마 UNIQUE 제약을 메모리에서 검사
+        seen_codes = set()
+        path = self.data_dir / "scope" / f"{insurer_key}_scope_mapped.csv"
+        for key, row in self._occurrences(iter_csv(path)):
+            coverage_code = (row.get("coverage_code") or "").strip()
+            if not coverage_code:
+                self.rows.skipped["coverage_instance_unmatched"] += 1
+                continue
+            if not COVERAGE_CODE_RE.match(coverage_code):
+                self.rows.skipped["coverage_instance_bad_code"] += 1
+                continue
+
+            if self.canonical_codes is not None and coverage_code not in self.canonical_codes:
+                self.rows.skipped["coverage_instance_unknown_canonical"] += 1
+                continue
+
+            variant_key = (row.get("variant_key") or "").strip()
+            variant_id = self.variants.get(variant_key) if variant_key else None
+            if variant_key and variant_id is None:
+                self.rows.skipped["coverage_instance_unknown_variant"] += 1
+                continue
+            if (product_id, variant_id, coverage_code) in seen_codes:
+                self.rows.skipped["coverage_instance_duplicate_code"] += 1
+                continue
+            seen_codes.add((product_id, variant_id, coverage_code))
+
+            instance_id = stable_id("coverage_instance", insurer_key, key[0], key[1])
+            instances[key] = instance_id
+            self.rows.add("coverage_instance", (
+                instance_id, insurer_id, product_id, variant_id, coverage_code, key[0],
+                _int_or_none(row.get("source_page")), row.get("mapping_status") or "matched",
+                row.get("match_type") or None
+            ))
+        return instances
+
+    def _document_id(self, file_path: str) -> Optional[str]:
+        document = self.documents.get(relative_evidence_path(file_path or ""))
+        return document[0] if document else None
+
+    def _evidence_row(self, instance_id: str, evidence: dict, rank: Optional[int]) -> Optional[tuple]:
+        document_id = self._document_id(evidence.get("file_path"))
+        if document_id is None:
+            self.rows.skipped["evidence_unknown_document"] += 1
+            return None
+        page = _int_or_none(evidence.get("page"))
+        snippet = evidence.get("snippet") or ""
+        if page is None or page <= 0 or not snippet:
+            self.rows.skipped["evidence_invalid"] += 1
+            return None
+        evidence_id = stable_id("evidence_ref", instance_id, document_id, page, snippet)
+        return (evidence_id, instance_id, document_id, evidence["doc_type"], page, snippet,
+                evidence.get("match_keyword"), rank)
+
+    def _load_evidence_pack(self, insurer_key: str, instances: Dict[Tuple[str, int], str]):
+        path = self.data_dir / "evidence_pack" / f"{insurer_key}_evidence_pack.jsonl"
+        if not path.exists():
+            return
+        for key, pack in self._occurrences(iter_jsonl(path)):
+            instance_id = instances.get(key)
+            if instance_id is None:
+                self.rows.skipped["evidence_pack_without_instance"] += 1
+                continue
+            rank_by_doc_type: Counter = Counter()
+            for evidence in pack.get("evidences", []):
+                rank_by_doc_type[evidence.get("doc_type")] += 1
+                rank = rank_by_doc_type[evidence.get("doc_type")]
+                row = self._evidence_row(instance_id, evidence, rank if rank <= MAX_EVIDENCE_RANK else None)
+                if row is not None and row[0] not in self.rows.tables["evidence_ref"]:
+                    self.rows.add("evidence_ref", row)
+
+    def _load_cards(self, insurer_key: str, instances: Dict[Tuple[str, int], str]):
+        path = self.data_dir / "compare" / f"{insurer_key}_coverage_cards.jsonl"
+        if not path.exists():
+            return
+        for key, card in self._occurrences(iter_jsonl(path)):
+            instance_id = instances.get(key)
+            if instance_id is None:
+                self.rows.skipped["card_without_instance"] += 1
+                continue
+            amount_id = stable_id("amount_fact", instance_id)
+            amount = card.get("amount")
+            if not amount:
+                self.rows.add("amount_fact", (amount_id, instance_id, None, "UNCONFIRMED", None, None, None, "[]"))
+                continue
+
+            evidence_id = None
+            if amount.get("evidence"):
+                evidence = dict(amount["evidence"])
+                evidence.setdefault("doc_type", amount.get("source_doc_type"))
+                row = self._evidence_row(instance_id, evidence, None)
+                if row is not None:
+                    evidence_id = row[0]
+                    if evidence_id not in self.rows.tables["evidence_ref"]:
+                        self.rows.add("evidence_ref", row)
+            if amount.get("status") == "CONFIRMED" and evidence_id is None:
+                self.rows.skipped["amount_confirmed_without_evidence"] += 1
+                continue
+            self.rows.add("amount_fact", (
+                amount_id, instance_id, evidence_id, amount["status"], amount.get("value_text"),
+                amount.get("source_doc_type"), amount.get("source_priority"),
+                json.dumps(amount.get("notes") or [], ensure_ascii=False)
+            ))
+
+    def build(self, insurer_keys: Optional[List[str]] = None) -> DB1Rows:
+        self.load_metadata()
+        for insurer_key in insurer_keys or self.insurer_keys():
+            self.load_insurer(insurer_key)
+        return self.rows
+
+
+def build_rows(insurer_keys: Optional[List[str]] = None, metadata_path: Path = DEFAULT_METADATA,
+               data_dir: Path = DEFAULT_DATA_DIR, canonical_codes: Optional[Set[str]] = None) -> DB1Rows:
+    return DB1RowBuilder(metadata_path, data_dir, canonical_codes).build(insurer_keys)
+
+
+def fetch_canonical_codes(conn) -> Set[str]:
+    """DB coverage_canonical(READ-ONLY)의 코드 집합"""
+    with conn.cursor() as cur:
+        cur.execute("SELECT coverage_code FROM coverage_canonical")
+        return {row[0] for row in cur.fetchall()}
+
+
+def copy_text_value(value) -> str:
+    """COPY text format 필드 (NULL = \\N, 구분자 / 개행 / 역슬래시 escape)"""
+    if value is None:
+        return "\\N"
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def copy_buffer(rows: Iterable[tuple]) -> io.StringIO:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(copy_text_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def merge_sql(table: str) -> str:
+    """staging → 대상 테이블 merge (값이 바뀐 행만 UPDATE)"""
+    pk, columns = TABLES[table]
+    column_list = ", ".join(columns)
+    casts = ", ".join(f"{column}::jsonb" if column == "notes" else column for column in columns)
+    updated = [column for column in columns if column != pk]
+    conflict = (
+        "DO UPDATE SET " + ", ".join(f"{column} = EXCLUDED.{column}" for column in updated)
+        + f"\n            WHERE ({', '.join(f'{table}.{c}' for c in updated)})"
+        + f" IS DISTINCT FROM ({', '.join(f'EXCLUDED.{c}' for c in updated)})"
+    )
+    return f"""
+        INSERT INTO {table} ({column_list})
+        SELECT {casts} FROM stg_{table}
+        ON CONFLICT ({pk}) {conflict}
+    """
+
+
+def prune_sql(table: str) -> str:
+    """적재 대상 insurer 범위에서 staging에 없는 행 삭제"""
+    pk, _ = TABLES[table]
+    if table == "coverage_instance":
+        scope = "t.insurer_id = ANY(%s::uuid[])"
+    else:
+        scope = ("t.coverage_instance_id IN (SELECT instance_id FROM coverage_instance "
+                 "WHERE insurer_id = ANY(%s::uuid[]))")
+    return f"""
+        DELETE FROM {table} t
+        WHERE {scope}
+          AND NOT EXISTS (SELECT 1 FROM stg_{table} s WHERE s.{pk} = t.{pk})
+    """
+
+
+def write_rows(conn, rows: DB1Rows, prune: bool = True) -> Dict[str, dict]:
+    """
+    COPY → staging → merge (+ prune), 단일 트랜잭션
+
+    Returns:
+        table → {"staged", "merged", "pruned"}
+    """
+    report = {}
+    try:
+        with conn.cursor() as cur:
+            for table, (_, columns) in TABLES.items():
+                # notes(JSONB)는 text로 COPY 후 merge에서 cast
+                cur.execute(f"CREATE TEMP TABLE stg_{table} (LIKE {table}) ON COMMIT DROP")
+                if table == "amount_fact":
+                    cur.execute("ALTER TABLE stg_amount_fact ALTER COLUMN notes TYPE TEXT")
+                cur.copy_expert(f"COPY stg_{table} ({', '.join(columns)}) FROM STDIN",
+                                copy_buffer(rows.rows(table)))
+                cur.execute(merge_sql(table))
+                report[table] = {"staged": len(rows.tables[table]), "merged": cur.rowcount, "pruned": 0}
+
+            if prune:
+                for table in PRUNE_TABLES:
+                    cur.execute(prune_sql(table), (rows.insurer_ids,))
+                    report[table]["pruned"] = cur.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-load pipeline outputs into the STEP NEXT-DB-1 schema")
+    parser.add_argument("--insurers", help="Comma-separated insurer keys (default: all data/scope/*_scope_mapped.csv)")
+    parser.add_argument("--metadata", default=str(DEFAULT_METADATA), help="products.yml path")
+    parser.add_argument("--data-dir", default=str(DEFAULT_DATA_DIR), help="Pipeline data directory")
+    parser.add_argument("--no-prune", action="store_true",
+                        help="Keep instance-level rows that are no longer in the input files")
+    parser.add_argument("--dry-run", action="store_true", help="Build rows and report counts without a DB")
+    args = parser.parse_args()
+
+    insurer_keys = [x.strip() for x in args.insurers.split(",") if x.strip()] if args.insurers else None
+
+    conn = None
+    canonical_codes = None
+    if not args.dry_run:
+        import psycopg2
+
+        conn = psycopg2.connect(**DB1_CONFIG)
+        canonical_codes = fetch_canonical_codes(conn)
+
+    try:
+        start = time.perf_counter()
+        rows = build_rows(insurer_keys, Path(args.metadata), Path(args.data_dir), canonical_codes)
+        print(f"[DB1 Loader] Built rows in {time.perf_counter() - start:.2f}s "
+              f"({len(rows.insurer_ids)} insurers)")
+        for table, count in rows.counts().items():
+            print(f"  {table}: {count}")
+        for reason, count in sorted(rows.skipped.items()):
+            print(f"  skipped {reason}: {count}")
+
+        if args.dry_run:
+            return
+
+        start = time.perf_counter()
+        report = write_rows(conn, rows, prune=not args.no_prune)
+    finally:
+        if conn is not None:
+            conn.close()
+    print(f"[DB1 Loader] Loaded in {time.perf_counter() - start:.2f}s")
+    for table, entry in report.items():
+        print(f"  {table}: staged={entry['staged']} merged={entry['merged']} pruned={entry['pruned']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Regex cost analyzer: coverage profile gate 패턴 + STEP 8 slot 패턴.
+
+패턴마다
+  1. 샘플 코퍼스(evidence pack snippet + 이를 이어 붙인 긴 약관 chunk) search 시간
+     (총 / 평균 / 최대 µs, 매칭 수) → --slow-us 초과 시 slow
+  2. 입력 길이를 2배씩 늘리며 search 시간 측정 → log-log 기울기(growth exponent)
+     - 입력: 패턴 구조에서 만든 pump 문자열 (앞부분만 맞고 그 다음에서 실패하는 반복,
+       예: r'\\d+년.*\\d+%' → "1년a1" × N, r'\\d+일' → 긴 숫자열) + 코퍼스 텍스트
+     - 기울기 >= --exponent 이고 최대 길이에서 --min-us 이상이면 super_linear
+       (catastrophic backtracking / 2차 이상 스캔)
+
+scope:
+  chunk: gate 패턴 (coverage_chunk.chunk_text 전체에 search)
+  line:  slot 패턴 (SlotEngine이 snippet을 라인 단위로 search → 실제 입력 길이는 라인 길이)
+
+런타임 guard (search 1회당 time budget 초과 기록)는 core/regex_budget.py /
+run_db_only_coverage.py, extract_single_coverage.py --regex-budget-us.
+
+Usage:
+  python3 tools/regex_cost.py [--corpus more.jsonl] [--slow-us 500] [--json report.json] [--fail-on-flag]
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+from pipeline.step8_single_coverage.extract_single_coverage import SLOT_SPECS, SlotEngine
+from tools.coverage_profiles import COVERAGE_PROFILES, compiled_profile
+
+PROFILE_GATE_KEYS = ("hard_negative_terms_global", "section_negative_terms_global", "diagnosis_signal_terms_global")
+PROFILE_SLOT_GATE_KEYS = ("required_terms_by_slot", "slot_specific_negatives")
+
+DEFAULT_SIZES = (1000, 2000, 4000, 8000)
+DEFAULT_CHUNK_CHARS = 4000
+MAX_PUMPS = 16
+
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) + (
+    (sre_constants.POSSESSIVE_REPEAT,) if hasattr(sre_constants, "POSSESSIVE_REPEAT") else ()
+)
+_CATEGORY_SAMPLES = {
+    sre_constants.CATEGORY_DIGIT: '1',
+    sre_constants.CATEGORY_NOT_DIGIT: 'a',
+    sre_constants.CATEGORY_SPACE: ' ',
+    sre_constants.CATEGORY_NOT_SPACE: 'a',
+    sre_constants.CATEGORY_WORD: 'a',
+    sre_constants.CATEGORY_NOT_WORD: ' ',
+}
+
+
+class PatternEntry:
+    """분석 대상 패턴 1개 (같은 (pattern, flags)는 source만 추가)"""
+
+    __slots__ = ('pattern', 'flags', 'scope', 'sources', 'compiled')
+
+    def __init__(self, pattern: str, flags: int, scope: str):
+        self.pattern = pattern
+        self.flags = flags
+        self.scope = scope
+        self.sources: List[str] = []
+        self.compiled = re.compile(pattern, flags)
+
+
+def collect_patterns(profiles: Optional[Dict[str, dict]] = None,
+                     slot_specs: Optional[Sequence[Tuple[str, List[str], int]]] = None) -> List[PatternEntry]:
+    """
+    gate / slot 패턴 목록 (런타임에 실제로 search되는 형태 그대로)
+
+    - profile: gate별 개별 패턴 + CompiledPatternSet union (GateEngine이 먼저 평가)
+    - slot: SLOT_SPECS 개별 패턴 (IGNORECASE) + SlotEngine 슬롯별 alternation
+    """
+    profiles = COVERAGE_PROFILES if profiles is None else profiles
+    slot_specs = SLOT_SPECS if slot_specs is None else slot_specs
+    entries: Dict[Tuple[str, int], PatternEntry] = {}
+
+    def add(pattern: str, flags: int, scope: str, source: str):
+        entry = entries.get((pattern, flags))
+        if entry is None:
+            entry = entries[(pattern, flags)] = PatternEntry(pattern, flags, scope)
+        if source not in entry.sources:
+            entry.sources.append(source)
+
+    for coverage_code, profile in sorted(profiles.items()):
+        compiled = compiled_profile(profile)
+        gate_sets = [(key, compiled_set, profile.get(key, []))
+                     for key, compiled_set in zip(PROFILE_GATE_KEYS, (compiled.hard_negatives,
+                                                                      compiled.section_negatives,
+                                                                      compiled.diagnosis_signals))]
+        for key in PROFILE_SLOT_GATE_KEYS:
+            by_slot = compiled.required_by_slot if key == "required_terms_by_slot" else compiled.slot_negatives
+            gate_sets += [(f"{key}.{slot_key}", compiled_set, compiled_set.patterns)
+                          for slot_key, compiled_set in sorted(by_slot.items())]
+        for key, compiled_set, patterns in gate_sets:
+            for pattern in patterns:
+                add(pattern, 0, "chunk", f"{coverage_code}:{key}")
+            if compiled_set.union_source:
+                add(compiled_set.union_source, 0, "chunk", f"{coverage_code}:{key} (union)")
+
+    for slot_key, patterns, _ in slot_specs:
+        for pattern in patterns:
+            add(pattern, re.IGNORECASE, "line", f"SLOT_SPECS:{slot_key}")
+    engine = SlotEngine(list(slot_specs))
+    for (slot_key, _, _), search in zip(slot_specs, engine.slot_searches):
+        add(search.__self__.pattern, re.IGNORECASE, "line", f"SlotEngine:{slot_key} (alternation)")
+
+    return list(entries.values())
+
+
+# ----------------------------------------------------------------------------
+# corpus
+# ----------------------------------------------------------------------------
+
+def _texts_from_record(record: dict) -> List[str]:
+    for key in ("chunk_text", "snippet", "text", "excerpt"):
+        if isinstance(record.get(key), str):
+            return [record[key]]
+    return [e["snippet"] for e in record.get("evidences", []) if isinstance(e.get("snippet"), str)]
+
+
+def load_corpus(paths: Optional[Iterable[Path]] = None, chunk_chars: int = DEFAULT_CHUNK_CHARS) -> List[str]:
+    """
+    샘플 코퍼스
+
+    기본: data/evidence_pack/*_evidence_pack.jsonl snippet.
+    paths: 추가 파일 (.jsonl: chunk_text / snippet / text / excerpt / evidences[].snippet, 그 외: 파일 전체 1건)
+    chunk_chars > 0이면 snippet을 이어 붙인 약 chunk_chars 길이의 긴 chunk도 추가 (약관 chunk 대용)
+    """
+    paths = list(paths) if paths else sorted((PROJECT_ROOT / "data" / "evidence_pack").glob("*_evidence_pack.jsonl"))
+    texts: List[str] = []
+    seen = set()
+    for path in paths:
+        path = Path(path)
+        if path.suffix != ".jsonl":
+            texts.append(path.read_text(encoding='utf-8'))
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                for text in _texts_from_record(json.loads(line)):
+                    if text and text not in seen:
+                        seen.add(text)
+                        texts.append(text)
+
+    if chunk_chars > 0:
+        chunk: List[str] = []
+        size = 0
+        for text in list(texts):
+            chunk.append(text)
+            size += len(text) + 1
+            if size >= chunk_chars:
+                texts.append('\n'.join(chunk))
+                chunk, size = [], 0
+    return texts
+
+
+def corpus_lines(texts: Iterable[str]) -> List[str]:
+    """line scope 패턴 입력 (SlotEngine과 같은 라인 단위)"""
+    return [line for text in texts for line in text.split('\n') if line.strip()]
+
+
+# ----------------------------------------------------------------------------
+# pump 문자열 (패턴 구조 기반 최악 입력 후보)
+# ----------------------------------------------------------------------------
+
+def _sample_in(items) -> str:
+    if items and items[0][0] is sre_constants.NEGATE:
+        return '#'
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            return chr(av)
+        if op is sre_constants.RANGE:
+            return chr(av[0])
+        if op is sre_constants.CATEGORY:
+            return _CATEGORY_SAMPLES.get(av, 'a')
+    return 'a'
+
+
+def _sample(items) -> str:
+    """parse tree → 매칭되는 최소 예시 문자열 (대안은 첫 번째, 반복은 최소 1회)"""
+    out = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            out.append(chr(av))
+        elif op is sre_constants.NOT_LITERAL:
+            out.append('b' if chr(av) == 'a' else 'a')
+        elif op is sre_constants.ANY:
+            out.append('a')
+        elif op is sre_constants.IN:
+            out.append(_sample_in(av))
+        elif op in _REPEATS:
+            low, _, sub = av
+            out.append(_sample(sub) * max(low, 1))
+        elif op is sre_constants.SUBPATTERN:
+            out.append(_sample(av[-1]))
+        elif op is sre_constants.BRANCH:
+            out.append(_sample(av[1][0]))
+        elif getattr(sre_constants, "ATOMIC_GROUP", None) is op:
+            out.append(_sample(av))
+        # AT / ASSERT / GROUPREF 등 폭 0 또는 생략
+    return ''.join(out)
+
+
+def _alternatives(items) -> List[list]:
+    """최상위 alternation / group을 풀어 대안별 요소 목록"""
+    items = list(items)
+    if len(items) == 1:
+        op, av = items[0]
+        if op is sre_constants.BRANCH:
+            return [alt for branch in av[1] for alt in _alternatives(branch)]
+        if op is sre_constants.SUBPATTERN:
+            return _alternatives(av[-1])
+    return [items]
+
+
+def pump_strings(pattern: str, flags: int = 0) -> List[str]:
+    """
+    대안별 pump 단위 문자열 (최대 MAX_PUMPS개)
+
+    대안의 앞부분(긴 prefix부터)만 맞는 예시 문자열을 반복하면 매 시작 위치에서
+    prefix는 맞고 그 다음에서 실패한다
+    (예: r'\\d+년.*\\d+%' → "1년a1", "1년", "1"; r'\\d+일' → "1" = 긴 숫자열).
+    단일 요소 대안은 예시 전체를 사용.
+    """
+    pumps = []
+    for alternative in _alternatives(sre_parse.parse(pattern, flags)):
+        ends = range(len(alternative) - 1, 0, -1) if len(alternative) > 1 else [1]
+        for end in ends:
+            unit = _sample(alternative[:end])
+            if unit and unit not in pumps:
+                pumps.append(unit)
+            if len(pumps) >= MAX_PUMPS:
+                return pumps
+    return pumps
+
+
+# ----------------------------------------------------------------------------
+# 측정
+# ----------------------------------------------------------------------------
+
+def _search_ns(compiled, text: str, min_total_ns: int = 2_000_000, max_runs: int = 5) -> int:
+    """search 1회 최소 소요 시간 (짧으면 여러 번 재어 최소값)"""
+    best = None
+    total = 0
+    for _ in range(max_runs):
+        start = perf_counter_ns()
+        compiled.search(text)
+        elapsed = perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+        total += elapsed
+        if total >= min_total_ns:
+            break
+    return best
+
+
+def _slope(points: List[Tuple[int, int]]) -> float:
+    """log(time) ~ log(length) 최소제곱 기울기"""
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(max(ns, 1)) for _, ns in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var if var else 0.0
+
+
+def growth(compiled, unit: str, sizes: Sequence[int] = DEFAULT_SIZES,
+           max_ns: int = 500_000_000) -> Tuple[float, List[Tuple[int, int]]]:
+    """
+    unit 반복 입력 길이별 search 시간 → (growth exponent, [(길이, ns)])
+
+    한 측정이 max_ns를 넘으면 더 긴 입력은 건너뜀 (이미 충분히 느림).
+    """
+    points = []
+    for size in sizes:
+        text = (unit * (size // len(unit) + 1))[:size]
+        elapsed = _search_ns(compiled, text)
+        points.append((size, elapsed))
+        if elapsed > max_ns:
+            break
+    return (_slope(points) if len(points) >= 2 else 0.0), points
+
+
+def time_corpus(compiled, texts: Sequence[str]) -> dict:
+    total = 0
+    worst = 0
+    worst_len = 0
+    hits = 0
+    for text in texts:
+        start = perf_counter_ns()
+        matched = compiled.search(text) is not None
+        elapsed = perf_counter_ns() - start
+        total += elapsed
+        hits += matched
+        if elapsed > worst:
+            worst, worst_len = elapsed, len(text)
+    return {
+        "inputs": len(texts),
+        "hits": hits,
+        "total_ms": round(total / 1e6, 3),
+        "mean_us": round(total / 1000 / len(texts), 3) if texts else 0.0,
+        "max_us": round(worst / 1000, 3),
+        "max_input_len": worst_len,
+    }
+
+
+def analyze_pattern(entry: PatternEntry, texts: Sequence[str], sizes: Sequence[int] = DEFAULT_SIZES,
+                    slow_us: float = 1000.0, exponent: float = 1.5, min_us: float = 200.0) -> dict:
+    """패턴 1개 비용 보고 (corpus 시간 + growth exponent + flags)"""
+    corpus = time_corpus(entry.compiled, texts)
+
+    units = [(f"pump:{unit}", unit) for unit in pump_strings(entry.pattern, entry.flags)]
+    if texts:
+        sample = '\n'.join(texts[:50])
+        units.append(("corpus", sample))
+    worst = {"exponent": 0.0, "input": None, "points": []}
+    super_linear = False
+    for label, unit in units:
+        slope, points = growth(entry.compiled, unit, sizes)
+        if slope > worst["exponent"]:
+            worst = {"exponent": round(slope, 2), "input": label, "points": points}
+        if slope >= exponent and points[-1][1] / 1000 >= min_us:
+            # 이미 super-linear 확정 → 나머지 입력은 측정하지 않음
+            worst = {"exponent": round(slope, 2), "input": label, "points": points}
+            super_linear = True
+            break
+
+    flags = []
+    if super_linear:
+        flags.append("super_linear")
+    if corpus["max_us"] > slow_us:
+        flags.append("slow")
+
+    return {
+        "pattern": entry.pattern,
+        "flags_re": entry.flags,
+        "scope": entry.scope,
+        "sources": entry.sources,
+        "corpus": corpus,
+        "growth": {
+            "exponent": worst["exponent"],
+            "input": worst["input"],
+            "points_us": [[n, round(ns / 1000, 3)] for n, ns in worst["points"]],
+        },
+        "flags": flags,
+    }
+
+
+def analyze(entries: Sequence[PatternEntry], texts: Sequence[str], sizes: Sequence[int] = DEFAULT_SIZES,
+            slow_us: float = 1000.0, exponent: float = 1.5, min_us: float = 200.0) -> List[dict]:
+    """scope별 입력(chunk 전체 / 라인)으로 전체 패턴 분석, flag → corpus 총 시간 내림차순"""
+    lines = corpus_lines(texts)
+    results = [analyze_pattern(entry, lines if entry.scope == "line" else texts, sizes, slow_us, exponent, min_us)
+               for entry in entries]
+    results.sort(key=lambda r: (-len(r["flags"]), -r["corpus"]["total_ms"]))
+    return results
+
+
+def format_report(results: List[dict]) -> List[str]:
+    lines = [f"{'flags':<20} {'exp':>5} {'total ms':>9} {'mean us':>8} {'max us':>9} {'hits':>6} "
+             f"{'scope':<5}  pattern  [sources]"]
+    for r in results:
+        corpus = r["corpus"]
+        sources = r["sources"][0] + (f" +{len(r['sources']) - 1}" if len(r["sources"]) > 1 else "")
+        pattern = r["pattern"] if len(r["pattern"]) <= 60 else r["pattern"][:57] + "..."
+        lines.append(f"{','.join(r['flags']) or '-':<20} {r['growth']['exponent']:>5.2f} {corpus['total_ms']:>9.3f} "
+                     f"{corpus['mean_us']:>8.2f} {corpus['max_us']:>9.1f} {corpus['hits']:>6d} "
+                     f"{r['scope']:<5}  {pattern}  [{sources}]")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regex cost analyzer for coverage profile / slot patterns")
+    parser.add_argument("--corpus", action="append", type=Path,
+                        help="Corpus file (.jsonl or plain text); repeatable. Default: data/evidence_pack/*.jsonl")
+    parser.add_argument("--chunk-chars", type=int, default=DEFAULT_CHUNK_CHARS,
+                        help="Also build long chunks of ~N chars from joined snippets (0 disables)")
+    parser.add_argument("--sizes", default=",".join(str(n) for n in DEFAULT_SIZES),
+                        help="Input lengths for the growth test (comma-separated)")
+    parser.add_argument("--slow-us", type=float, default=1000.0, help="Flag patterns whose worst corpus search exceeds this")
+    parser.add_argument("--exponent", type=float, default=1.5, help="Flag patterns whose growth exponent reaches this")
+    parser.add_argument("--min-us", type=float, default=200.0,
+                        help="Ignore growth below this time at the largest size (timer noise)")
+    parser.add_argument("--json", type=Path, help="Write the full report as JSON")
+    parser.add_argument("--fail-on-flag", action="store_true", help="Exit 1 if any pattern is flagged")
+    args = parser.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    texts = load_corpus(args.corpus, args.chunk_chars)
+    entries = collect_patterns()
+    print(f"Patterns: {len(entries)}  corpus: {len(texts)} texts "
+          f"(max {max((len(t) for t in texts), default=0)} chars)  sizes: {sizes}")
+
+    results = analyze(entries, texts, sizes, args.slow_us, args.exponent, args.min_us)
+    for line in format_report(results):
+        print(line)
+
+    flagged = [r for r in results if r["flags"]]
+    print(f"\nFlagged: {len(flagged)} / {len(results)}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"sizes": sizes, "corpus_texts": len(texts), "patterns": results}, f, ensure_ascii=False, indent=2)
+        print(f"Report: {args.json}")
+    if args.fail_on_flag and flagged:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
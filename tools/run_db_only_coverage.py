@@ -9,257 +9,397 @@ Usage:
     --as_of_date 2025-11-26 \\
     --ins_cds N01,N08 \\
     --skip-chunks
+
+  # 여러 coverage 병렬 (connection pool + gate process pool)
+  python3 tools/run_db_only_coverage.py \\
+    --all-profiled --as_of_date 2025-11-26 --jobs 8 --io-jobs 4
+
+  # Postgres 없이 SQLite stand-in (tools/coverage_store_cli.py load로 적재)
+  python3 tools/run_db_only_coverage.py \\
+    --coverage_code A4210 --as_of_date 2025-11-26 --sqlite /tmp/ssot.db
 """
 
 import argparse
+import hashlib
 import json
 import logging
-import re
 import sys
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Tuple
-
-import psycopg2
-import psycopg2.extras
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from tools.coverage_profiles import get_profile
+from core.regex_budget import RegexBudget, record_regex_overruns
+from tools.coverage_profiles import COVERAGE_PROFILES, describe_load_report, get_profile
+from tools.coverage_store import (  # noqa: F401 (re-export)
+    DB_CONFIG, STREAM_ITERSIZE, CoverageStore, StorePool, open_store
+)
+from tools.gate_engine import (  # noqa: F401 (re-export)
+    GateContext, GateEngine, apply_gates, select_slot_chunks, select_slot_chunks_instrumented
+)
+from tools.gate_stats import GATE_ORDER, GateStats, gate_order_for, record_gate_stats
+from tools.incremental_slots import SlotPlan, build_slot_plan, chunks_checksum, gate_state_changes
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
-DB_CONFIG = {
-    "host": "localhost",
-    "port": 5433,
-    "dbname": "inca_ssot",
-    "user": "postgres",
-    "password": "postgres"
-}
+SLOT_KEYS = ["waiting_period", "exclusions", "subtype_coverage_map"]
+
+EMPTY_MAPPING = {"anchors": [], "coverage_name": ""}
+
+DEFAULT_GATE_VERSION = "GATE_SSOT_V2_CONTEXT_GUARD"
+
+
+def _sha256_json(obj) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def profile_hash(profile: Optional[dict]) -> str:
+    """profile 내용 hash (키 순서 무관)"""
+    return _sha256_json(profile or {})
+
+
+def generation_fingerprint(inputs: dict) -> str:
+    """fingerprint 입력(dict) → sha256"""
+    return _sha256_json(inputs)
 
-class GateContext:
-    def __init__(self, coverage_code: str, ins_cd: str, anchors: List[str], coverage_name: str, profile: dict = None):
-        self.coverage_code = coverage_code
-        self.ins_cd = ins_cd
-        self.anchors = anchors
-        self.coverage_name = coverage_name
-        self.profile = profile or {}
-
-    def get_required_terms(self, slot_key: str) -> List[str]:
-        return self.profile.get("required_terms_by_slot", {}).get(slot_key, [])
-
-    def get_hard_negatives(self) -> List[str]:
-        return self.profile.get("hard_negative_terms_global", [])
-
-    def get_section_negatives(self) -> List[str]:
-        return self.profile.get("section_negative_terms_global", [])
-
-    def get_diagnosis_signals(self) -> List[str]:
-        return self.profile.get("diagnosis_signal_terms_global", [])
-
-    def get_slot_negatives(self, slot_key: str) -> List[str]:
-        return self.profile.get("slot_specific_negatives", {}).get(slot_key, [])
-
-
-def apply_gates(slot_key: str, chunk_text: str, excerpt: str, ctx: GateContext) -> Tuple[bool, List[str]]:
-    """Apply 7-gate validation to chunk"""
-    reasons = []
-
-    # GATE 1: Anchor in excerpt
-    if not any(anchor in excerpt for anchor in ctx.anchors):
-        reasons.append("no_anchor_in_excerpt")
-        return False, reasons
-
-    # GATE 2: Hard-negative check
-    for pattern in ctx.get_hard_negatives():
-        if re.search(pattern, chunk_text):
-            reasons.append(f"hard_negative:{pattern}")
-            return False, reasons
-
-    # GATE 3: Section-negative check
-    for pattern in ctx.get_section_negatives():
-        if re.search(pattern, chunk_text):
-            reasons.append(f"section_negative:{pattern}")
-            return False, reasons
-
-    # GATE 4: Diagnosis-signal required
-    has_signal = False
-    for pattern in ctx.get_diagnosis_signals():
-        if re.search(pattern, chunk_text):
-            has_signal = True
-            break
-    if not has_signal:
-        reasons.append("no_diagnosis_signal")
-        return False, reasons
-
-    # GATE 5: Coverage name lock
-    normalized_name = re.sub(r'\s+', '', ctx.coverage_name)
-    normalized_text = re.sub(r'\s+', '', chunk_text)
-    if normalized_name not in normalized_text:
-        core_tokens = []
-        if "유사암" in ctx.coverage_name:
-            core_tokens.append("유사암")
-        if "진단비" in ctx.coverage_name:
-            core_tokens.append("진단비")
-        if "경계성종양" in ctx.coverage_name:
-            core_tokens.append("경계성종양")
-
-        required_count = min(2, len(core_tokens))
-        matched_count = sum(1 for token in core_tokens if token in chunk_text)
-        if matched_count < required_count:
-            reasons.append("coverage_name_lock_failed")
-            return False, reasons
-
-    # GATE 6: Slot-specific keywords
-    required_terms = ctx.get_required_terms(slot_key)
-    if required_terms:
-        has_required = any(re.search(term, chunk_text) for term in required_terms)
-        if not has_required:
-            reasons.append(f"no_required_terms_for_{slot_key}")
-            return False, reasons
-
-    # GATE 7: Slot-specific negatives
-    for pattern in ctx.get_slot_negatives(slot_key):
-        if re.search(pattern, chunk_text):
-            reasons.append(f"slot_specific_negative:{pattern}")
-            return False, reasons
-
-    return True, []
+
+def gate_context_hash(profile: Optional[dict], mapping: dict) -> str:
+    """ins_cd 1개의 gate 판정 입력 hash (gate_version + profile + anchor / 담보명)"""
+    gate_version = profile.get("gate_version", DEFAULT_GATE_VERSION) if profile else DEFAULT_GATE_VERSION
+    return _sha256_json({"gate_version": gate_version, "profile_hash": profile_hash(profile), "mapping": mapping})
 
 
 class DBOnlyCoveragePipeline:
-    def __init__(self, coverage_code: str, as_of_date: str, ins_cds: List[str], skip_chunks: bool = False):
+    def __init__(self, coverage_code: str, as_of_date: str, ins_cds: Optional[List[str]] = None,
+                 skip_chunks: bool = False, store: Optional[CoverageStore] = None,
+                 adaptive_gates: bool = True, record_stats: bool = False, sqlite_path: Optional[str] = None,
+                 force: bool = False, itersize: int = STREAM_ITERSIZE, regex_budget_us: Optional[float] = None):
+        """
+        Args:
+            ins_cds: 대상 보험사 코드 (None이면 coverage_mapping_ssot의 전체 ins_cd)
+            store: 외부(StorePool 등) store. 주어지면 close() 시 닫지 않음
+            adaptive_gates: data/coverage_gate_stats.json 통계로 gate 평가 순서 결정
+            record_stats: gate별 비용 / 탈락률을 기록하여 실행 종료 시 통계 파일에 누적
+            sqlite_path: store 미지정 시 SQLite stand-in 사용 (None이면 Postgres DB_CONFIG)
+            force: generation fingerprint가 최신 compare_table_v2와 같아도 재생성 (incremental 상태 무시, 전체 재판정)
+            itersize: 후보 chunk 스트리밍 batch 크기 (cursor fetch / chunk_text 조회 단위)
+            regex_budget_us: gate 패턴 search 1회당 time budget(µs). 초과 패턴을 기록하여
+                실행 종료 시 data/regex_budget_overruns.json에 누적 (판정 결과 불변)
+        """
         self.coverage_code = coverage_code
         self.as_of_date = as_of_date
         self.ins_cds = ins_cds
         self.skip_chunks = skip_chunks
-        self.conn = None
-        self.cur = None
+        self.store = store
+        self._owns_store = store is None
+        self.sqlite_path = sqlite_path
+        self.adaptive_gates = adaptive_gates
+        self.gate_stats = GateStats() if record_stats else None
+        self.regex_budget_us = regex_budget_us
+        self.regex_budget = RegexBudget(regex_budget_us) if regex_budget_us is not None else None
+        self.force = force
+        self.fingerprint_inputs: Optional[dict] = None
+        self.itersize = itersize
+        self.slot_plans: Optional[Dict[str, SlotPlan]] = None
+        self.chunk_hashes: Optional[Dict[str, Dict[int, str]]] = None
+        self._gate_state: Dict[str, Dict[int, Tuple[str, str]]] = {}
+        self._gate_hashes: Dict[str, str] = {}
+
+    def profile_id(self) -> str:
+        profile = get_profile(self.coverage_code)
+        return profile.get("profile_id", f"{self.coverage_code}_DEFAULT") if profile else f"{self.coverage_code}_DEFAULT"
+
+    def gate_order(self) -> List[str]:
+        return gate_order_for(self.profile_id()) if self.adaptive_gates else list(GATE_ORDER)
+
+    def gate_chunks(self, candidates: Iterable[dict], ctx: GateContext, order: List[str],
+                    plan: Optional[SlotPlan] = None) -> Dict[str, dict]:
+        """후보 chunk gate 판정 (record_stats / regex_budget_us면 통계 / budget 초과 누적)"""
+        if self.gate_stats is None and self.regex_budget is None:
+            return select_slot_chunks(SLOT_KEYS, candidates, ctx, order, plan)
+        found, stats, budget = select_slot_chunks_instrumented(
+            SLOT_KEYS, candidates, ctx, order, plan,
+            record_stats=self.gate_stats is not None, budget_us=self.regex_budget_us
+        )
+        self.merge_instrumentation(stats, budget)
+        return found
+
+    def merge_instrumentation(self, stats: Optional[GateStats], budget: Optional[RegexBudget]):
+        if stats is not None:
+            self.gate_stats.merge(stats)
+        if budget is not None:
+            self.regex_budget.merge(budget)
+
+    def save_gate_stats(self):
+        if self.gate_stats is not None:
+            path = record_gate_stats(self.profile_id(), self.gate_stats)
+            logger.info(f"📈 Gate stats recorded: {path}")
+
+    def save_regex_overruns(self):
+        if self.regex_budget is None:
+            return
+        if not self.regex_budget.overruns:
+            logger.info(f"⏱️  No gate pattern exceeded the regex budget ({self.regex_budget_us}us)")
+            return
+        logger.warning(f"⏱️  {len(self.regex_budget.overruns)} gate patterns exceeded the regex budget "
+                       f"({self.regex_budget_us}us):")
+        for line in self.regex_budget.summary():
+            logger.warning(f"   {line}")
+        path = record_regex_overruns(self.regex_budget)
+        logger.info(f"⏱️  Regex budget overruns recorded: {path}")
 
     def connect(self):
-        conn_str = f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['dbname']}"
-        logger.info(f"Connecting to DB: {conn_str}")
-        self.conn = psycopg2.connect(**DB_CONFIG)
-        self.cur = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-        logger.info(f"✅ Connected to: {DB_CONFIG['dbname']}")
+        if not self._owns_store:
+            return
+        if self.sqlite_path:
+            logger.info(f"Connecting to SQLite store: {self.sqlite_path}")
+        else:
+            conn_str = f"postgresql://{DB_CONFIG['user']}:{DB_CONFIG['password']}@{DB_CONFIG['host']}:{DB_CONFIG['port']}/{DB_CONFIG['dbname']}"
+            logger.info(f"Connecting to DB: {conn_str}")
+        self.store = open_store(self.sqlite_path)
+        logger.info(f"✅ Connected to: {self.sqlite_path or DB_CONFIG['dbname']} ({self.store.backend})")
 
     def close(self):
-        if self.cur:
-            self.cur.close()
-        if self.conn:
-            self.conn.close()
-
-    def get_anchor_keywords(self, ins_cd: str) -> List[str]:
-        self.cur.execute("""
-            SELECT anchor_keywords FROM coverage_mapping_ssot
-            WHERE coverage_code = %s AND ins_cd = %s
-        """, (self.coverage_code, ins_cd))
-        row = self.cur.fetchone()
-        return row['anchor_keywords'] if row else []
-
-    def get_coverage_name(self, ins_cd: str) -> str:
-        self.cur.execute("""
-            SELECT insurer_coverage_name FROM coverage_mapping_ssot
-            WHERE coverage_code = %s AND ins_cd = %s
-        """, (self.coverage_code, ins_cd))
-        row = self.cur.fetchone()
-        return row['insurer_coverage_name'] if row else ""
+        if self.store and self._owns_store:
+            self.store.close()
+
+    def ensure_partitions(self):
+        """as_of_date partition 준비 (schema/050, 짧은 트랜잭션으로 먼저 commit)"""
+        self.store.ensure_partitions(self.as_of_date)
+        self.store.commit()
+
+    def resolve_ins_cds(self) -> List[str]:
+        """--ins_cds 미지정 시 coverage_mapping_ssot에 매핑된 전체 ins_cd"""
+        if self.ins_cds is None:
+            self.ins_cds = self.store.mapped_ins_cds(self.coverage_code)
+        return self.ins_cds
+
+    def load_mappings(self) -> Dict[str, dict]:
+        """ins_cds 전체의 anchor_keywords / insurer_coverage_name을 1회 조회"""
+        return self.store.load_mappings(self.coverage_code, self.resolve_ins_cds())
+
+    def compute_fingerprint(self, mappings: Optional[Dict[str, dict]] = None) -> str:
+        """
+        generation fingerprint 계산 (gate 판정 전, chunk 조회 전에 호출)
+
+        입력: gate_version, profile 내용 hash, 대상 ins_cds + mapping(anchor / 담보명),
+        대상 coverage_chunk checksum (행 수, max chunk_id, chunk_hash 목록 md5)
+
+        chunk_hash는 1회만 조회하여 self.chunk_hashes에 두고 plan_regate가 재사용한다.
+        """
+        profile = get_profile(self.coverage_code)
+        if mappings is None:
+            mappings = self.load_mappings()
+        ins_cds = self.resolve_ins_cds()
+        self.chunk_hashes = self.store.chunk_hashes(self.coverage_code, self.as_of_date, ins_cds)
+        self.fingerprint_inputs = {
+            "gate_version": profile.get("gate_version", DEFAULT_GATE_VERSION) if profile else DEFAULT_GATE_VERSION,
+            "profile_id": self.profile_id(),
+            "profile_hash": profile_hash(profile),
+            "ins_cds": list(ins_cds),
+            "mapping_hash": _sha256_json({ins_cd: mappings.get(ins_cd, EMPTY_MAPPING) for ins_cd in ins_cds}),
+            "chunks": chunks_checksum(self.chunk_hashes),
+        }
+        return generation_fingerprint(self.fingerprint_inputs)
+
+    def is_up_to_date(self, fingerprint: str) -> bool:
+        """최신 compare_table_v2의 generation fingerprint와 일치하면 True (--force면 항상 False)"""
+        if self.force:
+            return False
+        payload = self.store.latest_compare_payload(self.coverage_code, self.as_of_date)
+        latest = (payload or {}).get("debug", {}).get("generation_fingerprint")
+        return latest == fingerprint
+
+    def plan_regate(self, mappings: Dict[str, dict], profile: Optional[dict],
+                    hashes: Optional[Dict[str, Dict[int, str]]] = None) -> Dict[str, SlotPlan]:
+        """
+        ins_cd별 incremental 재판정 계획 (tools/incremental_slots.py)
+
+        evidence_gate_state / evidence_slot.chunk_hash와 현재 chunk hash를 비교한다.
+        --force면 상태를 무시하고 전체 재판정.
+
+        Args:
+            hashes: compute_fingerprint가 조회한 chunk_hashes (None이면 조회)
+        """
+        ins_cds = self.resolve_ins_cds()
+        if hashes is None:
+            hashes = self.store.chunk_hashes(self.coverage_code, self.as_of_date, ins_cds)
+        self._gate_state = {} if self.force else self.store.load_gate_state(self.coverage_code, self.as_of_date)
+        winners = self.store.load_slot_winners(self.coverage_code, self.as_of_date)
+        self._gate_hashes = {
+            ins_cd: gate_context_hash(profile, mappings.get(ins_cd, EMPTY_MAPPING)) for ins_cd in ins_cds
+        }
+        self.slot_plans = {
+            ins_cd: build_slot_plan(SLOT_KEYS, hashes.get(ins_cd, {}), self._gate_state.get(ins_cd, {}),
+                                    self._gate_hashes[ins_cd], winners.get(ins_cd, {}))
+            for ins_cd in ins_cds
+        }
+        for ins_cd, plan in self.slot_plans.items():
+            logger.info(f"  [{self.coverage_code}/{ins_cd}] Re-gate plan: {plan.summary()}")
+        return self.slot_plans
+
+    def write_gate_state(self):
+        """이번 판정 기준으로 evidence_gate_state 갱신 (변경분만)"""
+        upserts, removed = [], []
+        for ins_cd, plan in self.slot_plans.items():
+            ins_upserts, ins_removed = gate_state_changes(
+                ins_cd, plan, self._gate_state.get(ins_cd, {}), self._gate_hashes[ins_cd])
+            upserts.extend(ins_upserts)
+            removed.extend(ins_removed)
+        upserted, deleted = self.store.write_gate_state(self.coverage_code, self.as_of_date, self.ins_cds,
+                                                        upserts, removed)
+        logger.info(f"  evidence_gate_state upserted={upserted}, deleted={deleted}")
 
     def get_chunk_count(self) -> int:
-        self.cur.execute("""
-            SELECT COUNT(*) FROM coverage_chunk
-            WHERE coverage_code = %s AND as_of_date = %s
-        """, (self.coverage_code, self.as_of_date))
-        return self.cur.fetchone()['count']
-
-    def delete_existing_slots(self):
-        logger.info("🗑️  Deleting existing evidence_slot and compare_table_v2...")
-        self.cur.execute("DELETE FROM evidence_slot WHERE coverage_code = %s AND as_of_date = %s",
-                        (self.coverage_code, self.as_of_date))
-        slot_count = self.cur.rowcount
-        self.cur.execute("DELETE FROM compare_table_v2 WHERE coverage_code = %s AND as_of_date = %s",
-                        (self.coverage_code, self.as_of_date))
-        table_count = self.cur.rowcount
-        self.conn.commit()
-        logger.info(f"✅ Deleted {slot_count} evidence_slot rows, {table_count} compare_table_v2 rows")
-
-    def generate_evidence_slots(self) -> Dict[str, int]:
+        return self.store.count_chunks(self.coverage_code, self.as_of_date)
+
+    def delete_existing_compare_table(self):
+        logger.info("🗑️  Deleting existing compare_table_v2...")
+        deleted = self.store.delete_compare_tables(self.coverage_code, self.as_of_date)
+        logger.info(f"✅ Deleted {deleted} compare_table_v2 rows")
+
+    def gate_context(self, ins_cd: str, mapping: dict, profile: dict) -> GateContext:
+        return GateContext(
+            coverage_code=self.coverage_code,
+            ins_cd=ins_cd,
+            anchors=mapping["anchors"],
+            coverage_name=mapping["coverage_name"],
+            profile=profile
+        )
+
+    def fetch_candidates(self, ins_cd: str, ctx: GateContext) -> List[dict]:
+        """GATE 1-3 pushdown: 후보 chunk만 전송 (최종 판정은 apply_gates)"""
+        total_count = self.store.count_chunks(self.coverage_code, self.as_of_date, ins_cd)
+        candidates = self.store.fetch_candidates(
+            self.coverage_code, self.as_of_date, ins_cd,
+            ctx.anchors, ctx.get_hard_negatives(), ctx.get_section_negatives()
+        )
+        logger.info(f"  [{self.coverage_code}/{ins_cd}] Filtered chunks: {len(candidates)}/{total_count} "
+                    f"(anchor-matched, negatives pushed down)")
+        return candidates
+
+    def stream_candidates(self, ins_cd: str, ctx: GateContext, plan: Optional[SlotPlan] = None) -> Iterator[dict]:
+        """
+        GATE 1-3 pushdown 후보 chunk 스트리밍 (fetch_candidates와 같은 chunk, 같은 순서)
+
+        excerpt / page_number만 itersize 행씩 받고, anchor가 excerpt에 있는 행의 chunk_text만
+        batch 단위로 조회한다. gate가 모든 slot을 찾아 소비를 멈추면(close) 이후 batch는
+        조회하지 않는다 → 메모리는 batch 1개분 chunk_text로 제한.
+        plan이 주어지면 재판정 대상이 아닌 chunk는 건너뛰고, 유지되는 winner는 chunk_text 없이 전달.
+        """
+        total_count = self.store.count_chunks(self.coverage_code, self.as_of_date, ins_cd)
+        rows = self.store.iter_candidate_excerpts(
+            self.coverage_code, self.as_of_date, ins_cd,
+            ctx.anchors, ctx.get_hard_negatives(), ctx.get_section_negatives(), itersize=self.itersize
+        )
+        scanned = fetched = 0
+        try:
+            batch = []
+            for row in rows:
+                scanned += 1
+                if plan is not None and not plan.needs_chunk_text(SLOT_KEYS, row['chunk_id']):
+                    if row['chunk_id'] in plan.kept.values():
+                        yield from self._with_chunk_text(batch)
+                        fetched += len(batch)
+                        batch = []
+                        yield row
+                    continue
+                # GATE 1(anchor in excerpt) 탈락 행은 chunk_text 불필요
+                if any(anchor in row['excerpt'] for anchor in ctx.anchors):
+                    batch.append(row)
+                if len(batch) >= self.itersize:
+                    fetched += len(batch)
+                    yield from self._with_chunk_text(batch)
+                    batch = []
+            if batch:
+                fetched += len(batch)
+                yield from self._with_chunk_text(batch)
+        finally:
+            rows.close()
+            logger.info(f"  [{self.coverage_code}/{ins_cd}] Streamed chunks: scanned={scanned}, "
+                        f"chunk_text fetched={fetched}, total={total_count}")
+
+    def _with_chunk_text(self, batch: List[dict]) -> Iterator[dict]:
+        if not batch:
+            return
+        texts = self.store.fetch_chunk_texts([row['chunk_id'] for row in batch], self.as_of_date)
+        for row in batch:
+            row['chunk_text'] = texts[row['chunk_id']]
+            yield row
+
+    def generate_evidence_slots(self, found_by_ins: Optional[Dict[str, Dict[str, dict]]] = None) -> Dict[str, int]:
+        """
+        evidence_slot 생성
+
+        Args:
+            found_by_ins: ins_cd → select_slot_chunks 결과 (병렬 실행기가 미리 gate한 경우).
+                None이면 insurer 순서대로 후보 스트리밍 + gate (모든 slot FOUND 시 조기 종료)
+        """
         profile = get_profile(self.coverage_code)
-        gate_version = profile.get("gate_version", "GATE_SSOT_V2_CONTEXT_GUARD") if profile else "GATE_SSOT_V2_CONTEXT_GUARD"
+        gate_version = profile.get("gate_version", DEFAULT_GATE_VERSION) if profile else DEFAULT_GATE_VERSION
         profile_id = profile.get("profile_id", f"{self.coverage_code}_DEFAULT") if profile else f"{self.coverage_code}_DEFAULT"
 
         logger.info(f"🔍 Generating evidence_slot for {self.coverage_code}...")
         logger.info(f"  Profile: {profile_id}")
         logger.info(f"  Gate version: {gate_version}")
 
-        slot_keys = ["waiting_period", "exclusions", "subtype_coverage_map"]
         stats = {"FOUND": 0, "NOT_FOUND": 0, "DROPPED": 0}
 
+        if found_by_ins is None:
+            mappings = self.load_mappings()
+            self.plan_regate(mappings, profile, self.chunk_hashes)
+            order = self.gate_order()
+            logger.info(f"  Gate order: {order}")
+            found_by_ins = {}
+            for ins_cd in self.ins_cds:
+                logger.info(f"Processing {ins_cd}...")
+                mapping = mappings.get(ins_cd, EMPTY_MAPPING)
+                logger.info(f"  Anchors: {mapping['anchors']}")
+                logger.info(f"  Coverage name: {mapping['coverage_name']}")
+
+                ctx = self.gate_context(ins_cd, mapping, profile)
+                plan = self.slot_plans[ins_cd]
+                with closing(self.stream_candidates(ins_cd, ctx, plan)) as candidates:
+                    found_by_ins[ins_cd] = self.gate_chunks(candidates, ctx, order, plan)
+
+        slot_rows = []
         for ins_cd in self.ins_cds:
-            logger.info(f"Processing {ins_cd}...")
-            anchors = self.get_anchor_keywords(ins_cd)
-            coverage_name = self.get_coverage_name(ins_cd)
-            logger.info(f"  Anchors: {anchors}")
-            logger.info(f"  Coverage name: {coverage_name}")
-
-            self.cur.execute("""
-                SELECT chunk_id, chunk_text, excerpt, page_number
-                FROM coverage_chunk
-                WHERE coverage_code = %s AND as_of_date = %s AND ins_cd = %s
-            """, (self.coverage_code, self.as_of_date, ins_cd))
-            all_chunks = self.cur.fetchall()
-
-            anchor_matched = [c for c in all_chunks if any(a in c['excerpt'] for a in anchors)]
-            logger.info(f"  Filtered chunks: {len(anchor_matched)}/{len(all_chunks)} (anchor-matched)")
-
-            ctx = GateContext(
-                coverage_code=self.coverage_code,
-                ins_cd=ins_cd,
-                anchors=anchors,
-                coverage_name=coverage_name,
-                profile=profile
-            )
-
-            for slot_key in slot_keys:
-                found_chunk = None
-                for chunk in anchor_matched:
-                    passed, reasons = apply_gates(slot_key, chunk['chunk_text'], chunk['excerpt'], ctx)
-                    if passed:
-                        found_chunk = chunk
-                        break
-
+            found = found_by_ins.get(ins_cd, {})
+            hashes = self.slot_plans[ins_cd].hashes if self.slot_plans else {}
+            for slot_key in SLOT_KEYS:
+                found_chunk = found.get(slot_key)
                 if found_chunk:
-                    self.cur.execute("""
-                        INSERT INTO evidence_slot (coverage_code, as_of_date, ins_cd, slot_key, chunk_id, excerpt, page_number, status, gate_version)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, 'FOUND', %s)
-                    """, (self.coverage_code, self.as_of_date, ins_cd, slot_key, found_chunk['chunk_id'],
-                          found_chunk['excerpt'], found_chunk['page_number'], gate_version))
+                    slot_rows.append((self.coverage_code, self.as_of_date, ins_cd, slot_key, found_chunk['chunk_id'],
+                                      found_chunk['excerpt'], found_chunk['page_number'], 'FOUND', gate_version,
+                                      hashes.get(found_chunk['chunk_id'])))
                     stats["FOUND"] += 1
                 else:
                     stats["NOT_FOUND"] += 1
 
-        self.conn.commit()
+        upserted, deleted = self.store.write_evidence_slots(self.coverage_code, self.as_of_date, slot_rows)
         logger.info(f"✅ Created slots: FOUND={stats['FOUND']}, NOT_FOUND={stats['NOT_FOUND']}, DROPPED={stats['DROPPED']}")
+        logger.info(f"  evidence_slot upserted={upserted}, stale deleted={deleted}")
+        if self.slot_plans is not None:
+            self.write_gate_state()
         return stats
 
     def generate_compare_table(self) -> int:
         logger.info(f"📊 Generating compare_table_v2 for {self.coverage_code}...")
 
         profile = get_profile(self.coverage_code)
-        gate_version = profile.get("gate_version", "GATE_SSOT_V2_CONTEXT_GUARD") if profile else "GATE_SSOT_V2_CONTEXT_GUARD"
+        gate_version = profile.get("gate_version", DEFAULT_GATE_VERSION) if profile else DEFAULT_GATE_VERSION
         profile_id = profile.get("profile_id", f"{self.coverage_code}_DEFAULT") if profile else f"{self.coverage_code}_DEFAULT"
 
-        self.cur.execute("""
-            SELECT ins_cd, slot_key, excerpt, status
-            FROM evidence_slot
-            WHERE coverage_code = %s AND as_of_date = %s
-            ORDER BY ins_cd, slot_key
-        """, (self.coverage_code, self.as_of_date))
+        rows = self.store.load_evidence_slots(self.coverage_code, self.as_of_date)
 
         slots_by_insurer = {}
-        for row in self.cur.fetchall():
+        for row in rows:
             ins_cd = row['ins_cd']
             if ins_cd not in slots_by_insurer:
                 slots_by_insurer[ins_cd] = {}
@@ -281,31 +421,19 @@ class DBOnlyCoveragePipeline:
                 "chunk_rowcount_at_generation": self.get_chunk_count()
             }
         }
+        if self.fingerprint_inputs is not None:
+            payload["debug"]["generation_fingerprint"] = generation_fingerprint(self.fingerprint_inputs)
+            payload["debug"]["fingerprint_inputs"] = self.fingerprint_inputs
 
-        self.cur.execute("""
-            INSERT INTO compare_table_v2 (coverage_code, as_of_date, payload)
-            VALUES (%s, %s, %s)
-            RETURNING table_id
-        """, (self.coverage_code, self.as_of_date, json.dumps(payload)))
-
-        table_id = self.cur.fetchone()['table_id']
-        self.conn.commit()
+        table_id = self.store.insert_compare_table(self.coverage_code, self.as_of_date, payload)
         logger.info(f"✅ Created compare_table_v2: table_id={table_id}")
         return table_id
 
     def verify(self):
         logger.info("🔍 Verifying...")
-        self.cur.execute("SELECT COUNT(*) FROM coverage_chunk WHERE coverage_code = %s AND as_of_date = %s",
-                        (self.coverage_code, self.as_of_date))
-        chunk_count = self.cur.fetchone()['count']
-
-        self.cur.execute("SELECT COUNT(*) FROM evidence_slot WHERE coverage_code = %s AND as_of_date = %s",
-                        (self.coverage_code, self.as_of_date))
-        slot_count = self.cur.fetchone()['count']
-
-        self.cur.execute("SELECT COUNT(*) FROM compare_table_v2 WHERE coverage_code = %s AND as_of_date = %s",
-                        (self.coverage_code, self.as_of_date))
-        table_count = self.cur.fetchone()['count']
+        chunk_count = self.store.count_rows("coverage_chunk", self.coverage_code, self.as_of_date)
+        slot_count = self.store.count_rows("evidence_slot", self.coverage_code, self.as_of_date)
+        table_count = self.store.count_rows("compare_table_v2", self.coverage_code, self.as_of_date)
 
         logger.info("📊 Results:")
         logger.info(f"  coverage_chunk: {chunk_count}")
@@ -313,40 +441,262 @@ class DBOnlyCoveragePipeline:
         logger.info(f"  compare_table_v2: {table_count}")
         logger.info("✅ VERIFICATION PASSED")
 
-    def run(self):
+    def write_all(self, found_by_ins: Optional[Dict[str, Dict[str, dict]]] = None):
+        """evidence_slot upsert + compare_table_v2 교체를 advisory lock 하의 단일 트랜잭션으로 기록"""
+        try:
+            self.store.lock_coverage(self.coverage_code, self.as_of_date)
+            self.delete_existing_compare_table()
+            self.generate_evidence_slots(found_by_ins)
+            self.generate_compare_table()
+            self.store.commit()
+        except Exception:
+            self.store.rollback()
+            raise
+
+    def run(self) -> bool:
+        """
+        Returns:
+            bool: 재생성했으면 True, fingerprint 일치로 건너뛰었으면 False
+        """
         try:
             self.connect()
 
             if self.skip_chunks:
                 logger.info("⏭️  Skipping chunk generation (--skip-chunks)")
+            self.ensure_partitions()
 
-            self.delete_existing_slots()
-            self.generate_evidence_slots()
-            self.generate_compare_table()
+            fingerprint = self.compute_fingerprint()
+            if self.is_up_to_date(fingerprint):
+                self.store.rollback()
+                logger.info(f"⏭️  Up to date (generation fingerprint {fingerprint[:12]}), skipping regeneration")
+                return False
+
+            self.write_all()
             self.verify()
+            self.save_gate_stats()
+            self.save_regex_overruns()
 
             logger.info("✅ PIPELINE COMPLETED")
+            return True
         finally:
             self.close()
 
 
+class MultiCoverageRunner:
+    """
+    (coverage_code, ins_cd) 작업 단위 병렬 실행기
+
+    - I/O: StorePool(Postgres ThreadedConnectionPool / SQLite connection) + thread pool
+    - CPU: gate 판정(select_slot_chunks)은 process pool
+    - 쓰기: coverage별 lock_coverage로 직렬화 (Postgres advisory lock, 다른 실행과의 동시 쓰기 포함)
+    """
+
+    def __init__(self, coverage_codes: List[str], as_of_date: str, ins_cds: Optional[List[str]] = None,
+                 jobs: int = 4, io_jobs: int = 4, skip_chunks: bool = False,
+                 adaptive_gates: bool = True, record_stats: bool = False, sqlite_path: Optional[str] = None,
+                 force: bool = False, regex_budget_us: Optional[float] = None, itersize: int = STREAM_ITERSIZE):
+        self.coverage_codes = coverage_codes
+        self.as_of_date = as_of_date
+        self.ins_cds = ins_cds
+        self.jobs = jobs
+        self.io_jobs = io_jobs
+        self.skip_chunks = skip_chunks
+        self.adaptive_gates = adaptive_gates
+        self.record_stats = record_stats
+        self.sqlite_path = sqlite_path
+        self.force = force
+        self.regex_budget_us = regex_budget_us
+        self.itersize = itersize
+        self.pool = None
+        self.pipelines: Dict[str, DBOnlyCoveragePipeline] = {}
+
+    def _pipeline(self, coverage_code: str, ins_cds: Optional[List[str]], store: CoverageStore) -> DBOnlyCoveragePipeline:
+        pipeline = DBOnlyCoveragePipeline(coverage_code, self.as_of_date, ins_cds,
+                                          skip_chunks=self.skip_chunks, store=store,
+                                          adaptive_gates=self.adaptive_gates, record_stats=self.record_stats,
+                                          force=self.force, itersize=self.itersize,
+                                          regex_budget_us=self.regex_budget_us)
+        pipeline.connect()
+        return pipeline
+
+    def _gate_unit(self, coverage_code: str, ins_cd: str, ctx: GateContext, order: List[str],
+                   plan: SlotPlan, gate_pool) -> Tuple[Dict[str, dict], Optional[GateStats], Optional[RegexBudget]]:
+        """
+        작업 단위: pooled store로 후보 스트리밍 → itersize batch마다 process pool에서 gate
+
+        batch는 아직 판정되지 않은 slot만 gate하고, 남은 slot이 없으면(모두 FOUND 또는 plan horizon 경과)
+        stream을 닫아 이후 batch는 조회하지 않는다 → chunk_text 메모리 / process pool 전송은 batch 1개분.
+        slot별 winner는 chunk 순서상 최초 통과 chunk (단일 실행 select_slot_chunks와 동일).
+        """
+        found: Dict[str, dict] = {}
+        stats = GateStats() if self.record_stats else None
+        budget = RegexBudget(self.regex_budget_us) if self.regex_budget_us is not None else None
+        pending = list(SLOT_KEYS)
+        store = self.pool.acquire()
+        try:
+            pipeline = self._pipeline(coverage_code, [ins_cd], store)
+            with closing(pipeline.stream_candidates(ins_cd, ctx, plan)) as stream:
+                while pending:
+                    batch = list(islice(stream, self.itersize))
+                    if not batch:
+                        break
+                    if stats is not None or budget is not None:
+                        batch_found, batch_stats, batch_budget = gate_pool.submit(
+                            select_slot_chunks_instrumented, pending, batch, ctx, order, plan,
+                            self.record_stats, self.regex_budget_us).result()
+                        if batch_stats is not None:
+                            stats.merge(batch_stats)
+                        if batch_budget is not None:
+                            budget.merge(batch_budget)
+                    else:
+                        batch_found = gate_pool.submit(select_slot_chunks, pending, batch, ctx, order, plan).result()
+                    found.update(batch_found)
+                    last_chunk_id = batch[-1]['chunk_id']
+                    pending = [slot_key for slot_key in pending
+                               if slot_key not in found and last_chunk_id < plan.horizon(slot_key)]
+            store.rollback()
+        finally:
+            self.pool.release(store)
+        return {slot_key: found[slot_key] for slot_key in SLOT_KEYS if slot_key in found}, stats, budget
+
+    def _run_coverage(self, coverage_code: str, unit_pool, gate_pool) -> Dict[str, int]:
+        store = self.pool.acquire()
+        try:
+            pipeline = self._pipeline(coverage_code, self.ins_cds, store)
+            self.pipelines[coverage_code] = pipeline
+            profile = get_profile(coverage_code)
+            mappings = pipeline.load_mappings()
+            fingerprint = pipeline.compute_fingerprint(mappings)
+            if pipeline.is_up_to_date(fingerprint):
+                store.rollback()
+                logger.info(f"⏭️  {coverage_code}: up to date (generation fingerprint {fingerprint[:12]})")
+                return {"ins_cds": len(pipeline.ins_cds), "skipped": True}
+            order = pipeline.gate_order()
+            plans = pipeline.plan_regate(mappings, profile, pipeline.chunk_hashes)
+            store.rollback()
+
+            futures = {
+                ins_cd: unit_pool.submit(
+                    self._gate_unit, coverage_code, ins_cd,
+                    pipeline.gate_context(ins_cd, mappings.get(ins_cd, EMPTY_MAPPING), profile),
+                    order, plans[ins_cd], gate_pool
+                )
+                for ins_cd in pipeline.ins_cds
+            }
+            found_by_ins = {}
+            for ins_cd, future in futures.items():
+                found_by_ins[ins_cd], stats, budget = future.result()
+                pipeline.merge_instrumentation(stats, budget)
+
+            pipeline.write_all(found_by_ins)
+            pipeline.verify()
+            return {"ins_cds": len(pipeline.ins_cds),
+                    "found": sum(len(found) for found in found_by_ins.values()),
+                    "skipped": False}
+        finally:
+            self.pool.release(store)
+
+    def run(self) -> Dict[str, dict]:
+        logger.info(f"🚀 Multi-coverage run: {len(self.coverage_codes)} coverages, "
+                    f"jobs={self.jobs}, io_jobs={self.io_jobs}")
+        # coverage thread + unit thread가 동시에 connection을 잡을 수 있음
+        self.pool = StorePool("sqlite" if self.sqlite_path else "postgres",
+                              maxconn=2 * self.io_jobs, sqlite_path=self.sqlite_path)
+        results = {}
+        try:
+            store = self.pool.acquire()
+            try:
+                store.ensure_partitions(self.as_of_date)
+                store.commit()
+            finally:
+                self.pool.release(store)
+
+            with ProcessPoolExecutor(max_workers=self.jobs) as gate_pool, \
+                    ThreadPoolExecutor(max_workers=self.io_jobs) as unit_pool, \
+                    ThreadPoolExecutor(max_workers=self.io_jobs) as coverage_pool:
+                futures = {
+                    code: coverage_pool.submit(self._run_coverage, code, unit_pool, gate_pool)
+                    for code in self.coverage_codes
+                }
+                for code, future in futures.items():
+                    results[code] = future.result()
+                    logger.info(f"✅ {code}: {results[code]}")
+        finally:
+            self.pool.closeall()
+
+        # 통계 파일 갱신은 모든 coverage 완료 후 순차 기록
+        for code in results:
+            self.pipelines[code].save_gate_stats()
+            self.pipelines[code].save_regex_overruns()
+
+        logger.info(f"✅ MULTI-COVERAGE PIPELINE COMPLETED ({len(results)} coverages)")
+        return results
+
+
 def main():
     parser = argparse.ArgumentParser(description="DB-only coverage pipeline")
-    parser.add_argument("--coverage_code", required=True, help="Coverage code (e.g., A4210)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--coverage_code", help="Coverage code (e.g., A4210)")
+    target.add_argument("--coverage_codes", help="Comma-separated coverage codes (parallel mode)")
+    target.add_argument("--all-profiled", action="store_true",
+                        help="All coverage codes in data/coverage_profiles/ (parallel mode)")
     parser.add_argument("--as_of_date", required=True, help="As-of date (YYYY-MM-DD)")
-    parser.add_argument("--ins_cds", required=True, help="Comma-separated insurer codes (e.g., N01,N08)")
+    parser.add_argument("--ins_cds", help="Comma-separated insurer codes (e.g., N01,N08); default: all mapped")
     parser.add_argument("--skip-chunks", action="store_true", help="Skip chunk generation")
+    parser.add_argument("--jobs", type=int, default=4, help="Gate worker processes (parallel mode)")
+    parser.add_argument("--io-jobs", type=int, default=4, help="DB I/O threads / pooled connections (parallel mode)")
+    parser.add_argument("--canonical-gates", action="store_true",
+                        help="Evaluate gates in canonical order (ignore data/coverage_gate_stats.json)")
+    parser.add_argument("--record-gate-stats", action="store_true",
+                        help="Record per-gate cost / rejection rate into data/coverage_gate_stats.json")
+    parser.add_argument("--regex-budget-us", type=float,
+                        help="Per-match gate regex time budget in microseconds; record overruns into "
+                             "data/regex_budget_overruns.json (see tools/regex_cost.py)")
+    parser.add_argument("--sqlite", help="Use a SQLite stand-in store at this path instead of Postgres")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate even if the generation fingerprint matches the latest compare_table_v2")
+    parser.add_argument("--itersize", type=int, default=STREAM_ITERSIZE,
+                        help="Candidate chunk streaming / gate batch size")
     args = parser.parse_args()
 
-    ins_cds = [x.strip() for x in args.ins_cds.split(",")]
-
-    pipeline = DBOnlyCoveragePipeline(
-        coverage_code=args.coverage_code,
+    logger.info(f"📚 Coverage profiles: {describe_load_report()}")
+    ins_cds = [x.strip() for x in args.ins_cds.split(",")] if args.ins_cds else None
+
+    if args.coverage_code:
+        pipeline = DBOnlyCoveragePipeline(
+            coverage_code=args.coverage_code,
+            as_of_date=args.as_of_date,
+            ins_cds=ins_cds,
+            skip_chunks=args.skip_chunks,
+            adaptive_gates=not args.canonical_gates,
+            record_stats=args.record_gate_stats,
+            sqlite_path=args.sqlite,
+            force=args.force,
+            itersize=args.itersize,
+            regex_budget_us=args.regex_budget_us
+        )
+        pipeline.run()
+        return
+
+    if args.all_profiled:
+        coverage_codes = sorted(COVERAGE_PROFILES)
+    else:
+        coverage_codes = [x.strip() for x in args.coverage_codes.split(",") if x.strip()]
+
+    MultiCoverageRunner(
+        coverage_codes=coverage_codes,
         as_of_date=args.as_of_date,
         ins_cds=ins_cds,
-        skip_chunks=args.skip_chunks
-    )
-    pipeline.run()
+        jobs=args.jobs,
+        io_jobs=args.io_jobs,
+        skip_chunks=args.skip_chunks,
+        adaptive_gates=not args.canonical_gates,
+        record_stats=args.record_gate_stats,
+        sqlite_path=args.sqlite,
+        force=args.force,
+        regex_budget_us=args.regex_budget_us,
+        itersize=args.itersize
+    ).run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Fused pipeline: step 2–7 메모리 내 실행
+
+단계별 명령은 산출물을 CSV / JSONL로 기록하고 다음 단계가 다시 parse한다
+(mapped CSV → evidence pack JSONL → cards JSONL → compare JSONL, scope CSV는 step 4/5가 각각 로드).
+이 runner는 같은 단계 함수를 한 프로세스에서 호출하며 중간 결과를 객체로 넘긴다.
+
+  step 2  map_scope_rows          scope 행 → mapped 행           (CanonicalMapper 1회 로드, 보험사 간 공유)
+  step 4  build_evidence_pack     mapped 행 → evidence pack 항목  (ScopeGate / corpus 보험사별 1회 로드)
+  step 5  build_cards_in_memory   → CoverageCard 목록 (sort_key 순, ScopeGate 공유)
+  step 6  write_markdown_report   CoverageCard + unmatched 행 → 리포트
+  step 7  compare_pairs           CoverageCard coverage_code 인덱스 → 전체 쌍 비교
+
+- 산출물은 모든 계산이 끝난 뒤 한 번에 기록한다 (단계별 명령과 같은 경로 / 같은 내용).
+  계산 도중 실패하면 아무것도 기록하지 않는다.
+- --no-intermediate: step 2/4/5 산출물(mapped CSV, evidence pack, unmatched review, cards)을
+  기록하지 않고 리포트(step 6)와 비교(step 7) 결과만 기록한다 (step 4–7 규칙 반복 수정용).
+- --skip-mapping: step 2를 다시 실행하지 않고 기존 {INSURER}_scope_mapped.csv를 사용한다.
+- step 3 (PDF 텍스트 추출)은 포함하지 않는다. data/evidence_text의 page JSONL을 corpus로 로드한다.
+- step 7 비교 대상은 data/compare의 전체 보험사 cards (fused 대상은 메모리 내 카드, 나머지는 파일).
+- 산출물을 직접 기록하므로 실행 후 tools/run_pipeline.py --adopt로 orchestrator state를 맞춘다.
+
+Usage:
+  python3 tools/run_fused_pipeline.py                          # 전체 보험사
+  python3 tools/run_fused_pipeline.py --insurers kb,hanwha --skip-mapping
+  python3 tools/run_fused_pipeline.py --insurers kb --skip-mapping --no-intermediate
+"""
+
+import argparse
+import csv
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.cards_store import load_card_views
+from core.compare_types import CompareStats, CoverageCard
+from core.scope_gate import ScopeGate, load_scope_gate
+from pipeline.step2_canonical_mapping.map_to_canonical import CanonicalMapper, map_scope_rows, write_mapped_csv
+from pipeline.step4_evidence_search.search_evidence import (
+    EvidenceSearcher, build_evidence_pack, write_evidence_pack, write_unmatched_review
+)
+from pipeline.step5_build_cards.build_cards import build_cards_in_memory, write_coverage_cards
+from pipeline.step6_build_report.build_report import write_markdown_report
+from pipeline.step7_compare.compare_insurers import compare_pairs, index_cards_by_code, write_pair_results
+from tools.run_pipeline import default_insurers
+
+MAPPING_EXCEL = "data/sources/mapping/담보명mapping자료.xlsx"
+STAGES = ("map", "evidence", "cards", "compare", "write")
+
+
+@dataclass
+class FusedInsurerResult:
+    """보험사 1곳의 step 2–5 메모리 내 결과"""
+    insurer: str
+    mapped_rows: List[Dict]
+    mapping_stats: Optional[Dict]  # --skip-mapping이면 None
+    evidence_pack: List[Dict]
+    unmatched_rows: List[Dict]
+    evidence_stats: Dict
+    cards: List[CoverageCard]
+    card_stats: CompareStats
+
+
+class FusedPipeline:
+    """
+    step 2–7 fused runner
+
+    CanonicalMapper / ScopeGate / corpus(EvidenceSearcher)는 인스턴스에 cache되어
+    run()을 반복 호출해도 다시 로드하지 않는다.
+    """
+
+    def __init__(self, insurers: List[str], base_dir: Path = PROJECT_ROOT,
+                 mapper: Optional[CanonicalMapper] = None, remap: bool = True,
+                 write_intermediate: bool = True, jobs: int = 4, log: Callable[[str], None] = print):
+        self.insurers = list(insurers)
+        self.base_dir = Path(base_dir)
+        self.remap = remap
+        self.write_intermediate = write_intermediate
+        self.jobs = jobs
+        self.log = log
+        self._mapper = mapper
+        self._gates: Dict[str, ScopeGate] = {}
+        self._searchers: Dict[str, EvidenceSearcher] = {}
+        self.timings: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------
+    # 경로 (단계별 명령 main()과 동일)
+
+    def path(self, kind: str, insurer: str = "") -> Path:
+        data = self.base_dir / "data"
+        return {
+            'scope': data / "scope" / f"{insurer}_scope.csv",
+            'mapped': data / "scope" / f"{insurer}_scope_mapped.csv",
+            'unmatched': data / "scope" / f"{insurer}_unmatched_review.csv",
+            'evidence_text': data / "evidence_text",
+            'evidence_pack': data / "evidence_pack" / f"{insurer}_evidence_pack.jsonl",
+            'cards': data / "compare" / f"{insurer}_coverage_cards.jsonl",
+            'report': self.base_dir / "reports" / f"{insurer}_scope_report.md",
+            'compare_dir': data / "compare",
+            'report_dir': self.base_dir / "reports",
+            'compare_stats': data / "compare" / "all_pairs_compare_stats.json",
+        }[kind]
+
+    # ------------------------------------------------------------------
+    # 공유 객체 (1회 로드)
+
+    @property
+    def mapper(self) -> CanonicalMapper:
+        if self._mapper is None:
+            self._mapper = CanonicalMapper(str(self.base_dir / MAPPING_EXCEL))
+        return self._mapper
+
+    def scope_gate(self, insurer: str) -> ScopeGate:
+        if insurer not in self._gates:
+            self._gates[insurer] = load_scope_gate(insurer, str(self.base_dir / "data" / "scope"))
+        return self._gates[insurer]
+
+    def searcher(self, insurer: str) -> EvidenceSearcher:
+        if insurer not in self._searchers:
+            self._searchers[insurer] = EvidenceSearcher(str(self.path('evidence_text')), insurer)
+        return self._searchers[insurer]
+
+    def _timed(self, stage: str, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        self.timings[stage] = self.timings.get(stage, 0.0) + time.perf_counter() - start
+        return result
+
+    @staticmethod
+    def _read_csv(path: Path) -> List[Dict]:
+        with open(path, 'r', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    # ------------------------------------------------------------------
+    # 실행
+
+    def run_insurer(self, insurer: str) -> FusedInsurerResult:
+        """보험사 1곳 step 2 → 4 → 5 (메모리 내, 기록 없음)"""
+        if self.remap:
+            scope_rows = self._read_csv(self.path('scope', insurer))
+            mapped_rows, mapping_stats = self._timed('map', map_scope_rows, scope_rows, self.mapper)
+        else:
+            mapped_rows, mapping_stats = self._read_csv(self.path('mapped', insurer)), None
+
+        gate = self.scope_gate(insurer)
+        evidence_pack, unmatched_rows, evidence_stats = self._timed(
+            'evidence', build_evidence_pack, mapped_rows, gate, self.searcher(insurer), insurer
+        )
+        cards, card_stats = self._timed('cards', build_cards_in_memory, mapped_rows, evidence_pack, insurer, gate)
+
+        return FusedInsurerResult(insurer, mapped_rows, mapping_stats, evidence_pack, unmatched_rows,
+                                  evidence_stats, cards, card_stats)
+
+    def compare_insurers(self) -> List[str]:
+        """step 7 비교 대상: data/compare의 기존 cards + fused 대상 (이름순)"""
+        existing = {
+            f.stem.replace("_coverage_cards", "")
+            for f in self.path('compare_dir').glob("*_coverage_cards.jsonl")
+        }
+        return sorted(existing | set(self.insurers))
+
+    def compare(self, results: Dict[str, FusedInsurerResult]) -> list:
+        """step 7 전체 쌍 비교 (fused 대상은 메모리 내 카드, 나머지는 cards JSONL view)"""
+        insurers = self.compare_insurers()
+        cards_by_insurer = {}
+        for insurer in insurers:
+            if insurer in results:
+                cards_by_insurer[insurer] = index_cards_by_code(results[insurer].cards)
+            else:
+                cards_by_insurer[insurer] = index_cards_by_code(load_card_views(self.path('cards', insurer)))
+        return compare_pairs(insurers, cards_by_insurer)
+
+    def write(self, results: Dict[str, FusedInsurerResult], pair_results: list) -> Dict[str, Dict]:
+        """산출물 기록 (단계별 명령과 같은 경로 / 같은 내용)"""
+        for insurer, result in results.items():
+            if self.write_intermediate:
+                if result.mapping_stats is not None:
+                    write_mapped_csv(result.mapped_rows, str(self.path('mapped', insurer)))
+                self.path('evidence_pack', insurer).parent.mkdir(parents=True, exist_ok=True)
+                write_evidence_pack(result.evidence_pack, str(self.path('evidence_pack', insurer)))
+                write_unmatched_review(result.unmatched_rows, str(self.path('unmatched', insurer)))
+                write_coverage_cards(result.cards, str(self.path('cards', insurer)))
+            write_markdown_report(result.cards, result.unmatched_rows, insurer, str(self.path('report', insurer)))
+
+        return write_pair_results(
+            pair_results,
+            str(self.path('compare_dir')),
+            str(self.path('report_dir')),
+            str(self.path('compare_stats')),
+            jobs=self.jobs
+        )
+
+    def run(self) -> Dict[str, dict]:
+        """전체 보험사 계산 후 일괄 기록. 보험사별 통계 + 단계별 소요 시간 반환"""
+        self.timings = {}
+        results = {}
+        for insurer in self.insurers:
+            results[insurer] = self.run_insurer(insurer)
+            card_stats = results[insurer].card_stats
+            self.log(f"[Fused] {insurer}: {card_stats.total_coverages} cards "
+                     f"(matched {card_stats.matched}, evidence found {card_stats.evidence_found})")
+
+        pair_results = self._timed('compare', self.compare, results)
+        pair_stats = self._timed('write', self.write, results, pair_results)
+
+        return {
+            'insurers': {
+                insurer: {
+                    'mapping': result.mapping_stats,
+                    'evidence': result.evidence_stats,
+                    'cards': result.card_stats.to_dict(),
+                }
+                for insurer, result in results.items()
+            },
+            'pairs': len(pair_stats),
+            'timings': {stage: round(self.timings.get(stage, 0.0), 3) for stage in STAGES},
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fused in-memory pipeline (step 2–7)')
+    parser.add_argument('--insurers', type=str, help='쉼표 구분 보험사 (기본: manifest 전체)')
+    parser.add_argument('--skip-mapping', action='store_true',
+                        help='step 2 생략, 기존 {INSURER}_scope_mapped.csv 사용')
+    parser.add_argument('--no-intermediate', action='store_true',
+                        help='mapped CSV / evidence pack / unmatched review / cards 미기록 (리포트 / 비교만 기록)')
+    parser.add_argument('--jobs', type=int, default=4, help='step 7 쌍별 출력 병렬 thread 수')
+    args = parser.parse_args()
+
+    insurers = args.insurers.split(',') if args.insurers else default_insurers()
+
+    print(f"[Fused] Steps 2–7 in memory")
+    print(f"[Fused] Insurers: {', '.join(insurers)}")
+    print(f"[Fused] Mapping: {'existing mapped CSV' if args.skip_mapping else MAPPING_EXCEL}")
+    print(f"[Fused] Intermediate artifacts: {'skipped' if args.no_intermediate else 'written'}")
+
+    pipeline = FusedPipeline(
+        insurers,
+        remap=not args.skip_mapping,
+        write_intermediate=not args.no_intermediate,
+        jobs=args.jobs
+    )
+    summary = pipeline.run()
+
+    print(f"\n[Fused] Completed:")
+    for insurer, stats in summary['insurers'].items():
+        cards = stats['cards']
+        print(f"  - {insurer}: {cards['total_coverages']} cards, "
+              f"matched {cards['matched']}, evidence found {cards['evidence_found']}")
+    print(f"  - Pairs compared: {summary['pairs']}")
+    print(f"  - Timings (s): " + ", ".join(f"{stage} {t}" for stage, t in summary['timings'].items()))
+
+
+if __name__ == "__main__":
+    main()
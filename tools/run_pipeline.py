@@ -0,0 +1,529 @@
+#!/usr/bin/env python3
+"""
+Pipeline orchestrator: step 1–10 DAG (보험사 × 단계) + content-hash cache.
+
+README Quickstart의 단계별 명령(python -m pipeline.stepN... --insurer X)을 node로 모델링하고
+입력이 바뀐 node만 다시 실행한다.
+
+  scope:{ins} → mapped:{ins} ─┐
+  text:{ins} ─────────────────┴→ evidence:{ins} → cards:{ins} → report:{ins}
+  cards:* → compare (step 7 all-pairs), multi_compare (step 8)
+  cards:* + evidence:* → single (step 8 single coverage --all) → matrix (step 10)
+
+node fingerprint = sha256(단계 이름 + 인자 + 코드 + 입력 파일 내용)
+  - 코드: node 모듈과 그 모듈이 import하는 저장소 내 모듈(core.* / pipeline.*)의 파일 내용
+  - 입력: 외부 원천(PDF / manifest / mapping 엑셀 / 설정 YAML) + 상위 node 산출물 내용
+  - fingerprint와 산출물 내용이 data/pipeline_state.json 기록과 같으면 건너뜀
+  - 상위 node를 다시 실행해도 산출물 내용이 같으면 하위 node는 최신으로 유지 (early cutoff)
+    → mapping 1줄 변경 시 mapped:* 는 전부 재실행되지만, mapped CSV가 실제로 바뀐 보험사만
+      evidence / cards / report와 전역 비교를 다시 만든다
+  - 파일 hash는 (size, mtime_ns) 기준으로 state에 cache (변경 없는 대용량 입력은 다시 읽지 않음)
+
+실행:
+  - node = 하위 프로세스 1개 (python -m {module} {args}, cwd=프로젝트 루트)
+  - 의존 node가 끝난 node부터 --jobs 개까지 동시 실행 (보험사 간 / 독립 단계 간 병렬)
+  - 실패한 node의 하위 node는 blocked (state 미기록 → 다음 실행에서 재시도)
+  - 산출물은 각 단계가 core.atomic_io.atomic_write로 기록 (중단 / 실패 시 기존 파일 유지)
+
+Step 9 (보험사 쌍 × coverage_code 단건 비교)는 대상 쌍을 인자로 받는 ad hoc 명령이라 DAG에 포함하지 않는다.
+N 보험사 비교는 matrix (step 10) node가 생성한다.
+
+Usage:
+  python3 tools/run_pipeline.py                          # 전체 보험사, stale node만 실행
+  python3 tools/run_pipeline.py --insurers samsung,kb --jobs 4
+  python3 tools/run_pipeline.py --targets cards --dry-run
+  python3 tools/run_pipeline.py --adopt                  # 현재 산출물을 최신으로 기록 (최초 도입 시)
+"""
+
+import argparse
+import ast
+import csv
+import glob
+import hashlib
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.atomic_io import atomic_write
+
+STATE_FILE = "data/pipeline_state.json"
+MISSING = "missing"
+LOCAL_PACKAGES = ("core", "pipeline", "tools")
+STDERR_TAIL_LINES = 20
+
+
+# ----------------------------------------------------------------------------
+# 단계 정의
+# ----------------------------------------------------------------------------
+
+class Step:
+    """
+    DAG 단계 1개
+
+    - per_insurer: True면 보험사별 node ({name}:{insurer}), False면 전역 node 1개
+    - deps: 상위 단계 이름 (보험사별 → 같은 보험사 node, 전역 → 모든 보험사 node)
+    - args / inputs / outputs: target(보험사명 또는 전역이면 보험사 목록) → 인자 / 경로 목록
+      경로는 프로젝트 루트 기준 상대 경로 (파일 / 디렉토리 / glob)
+    - runtime_args: 결과에 영향 없는 실행 인자 (--jobs 등, fingerprint 제외)
+    """
+
+    __slots__ = ('name', 'module', 'per_insurer', 'deps', 'args', 'inputs', 'outputs', 'runtime_args')
+
+    def __init__(self, name: str, module: str, deps: Sequence[str] = (), per_insurer: bool = True,
+                 args: Optional[Callable] = None, inputs: Optional[Callable] = None,
+                 outputs: Optional[Callable] = None, runtime_args: Optional[Callable[[int], List[str]]] = None):
+        self.name = name
+        self.module = module
+        self.per_insurer = per_insurer
+        self.deps = tuple(deps)
+        self.args = args or ((lambda insurer: ["--insurer", insurer]) if per_insurer else (lambda insurers: []))
+        self.inputs = inputs or (lambda target: [])
+        self.outputs = outputs or (lambda target: [])
+        self.runtime_args = runtime_args or (lambda jobs: [])
+
+
+def _scope_inputs(insurer: str) -> List[str]:
+    # step1: 가입설계서 디렉토리 (없으면 보험사 디렉토리 직속 PDF)
+    plan_dir = f"data/sources/insurers/{insurer}/가입설계서"
+    if (PROJECT_ROOT / plan_dir).is_dir():
+        return [f"{plan_dir}/*.pdf"]
+    return [f"data/sources/insurers/{insurer}/*.pdf"]
+
+
+def _text_inputs(insurer: str) -> List[str]:
+    # step3: manifest + manifest에 등록된 PDF
+    manifest = f"data/evidence_sources/{insurer}_manifest.csv"
+    paths = [manifest]
+    manifest_path = PROJECT_ROOT / manifest
+    if manifest_path.exists():
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            paths += [row['file_path'] for row in csv.DictReader(f) if row.get('file_path')]
+    return paths
+
+
+CARDS_GLOB = "data/compare/*_coverage_cards.jsonl"
+
+PIPELINE_STEPS = [
+    Step("scope", "pipeline.step1_extract_scope.run",
+         inputs=_scope_inputs,
+         outputs=lambda i: [f"data/scope/{i}_scope.csv"]),
+    Step("mapped", "pipeline.step2_canonical_mapping.map_to_canonical", deps=["scope"],
+         inputs=lambda i: [f"data/scope/{i}_scope.csv", "data/sources/mapping/담보명mapping자료.xlsx"],
+         outputs=lambda i: [f"data/scope/{i}_scope_mapped.csv"]),
+    Step("text", "pipeline.step3_extract_text.extract_pdf_text",
+         inputs=_text_inputs,
+         outputs=lambda i: [f"data/evidence_text/{i}"]),
+    Step("evidence", "pipeline.step4_evidence_search.search_evidence", deps=["mapped", "text"],
+         inputs=lambda i: [f"data/scope/{i}_scope.csv", f"data/scope/{i}_scope_mapped.csv",
+                           f"data/evidence_text/{i}"],
+         outputs=lambda i: [f"data/evidence_pack/{i}_evidence_pack.jsonl",
+                            f"data/evidence_pack/{i}_evidence_pack.index.json",
+                            f"data/scope/{i}_unmatched_review.csv"]),
+    Step("cards", "pipeline.step5_build_cards.build_cards", deps=["evidence"],
+         inputs=lambda i: [f"data/scope/{i}_scope.csv", f"data/scope/{i}_scope_mapped.csv",
+                           f"data/evidence_pack/{i}_evidence_pack.jsonl"],
+         outputs=lambda i: [f"data/compare/{i}_coverage_cards.jsonl", f"data/compare/{i}_coverage_cards.summary.json",
+                            f"data/compare/{i}_coverage_cards.index.json"]),
+    Step("report", "pipeline.step6_build_report.build_report", deps=["cards"],
+         inputs=lambda i: [f"data/compare/{i}_coverage_cards.jsonl", f"data/scope/{i}_unmatched_review.csv"],
+         outputs=lambda i: [f"reports/{i}_scope_report.md"]),
+    Step("compare", "pipeline.step7_compare.compare_insurers", deps=["cards"], per_insurer=False,
+         args=lambda insurers: ["--all-pairs"],
+         runtime_args=lambda jobs: ["--jobs", str(jobs)],
+         inputs=lambda insurers: [CARDS_GLOB],
+         outputs=lambda insurers: ["data/compare/all_pairs_compare_stats.json", "data/compare/*_vs_*_compare.jsonl",
+                                   "reports/*_vs_*_report.md"]),
+    Step("multi_compare", "pipeline.step8_multi_compare.compare_all_insurers", deps=["cards"], per_insurer=False,
+         inputs=lambda insurers: [CARDS_GLOB],
+         outputs=lambda insurers: ["data/compare/all_insurers_matrix.json", "data/compare/all_insurers_stats.json",
+                                   "reports/all_insurers_overview.md"]),
+    Step("single", "pipeline.step8_single_coverage.extract_single_coverage", deps=["cards", "evidence"],
+         per_insurer=False,
+         # code별 비교 JSON / 리포트는 matrix 단계만 기록 (같은 파일을 두 node가 쓰지 않도록)
+         args=lambda insurers: ["--all", "--no-compare"],
+         runtime_args=lambda jobs: ["--jobs", str(jobs)],
+         inputs=lambda insurers: [CARDS_GLOB, "data/evidence_pack/*_evidence_pack.jsonl"],
+         outputs=lambda insurers: ["data/single/*_profile.json"]),
+    Step("matrix", "pipeline.step10_multi_single_compare.compare_matrix", deps=["single"], per_insurer=False,
+         runtime_args=lambda jobs: ["--jobs", str(jobs)],
+         inputs=lambda insurers: ["data/single/*_profile.json", "data/metadata/single_compare_targets.json"],
+         outputs=lambda insurers: ["data/single/slot_status_matrix.json", "data/single/*_all_compare.json",
+                                   "reports/*_all_insurers.md"]),
+]
+
+
+def default_insurers(root: Path = PROJECT_ROOT) -> List[str]:
+    """data/evidence_sources/{insurer}_manifest.csv 기준 보험사 목록"""
+    return sorted(p.name[:-len("_manifest.csv")] for p in (root / "data" / "evidence_sources").glob("*_manifest.csv"))
+
+
+# ----------------------------------------------------------------------------
+# 코드 / 입력 hash
+# ----------------------------------------------------------------------------
+
+def _module_path(root: Path, module: str) -> Optional[Path]:
+    path = root.joinpath(*module.split('.'))
+    if path.with_suffix('.py').exists():
+        return path.with_suffix('.py')
+    if (path / '__init__.py').exists():
+        return path / '__init__.py'
+    return None
+
+
+def code_files(module: str, root: Path = PROJECT_ROOT) -> List[str]:
+    """모듈 + 모듈이 (재귀적으로) import하는 저장소 내 모듈 파일 (루트 기준 상대 경로, 정렬)"""
+    found: Dict[str, Path] = {}
+    stack = [module]
+    while stack:
+        name = stack.pop()
+        path = _module_path(root, name)
+        if path is None:
+            continue
+        rel = path.relative_to(root).as_posix()
+        if rel in found:
+            continue
+        found[rel] = path
+        package = name.rsplit('.', 1)[0] if path.name != '__init__.py' else name
+        for node in ast.walk(ast.parse(path.read_text(encoding='utf-8'))):
+            if isinstance(node, ast.ImportFrom):
+                if node.level:
+                    base = package.split('.')
+                    base = base[:len(base) - node.level + 1]
+                    target = '.'.join(base + ([node.module] if node.module else []))
+                else:
+                    target = node.module or ''
+                candidates = [target] + [f"{target}.{alias.name}" for alias in node.names]
+            elif isinstance(node, ast.Import):
+                candidates = [alias.name for alias in node.names]
+            else:
+                continue
+            stack += [c for c in candidates if c.split('.')[0] in LOCAL_PACKAGES]
+    return sorted(found)
+
+
+class ContentHasher:
+    """
+    파일 내용 sha256 (size / mtime_ns가 같으면 cache 값 사용)
+
+    cache: 상대 경로 → [size, mtime_ns, sha256] (state 파일에 함께 저장)
+    """
+
+    def __init__(self, root: Path, cache: Optional[dict] = None):
+        self.root = Path(root)
+        self.cache: Dict[str, list] = cache if cache is not None else {}
+
+    def file(self, rel: str) -> str:
+        path = self.root / rel
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return MISSING
+        cached = self.cache.get(rel)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        sha = digest.hexdigest()
+        self.cache[rel] = [stat.st_size, stat.st_mtime_ns, sha]
+        return sha
+
+    def expand(self, spec: str) -> List[str]:
+        """경로 spec → 파일 상대 경로 목록 (glob / 디렉토리는 하위 파일 전체, 임시 파일 제외)"""
+        path = self.root / spec
+        if glob.has_magic(spec):
+            matches = [Path(p) for p in glob.glob(str(path))]
+        elif path.is_dir():
+            matches = [p for p in path.rglob('*') if p.is_file()]
+        else:
+            return [spec]
+        return sorted(p.relative_to(self.root).as_posix() for p in matches
+                      if p.is_file() and not p.name.startswith('.'))
+
+    def digest(self, specs: Sequence[str]) -> Dict[str, str]:
+        """spec 목록 → {상대 경로: sha256 | missing} (빈 glob / 디렉토리는 spec: missing)"""
+        hashes = {}
+        for spec in specs:
+            files = self.expand(spec)
+            if not files:
+                hashes[spec] = MISSING
+            for rel in files:
+                hashes[rel] = self.file(rel)
+        return hashes
+
+
+def _sha256_json(obj) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+# ----------------------------------------------------------------------------
+# DAG
+# ----------------------------------------------------------------------------
+
+class Node:
+    __slots__ = ('node_id', 'step', 'target', 'deps')
+
+    def __init__(self, node_id: str, step: Step, target, deps: List[str]):
+        self.node_id = node_id
+        self.step = step
+        self.target = target
+        self.deps = deps
+
+    def command(self, jobs: int) -> List[str]:
+        return [sys.executable, "-m", self.step.module] + self.step.args(self.target) + self.step.runtime_args(jobs)
+
+
+def build_graph(steps: Sequence[Step], insurers: Sequence[str],
+                targets: Optional[Sequence[str]] = None) -> Dict[str, Node]:
+    """
+    단계 × 보험사 node (위상 순서 dict)
+
+    targets가 주어지면 해당 단계 node와 그 상위 node만 포함.
+    """
+    by_name = {step.name: step for step in steps}
+    order = {step.name: index for index, step in enumerate(steps)}
+    for step in steps:
+        misplaced = [dep for dep in step.deps if order.get(dep, len(steps)) >= order[step.name]]
+        if misplaced:
+            raise ValueError(f"step {step.name} must come after its dependencies {misplaced}")
+    unknown = [name for name in (targets or []) if name not in by_name]
+    if unknown:
+        raise ValueError(f"unknown steps {unknown} (available: {list(by_name)})")
+
+    wanted = set()
+    stack = list(targets or by_name)
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack += list(by_name[name].deps)
+
+    nodes: Dict[str, Node] = {}
+    for step in steps:
+        if step.name not in wanted:
+            continue
+        if step.per_insurer:
+            for insurer in insurers:
+                deps = [f"{dep}:{insurer}" if by_name[dep].per_insurer else dep for dep in step.deps]
+                nodes[f"{step.name}:{insurer}"] = Node(f"{step.name}:{insurer}", step, insurer, deps)
+        else:
+            deps = []
+            for dep in step.deps:
+                deps += [f"{dep}:{insurer}" for insurer in insurers] if by_name[dep].per_insurer else [dep]
+            nodes[step.name] = Node(step.name, step, list(insurers), deps)
+    return nodes
+
+
+class PipelineRunner:
+    """
+    stale node 실행기
+
+    Usage:
+        runner = PipelineRunner(build_graph(PIPELINE_STEPS, insurers), jobs=4)
+        summary = runner.run()   # {"ran": [...], "skipped": [...], "failed": [...], "blocked": [...]}
+    """
+
+    def __init__(self, nodes: Dict[str, Node], root: Path = PROJECT_ROOT, jobs: int = 4, force: bool = False,
+                 state_file: str = STATE_FILE, log: Callable[[str], None] = print):
+        self.nodes = nodes
+        self.root = Path(root)
+        self.jobs = max(1, jobs)
+        self.force = force
+        self.state_path = self.root / state_file
+        self.log = log
+        self.state = self._load_state()
+        self.hasher = ContentHasher(self.root, self.state.setdefault("file_hashes", {}))
+        self._code_hashes: Dict[str, str] = {}
+
+    def _load_state(self) -> dict:
+        if self.state_path.exists():
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {"nodes": {}, "file_hashes": {}}
+
+    def save_state(self):
+        with atomic_write(self.state_path) as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=1, sort_keys=True)
+
+    def code_hash(self, module: str) -> str:
+        if module not in self._code_hashes:
+            files = code_files(module, self.root)
+            self._code_hashes[module] = _sha256_json({rel: self.hasher.file(rel) for rel in files})
+        return self._code_hashes[module]
+
+    def fingerprint(self, node: Node) -> str:
+        step = node.step
+        return _sha256_json({
+            "step": step.name,
+            "module": step.module,
+            "args": step.args(node.target),
+            "code": self.code_hash(step.module),
+            "inputs": self.hasher.digest(step.inputs(node.target)),
+        })
+
+    def outputs(self, node: Node) -> Dict[str, str]:
+        return self.hasher.digest(node.step.outputs(node.target))
+
+    def stale_reason(self, node: Node, fingerprint: str) -> Optional[str]:
+        """최신이면 None, 아니면 재실행 사유"""
+        if self.force:
+            return "forced"
+        recorded = self.state["nodes"].get(node.node_id)
+        if recorded is None:
+            return "never built"
+        if recorded["fingerprint"] != fingerprint:
+            return "inputs or code changed"
+        outputs = self.outputs(node)
+        if MISSING in outputs.values():
+            return "output missing"
+        if outputs != recorded["outputs"]:
+            return "output modified"
+        return None
+
+    def record(self, node: Node, fingerprint: str):
+        self.state["nodes"][node.node_id] = {
+            "fingerprint": fingerprint,
+            "outputs": self.outputs(node),
+            "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        self.save_state()
+
+    def execute(self, node: Node) -> Tuple[int, float, str]:
+        start = time.perf_counter()
+        proc = subprocess.run(node.command(self.jobs), cwd=self.root, capture_output=True, text=True)
+        return proc.returncode, time.perf_counter() - start, proc.stderr or proc.stdout
+
+    def run(self) -> Dict[str, List[str]]:
+        """의존 순서대로 stale node 실행 (최대 jobs개 동시)"""
+        status: Dict[str, str] = {}
+        summary = {"ran": [], "skipped": [], "failed": [], "blocked": []}
+        pending = list(self.nodes)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                for node_id in list(pending):
+                    node = self.nodes[node_id]
+                    dep_status = [status.get(dep) for dep in node.deps if dep in self.nodes]
+                    if any(s in ("failed", "blocked") for s in dep_status):
+                        pending.remove(node_id)
+                        status[node_id] = "blocked"
+                        summary["blocked"].append(node_id)
+                        self.log(f"⛔ {node_id}: blocked (upstream failed)")
+                        continue
+                    if any(s != "done" for s in dep_status):
+                        continue
+                    pending.remove(node_id)
+                    fingerprint = self.fingerprint(node)
+                    reason = self.stale_reason(node, fingerprint)
+                    if reason is None:
+                        status[node_id] = "done"
+                        summary["skipped"].append(node_id)
+                        self.log(f"⏭️  {node_id}: up to date")
+                        continue
+                    status[node_id] = "running"
+                    self.log(f"▶ {node_id}: {reason} → {' '.join(node.command(self.jobs)[2:])}")
+                    running[pool.submit(self.execute, node)] = (node, fingerprint)
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node, fingerprint = running.pop(future)
+                    returncode, elapsed, output = future.result()
+                    if returncode == 0:
+                        self.record(node, fingerprint)
+                        status[node.node_id] = "done"
+                        summary["ran"].append(node.node_id)
+                        self.log(f"✓ {node.node_id} ({elapsed:.1f}s)")
+                    else:
+                        status[node.node_id] = "failed"
+                        summary["failed"].append(node.node_id)
+                        tail = '\n'.join(output.strip().splitlines()[-STDERR_TAIL_LINES:])
+                        self.log(f"✗ {node.node_id}: exit {returncode} ({elapsed:.1f}s)\n{tail}")
+
+        self.save_state()
+        return summary
+
+    def plan(self) -> List[Tuple[str, str]]:
+        """
+        dry-run: (node_id, 상태) 목록 (실행하지 않음)
+
+        상위 node가 stale이면 하위 node는 "after upstream" (상위 산출물이 실제로 바뀔 때만 재실행)
+        """
+        stale = set()
+        plan = []
+        for node_id, node in self.nodes.items():
+            reason = self.stale_reason(node, self.fingerprint(node))
+            if reason is None and any(dep in stale for dep in node.deps):
+                reason = "after upstream (if its outputs change)"
+            if reason is not None:
+                stale.add(node_id)
+            plan.append((node_id, reason or "up to date"))
+        return plan
+
+    def adopt(self) -> Dict[str, List[str]]:
+        """산출물이 모두 있는 node를 현재 입력 기준 최신으로 기록 (실행하지 않음)"""
+        summary = {"adopted": [], "missing": []}
+        for node_id, node in self.nodes.items():
+            if MISSING in self.outputs(node).values():
+                summary["missing"].append(node_id)
+                continue
+            self.state["nodes"][node_id] = {
+                "fingerprint": self.fingerprint(node),
+                "outputs": self.outputs(node),
+                "built_at": "adopted",
+            }
+            summary["adopted"].append(node_id)
+        self.save_state()
+        return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run pipeline steps 1–10 as a DAG, skipping up-to-date nodes")
+    parser.add_argument("--insurers", help="Comma-separated insurers (default: all data/evidence_sources manifests)")
+    parser.add_argument("--targets", help=f"Comma-separated steps to build (with their upstream steps); "
+                                          f"available: {','.join(step.name for step in PIPELINE_STEPS)}")
+    parser.add_argument("--jobs", type=int, default=4, help="Max nodes running in parallel")
+    parser.add_argument("--force", action="store_true", help="Rerun every selected node")
+    parser.add_argument("--dry-run", action="store_true", help="Show which nodes are stale without running them")
+    parser.add_argument("--adopt", action="store_true",
+                        help="Record existing outputs as up to date without running (first-time setup)")
+    args = parser.parse_args()
+
+    insurers = [x.strip() for x in args.insurers.split(",") if x.strip()] if args.insurers else default_insurers()
+    targets = [x.strip() for x in args.targets.split(",") if x.strip()] if args.targets else None
+    nodes = build_graph(PIPELINE_STEPS, insurers, targets)
+    runner = PipelineRunner(nodes, jobs=args.jobs, force=args.force)
+
+    print(f"[Pipeline] Insurers: {', '.join(insurers)}")
+    print(f"[Pipeline] Nodes: {len(nodes)} (jobs={args.jobs})")
+
+    if args.dry_run:
+        for node_id, reason in runner.plan():
+            print(f"  {node_id:<28} {reason}")
+        return
+
+    if args.adopt:
+        summary = runner.adopt()
+        print(f"[Pipeline] Adopted: {len(summary['adopted'])}, missing outputs: {', '.join(summary['missing']) or '-'}")
+        return
+
+    summary = runner.run()
+    print(f"\n[Pipeline] ran {len(summary['ran'])}, up to date {len(summary['skipped'])}, "
+          f"failed {len(summary['failed'])}, blocked {len(summary['blocked'])}")
+    print(f"✓ State: {runner.state_path}")
+    if summary["failed"] or summary["blocked"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()